@@ -0,0 +1,138 @@
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy
+from brainflow.board_shim import BoardShim
+
+# All benchmarks save results in the same format, so compare_results works for each of them:
+# {'environment': {...}, 'args': {...}, 'results': [{'benchmark': 'acquisition', 'case': 'synthetic',
+#  'params': {'rate': 250, ...}, 'metrics': {'push_samples_per_second': 250.0, ...}}, ...]}
+# Metrics are numbers, names ending with _per_second and speedup are better when larger, others when smaller.
+LARGER_IS_BETTER_SUFFIXES = ('_per_second', 'speedup')
+
+
+def get_rss_bytes():
+    # current resident set size, falls back to peak value if /proc is not available,
+    # returns None if neither is available (resource module doesnt exist on windows)
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (IOError, OSError, IndexError, ValueError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+def get_percentiles(values):
+    if values is None or values.shape[0] == 0:
+        return None
+    return {
+        'p50': float(numpy.percentile(values, 50)),
+        'p90': float(numpy.percentile(values, 90)),
+        'p99': float(numpy.percentile(values, 99)),
+        'max': float(numpy.max(values))
+    }
+
+
+def get_environment():
+    return {
+        'brainflow_version': BoardShim.get_version(),
+        'python_version': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S')
+    }
+
+
+def make_result(benchmark, case, params, metrics):
+    # metrics which are not available for this run are not saved
+    return {
+        'benchmark': benchmark,
+        'case': case,
+        'params': params,
+        'metrics': dict((k, v) for k, v in metrics.items() if v is not None)
+    }
+
+
+def save_results(file_name, args, results):
+    with open(file_name, 'w') as f:
+        json.dump({'environment': get_environment(), 'args': args, 'results': results}, f, indent=4)
+
+
+def is_larger_better(metric):
+    return metric.endswith(LARGER_IS_BETTER_SUFFIXES)
+
+
+class Measurement(object):
+    """Polls board with get_board_data and collects push rate, poll latency, copy cost, memory and streamer stats"""
+
+    def __init__(self, board, timestamp_channel, poll_interval, with_streamer=False):
+        self.board = board
+        self.with_streamer = with_streamer
+        self.streamer_stats = list()
+        self.timestamp_channel = timestamp_channel
+        self.poll_interval = poll_interval
+        self.latencies = list()
+        self.num_samples = 0
+        self.copy_time = 0.0
+        self.baseline_rss = get_rss_bytes()
+        self.peak_rss = self.baseline_rss
+        self.wall_time = 0.0
+
+    def run(self, duration, warmup=0.5):
+        # data from warmup period includes start up costs, dont count it
+        time.sleep(warmup)
+        self.board.get_board_data()
+        if self.with_streamer:
+            self.streamer_stats.append(self.board.get_streamer_stats())
+        start = time.time()
+        while time.time() - start < duration:
+            time.sleep(self.poll_interval)
+            self.poll()
+        self.wall_time = time.time() - start
+        if self.with_streamer:
+            self.streamer_stats.append(self.board.get_streamer_stats())
+
+    def poll(self):
+        copy_start = time.perf_counter()
+        data = self.board.get_board_data()
+        copy_stop = time.perf_counter()
+        poll_time = time.time()
+        rss = get_rss_bytes()
+        if rss is not None:
+            self.peak_rss = max(self.peak_rss, rss)
+        if data.shape[1] == 0:
+            return
+        self.copy_time = self.copy_time + copy_stop - copy_start
+        self.num_samples = self.num_samples + data.shape[1]
+        self.latencies.append(poll_time - data[self.timestamp_channel])
+
+    def get_results(self):
+        latencies = numpy.concatenate(self.latencies) * 1000 if self.latencies else None
+        percentiles = get_percentiles(latencies) or dict()
+        result = {
+            'push_samples_per_second': self.num_samples / self.wall_time if self.wall_time > 0 else 0.0,
+            'copy_ns_per_sample': 1e9 * self.copy_time / self.num_samples if self.num_samples > 0 else None,
+            'baseline_rss_mb': self.baseline_rss / 1048576.0 if self.baseline_rss is not None else None,
+            'peak_rss_mb': self.peak_rss / 1048576.0 if self.peak_rss is not None else None
+        }
+        for name, value in percentiles.items():
+            result['poll_latency_%s_ms' % name] = value
+        if len(self.streamer_stats) == 2:
+            start_stats, stop_stats = self.streamer_stats
+            # packages written by streamers during the measurement, queue grows if streamer is too slow
+            written = (stop_stats['queued'] - stop_stats['pending'] - stop_stats['dropped']) - (
+                start_stats['queued'] - start_stats['pending'] - start_stats['dropped'])
+            result['streamer_queued'] = stop_stats['queued']
+            result['streamer_dropped'] = stop_stats['dropped']
+            result['streamer_pending'] = stop_stats['pending']
+            result['streamer_samples_per_second'] = written / self.wall_time
+        return result
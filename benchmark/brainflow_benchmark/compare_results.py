@@ -0,0 +1,56 @@
+import argparse
+import json
+import numbers
+
+from brainflow_benchmark.benchmark_common import is_larger_better
+
+
+def get_key(result):
+    # params are part of the key, runs with different params are not compared
+    return result['benchmark'], result['case'], json.dumps(result['params'], sort_keys=True)
+
+
+def compare(old_results, new_results, threshold):
+    # returns list of regressions which are worse than threshold percents
+    regressions = list()
+    old_by_key = dict((get_key(x), x) for x in old_results['results'])
+    print('old: brainflow %s, new: brainflow %s' % (
+        old_results['environment']['brainflow_version'], new_results['environment']['brainflow_version']))
+    for new_result in new_results['results']:
+        key = get_key(new_result)
+        if key not in old_by_key:
+            continue
+        print('%s %s %s' % key)
+        old_metrics = old_by_key[key]['metrics']
+        for name, new_value in sorted(new_result['metrics'].items()):
+            old_value = old_metrics.get(name)
+            if not isinstance(old_value, numbers.Number) or not isinstance(new_value, numbers.Number) or \
+                    old_value == 0:
+                continue
+            change = 100.0 * (new_value - old_value) / abs(old_value)
+            worse = -change if is_larger_better(name) else change
+            print('    %-30s %14.2f %14.2f %+8.1f%%%s' % (
+                name, old_value, new_value, change, ' WORSE' if worse > threshold else ''))
+            if worse > threshold:
+                regressions.append((key, name, change))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compares two json files created by benchmarks from this package')
+    parser.add_argument('old', type=str, help='results of baseline version')
+    parser.add_argument('new', type=str, help='results of new version')
+    parser.add_argument('--threshold', type=float, help='percents, changes above it are marked as regressions',
+                        required=False, default=10.0)
+    args = parser.parse_args()
+
+    with open(args.old) as f:
+        old_results = json.load(f)
+    with open(args.new) as f:
+        new_results = json.load(f)
+    regressions = compare(old_results, new_results, args.threshold)
+    print('%d regressions above %.1f%%' % (len(regressions), args.threshold))
+
+
+if __name__ == '__main__':
+    main()
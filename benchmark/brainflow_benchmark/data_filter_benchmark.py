@@ -0,0 +1,130 @@
+import argparse
+import time
+
+import numpy as np
+from brainflow.data_filter import DataFilter, FilterTypes, AggOperations, WindowOperations, DetrendOperations, \
+    NoiseTypes, WaveletTypes, FilterOperations
+
+from brainflow_benchmark.benchmark_common import make_result, save_results
+
+
+# Measures time per call for DataFilter wrappers. Small inputs show python and ctypes overhead since native
+# part is almost free for them, large inputs show the cost for typical 32 channels x 10 seconds windows.
+SMALL_NUM_CHANNELS = 4
+
+
+def get_cases(num_channels, num_samples, sampling_rate):
+    rng = np.random.default_rng(42)
+    data_2d = rng.standard_normal((num_channels, num_samples))
+    row = data_2d[0].copy()
+    channels = list(range(num_channels))
+    fft_len = num_samples - num_samples % 2
+    fft_data = DataFilter.perform_fft(row[:fft_len].copy(), WindowOperations.NO_WINDOW.value)
+    psd = DataFilter.get_psd(row[:fft_len].copy(), sampling_rate, WindowOperations.NO_WINDOW.value)
+    wavelet_output = DataFilter.perform_wavelet_transform(row.copy(), WaveletTypes.DB4, 3)
+    nfft = DataFilter.get_nearest_power_of_two(min(sampling_rate, num_samples // 2))
+    bands = [(1.5, 4.0), (4.0, 8.0), (8.0, 13.0), (13.0, 30.0), (30.0, 45.0)]
+    streaming_filter = DataFilter.create_filter(FilterOperations.BANDPASS.value, sampling_rate, 3.0, 45.0, 4,
+                                                FilterTypes.BUTTERWORTH.value, num_channels=num_channels)
+
+    # each case is (name, function, args factory), args are created before timing so copies are not measured
+    return [
+        ('perform_lowpass', DataFilter.perform_lowpass,
+         lambda: (row.copy(), sampling_rate, 30.0, 4, FilterTypes.BUTTERWORTH.value, 0.0)),
+        ('perform_highpass', DataFilter.perform_highpass,
+         lambda: (row.copy(), sampling_rate, 3.0, 4, FilterTypes.BUTTERWORTH.value, 0.0)),
+        ('perform_bandpass', DataFilter.perform_bandpass,
+         lambda: (row.copy(), sampling_rate, 3.0, 45.0, 4, FilterTypes.BUTTERWORTH.value, 0.0)),
+        ('perform_bandstop', DataFilter.perform_bandstop,
+         lambda: (row.copy(), sampling_rate, 48.0, 52.0, 4, FilterTypes.BUTTERWORTH.value, 0.0)),
+        ('remove_environmental_noise', DataFilter.remove_environmental_noise,
+         lambda: (row.copy(), sampling_rate, NoiseTypes.FIFTY.value)),
+        ('perform_rolling_filter', DataFilter.perform_rolling_filter,
+         lambda: (row.copy(), 3, AggOperations.MEAN.value)),
+        ('calc_stddev', DataFilter.calc_stddev, lambda: (row,)),
+        ('get_railed_percentage', DataFilter.get_railed_percentage, lambda: (row, 24)),
+        ('perform_downsampling', DataFilter.perform_downsampling, lambda: (row, 3, AggOperations.MEAN.value)),
+        ('perform_wavelet_transform', DataFilter.perform_wavelet_transform, lambda: (row, WaveletTypes.DB4, 3)),
+        ('perform_inverse_wavelet_transform', DataFilter.perform_inverse_wavelet_transform,
+         lambda: (wavelet_output, num_samples, WaveletTypes.DB4, 3)),
+        ('perform_wavelet_denoising', DataFilter.perform_wavelet_denoising,
+         lambda: (row.copy(), WaveletTypes.DB4, 3)),
+        ('restore_data_from_wavelet_detailed_coeffs', DataFilter.restore_data_from_wavelet_detailed_coeffs,
+         lambda: (row, WaveletTypes.DB4, 3, 2)),
+        ('detect_peaks_z_score', DataFilter.detect_peaks_z_score, lambda: (row,)),
+        ('get_window', DataFilter.get_window, lambda: (WindowOperations.HANNING.value, num_samples)),
+        ('perform_fft', DataFilter.perform_fft, lambda: (row[:fft_len], WindowOperations.HANNING.value)),
+        ('perform_ifft', DataFilter.perform_ifft, lambda: (fft_data,)),
+        ('get_psd', DataFilter.get_psd, lambda: (row[:fft_len], sampling_rate, WindowOperations.HANNING.value)),
+        ('get_psd_welch', DataFilter.get_psd_welch,
+         lambda: (row, nfft, nfft // 2, sampling_rate, WindowOperations.HANNING.value)),
+        ('detrend', DataFilter.detrend, lambda: (row.copy(), DetrendOperations.LINEAR.value)),
+        ('get_band_power', DataFilter.get_band_power, lambda: (psd, 8.0, 13.0)),
+        ('get_avg_band_powers', DataFilter.get_avg_band_powers, lambda: (data_2d, channels, sampling_rate, False)),
+        ('get_custom_band_powers', DataFilter.get_custom_band_powers,
+         lambda: (data_2d, bands, channels, sampling_rate, False)),
+        ('perform_ica', DataFilter.perform_ica, lambda: (data_2d, 2, channels[:4])),
+        ('perform_bandpass_2d', DataFilter.perform_bandpass_2d,
+         lambda: (data_2d.copy(), channels, sampling_rate, 3.0, 45.0, 4, FilterTypes.BUTTERWORTH.value, 0.0)),
+        ('detrend_2d', DataFilter.detrend_2d, lambda: (data_2d.copy(), channels, DetrendOperations.LINEAR.value)),
+        ('perform_fft_2d', DataFilter.perform_fft_2d,
+         lambda: (np.ascontiguousarray(data_2d[:, :fft_len]), channels, WindowOperations.HANNING.value)),
+        ('get_psd_welch_2d', DataFilter.get_psd_welch_2d,
+         lambda: (data_2d, channels, nfft, nfft // 2, sampling_rate, WindowOperations.HANNING.value)),
+        ('streaming_filter_process', streaming_filter.process, lambda: (data_2d.copy(),)),
+    ]
+
+
+def run_case(func, make_args, min_time):
+    # calibrate number of calls so each case runs for at least min_time
+    number = 1
+    while True:
+        args_list = [make_args() for _ in range(number)]
+        start = time.perf_counter()
+        for args in args_list:
+            func(*args)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 100000:
+            return elapsed / number, number
+        number *= 2 if elapsed > min_time / 10 else 10
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sampling-rate', type=int, help='sampling rate', required=False, default=250)
+    parser.add_argument('--small-samples', type=int, help='num samples for overhead run', required=False,
+                        default=64)
+    parser.add_argument('--num-channels', type=int, help='num channels for large run', required=False, default=32)
+    parser.add_argument('--large-samples', type=int, help='num samples for large run', required=False,
+                        default=2500)
+    parser.add_argument('--min-time', type=float, help='min time per case in seconds', required=False, default=0.2)
+    parser.add_argument('--filter', type=str, help='run only cases containing this string', required=False,
+                        default='')
+    parser.add_argument('--output-file', type=str, help='file to save results as json', required=False, default='')
+    args = parser.parse_args()
+
+    DataFilter.disable_data_logger()
+    small_cases = get_cases(SMALL_NUM_CHANNELS, args.small_samples, args.sampling_rate)
+    large_cases = get_cases(args.num_channels, args.large_samples, args.sampling_rate)
+    results = list()
+    print('%-45s %15s %15s' % ('case', 'small, us/call', 'large, us/call'))
+    for small, large in zip(small_cases, large_cases):
+        name = small[0]
+        if args.filter not in name:
+            continue
+        small_time, _ = run_case(small[1], small[2], args.min_time)
+        large_time, _ = run_case(large[1], large[2], args.min_time)
+        print('%-45s %15.2f %15.2f' % (name, small_time * 1e6, large_time * 1e6))
+        results.append(make_result('data_filter', name,
+                                   {'num_channels': SMALL_NUM_CHANNELS, 'num_samples': args.small_samples},
+                                   {'us_per_call': small_time * 1e6}))
+        results.append(make_result('data_filter', name,
+                                   {'num_channels': args.num_channels, 'num_samples': args.large_samples},
+                                   {'us_per_call': large_time * 1e6}))
+
+    if args.output_file:
+        save_results(args.output_file, vars(args), results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import argparse
+import logging
+
+from brainflow.board_shim import BoardShim
+from brainflow_benchmark.benchmark_common import save_results
+from brainflow_benchmark.scenarios import SCENARIOS, SYNTHETIC_DEFAULT_CHANNELS, run_scenario
+
+
+def format_value(value, fmt):
+    return fmt % value if value is not None else '-'
+
+
+def print_result(result):
+    params = result['params']
+    metrics = result['metrics']
+    print('%-10s rate %-8d channels %-5s rows %-5d push %10.1f/s latency p50 %8s p99 %8s ms copy %8s ns/sample '
+          'rss %s MB streamer %s/s dropped %s' % (
+              result['case'], params['rate'], format_value(params['channels'], '%d'), params['num_rows'],
+              metrics['push_samples_per_second'], format_value(metrics.get('poll_latency_p50_ms'), '%.2f'),
+              format_value(metrics.get('poll_latency_p99_ms'), '%.2f'),
+              format_value(metrics.get('copy_ns_per_sample'), '%.1f'), format_value(metrics.get('peak_rss_mb'), '%.1f'),
+              format_value(metrics.get('streamer_samples_per_second'), '%.1f'),
+              format_value(metrics.get('streamer_dropped'), '%d')))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark for data acquisition: device -> DataBuffer -> Python')
+    parser.add_argument('--scenarios', type=str, help='comma separated scenarios: %s' % ','.join(sorted(SCENARIOS)),
+                        required=False, default='synthetic,playback,streaming')
+    parser.add_argument('--rates', type=str, help='comma separated sampling rates', required=False,
+                        default='250,2000,8000')
+    parser.add_argument('--channels', type=str, help='comma separated numbers of EEG channels, only synthetic board '
+                        'supports it', required=False, default=str(SYNTHETIC_DEFAULT_CHANNELS))
+    parser.add_argument('--duration', type=float, help='seconds to measure for each run', required=False, default=5)
+    parser.add_argument('--poll-interval', type=float, help='seconds between get_board_data calls', required=False,
+                        default=0.01)
+    parser.add_argument('--streamer', type=str, help='streamer to add: file, bfbin or empty', required=False,
+                        default='', choices=['', 'file', 'bfbin'])
+    parser.add_argument('--output-file', type=str, help='file to save results as json', required=False, default='')
+    args = parser.parse_args()
+
+    scenarios = args.scenarios.split(',')
+    for scenario in scenarios:
+        if scenario not in SCENARIOS:
+            parser.error('unsupported scenario %s' % scenario)
+    BoardShim.disable_board_logger()
+    results = list()
+    for scenario in scenarios:
+        for rate in [int(x) for x in args.rates.split(',')]:
+            channels_list = [int(x) for x in args.channels.split(',')]
+            # other boards have fixed layout, dont repeat the same run
+            if not SCENARIOS[scenario].supports_channels:
+                channels_list = channels_list[:1]
+            for channels in channels_list:
+                result = run_scenario(scenario, rate, channels, args.duration, args.poll_interval, args.streamer)
+                print_result(result)
+                results.append(result)
+
+    if args.output_file:
+        save_results(args.output_file, vars(args), results)
+
+
+if __name__ == '__main__':
+    logging.basicConfig(format='%(asctime)s %(levelname)-8s %(message)s', level=logging.INFO)
+    main()
@@ -0,0 +1,65 @@
+import argparse
+import json
+import os
+import subprocess
+
+from brainflow_benchmark.benchmark_common import save_results
+
+# binaries are built from benchmark/native with BUILD_TESTS option, each of them prints json lines with --json
+# arguments are positional and depend on benchmark, quick arguments are used for CI
+NATIVE_BENCHMARKS = {
+    'data_buffer_benchmark': {'default': [], 'quick': ['1', '100000']},
+    'push_package_benchmark': {'default': [], 'quick': ['10000']},
+    'recording_format_benchmark': {'default': [], 'quick': ['16', '20000']},
+    'rolling_filter_benchmark': {'default': [], 'quick': ['10000']}
+}
+
+
+def get_binary(build_dir, name):
+    for file_name in (name, name + '.exe', os.path.join('Release', name + '.exe')):
+        path = os.path.join(build_dir, file_name)
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def run_native_benchmark(binary, args):
+    output = subprocess.check_output([binary, '--json'] + args, universal_newlines=True)
+    return [json.loads(line) for line in output.splitlines() if line.startswith('{')]
+
+
+def print_result(result):
+    params = ' '.join('%s %s' % (k, v) for k, v in sorted(result['params'].items()))
+    metrics = ' '.join('%s %.4g' % (k, v) for k, v in sorted(result['metrics'].items()))
+    print('%-20s %-25s %s: %s' % (result['benchmark'], result['case'], params, metrics))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Runs native benchmarks and saves results in the common format')
+    parser.add_argument('--build-dir', type=str, help='folder with benchmark binaries', required=False,
+                        default=os.path.join('build', 'tests'))
+    parser.add_argument('--benchmarks', type=str, help='comma separated benchmarks: %s' % ','.join(
+                        sorted(NATIVE_BENCHMARKS)), required=False, default=','.join(sorted(NATIVE_BENCHMARKS)))
+    parser.add_argument('--quick', action='store_true', help='use small arguments')
+    parser.add_argument('--output-file', type=str, help='file to save results as json', required=False, default='')
+    args = parser.parse_args()
+
+    names = args.benchmarks.split(',')
+    for name in names:
+        if name not in NATIVE_BENCHMARKS:
+            parser.error('unsupported benchmark %s' % name)
+    results = list()
+    for name in names:
+        binary = get_binary(args.build_dir, name)
+        if binary is None:
+            parser.error('%s is not found in %s, build with BUILD_TESTS option' % (name, args.build_dir))
+        for result in run_native_benchmark(binary, NATIVE_BENCHMARKS[name]['quick' if args.quick else 'default']):
+            print_result(result)
+            results.append(result)
+
+    if args.output_file:
+        save_results(args.output_file, vars(args), results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,220 @@
+import abc
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+
+import numpy
+from brainflow.board_shim import BoardShim, BrainFlowInputParams, BoardIds
+from brainflow.data_filter import DataFilter
+
+from brainflow_benchmark.benchmark_common import Measurement, make_result
+
+SYNTHETIC_DEFAULT_CHANNELS = 16
+STREAMING_BOARD_IP = '225.1.1.1'
+STREAMING_BOARD_PORT = 6697
+
+
+class Scenario(abc.ABC):
+    """Creates board session for benchmark, subclasses start data sources and release them in cleanup"""
+
+    # some boards have fixed layout, channels argument is ignored for them
+    supports_channels = False
+
+    def __init__(self, rate, channels):
+        self.rate = rate
+        self.channels = channels
+        self.board = None
+
+    @abc.abstractmethod
+    def create_board(self):
+        pass
+
+    def get_timestamp_channel(self):
+        return BoardShim.get_timestamp_channel(self.board.get_board_id())
+
+    def configure(self):
+        pass
+
+    def cleanup(self):
+        pass
+
+
+class SyntheticScenario(Scenario):
+
+    supports_channels = True
+
+    def create_board(self):
+        params = BrainFlowInputParams()
+        # larger blocks decrease overhead for high rates, vectorized mode is needed for many channels
+        batch_size = max(1, int(self.rate // 1000))
+        params.other_info = 'set_sampling_rate:%d;set_eeg_channels:%d;set_batch_size:%d;vectorized_true' % (
+            self.rate, self.channels, batch_size)
+        self.board = BoardShim(BoardIds.SYNTHETIC_BOARD.value, params)
+
+    def get_timestamp_channel(self):
+        return self.board.get_session_board_descr()['timestamp_channel']
+
+
+class PlaybackScenario(Scenario):
+
+    def __init__(self, rate, channels):
+        super(PlaybackScenario, self).__init__(rate, channels)
+        self.file_name = None
+
+    def create_board(self):
+        # file with recorded sampling rate, speed multiplier gives requested rate
+        master_board_id = BoardIds.SYNTHETIC_BOARD.value
+        recorded_rate = BoardShim.get_sampling_rate(master_board_id)
+        num_samples = recorded_rate * 60
+        data = numpy.random.uniform(-100, 100,
+                                    (BoardShim.get_num_rows(master_board_id), num_samples))
+        data[BoardShim.get_package_num_channel(master_board_id)] = numpy.arange(num_samples) % 256
+        data[BoardShim.get_timestamp_channel(master_board_id)] = time.time() + numpy.arange(
+            num_samples) / float(recorded_rate)
+        data[BoardShim.get_marker_channel(master_board_id)] = 0
+        self.file_name = os.path.join(tempfile.mkdtemp(), 'benchmark_playback.csv')
+        DataFilter.write_file(data, self.file_name, 'w')
+        params = BrainFlowInputParams()
+        params.file = self.file_name
+        params.master_board = master_board_id
+        self.board = BoardShim(BoardIds.PLAYBACK_FILE_BOARD.value, params)
+
+    def get_timestamp_channel(self):
+        return BoardShim.get_timestamp_channel(BoardIds.SYNTHETIC_BOARD.value)
+
+    def configure(self):
+        recorded_rate = BoardShim.get_sampling_rate(BoardIds.SYNTHETIC_BOARD.value)
+        self.board.config_board('loopback_true')
+        self.board.config_board('set_speed:%f' % (self.rate / float(recorded_rate)))
+
+    def cleanup(self):
+        # folder contains recording and its index
+        if self.file_name is not None:
+            shutil.rmtree(os.path.dirname(self.file_name), ignore_errors=True)
+
+
+class StreamingScenario(Scenario):
+
+    def __init__(self, rate, channels):
+        super(StreamingScenario, self).__init__(rate, channels)
+        self.source = None
+
+    def create_board(self):
+        # source board runs in this process, streaming board uses descriptor of master board so layout is default
+        params = BrainFlowInputParams()
+        params.other_info = 'set_sampling_rate:%d;set_batch_size:%d;vectorized_true' % (
+            self.rate, max(1, int(self.rate // 1000)))
+        self.source = BoardShim(BoardIds.SYNTHETIC_BOARD.value, params)
+        self.source.prepare_session()
+        self.source.add_streamer('streaming_board://%s:%d' % (STREAMING_BOARD_IP, STREAMING_BOARD_PORT))
+        self.source.start_stream()
+        params = BrainFlowInputParams()
+        params.ip_address = STREAMING_BOARD_IP
+        params.ip_port = STREAMING_BOARD_PORT
+        params.master_board = BoardIds.SYNTHETIC_BOARD.value
+        self.board = BoardShim(BoardIds.STREAMING_BOARD.value, params)
+
+    def get_timestamp_channel(self):
+        return BoardShim.get_timestamp_channel(BoardIds.SYNTHETIC_BOARD.value)
+
+    def cleanup(self):
+        if self.source is not None and self.source.is_prepared():
+            self.source.release_session()
+
+
+class EmulatorScenario(Scenario):
+    """Uses devices from brainflow_emulator package, emulator runs in a separate process"""
+
+    device_type = None
+
+    def __init__(self, rate, channels):
+        super(EmulatorScenario, self).__init__(rate, channels)
+        self.stop_event = None
+        self.process = None
+        self.conn = None
+
+    def create_board(self):
+        from brainflow_emulator.load_harness import run_device, create_board
+        context = multiprocessing.get_context('spawn')
+        self.stop_event = context.Event()
+        # emulator sends stream start time later, connection should be alive until the end
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=run_device,
+                                       args=(self.device_type, 0, self.rate, child_conn, self.stop_event))
+        self.process.daemon = True
+        self.process.start()
+        if not self.conn.poll(30):
+            raise RuntimeError('emulator for %s is not started' % self.device_type)
+        board_id, params = create_board(self.device_type, self.conn.recv())
+        self.board = BoardShim(board_id, params)
+
+    def cleanup(self):
+        if self.stop_event is not None:
+            self.stop_event.set()
+            self.process.join(10)
+
+
+class CytonScenario(EmulatorScenario):
+    device_type = 'cyton'
+
+
+class GaleaScenario(EmulatorScenario):
+    device_type = 'galea'
+
+
+SCENARIOS = {
+    'synthetic': SyntheticScenario,
+    'playback': PlaybackScenario,
+    'streaming': StreamingScenario,
+    'cyton': CytonScenario,
+    'galea': GaleaScenario
+}
+
+
+def get_streamer_params(streamer, folder):
+    if streamer == 'file':
+        return 'file://%s:w' % os.path.join(folder, 'benchmark_streamer.csv')
+    if streamer == 'bfbin':
+        return 'bfbin://%s:w' % os.path.join(folder, 'benchmark_streamer.bfbin')
+    return ''
+
+
+def run_scenario(name, rate, channels, duration, poll_interval, streamer='', buffer_size=450000):
+    scenario = SCENARIOS[name](rate, channels)
+    params = {
+        'rate': rate,
+        'channels': channels if scenario.supports_channels else None,
+        'streamer_type': streamer if streamer else None
+    }
+    folder = tempfile.mkdtemp()
+    streamer_params = get_streamer_params(streamer, folder)
+    try:
+        scenario.create_board()
+        board = scenario.board
+        board.prepare_session()
+        scenario.configure()
+        params['num_rows'] = board.get_session_board_descr()['num_rows']
+        measurement = Measurement(board, scenario.get_timestamp_channel(), poll_interval, bool(streamer_params))
+        board.start_stream(buffer_size, streamer_params)
+        measurement.run(duration)
+        board.stop_stream()
+        metrics = measurement.get_results()
+        if streamer_params:
+            # pending packages are written before streamer is removed
+            drain_start = time.time()
+            board.delete_streamer(streamer_params)
+            metrics['streamer_drain_seconds'] = time.time() - drain_start
+            file_name = streamer_params[streamer_params.index('://') + 3:-2]
+            # number of queued packages depends on duration, it is not compared
+            written = metrics.pop('streamer_queued') - metrics['streamer_dropped']
+            bytes_per_sample = os.path.getsize(file_name) / float(written) if written > 0 else 0.0
+            metrics['streamer_mb_per_second'] = metrics['streamer_samples_per_second'] * bytes_per_sample / 1048576.0
+        board.release_session()
+    finally:
+        if scenario.board is not None and scenario.board.is_prepared():
+            scenario.board.release_session()
+        scenario.cleanup()
+        shutil.rmtree(folder, ignore_errors=True)
+    return make_result('acquisition', name, params, metrics)
@@ -0,0 +1,52 @@
+#pragma once
+
+// Native benchmarks print a table by default. With --json as the first argument they print each
+// result as a single json line instead: {"benchmark": ..., "case": ..., "params": {...},
+// "metrics": {...}}, brainflow_benchmark.run_native_benchmark collects these lines into the result
+// file format shared by all benchmarks, see brainflow_benchmark/benchmark_common.py
+
+#include <stdio.h>
+#include <string.h>
+#include <string>
+#include <utility>
+#include <vector>
+
+typedef std::vector<std::pair<std::string, double>> BenchmarkValues;
+
+
+// removes --json from arguments, so positional arguments keep their numbers
+inline bool parse_json_flag (int &argc, char *argv[])
+{
+    if ((argc < 2) || (strcmp (argv[1], "--json") != 0))
+    {
+        return false;
+    }
+    for (int i = 1; i < argc - 1; i++)
+    {
+        argv[i] = argv[i + 1];
+    }
+    argc--;
+    return true;
+}
+
+inline void print_json_values (const BenchmarkValues &values)
+{
+    printf ("{");
+    for (size_t i = 0; i < values.size (); i++)
+    {
+        printf ("%s\"%s\": %.17g", (i == 0) ? "" : ", ", values[i].first.c_str (),
+            values[i].second);
+    }
+    printf ("}");
+}
+
+inline void print_json_result (const char *benchmark, const std::string &test_case,
+    const BenchmarkValues &params, const BenchmarkValues &metrics)
+{
+    printf ("{\"benchmark\": \"%s\", \"case\": \"%s\", \"params\": ", benchmark,
+        test_case.c_str ());
+    print_json_values (params);
+    printf (", \"metrics\": ");
+    print_json_values (metrics);
+    printf ("}\n");
+}
@@ -0,0 +1,144 @@
+// Contention benchmark for ring buffer implementations: one producer thread pushes packages as fast
+// as possible while several reader threads poll the buffer like BoardShim users do.
+// Usage: data_buffer_benchmark [--json] [num_readers] [num_packages] [num_rows]
+
+#include <algorithm>
+#include <atomic>
+#include <chrono>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string>
+#include <thread>
+#include <vector>
+
+#include "benchmark_output.h"
+#include "data_buffer.h"
+#include "lock_free_data_buffer.h"
+
+
+struct BenchmarkResult
+{
+    double packages_per_second;
+    double push_p50_ns;
+    double push_p99_ns;
+    double push_max_ns;
+    double reads_per_second;
+};
+
+static BenchmarkResult run_benchmark (
+    DataBuffer *buffer, int num_readers, int num_packages, int num_rows)
+{
+    std::atomic<bool> stop (false);
+    std::atomic<long long> reads (0);
+    std::vector<std::thread> readers;
+    for (int i = 0; i < num_readers; i++)
+    {
+        readers.push_back (std::thread (
+            [&] (int reader_id)
+            {
+                std::vector<double> output (250 * num_rows);
+                long long local_reads = 0;
+                while (!stop)
+                {
+                    // mix of polling patterns used by high level apis
+                    if (reader_id % 2 == 0)
+                    {
+                        buffer->get_current_data (250, output.data ());
+                    }
+                    else
+                    {
+                        buffer->get_data_count ();
+                        buffer->get_data (250, output.data ());
+                    }
+                    local_reads++;
+                }
+                reads += local_reads;
+            },
+            i));
+    }
+
+    std::vector<double> package (num_rows);
+    std::vector<double> latencies (num_packages);
+    auto start = std::chrono::high_resolution_clock::now ();
+    for (int i = 0; i < num_packages; i++)
+    {
+        std::fill (package.begin (), package.end (), (double)i);
+        auto push_start = std::chrono::high_resolution_clock::now ();
+        buffer->add_data (package.data ());
+        auto push_end = std::chrono::high_resolution_clock::now ();
+        latencies[i] =
+            (double)std::chrono::duration_cast<std::chrono::nanoseconds> (push_end - push_start)
+                .count ();
+    }
+    auto end = std::chrono::high_resolution_clock::now ();
+    stop = true;
+    for (auto &reader : readers)
+    {
+        reader.join ();
+    }
+
+    std::sort (latencies.begin (), latencies.end ());
+    double seconds = std::chrono::duration<double> (end - start).count ();
+    BenchmarkResult result;
+    result.packages_per_second = num_packages / seconds;
+    result.push_p50_ns = latencies[num_packages / 2];
+    result.push_p99_ns = latencies[(size_t)(num_packages * 0.99)];
+    result.push_max_ns = latencies[num_packages - 1];
+    result.reads_per_second = reads / seconds;
+    return result;
+}
+
+int main (int argc, char *argv[])
+{
+    bool json_output = parse_json_flag (argc, argv);
+    int num_readers = (argc > 1) ? atoi (argv[1]) : 4;
+    int num_packages = (argc > 2) ? atoi (argv[2]) : 1000000;
+    int num_rows = (argc > 3) ? atoi (argv[3]) : 32;
+    int buffer_size = 250 * 60;
+    if ((num_readers < 0) || (num_packages < 1) || (num_rows < 1))
+    {
+        printf ("Usage: %s [--json] [num_readers] [num_packages] [num_rows]\n", argv[0]);
+        return 1;
+    }
+
+    if (!json_output)
+    {
+        printf ("readers: %d, packages: %d, rows: %d\n", num_readers, num_packages, num_rows);
+        printf ("%-12s %16s %12s %12s %14s %12s\n", "buffer", "packages/s", "p50 ns", "p99 ns",
+            "max ns", "reads/s");
+    }
+    for (int buffer_type = 0; buffer_type < 2; buffer_type++)
+    {
+        DataBuffer *buffer = NULL;
+        std::string name;
+        if (buffer_type == 0)
+        {
+            buffer = new DataBuffer (num_rows, buffer_size);
+            name = "spin_lock";
+        }
+        else
+        {
+            buffer = new LockFreeDataBuffer (num_rows, buffer_size);
+            name = "lock_free";
+        }
+        BenchmarkResult result = run_benchmark (buffer, num_readers, num_packages, num_rows);
+        if (json_output)
+        {
+            print_json_result ("data_buffer", name,
+                {{"num_readers", num_readers}, {"num_packages", num_packages},
+                    {"num_rows", num_rows}},
+                {{"packages_per_second", result.packages_per_second},
+                    {"push_p50_ns", result.push_p50_ns}, {"push_p99_ns", result.push_p99_ns},
+                    {"push_max_ns", result.push_max_ns},
+                    {"reads_per_second", result.reads_per_second}});
+        }
+        else
+        {
+            printf ("%-12s %16.0f %12.0f %12.0f %14.0f %12.0f\n", name.c_str (),
+                result.packages_per_second, result.push_p50_ns, result.push_p99_ns,
+                result.push_max_ns, result.reads_per_second);
+        }
+        delete buffer;
+    }
+    return 0;
+}
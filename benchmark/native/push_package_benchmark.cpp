@@ -0,0 +1,173 @@
+// Push rate benchmark for board threads, compares json lookups for each package which were used
+// before with precompiled PresetLayout. Each iteration fills a package like SyntheticBoard does,
+// sets marker like Board::push_package does and adds package to ring buffer.
+// Usage: push_package_benchmark [--json] [num_packages] [board_id]
+
+#include <chrono>
+#include <deque>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string>
+#include <vector>
+
+#include "benchmark_output.h"
+#include "brainflow_boards.h"
+#include "brainflow_constants.h"
+#include "data_buffer.h"
+#include "preset_layout.h"
+
+
+static void set_channel (double *package, int channel)
+{
+    // not all boards have all channels
+    if (channel >= 0)
+    {
+        package[channel] = 1.0;
+    }
+}
+
+static void fill_package_json (json &board_descr, const std::string &preset_str, double *package)
+{
+    set_channel (package, board_descr[preset_str].value ("package_num_channel", -1));
+    for (int channel : board_descr[preset_str]["eeg_channels"])
+    {
+        package[channel] = 1.0;
+    }
+    for (int channel : board_descr[preset_str]["accel_channels"])
+    {
+        package[channel] = 1.0;
+    }
+    for (int channel : board_descr[preset_str]["gyro_channels"])
+    {
+        package[channel] = 1.0;
+    }
+    set_channel (package, board_descr[preset_str].value ("battery_channel", -1));
+    set_channel (package, board_descr[preset_str].value ("timestamp_channel", -1));
+}
+
+static void push_package_json (json &board_descr, const std::string &preset_str, double *package,
+    std::deque<double> &marker_queue, DataBuffer &db)
+{
+    if (board_descr.find (preset_str) == board_descr.end ())
+    {
+        return;
+    }
+    json board_preset = board_descr[preset_str];
+    int marker_channel = board_preset["marker_channel"];
+    if (marker_queue.empty ())
+    {
+        package[marker_channel] = 0.0;
+    }
+    else
+    {
+        package[marker_channel] = marker_queue.front ();
+        marker_queue.pop_front ();
+    }
+    db.add_data (package);
+}
+
+static void fill_package_layout (const PresetLayout &layout, double *package)
+{
+    set_channel (package, layout.package_num_channel);
+    for (int channel : layout.eeg_channels)
+    {
+        package[channel] = 1.0;
+    }
+    for (int channel : layout.accel_channels)
+    {
+        package[channel] = 1.0;
+    }
+    for (int channel : layout.gyro_channels)
+    {
+        package[channel] = 1.0;
+    }
+    set_channel (package, layout.battery_channel);
+    set_channel (package, layout.timestamp_channel);
+}
+
+static void push_package_layout (
+    const PresetLayout &layout, double *package, std::deque<double> &marker_queue, DataBuffer &db)
+{
+    if (!layout.is_valid)
+    {
+        return;
+    }
+    if (marker_queue.empty ())
+    {
+        package[layout.marker_channel] = 0.0;
+    }
+    else
+    {
+        package[layout.marker_channel] = marker_queue.front ();
+        marker_queue.pop_front ();
+    }
+    db.add_data (package);
+}
+
+int main (int argc, char *argv[])
+{
+    bool json_output = parse_json_flag (argc, argv);
+    int num_packages = (argc > 1) ? atoi (argv[1]) : 1000000;
+    std::string board_id = (argc > 2) ? argv[2] : "-1";
+    if ((num_packages < 1) ||
+        (boards_struct.brainflow_boards_json["boards"].find (board_id) ==
+            boards_struct.brainflow_boards_json["boards"].end ()))
+    {
+        printf ("Usage: push_package_benchmark [--json] [num_packages] [board_id]\n");
+        return 1;
+    }
+    json board_descr = boards_struct.brainflow_boards_json["boards"][board_id];
+
+    if (!json_output)
+    {
+        printf ("board_id: %s, num_packages: %d\n", board_id.c_str (), num_packages);
+        printf ("%12s %16s %16s %10s\n", "preset", "json, pkg/s", "layout, pkg/s", "speedup");
+    }
+    for (auto &el : board_descr.items ())
+    {
+        std::string preset_str = el.key ();
+        PresetLayout layout;
+        if (compile_preset_layout (el.value (), layout) != (int)BrainFlowExitCodes::STATUS_OK)
+        {
+            fprintf (stderr, "%12s invalid descriptor\n", preset_str.c_str ());
+            continue;
+        }
+        std::vector<double> package (layout.num_rows, 0.0);
+        std::deque<double> marker_queue;
+
+        DataBuffer json_db (layout.num_rows, 45000);
+        auto start = std::chrono::high_resolution_clock::now ();
+        for (int i = 0; i < num_packages; i++)
+        {
+            fill_package_json (board_descr, preset_str, package.data ());
+            push_package_json (board_descr, preset_str, package.data (), marker_queue, json_db);
+        }
+        auto stop = std::chrono::high_resolution_clock::now ();
+        double json_time = std::chrono::duration<double> (stop - start).count ();
+
+        DataBuffer layout_db (layout.num_rows, 45000);
+        start = std::chrono::high_resolution_clock::now ();
+        for (int i = 0; i < num_packages; i++)
+        {
+            fill_package_layout (layout, package.data ());
+            push_package_layout (layout, package.data (), marker_queue, layout_db);
+        }
+        stop = std::chrono::high_resolution_clock::now ();
+        double layout_time = std::chrono::duration<double> (stop - start).count ();
+
+        if (json_output)
+        {
+            print_json_result ("push_package", preset_str,
+                {{"board_id", atof (board_id.c_str ())}, {"num_packages", num_packages}},
+                {{"json_packages_per_second", num_packages / json_time},
+                    {"layout_packages_per_second", num_packages / layout_time},
+                    {"speedup", json_time / layout_time}});
+        }
+        else
+        {
+            printf ("%12s %16.0f %16.0f %10.1f\n", preset_str.c_str (), num_packages / json_time,
+                num_packages / layout_time, json_time / layout_time);
+        }
+    }
+    return 0;
+}
@@ -0,0 +1,138 @@
+// Throughput benchmark for recording formats: streams packages through FileStreamer and
+// BinaryFileStreamer and measures write_file/read_file for tsv and bfbin files.
+// Usage: recording_format_benchmark [--json] [num_rows] [num_packages]
+
+#include <algorithm>
+#include <chrono>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string>
+#include <vector>
+
+#include "benchmark_output.h"
+#include "bfbin_file_streamer.h"
+#include "brainflow_constants.h"
+#include "data_handler.h"
+#include "file_streamer.h"
+
+
+static double get_file_mb (const char *file_name)
+{
+    FILE *fp = fopen (file_name, "rb");
+    if (fp == NULL)
+    {
+        return 0.0;
+    }
+    fseek (fp, 0, SEEK_END);
+    double size = (double)ftell (fp) / (1024.0 * 1024.0);
+    fclose (fp);
+    return size;
+}
+
+static double stream_packages (
+    Streamer *streamer, const std::vector<double> &packages, int num_rows)
+{
+    auto start = std::chrono::high_resolution_clock::now ();
+    if (streamer->init_streamer () != (int)BrainFlowExitCodes::STATUS_OK)
+    {
+        delete streamer;
+        return -1.0;
+    }
+    std::vector<double> package (num_rows);
+    int num_packages = (int)(packages.size () / num_rows);
+    for (int i = 0; i < num_packages; i++)
+    {
+        // board passes packages as mutable arrays, copy to mimic it
+        std::copy (packages.begin () + (size_t)i * num_rows,
+            packages.begin () + (size_t)(i + 1) * num_rows, package.begin ());
+        streamer->stream_data (package.data ());
+    }
+    delete streamer;
+    auto stop = std::chrono::high_resolution_clock::now ();
+    return std::chrono::duration<double> (stop - start).count ();
+}
+
+static void run_file_benchmark (const char *format, const char *file_name,
+    const std::vector<double> &data, int num_rows, double stream_time, bool json_output)
+{
+    int num_cols = (int)(data.size () / num_rows);
+    auto start = std::chrono::high_resolution_clock::now ();
+    int res = write_file (data.data (), num_rows, num_cols, file_name, "w");
+    auto written = std::chrono::high_resolution_clock::now ();
+    int num_elements = 0;
+    if (res == (int)BrainFlowExitCodes::STATUS_OK)
+    {
+        res = get_num_elements_in_file (file_name, &num_elements);
+    }
+    std::vector<double> output (num_elements);
+    int output_rows = 0;
+    int output_cols = 0;
+    if (res == (int)BrainFlowExitCodes::STATUS_OK)
+    {
+        res = read_file (output.data (), &output_rows, &output_cols, file_name, num_elements);
+    }
+    auto read = std::chrono::high_resolution_clock::now ();
+    if (res != (int)BrainFlowExitCodes::STATUS_OK)
+    {
+        fprintf (stderr, "%s: failed with error %d\n", format, res);
+        return;
+    }
+    double write_time = std::chrono::duration<double> (written - start).count ();
+    double read_time = std::chrono::duration<double> (read - written).count ();
+    if (json_output)
+    {
+        print_json_result ("recording_format", format,
+            {{"num_rows", num_rows}, {"num_packages", num_cols}},
+            {{"streamer_packages_per_second", num_cols / stream_time},
+                {"write_file_seconds", write_time}, {"read_file_seconds", read_time},
+                {"file_mb", get_file_mb (file_name)}});
+    }
+    else
+    {
+        printf ("%-6s streamer: %12.0f packages/s write_file: %8.3f s read_file: %8.3f s size: "
+                "%8.2f MB shape: %dx%d\n",
+            format, num_cols / stream_time, write_time, read_time, get_file_mb (file_name),
+            output_rows, output_cols);
+    }
+}
+
+int main (int argc, char *argv[])
+{
+    bool json_output = parse_json_flag (argc, argv);
+    int num_rows = (argc > 1) ? atoi (argv[1]) : 32;
+    int num_packages = (argc > 2) ? atoi (argv[2]) : 250 * 600;
+    if ((num_rows < 1) || (num_packages < 1))
+    {
+        printf ("Usage: recording_format_benchmark [--json] [num_rows] [num_packages]\n");
+        return 1;
+    }
+    if (!json_output)
+    {
+        printf ("num_rows: %d num_packages: %d\n", num_rows, num_packages);
+    }
+
+    std::vector<double> data ((size_t)num_rows * num_packages);
+    for (size_t i = 0; i < data.size (); i++)
+    {
+        data[i] = (double)rand () / RAND_MAX * 200.0 - 100.0;
+    }
+    set_log_level_data_handler ((int)LogLevels::LEVEL_OFF);
+
+    double tsv_stream_time = stream_packages (
+        new FileStreamer ("benchmark_streamer.csv", "w", num_rows), data, num_rows);
+    BFBinHeader header;
+    double bfbin_stream_time = stream_packages (
+        new BinaryFileStreamer ("benchmark_streamer.bfbin", "w", num_rows, header), data, num_rows);
+
+    // write_file expects row major data, e.g. [num_rows x num_packages]
+    run_file_benchmark (
+        "tsv", "benchmark_data.csv", data, num_rows, tsv_stream_time, json_output);
+    run_file_benchmark (
+        "bfbin", "benchmark_data.bfbin", data, num_rows, bfbin_stream_time, json_output);
+
+    remove ("benchmark_streamer.csv");
+    remove ("benchmark_streamer.bfbin");
+    remove ("benchmark_data.csv");
+    remove ("benchmark_data.bfbin");
+    return 0;
+}
@@ -0,0 +1,116 @@
+// Throughput benchmark for rolling filters used by perform_rolling_filter, compares them with
+// multiset based median which was used before.
+// Usage: rolling_filter_benchmark [--json] [num_samples]
+
+#include <chrono>
+#include <deque>
+#include <set>
+#include <stdio.h>
+#include <stdlib.h>
+#include <vector>
+
+#include "benchmark_output.h"
+#include "rolling_filter.h"
+
+
+class MultisetRollingMedian : public RollingFilter<double>
+{
+
+private:
+    std::multiset<double> dataset;
+    std::deque<double> deque;
+
+public:
+    MultisetRollingMedian (int period) : RollingFilter<double> (period)
+    {
+    }
+
+    void add_data (double num)
+    {
+        deque.push_back (num);
+        dataset.insert (num);
+    }
+
+    double get_value ()
+    {
+        if ((int)dataset.size () < period)
+        {
+            return deque.back ();
+        }
+        auto it1 = dataset.begin ();
+        std::advance (it1, (period - 1) / 2);
+        auto it2 = it1;
+        std::advance (it2, (int)((period & 1) == 0));
+        double res = (*it1 + *it2) / 2.0;
+        double val = deque.front ();
+        deque.pop_front ();
+        dataset.erase (dataset.find (val));
+        return res;
+    }
+};
+
+static double run_filter (RollingFilter<double> *filter, const std::vector<double> &data)
+{
+    // checksum prevents compiler from removing the loop
+    volatile double checksum = 0.0;
+    auto start = std::chrono::high_resolution_clock::now ();
+    for (size_t i = 0; i < data.size (); i++)
+    {
+        filter->add_data (data[i]);
+        checksum += filter->get_value ();
+    }
+    auto stop = std::chrono::high_resolution_clock::now ();
+    delete filter;
+    (void)checksum;
+    return std::chrono::duration<double, std::nano> (stop - start).count () / data.size ();
+}
+
+int main (int argc, char *argv[])
+{
+    bool json_output = parse_json_flag (argc, argv);
+    int num_samples = (argc > 1) ? atoi (argv[1]) : 1000000;
+    if (num_samples < 1)
+    {
+        printf ("Usage: rolling_filter_benchmark [--json] [num_samples]\n");
+        return 1;
+    }
+    std::vector<double> data (num_samples);
+    for (int i = 0; i < num_samples; i++)
+    {
+        data[i] = (double)rand () / RAND_MAX * 200.0 - 100.0;
+    }
+
+    if (!json_output)
+    {
+        printf ("num_samples: %d, ns per sample\n", num_samples);
+        printf ("%8s %12s %12s %12s %12s %12s %12s\n", "period", "old_median", "median", "mean",
+            "sum", "min", "max");
+    }
+    int periods[] = {3, 10, 100, 1000, 10000};
+    for (int period : periods)
+    {
+        double old_median = run_filter (new MultisetRollingMedian (period), data);
+        double median = run_filter (new RollingMedian<double> (period), data);
+        double mean = run_filter (new RollingAverage<double> (period), data);
+        double sum = run_filter (new RollingSum<double> (period), data);
+        double min = run_filter (new RollingMin<double> (period), data);
+        double max = run_filter (new RollingMax<double> (period), data);
+        if (json_output)
+        {
+            const char *names[] = {"old_median", "median", "mean", "sum", "min", "max"};
+            double values[] = {old_median, median, mean, sum, min, max};
+            for (int i = 0; i < 6; i++)
+            {
+                print_json_result ("rolling_filter", names[i],
+                    {{"period", period}, {"num_samples", num_samples}},
+                    {{"ns_per_sample", values[i]}});
+            }
+        }
+        else
+        {
+            printf ("%8d %12.1f %12.1f %12.1f %12.1f %12.1f %12.1f\n", period, old_median, median,
+                mean, sum, min, max);
+        }
+    }
+    return 0;
+}
@@ -0,0 +1,21 @@
+from setuptools import setup, find_packages
+
+setup(
+    name='brainflow_benchmark',
+    version='0.0.1',
+    description='Benchmarks for brainflow project',
+    url='https://github.com/brainflow-dev/brainflow',
+    author='Andrey Parfenov',
+    author_email='andrey@brainflow.org',
+    packages=find_packages(),
+    classifiers=[
+        'Development Status :: 2 - Pre-Alpha',
+        'Topic :: Utilities'
+    ],
+    install_requires=[
+        'brainflow',
+        'numpy'
+    ],
+    zip_safe=True,
+    python_requires='>=3.6'
+)
@@ -16,7 +16,9 @@ namespace brainflow
     {
         MEAN = 0,
         MEDIAN = 1,
-        EACH = 2
+        EACH = 2,
+        MIN = 3,
+        MAX = 4
     };
 
     public enum WindowOperations
@@ -1,7 +1,9 @@
+import argparse
 import logging
 import threading
 import time
-from random import randint
+
+import numpy
 
 
 def log_multilines(log_function, message):
@@ -15,15 +17,79 @@ class TestFailureError(Exception):
         self.exit_code = exit_code
 
 
+def parse_args(args, default_rate):
+    # options for emulator go before the command to test, everything after the command is passed as is
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rate', type=float, help='packages per second', required=False, default=default_rate)
+    parser.add_argument('cmd', nargs=argparse.REMAINDER, help='command to test')
+    parsed = parser.parse_args(args)
+    if parsed.rate <= 0:
+        parser.error('rate should be positive')
+    return parsed.rate, parsed.cmd
+
+
+class RateController(object):
+    """Tells how many packages are due to keep average rate, packages are sent in blocks
+    instead of sleeping after each package because sleep is too coarse for high rates"""
+
+    def __init__(self, rate, max_block_size=1024):
+        self.rate = rate
+        self.max_block_size = max_block_size
+        self.start_time = time.time()
+        self.num_sent = 0
+
+    def get_num_due(self):
+        elapsed = time.time() - self.start_time
+        return min(int(elapsed * self.rate) - self.num_sent, self.max_block_size)
+
+    def get_time_to_next(self, num_packages=1):
+        return max(0.0, (self.num_sent + num_packages) / float(self.rate) - (time.time() - self.start_time))
+
+    def wait_for_packages(self, min_packages=1):
+        num_due = self.get_num_due()
+        while num_due < min_packages:
+            time.sleep(self.get_time_to_next(min_packages))
+            num_due = self.get_num_due()
+        return num_due
+
+    def on_sent(self, num_packages):
+        self.num_sent = self.num_sent + num_packages
+
+
+class PackageGenerator(object):
+    """Builds blocks of packages from precomputed byte templates, payloads are taken from a pool
+    of random packages and only package counters are computed for each block"""
+
+    def __init__(self, template, package_num_pos, random_bytes=None, pool_size=1024):
+        template = numpy.asarray(template, dtype=numpy.uint8)
+        self.package_size = template.shape[0]
+        self.package_num_pos = package_num_pos
+        self.pool = numpy.tile(template, (pool_size, 1))
+        if random_bytes is not None:
+            self.pool[:, random_bytes] = numpy.random.randint(0, 256, self.pool[:, random_bytes].shape).astype(
+                numpy.uint8)
+        self.pool_pos = 0
+        self.package_num = 0
+
+    def get_block(self, num_packages):
+        offsets = numpy.arange(num_packages)
+        block = self.pool[(self.pool_pos + offsets) % self.pool.shape[0]]
+        block[:, self.package_num_pos] = (self.package_num + offsets) % 256
+        self.pool_pos = (self.pool_pos + num_packages) % self.pool.shape[0]
+        self.package_num = (self.package_num + num_packages) % 256
+        return block
+
+
 class Listener(threading.Thread):
 
-    def __init__(self, port, write, read):
+    def __init__(self, port, write, read, rate=250):
         # for windows write and read are methods from Serial object, for linux - os.read/write it doesnt work otherwise
         threading.Thread.__init__(self)
         self.port = port
         self.writer_process = None
         self.write = write
         self.read = read
+        self.rate = rate
 
     def run(self):
         while True:
@@ -37,7 +103,7 @@ class Listener(threading.Thread):
             elif res == b'?':
                 self.write(self.port, b'Imagine registers here')
             elif res == b'b':
-                self.writer_process = CytonWriter(self.port, 0.005, self.write)
+                self.writer_process = CytonWriter(self.port, self.rate, self.write)
                 self.writer_process.daemon = True
                 self.writer_process.start()
             elif res == b's':
@@ -52,28 +118,25 @@ class Listener(threading.Thread):
 
 class CytonWriter(threading.Thread):
 
-    def __init__(self, port, delay, write):
+    def __init__(self, port, rate, write):
         threading.Thread.__init__(self)
         self.port = port
         self.write = write
-        self.delay = delay
+        self.rate = rate
         self.package_size = 33
-        self.package_num = 0
         self.need_data = True
+        template = numpy.zeros(self.package_size, dtype=numpy.uint8)
+        template[0] = 0xA0
+        template[-1] = 0xC0
+        self.generator = PackageGenerator(template, 1, slice(2, self.package_size - 1))
+        self.stream_start_time = None
 
     def run(self):
+        rate_controller = RateController(self.rate)
+        # time when the first package is scheduled, used to measure latency
+        self.stream_start_time = rate_controller.start_time
         while self.need_data:
-            if self.package_num % 256 == 0:
-                self.package_num = 0
-
-            package = list()
-            package.append(0xA0)
-            package.append(self.package_num)
-            for i in range(2, self.package_size - 1):
-                package.append(randint(0, 255))
-            package.append(0xC0)
-            logging.debug('package is %s' % ' '.join([str(x) for x in package]))
-            self.write(self.port, bytes(package))
-
-            self.package_num = self.package_num + 1
-            time.sleep(self.delay)
+            num_packages = rate_controller.wait_for_packages()
+            block = self.generator.get_block(num_packages)
+            self.write(self.port, block.tobytes())
+            rate_controller.on_sent(num_packages)
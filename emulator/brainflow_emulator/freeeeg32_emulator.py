@@ -1,11 +1,14 @@
-import logging
 import threading
 import time
 
+import numpy
+
+from brainflow_emulator.emulate_common import PackageGenerator, RateController
+
 
 class Listener(threading.Thread):
 
-    def __init__(self, port, write, read):
+    def __init__(self, port, write, read, rate=512):
         # for windows write and read are methods from Serial object, for linux - os.read/write it doesnt work otherwise
         threading.Thread.__init__(self)
         self.port = port
@@ -13,9 +16,10 @@ class Listener(threading.Thread):
         self.write = write
         self.read = read
         self.need_stop = False
+        self.rate = rate
 
     def run(self):
-        self.writer_process = FreeEEG32Writer(self.port, 0.005, self.write)
+        self.writer_process = FreeEEG32Writer(self.port, self.rate, self.write)
         self.writer_process.daemon = True
         self.writer_process.start()
         time.sleep(10)
@@ -25,28 +29,22 @@ class Listener(threading.Thread):
 
 class FreeEEG32Writer(threading.Thread):
 
-    def __init__(self, port, delay, write):
+    def __init__(self, port, rate, write):
         threading.Thread.__init__(self)
         self.port = port
         self.write = write
-        self.delay = delay
+        self.rate = rate
         self.package_size = 106
-        self.package_num = 0
         self.need_data = True
+        template = numpy.arange(self.package_size, dtype=numpy.uint8)
+        template[0] = 0xA0
+        template[-1] = 0xC0
+        self.generator = PackageGenerator(template, 1)
 
     def run(self):
+        rate_controller = RateController(self.rate)
         while self.need_data:
-            if self.package_num % 256 == 0:
-                self.package_num = 0
-
-            package = list()
-            package.append(0xA0)
-            package.append(self.package_num)
-            for i in range(2, self.package_size - 1):
-                package.append(i)
-            package.append(0xC0)
-            logging.info(bytes(package))
-            self.write(self.port, bytes(package))
-
-            self.package_num = self.package_num + 1
-            time.sleep(self.delay)
+            num_packages = rate_controller.wait_for_packages()
+            block = self.generator.get_block(num_packages)
+            self.write(self.port, block.tobytes())
+            rate_controller.on_sent(num_packages)
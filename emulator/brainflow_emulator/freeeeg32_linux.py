@@ -4,7 +4,7 @@ import pty
 import subprocess
 import sys
 
-from brainflow_emulator.emulate_common import TestFailureError, log_multilines
+from brainflow_emulator.emulate_common import TestFailureError, log_multilines, parse_args
 from brainflow_emulator.freeeeg32_emulator import Listener
 
 
@@ -22,8 +22,8 @@ def get_ports_pty():
     return master, slave, s_name
 
 
-def test_serial(cmd_list, master, slave, s_name):
-    listen_thread = Listener(master, write, read)
+def test_serial(cmd_list, master, slave, s_name, rate):
+    listen_thread = Listener(master, write, read, rate)
     listen_thread.daemon = True
     listen_thread.start()
 
@@ -41,13 +41,14 @@ def test_serial(cmd_list, master, slave, s_name):
     return stdout, stderr
 
 
-def main(cmd_list):
+def main(cmd_list, rate=512):
     if not cmd_list:
         raise Exception('No command to execute')
     master, slave, s_name = get_ports_pty()
-    test_serial(cmd_list, master, slave, s_name)
+    test_serial(cmd_list, master, slave, s_name, rate)
 
 
 if __name__ == '__main__':
     logging.basicConfig(level=logging.INFO)
-    main(sys.argv[1:])
+    rate, cmd_list = parse_args(sys.argv[1:], 512)
+    main(cmd_list, rate)
@@ -5,7 +5,7 @@ import sys
 import time
 
 import pkg_resources
-from brainflow_emulator.emulate_common import TestFailureError, log_multilines
+from brainflow_emulator.emulate_common import TestFailureError, log_multilines, parse_args
 from brainflow_emulator.freeeeg32_emulator import Listener
 from serial import Serial
 
@@ -66,9 +66,9 @@ def get_ports_windows():
     return m_name, s_name
 
 
-def test_serial(cmd_list, m_name, s_name):
+def test_serial(cmd_list, m_name, s_name, rate):
     master = Serial('\\\\.\\%s' % m_name, timeout=0)
-    listen_thread = Listener(master, write, read)
+    listen_thread = Listener(master, write, read, rate)
     listen_thread.daemon = True
     listen_thread.start()
 
@@ -87,14 +87,15 @@ def test_serial(cmd_list, m_name, s_name):
     return stdout, stderr
 
 
-def main(cmd_list):
+def main(cmd_list, rate=512):
     if not cmd_list:
         raise Exception('No command to execute')
 
     m_name, s_name = get_ports_windows()
-    test_serial(cmd_list, m_name, s_name)
+    test_serial(cmd_list, m_name, s_name, rate)
 
 
 if __name__ == '__main__':
     logging.basicConfig(level=logging.INFO)
-    main(sys.argv[1:])
+    rate, cmd_list = parse_args(sys.argv[1:], 512)
+    main(cmd_list, rate)
@@ -1,6 +1,5 @@
 import enum
 import logging
-import random
 import socket
 import struct
 import subprocess
@@ -8,7 +7,10 @@ import sys
 import threading
 import time
 
-from brainflow_emulator.emulate_common import TestFailureError, log_multilines
+import numpy
+
+from brainflow_emulator.emulate_common import TestFailureError, log_multilines, parse_args, PackageGenerator, \
+    RateController
 
 
 class State(enum.Enum):
@@ -38,17 +40,17 @@ def test_socket(cmd_list):
     return stdout, stderr
 
 
-def run_socket_server():
-    novaxr_thread = GaleaEmulator()
+def run_socket_server(rate):
+    novaxr_thread = GaleaEmulator(rate)
     novaxr_thread.start()
     return novaxr_thread
 
 
 class GaleaEmulator(threading.Thread):
 
-    def __init__(self):
+    def __init__(self, rate=250, local_ip='127.0.0.1'):
         threading.Thread.__init__(self)
-        self.local_ip = '127.0.0.1'
+        self.local_ip = local_ip
         self.local_port = 2390
         self.server_socket = socket.socket(family=socket.AF_INET, type=socket.SOCK_DGRAM)
         self.server_socket.settimeout(
@@ -56,19 +58,34 @@ class GaleaEmulator(threading.Thread):
         self.server_socket.bind((self.local_ip, self.local_port))
         self.state = State.wait.value
         self.addr = None
-        self.package_num = 0
         self.package_size = 72
+        self.packages_per_transaction = 19
+        self.rate = rate
         self.keep_alive = True
+        self.stream_start_time = None
+        # last 8 bytes are timestamp, set for each block
+        self.generator = PackageGenerator(numpy.zeros(self.package_size, dtype=numpy.uint8), 0,
+                                          slice(1, self.package_size - 8))
 
     def run(self):
         start_time = time.time()
+        rate_controller = None
         while self.keep_alive:
+            if rate_controller is not None:
+                # dont wait in recv longer than time until the next transaction
+                self.server_socket.settimeout(
+                    max(0.0005, rate_controller.get_time_to_next(self.packages_per_transaction)))
             try:
                 msg, self.addr = self.server_socket.recvfrom(128)
                 if msg == Message.start_stream.value:
                     self.state = State.stream.value
+                    rate_controller = RateController(self.rate, self.packages_per_transaction * 64)
+                    self.generator.package_num = 0
+                    self.stream_start_time = rate_controller.start_time
                 elif msg == Message.stop_stream.value:
                     self.state = State.wait.value
+                    rate_controller = None
+                    self.server_socket.settimeout(0.1)
                 elif msg in Message.ack_values.value:
                     self.server_socket.sendto(Message.ack_from_device.value, self.addr)
                 elif msg == Message.time_calc_command.value:
@@ -85,27 +102,29 @@ class GaleaEmulator(threading.Thread):
                 break
 
             if self.state == State.stream.value:
-                package = list()
-                for _ in range(19):
-                    package.append(self.package_num)
-                    self.package_num = self.package_num + 1
-                    if self.package_num % 256 == 0:
-                        self.package_num = 0
-                    for i in range(1, self.package_size - 8):
-                        package.append(random.randint(0, 255))
-                    cur_time = time.time()
-                    timestamp = bytearray(struct.pack('d', (cur_time - start_time) * 1000))
-                    package.extend(timestamp)
+                num_transactions = rate_controller.get_num_due() // self.packages_per_transaction
+                if num_transactions < 1:
+                    continue
+                num_packages = num_transactions * self.packages_per_transaction
+                block = self.generator.get_block(num_packages)
+                # packages of the block are spaced by sampling period and the last one is now
+                cur_time = (time.time() - start_time) * 1000
+                timestamps = cur_time - numpy.arange(num_packages - 1, -1, -1) * 1000.0 / self.rate
+                block[:, self.package_size - 8:] = timestamps.astype(numpy.float64).view(numpy.uint8).reshape(
+                    num_packages, 8)
+                transactions = block.reshape(num_transactions, self.packages_per_transaction * self.package_size)
                 try:
-                    self.server_socket.sendto(bytes(package), self.addr)
+                    for transaction in transactions:
+                        self.server_socket.sendto(transaction.tobytes(), self.addr)
                 except socket.timeout:
                     logging.info('timeout for send')
+                rate_controller.on_sent(num_packages)
 
 
-def main(cmd_list):
+def main(cmd_list, rate=250):
     if not cmd_list:
         raise Exception('No command to execute')
-    server_thread = run_socket_server()
+    server_thread = run_socket_server(rate)
     test_socket(cmd_list)
     server_thread.keep_alive = False
     server_thread.join()
@@ -113,4 +132,5 @@ def main(cmd_list):
 
 if __name__ == '__main__':
     logging.basicConfig(format='%(asctime)s %(levelname)-8s %(message)s', level=logging.INFO)
-    main(sys.argv[1:])
\ No newline at end of file
+    rate, cmd_list = parse_args(sys.argv[1:], 250)
+    main(cmd_list, rate)
\ No newline at end of file
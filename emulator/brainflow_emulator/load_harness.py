@@ -0,0 +1,283 @@
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+
+import numpy
+from brainflow.board_shim import BoardShim, BrainFlowInputParams, BoardIds
+from brainflow_emulator.emulate_common import TestFailureError
+
+# all devices send packages with these rates by default
+NOMINAL_RATES = {
+    'cyton': 250,
+    'galea': 250,
+    'streaming': 250
+}
+STREAMING_BOARD_IP = '225.1.1.1'
+STREAMING_BOARD_FIRST_PORT = 6677
+
+
+def run_device(device_type, device_id, rate, conn, stop_event):
+    # runs in a separate process, sends connection params and time when the first package is scheduled to conn
+    get_start_time = None
+    cleanup = None
+    if device_type == 'cyton':
+        import pty
+        from brainflow_emulator.emulate_common import Listener
+        master, slave = pty.openpty()
+        listener = Listener(master, os.write, os.read, rate)
+        listener.daemon = True
+        listener.start()
+        conn.send({'serial_port': os.ttyname(slave)})
+
+        def get_start_time():
+            writer = listener.writer_process
+            return writer.stream_start_time if writer is not None else None
+    elif device_type == 'galea':
+        from brainflow_emulator.galea_udp import GaleaEmulator
+        # board uses fixed port, each device gets its own loopback address
+        emulator = GaleaEmulator(rate, '127.0.0.%d' % (device_id + 1))
+        emulator.daemon = True
+        emulator.start()
+        conn.send({'ip_address': emulator.local_ip})
+
+        def get_start_time():
+            return emulator.stream_start_time
+
+        def cleanup():
+            emulator.keep_alive = False
+    elif device_type == 'streaming':
+        # packages from synthetic board keep their timestamps, latency is computed from them
+        board = BoardShim(BoardIds.SYNTHETIC_BOARD.value, BrainFlowInputParams())
+        board.prepare_session()
+        if rate != NOMINAL_RATES['streaming']:
+            board.config_board('set_sampling_rate:%d' % rate)
+        port = STREAMING_BOARD_FIRST_PORT + device_id
+        board.add_streamer('streaming_board://%s:%d' % (STREAMING_BOARD_IP, port))
+        board.start_stream()
+        conn.send({'ip_address': STREAMING_BOARD_IP, 'ip_port': port})
+
+        def cleanup():
+            board.stop_stream()
+            board.release_session()
+    else:
+        raise ValueError('unsupported device type %s' % device_type)
+
+    start_time_sent = False
+    while not stop_event.wait(0.01):
+        if get_start_time is not None and not start_time_sent:
+            start_time = get_start_time()
+            if start_time is not None:
+                conn.send({'start_time': start_time})
+                start_time_sent = True
+    if cleanup is not None:
+        cleanup()
+
+
+class BoardStats(object):
+    """Counts lost packages using package counters and end-to-end latency, latency is the time between
+    scheduled send time of a package and the moment when it is returned by get_board_data"""
+
+    def __init__(self, name, board_id, rate, latency_from_timestamps):
+        self.name = name
+        self.rate = rate
+        self.latency_from_timestamps = latency_from_timestamps
+        self.package_num_channel = BoardShim.get_package_num_channel(board_id)
+        self.timestamp_channel = BoardShim.get_timestamp_channel(board_id)
+        self.start_time = None
+        self.last_package_num = None
+        self.last_seq = None
+        self.num_received = 0
+        self.num_lost = 0
+        self.latencies = list()
+
+    def add_data(self, data, poll_time):
+        if data.shape[1] == 0:
+            return
+        package_nums = data[self.package_num_channel].astype(numpy.int64)
+        if self.last_package_num is None:
+            # packages before the first received one are not counted, board may connect after device started
+            self.last_package_num = package_nums[0] - 1
+            self.last_seq = package_nums[0] - 1
+        steps = (numpy.diff(numpy.concatenate(([self.last_package_num], package_nums))) - 1) % 256 + 1
+        seq = self.last_seq + numpy.cumsum(steps)
+        self.num_received = self.num_received + data.shape[1]
+        self.num_lost = self.num_lost + int(numpy.sum(steps - 1))
+        self.last_package_num = package_nums[-1]
+        self.last_seq = seq[-1]
+        if self.latency_from_timestamps:
+            self.latencies.append(poll_time - data[self.timestamp_channel])
+        elif self.start_time is not None:
+            self.latencies.append(poll_time - (self.start_time + seq / float(self.rate)))
+
+    def get_results(self):
+        total = self.num_received + self.num_lost
+        result = {
+            'board': self.name,
+            'received': self.num_received,
+            'lost': self.num_lost,
+            'loss_percent': 100.0 * self.num_lost / total if total > 0 else 0.0,
+            'latency_p50_ms': None,
+            'latency_p99_ms': None
+        }
+        if self.latencies:
+            latencies = numpy.concatenate(self.latencies) * 1000
+            result['latency_p50_ms'] = float(numpy.percentile(latencies, 50))
+            result['latency_p99_ms'] = float(numpy.percentile(latencies, 99))
+        return result
+
+
+def read_host_cpu_times():
+    # returns idle and total jiffies from /proc/stat, None if not available
+    try:
+        with open('/proc/stat') as f:
+            values = [int(x) for x in f.readline().split()[1:]]
+        return values[3] + values[4], sum(values)
+    except (IOError, OSError, IndexError, ValueError):
+        return None
+
+
+def create_board(device_type, conn_params):
+    params = BrainFlowInputParams()
+    if device_type == 'cyton':
+        params.serial_port = conn_params['serial_port']
+        return BoardIds.CYTON_BOARD.value, params
+    if device_type == 'galea':
+        params.ip_address = conn_params['ip_address']
+        return BoardIds.GALEA_BOARD.value, params
+    params.ip_address = conn_params['ip_address']
+    params.ip_port = conn_params['ip_port']
+    params.master_board = BoardIds.SYNTHETIC_BOARD.value
+    return BoardIds.STREAMING_BOARD.value, params
+
+
+def run_step(device_types, rate, duration, poll_interval):
+    context = multiprocessing.get_context('spawn')
+    stop_event = context.Event()
+    devices = list()
+    for device_id, device_type in enumerate(device_types):
+        device_rate = rate if rate is not None else NOMINAL_RATES[device_type]
+        parent_conn, child_conn = context.Pipe()
+        process = context.Process(target=run_device,
+                                  args=(device_type, device_id, device_rate, child_conn, stop_event))
+        process.daemon = True
+        process.start()
+        devices.append((device_type, device_rate, process, parent_conn))
+
+    boards = list()
+    try:
+        for device_id, (device_type, device_rate, process, conn) in enumerate(devices):
+            if not conn.poll(30):
+                raise TestFailureError('device %s %d is not started' % (device_type, device_id), -1)
+            board_id, params = create_board(device_type, conn.recv())
+            board = BoardShim(board_id, params)
+            board.prepare_session()
+            name = '%s_%d' % (device_type, device_id)
+            # channels of streaming board are described by the board which sends data
+            descr_board_id = params.master_board if device_type == 'streaming' else board_id
+            stats = BoardStats(name, descr_board_id, device_rate, device_type == 'streaming')
+            boards.append((board, stats, conn))
+        for board, _, _ in boards:
+            board.start_stream(450000)
+
+        start_times = os.times()
+        start_cpu = read_host_cpu_times()
+        start = time.time()
+        while time.time() - start < duration:
+            time.sleep(poll_interval)
+            for board, stats, conn in boards:
+                while conn.poll():
+                    stats.start_time = conn.recv().get('start_time', stats.start_time)
+                data = board.get_board_data()
+                stats.add_data(data, time.time())
+        wall_time = time.time() - start
+        stop_times = os.times()
+        stop_cpu = read_host_cpu_times()
+    finally:
+        for board, _, _ in boards:
+            if board.is_prepared():
+                board.release_session()
+        stop_event.set()
+        for _, _, process, _ in devices:
+            process.join(10)
+
+    result = {
+        'num_devices': len(device_types),
+        'boards': [stats.get_results() for _, stats, _ in boards],
+        # cpu usage of this process includes all BoardShim sessions, 100 is one core
+        'acquisition_cpu_percent': 100.0 * ((stop_times[0] + stop_times[1]) -
+                                            (start_times[0] + start_times[1])) / wall_time,
+        'host_cpu_percent': None
+    }
+    if start_cpu is not None and stop_cpu is not None and stop_cpu[1] > start_cpu[1]:
+        busy = (stop_cpu[1] - start_cpu[1]) - (stop_cpu[0] - start_cpu[0])
+        result['host_cpu_percent'] = 100.0 * busy / (stop_cpu[1] - start_cpu[1])
+    return result
+
+
+def format_value(value, fmt):
+    return fmt % value if value is not None else '-'
+
+
+def print_result(result):
+    print('devices: %d, acquisition cpu: %.1f%%, host cpu: %s%%' % (
+        result['num_devices'], result['acquisition_cpu_percent'],
+        format_value(result['host_cpu_percent'], '%.1f')))
+    print('    %-16s %10s %8s %8s %12s %12s' % ('board', 'received', 'lost', 'loss %', 'p50 ms', 'p99 ms'))
+    for board in result['boards']:
+        print('    %-16s %10d %8d %8.2f %12s %12s' % (
+            board['board'], board['received'], board['lost'], board['loss_percent'],
+            format_value(board['latency_p50_ms'], '%.2f'), format_value(board['latency_p99_ms'], '%.2f')))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Starts N emulated devices of mixed types and N BoardShim sessions, reports packet loss, '
+                    'latency and cpu usage for each N')
+    parser.add_argument('--num-devices', type=str, help='comma separated numbers of devices', required=False,
+                        default='1,2,4,8')
+    parser.add_argument('--types', type=str, help='comma separated device types, used round robin',
+                        required=False, default='cyton,galea,streaming')
+    parser.add_argument('--rate', type=float, help='packages per second for each device, default is nominal rate',
+                        required=False, default=None)
+    parser.add_argument('--duration', type=float, help='seconds to stream for each N', required=False, default=10)
+    parser.add_argument('--poll-interval', type=float, help='seconds between get_board_data calls, latency includes it',
+                        required=False, default=0.01)
+    parser.add_argument('--max-loss', type=float, help='fail if loss for any board is higher, percents',
+                        required=False, default=None)
+    parser.add_argument('--output-file', type=str, help='file to save results as json', required=False, default='')
+    args = parser.parse_args()
+
+    types = args.types.split(',')
+    for device_type in types:
+        if device_type not in NOMINAL_RATES:
+            parser.error('unsupported device type %s, supported types: %s' % (
+                device_type, ','.join(sorted(NOMINAL_RATES.keys()))))
+    results = list()
+    for num_devices in [int(x) for x in args.num_devices.split(',')]:
+        device_types = [types[i % len(types)] for i in range(num_devices)]
+        result = run_step(device_types, args.rate, args.duration, args.poll_interval)
+        print_result(result)
+        results.append(result)
+
+    if args.output_file:
+        with open(args.output_file, 'w') as f:
+            json.dump(results, f, indent=4)
+    if args.max_loss is not None:
+        for result in results:
+            for board in result['boards']:
+                if board['loss_percent'] > args.max_loss:
+                    raise TestFailureError('loss for %s with %d devices is %.2f%%' % (
+                        board['board'], result['num_devices'], board['loss_percent']), -1)
+
+
+if __name__ == '__main__':
+    logging.basicConfig(format='%(asctime)s %(levelname)-8s %(message)s', level=logging.INFO)
+    try:
+        main()
+    except TestFailureError as e:
+        logging.error(str(e))
+        sys.exit(1)
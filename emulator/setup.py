@@ -15,7 +15,8 @@ setup(
         'Topic :: Utilities'
     ],
     install_requires=[
-        'pyserial'
+        'pyserial',
+        'numpy'
     ],
     package_data={
         'brainflow_emulator': [
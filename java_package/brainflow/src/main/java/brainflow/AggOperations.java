@@ -11,7 +11,9 @@ public enum AggOperations
 
     MEAN (0),
     MEDIAN (1),
-    EACH (2);
+    EACH (2),
+    MIN (3),
+    MAX (4);
 
     private final int agg_operation;
     private static final Map<Integer, AggOperations> ao_map = new HashMap<Integer, AggOperations> ();
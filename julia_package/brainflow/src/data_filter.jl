@@ -3,6 +3,8 @@
     MEAN = 0
     MEDIAN = 1
     EACH = 2
+    MIN = 3
+    MAX = 4
 
 end
 
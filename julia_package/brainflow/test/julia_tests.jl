@@ -32,6 +32,8 @@ end
     @test Int32(BrainFlow.MEAN) == 0
     @test Int32(BrainFlow.MEDIAN) == 1
     @test Int32(BrainFlow.EACH) == 2
+    @test Int32(BrainFlow.MIN) == 3
+    @test Int32(BrainFlow.MAX) == 4
 
     @test Int32(BrainFlow.BUTTERWORTH) == 0
     @test Int32(BrainFlow.CHEBYSHEV_TYPE_1) == 1
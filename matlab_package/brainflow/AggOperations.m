@@ -4,5 +4,7 @@ classdef AggOperations < int32
         MEAN(0)
         MEDIAN(1)
         EACH(2)
+        MIN(3)
+        MAX(4)
     end
 end
\ No newline at end of file
@@ -105,6 +105,8 @@ export enum AggOperations {
     MEAN = 0,
     MEDIAN = 1,
     EACH = 2,
+    MIN = 3,
+    MAX = 4,
 }
 
 export enum WindowOperations {
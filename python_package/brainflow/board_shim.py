@@ -1,10 +1,12 @@
+import asyncio
 import ctypes
 import enum
 import json
 import os
 import platform
 import struct
-from typing import List
+import threading
+from typing import Callable, List
 
 import numpy
 import pkg_resources
@@ -92,6 +94,30 @@ class BrainFlowPresets(enum.IntEnum):
     ANCILLARY_PRESET = 2  #:
 
 
+class BufferTypes(enum.IntEnum):
+    """Enum to store ring buffer implementations"""
+
+    SPIN_LOCK_BUFFER = 0  #:
+    LOCK_FREE_BUFFER = 1  #:
+
+
+class StreamerOverflowPolicies(enum.IntEnum):
+    """Enum to store behavior of streamer queue if streamers can not keep up with the board, BLOCK waits for
+    streamers in the board thread not longer than streamer_block_timeout_ms and drops packages after that"""
+
+    BLOCK = 0  #:
+    DROP_OLDEST = 1  #:
+    DROP_NEWEST = 2  #:
+
+
+class BufferOverflowPolicies(enum.IntEnum):
+    """Enum to store behavior of ring buffer if it is full"""
+
+    OVERWRITE_OLDEST = 0  #:
+    DROP_NEWEST = 1  #:
+    GROW = 2  #:
+
+
 class BrainFlowInputParams(object):
     """ inputs parameters for prepare_session method
 
@@ -148,6 +174,50 @@ class BrainFlowInputParams(object):
                           sort_keys=True, indent=4)
 
 
+class BrainFlowBufferParams(object):
+    """ ring buffer parameters, applied by start_stream method
+
+    :param buffer_type: ring buffer implementation from BufferTypes enum, lock free buffer never blocks the board thread on reads and markers, only adding or removing callbacks, data ready fds and streamers synchronizes with it. Use it for high sampling rates and multiple readers
+    :type buffer_type: int
+    :param streamer_queue_size: max number of packages waiting for streamers, applied when the first streamer of the session is added
+    :type streamer_queue_size: int
+    :param streamer_overflow_policy: value from StreamerOverflowPolicies enum, BLOCK delays the board thread until streamers catch up but not longer than streamer_block_timeout_ms, after that packages are dropped and counted. DROP_OLDEST and DROP_NEWEST never block it and count dropped packages
+    :type streamer_overflow_policy: int
+    :param streamer_block_timeout_ms: max time in milliseconds to wait for streamers with BLOCK policy
+    :type streamer_block_timeout_ms: int
+    :param collect_stats: collect per preset counters and latency histograms, returned by get_stats method
+    :type collect_stats: bool
+    :param buffer_overflow_policy: value from BufferOverflowPolicies enum, OVERWRITE_OLDEST replaces the oldest package, DROP_NEWEST keeps buffer unchanged until data is removed, GROW doubles capacity up to max_buffer_size and overwrites the oldest package after that. GROW is not supported by lock free buffer
+    :type buffer_overflow_policy: int
+    :param max_buffer_size: max capacity of ring buffer for GROW policy, 0 means max allowed size
+    :type max_buffer_size: int
+    :param lazy_allocation: allocate ring buffer in chunks when data arrives instead of allocating num_samples packages in start_stream
+    :type lazy_allocation: bool
+    :param float32_exg: store EXG rows as float32 to save memory, values are converted to float64 on retrieval
+    :type float32_exg: bool
+    """
+
+    def __init__(self) -> None:
+        self.buffer_type = BufferTypes.SPIN_LOCK_BUFFER.value
+        self.streamer_queue_size = 16384
+        self.streamer_overflow_policy = StreamerOverflowPolicies.BLOCK.value
+        self.streamer_block_timeout_ms = 1000
+        self.collect_stats = False
+        self.buffer_overflow_policy = BufferOverflowPolicies.OVERWRITE_OLDEST.value
+        self.max_buffer_size = 0
+        self.lazy_allocation = False
+        self.float32_exg = False
+
+    def to_json(self) -> None:
+        return json.dumps(self, default=lambda o: o.__dict__,
+                          sort_keys=True, indent=4)
+
+
+# data, num_rows, num_samples, user_data
+DataCallbackType = ctypes.CFUNCTYPE(None, ctypes.POINTER(ctypes.c_double), ctypes.c_int, ctypes.c_int,
+                                    ctypes.c_void_p)
+
+
 class BoardControllerDLL(object):
     __instance = None
 
@@ -257,6 +327,30 @@ class BoardControllerDLL(object):
             ctypes.c_char_p
         ]
 
+        self.get_board_data_into = self.lib.get_board_data_into
+        self.get_board_data_into.restype = ctypes.c_int
+        self.get_board_data_into.argtypes = [
+            ctypes.c_int,
+            ctypes.c_int,
+            ndpointer(ctypes.c_double, flags='C_CONTIGUOUS'),
+            ctypes.c_int,
+            ndpointer(ctypes.c_int32),
+            ctypes.c_int,
+            ctypes.c_char_p
+        ]
+
+        self.get_current_board_data_into = self.lib.get_current_board_data_into
+        self.get_current_board_data_into.restype = ctypes.c_int
+        self.get_current_board_data_into.argtypes = [
+            ctypes.c_int,
+            ctypes.c_int,
+            ndpointer(ctypes.c_double, flags='C_CONTIGUOUS'),
+            ctypes.c_int,
+            ndpointer(ctypes.c_int32),
+            ctypes.c_int,
+            ctypes.c_char_p
+        ]
+
         self.release_session = self.lib.release_session
         self.release_session.restype = ctypes.c_int
         self.release_session.argtypes = [
@@ -264,10 +358,37 @@ class BoardControllerDLL(object):
             ctypes.c_char_p
         ]
 
+        self.set_buffer_params = self.lib.set_buffer_params
+        self.set_buffer_params.restype = ctypes.c_int
+        self.set_buffer_params.argtypes = [
+            ctypes.c_char_p,
+            ctypes.c_int,
+            ctypes.c_char_p
+        ]
+
         self.release_all_sessions = self.lib.release_all_sessions
         self.release_all_sessions.restype = ctypes.c_int
         self.release_all_sessions.argtypes = []
 
+        self.register_data_callback = self.lib.register_data_callback
+        self.register_data_callback.restype = ctypes.c_int
+        self.register_data_callback.argtypes = [
+            DataCallbackType,
+            ctypes.c_void_p,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_char_p
+        ]
+
+        self.unregister_data_callback = self.lib.unregister_data_callback
+        self.unregister_data_callback.restype = ctypes.c_int
+        self.unregister_data_callback.argtypes = [
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_char_p
+        ]
+
         self.insert_marker = self.lib.insert_marker
         self.insert_marker.restype = ctypes.c_int
         self.insert_marker.argtypes = [
@@ -286,6 +407,162 @@ class BoardControllerDLL(object):
             ctypes.c_char_p
         ]
 
+        self.get_session_handle = self.lib.get_session_handle
+        self.get_session_handle.restype = ctypes.c_int
+        self.get_session_handle.argtypes = [
+            ndpointer(ctypes.c_int32),
+            ctypes.c_int,
+            ctypes.c_char_p
+        ]
+
+        self.get_current_board_data_by_handle = self.lib.get_current_board_data_by_handle
+        self.get_current_board_data_by_handle.restype = ctypes.c_int
+        self.get_current_board_data_by_handle.argtypes = [
+            ctypes.c_int,
+            ctypes.c_int,
+            ndpointer(ctypes.c_double),
+            ndpointer(ctypes.c_int32),
+            ctypes.c_int
+        ]
+
+        self.get_board_data_count_by_handle = self.lib.get_board_data_count_by_handle
+        self.get_board_data_count_by_handle.restype = ctypes.c_int
+        self.get_board_data_count_by_handle.argtypes = [
+            ctypes.c_int,
+            ndpointer(ctypes.c_int32),
+            ctypes.c_int
+        ]
+
+        self.get_board_data_by_handle = self.lib.get_board_data_by_handle
+        self.get_board_data_by_handle.restype = ctypes.c_int
+        self.get_board_data_by_handle.argtypes = [
+            ctypes.c_int,
+            ctypes.c_int,
+            ndpointer(ctypes.c_double),
+            ctypes.c_int
+        ]
+
+        self.get_board_data_into_by_handle = self.lib.get_board_data_into_by_handle
+        self.get_board_data_into_by_handle.restype = ctypes.c_int
+        self.get_board_data_into_by_handle.argtypes = [
+            ctypes.c_int,
+            ctypes.c_int,
+            ndpointer(ctypes.c_double, flags='C_CONTIGUOUS'),
+            ctypes.c_int,
+            ndpointer(ctypes.c_int32),
+            ndpointer(ctypes.c_int32),
+            ctypes.c_int
+        ]
+
+        self.get_current_board_data_into_by_handle = self.lib.get_current_board_data_into_by_handle
+        self.get_current_board_data_into_by_handle.restype = ctypes.c_int
+        self.get_current_board_data_into_by_handle.argtypes = [
+            ctypes.c_int,
+            ctypes.c_int,
+            ndpointer(ctypes.c_double, flags='C_CONTIGUOUS'),
+            ctypes.c_int,
+            ndpointer(ctypes.c_int32),
+            ctypes.c_int
+        ]
+
+        self.insert_marker_by_handle = self.lib.insert_marker_by_handle
+        self.insert_marker_by_handle.restype = ctypes.c_int
+        self.insert_marker_by_handle.argtypes = [
+            ctypes.c_double,
+            ctypes.c_int,
+            ctypes.c_int
+        ]
+
+        self.wait_for_data_by_handle = self.lib.wait_for_data_by_handle
+        self.wait_for_data_by_handle.restype = ctypes.c_int
+        self.wait_for_data_by_handle.argtypes = [
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ndpointer(ctypes.c_int32),
+            ctypes.c_int
+        ]
+
+        self.register_data_ready_fd_by_handle = self.lib.register_data_ready_fd_by_handle
+        self.register_data_ready_fd_by_handle.restype = ctypes.c_int
+        self.register_data_ready_fd_by_handle.argtypes = [
+            ctypes.c_int,
+            ctypes.c_int,
+            ndpointer(ctypes.c_int32),
+            ctypes.c_int
+        ]
+
+        self.unregister_data_ready_fd_by_handle = self.lib.unregister_data_ready_fd_by_handle
+        self.unregister_data_ready_fd_by_handle.restype = ctypes.c_int
+        self.unregister_data_ready_fd_by_handle.argtypes = [
+            ctypes.c_int,
+            ctypes.c_int
+        ]
+
+        self.create_buffer_reader_by_handle = self.lib.create_buffer_reader_by_handle
+        self.create_buffer_reader_by_handle.restype = ctypes.c_int
+        self.create_buffer_reader_by_handle.argtypes = [
+            ctypes.c_int,
+            ndpointer(ctypes.c_int32),
+            ctypes.c_int
+        ]
+
+        self.delete_buffer_reader_by_handle = self.lib.delete_buffer_reader_by_handle
+        self.delete_buffer_reader_by_handle.restype = ctypes.c_int
+        self.delete_buffer_reader_by_handle.argtypes = [
+            ctypes.c_int,
+            ctypes.c_int
+        ]
+
+        self.get_buffer_reader_data_by_handle = self.lib.get_buffer_reader_data_by_handle
+        self.get_buffer_reader_data_by_handle.restype = ctypes.c_int
+        self.get_buffer_reader_data_by_handle.argtypes = [
+            ctypes.c_int,
+            ctypes.c_int,
+            ndpointer(ctypes.c_double, flags='C_CONTIGUOUS'),
+            ctypes.c_int,
+            ndpointer(ctypes.c_int32),
+            ndpointer(ctypes.c_int32),
+            ctypes.c_int
+        ]
+
+        self.get_buffer_reader_data_count_by_handle = self.lib.get_buffer_reader_data_count_by_handle
+        self.get_buffer_reader_data_count_by_handle.restype = ctypes.c_int
+        self.get_buffer_reader_data_count_by_handle.argtypes = [
+            ctypes.c_int,
+            ndpointer(ctypes.c_int32),
+            ctypes.c_int
+        ]
+
+        self.get_streamer_stats_by_handle = self.lib.get_streamer_stats_by_handle
+        self.get_streamer_stats_by_handle.restype = ctypes.c_int
+        self.get_streamer_stats_by_handle.argtypes = [
+            ndpointer(ctypes.c_int64),
+            ndpointer(ctypes.c_int64),
+            ndpointer(ctypes.c_int32),
+            ctypes.c_int
+        ]
+
+        self.get_board_descr_by_handle = self.lib.get_board_descr_by_handle
+        self.get_board_descr_by_handle.restype = ctypes.c_int
+        self.get_board_descr_by_handle.argtypes = [
+            ctypes.c_int,
+            ndpointer(ctypes.c_ubyte),
+            ctypes.c_int,
+            ndpointer(ctypes.c_int32),
+            ctypes.c_int
+        ]
+
+        self.get_board_stats_by_handle = self.lib.get_board_stats_by_handle
+        self.get_board_stats_by_handle.restype = ctypes.c_int
+        self.get_board_stats_by_handle.argtypes = [
+            ctypes.c_int,
+            ndpointer(ctypes.c_ubyte),
+            ctypes.c_int,
+            ndpointer(ctypes.c_int32),
+            ctypes.c_int
+        ]
+
         self.set_log_level_board_controller = self.lib.set_log_level_board_controller
         self.set_log_level_board_controller.restype = ctypes.c_int
         self.set_log_level_board_controller.argtypes = [
@@ -551,6 +828,93 @@ class BoardControllerDLL(object):
         ]
 
 
+class BufferReader(object):
+    """Independent cursor over the ring buffer, use BoardShim.create_reader to create it.
+    Each reader gets only packages it has not seen yet and doesnt remove them for other readers and for
+    BoardShim.get_board_data. If reader is too slow older packages are overwritten, their number is stored in
+    missed_samples
+
+    :param board_shim: board
+    :type board_shim: BoardShim
+    :param preset: preset
+    :type preset: int
+    :param reader_id: id of native reader
+    :type reader_id: int
+    """
+
+    def __init__(self, board_shim, preset: int, reader_id: int) -> None:
+        self.board_shim = board_shim
+        self.preset = preset
+        self.reader_id = reader_id
+        self.missed_samples = 0
+
+    def get_data_count(self) -> int:
+        """Get number of packages which were not read by this reader yet
+
+        :return: number of new packages
+        :rtype: int
+        """
+
+        data_size = numpy.zeros(1).astype(numpy.int32)
+
+        res = BoardControllerDLL.get_instance().get_buffer_reader_data_count_by_handle(
+            self.reader_id, data_size, self.board_shim.get_session_handle())
+        if res != BrainFlowExitCodes.STATUS_OK.value:
+            raise BrainFlowError('unable to obtain buffer size', res)
+        return int(data_size[0])
+
+    def get_data(self, num_samples: int = None,
+                 out: NDArray[Shape["*, *"], Float64] = None) -> NDArray[Shape["*, *"], Float64]:
+        """Get packages which were not read by this reader yet, they stay in ring buffer for others
+
+        :param num_samples: max number of packages to get, all new packages if None
+        :type num_samples: int
+        :param out: optional preallocated C-contiguous float64 array with shape (num_rows, n), at most n packages are written directly into it
+        :type out: NDArray[Shape["*, *"], Float64]
+        :return: array with shape (num_rows, returned_samples), if out is provided its a view of out
+        :rtype: NDArray[Shape["*, *"], Float64]
+        """
+
+        if num_samples is not None and num_samples < 1:
+            raise BrainFlowError('invalid num_samples', BrainFlowExitCodes.INVALID_ARGUMENTS_ERROR.value)
+
+        if out is not None:
+            self.board_shim._check_out_array(out, self.preset)
+            max_samples = out.shape[1] if num_samples is None else min(num_samples, out.shape[1])
+        else:
+            max_samples = self.get_data_count()
+            if num_samples is not None:
+                max_samples = min(max_samples, num_samples)
+            out = numpy.zeros((self.board_shim._get_num_rows(self.preset), max(max_samples, 1)),
+                              dtype=numpy.float64)
+        current_size = numpy.zeros(1).astype(numpy.int32)
+        missed = numpy.zeros(1).astype(numpy.int32)
+        res = BoardControllerDLL.get_instance().get_buffer_reader_data_by_handle(
+            self.reader_id, max_samples, out, out.shape[1], current_size, missed,
+            self.board_shim.get_session_handle())
+        if res != BrainFlowExitCodes.STATUS_OK.value:
+            raise BrainFlowError('unable to get data for buffer reader', res)
+        self.missed_samples += int(missed[0])
+        return out[:, 0:current_size[0]]
+
+    def close(self) -> None:
+        """Delete native reader"""
+
+        if self.reader_id is None:
+            return
+        res = BoardControllerDLL.get_instance().delete_buffer_reader_by_handle(self.reader_id,
+                                                                               self.board_shim.get_session_handle())
+        self.reader_id = None
+        if res != BrainFlowExitCodes.STATUS_OK.value:
+            raise BrainFlowError('unable to delete buffer reader', res)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
 class BoardShim(object):
     """BoardShim class is a primary interface to all boards
 
@@ -575,6 +939,12 @@ class BoardShim(object):
                                      BrainFlowExitCodes.INVALID_ARGUMENTS_ERROR.value)
         else:
             self._master_board_id = self.board_id
+        # data path methods use session handle to skip json parsing and global lock
+        self._session_handle = None
+        self._num_rows = dict()
+        # ctypes callbacks must stay alive while native code can call them
+        self._data_callbacks = dict()
+        self._callback_thread = threading.local()
 
     @classmethod
     def set_log_level(cls, log_level: int) -> None:
@@ -1182,19 +1552,69 @@ class BoardShim(object):
         if res != BrainFlowExitCodes.STATUS_OK.value:
             raise BrainFlowError('unable to release sessions', res)
 
-    def prepare_session(self) -> None:
-        """prepare streaming sesssion, init resources, you need to call it before any other BoardShim object methods"""
+    def prepare_session(self) -> int:
+        """prepare streaming sesssion, init resources, you need to call it before any other BoardShim object methods
+
+        :return: session handle
+        :rtype: int
+        """
 
         res = BoardControllerDLL.get_instance().prepare_session(self.board_id, self.input_json)
         if res != BrainFlowExitCodes.STATUS_OK.value:
             raise BrainFlowError('unable to prepare streaming session', res)
+        self._session_handle = None
+        self._num_rows = dict()
+        return self.get_session_handle()
+
+    def get_session_handle(self) -> int:
+        """Get handle of prepared session, handles are never reused within a process
+
+        :return: session handle
+        :rtype: int
+        """
+
+        if self._session_handle is None:
+            session_handle = numpy.zeros(1).astype(numpy.int32)
+            res = BoardControllerDLL.get_instance().get_session_handle(session_handle, self.board_id,
+                                                                       self.input_json)
+            if res != BrainFlowExitCodes.STATUS_OK.value:
+                raise BrainFlowError('unable to get session handle', res)
+            self._session_handle = int(session_handle[0])
+        return self._session_handle
+
+    def _get_num_rows(self, preset: int) -> int:
+        if preset not in self._num_rows:
+            # configurable boards like synthetic board may have more rows than the default description
+            try:
+                self._num_rows[preset] = self.get_session_board_descr(preset)['num_rows']
+            except BrainFlowError:
+                self._num_rows[preset] = BoardShim.get_num_rows(self._master_board_id, preset)
+        return self._num_rows[preset]
+
+    def get_session_board_descr(self, preset: int = BrainFlowPresets.DEFAULT_PRESET):
+        """get description of prepared session, for configurable boards like synthetic board it reflects settings
+        from other_info and config_board and can be different from get_board_descr(board_id)
+
+        :param preset: preset
+        :type preset: int
+        :return: info about board
+        :rtype: json
+        """
+
+        string = numpy.zeros(65536).astype(numpy.ubyte)
+        string_len = numpy.zeros(1).astype(numpy.int32)
+        res = BoardControllerDLL.get_instance().get_board_descr_by_handle(preset, string, string.shape[0],
+                                                                          string_len, self.get_session_handle())
+        if res != BrainFlowExitCodes.STATUS_OK.value:
+            raise BrainFlowError('unable to request info about this session', res)
+        return json.loads(string.tobytes().decode('utf-8')[0:string_len[0]])
 
     def add_streamer(self, streamer_params: str, preset: int = BrainFlowPresets.DEFAULT_PRESET) -> None:
         """Add streamer
 
         :param preset: preset
         :type preset: int
-        :param streamer_params parameter to stream data from brainflow, supported vals: "file://%file_name%:w", "file://%file_name%:a", "streaming_board://%multicast_group_ip%:%port%". Range for multicast addresses is from "224.0.0.0" to "239.255.255.255"
+        :param streamer_params parameter to stream data from brainflow, supported vals: "file://%file_name%:w", "file://%file_name%:a", "bfbin://%file_name%:w", "bfbin://%file_name%:a", "streaming_board://%multicast_group_ip%:%port%". Range for multicast addresses is from "224.0.0.0" to "239.255.255.255"
         :type streamer_params: str
         """
 
@@ -1215,7 +1635,7 @@ class BoardShim(object):
 
         :param preset: preset
         :type preset: int
-        :param streamer_params parameter to stream data from brainflow, supported vals: "file://%file_name%:w", "file://%file_name%:a", "streaming_board://%multicast_group_ip%:%port%". Range for multicast addresses is from "224.0.0.0" to "239.255.255.255"
+        :param streamer_params parameter to stream data from brainflow, supported vals: "file://%file_name%:w", "file://%file_name%:a", "bfbin://%file_name%:w", "bfbin://%file_name%:a", "streaming_board://%multicast_group_ip%:%port%". Range for multicast addresses is from "224.0.0.0" to "239.255.255.255"
         :type streamer_params: str
         """
 
@@ -1231,13 +1651,52 @@ class BoardShim(object):
         if res != BrainFlowExitCodes.STATUS_OK.value:
             raise BrainFlowError('unable to delete streamer', res)
 
-    def start_stream(self, num_samples: int = 1800 * 250, streamer_params: str = None) -> None:
+    def get_streamer_stats(self) -> dict:
+        """Get counters of the queue which feeds streamers from a separate writer thread
+
+        :return: dict with total queued and dropped packages and number of packages pending write
+        :rtype: dict
+        """
+
+        queued = numpy.zeros(1).astype(numpy.int64)
+        dropped = numpy.zeros(1).astype(numpy.int64)
+        pending = numpy.zeros(1).astype(numpy.int32)
+
+        res = BoardControllerDLL.get_instance().get_streamer_stats_by_handle(queued, dropped, pending,
+                                                                             self.get_session_handle())
+        if res != BrainFlowExitCodes.STATUS_OK.value:
+            raise BrainFlowError('unable to get streamer stats', res)
+        return {'queued': int(queued[0]), 'dropped': int(dropped[0]), 'pending': int(pending[0])}
+
+    def get_stats(self, preset: int = BrainFlowPresets.DEFAULT_PRESET) -> dict:
+        """Get counters and latency histograms of a preset, enable them with collect_stats field of BrainFlowBufferParams.
+        Latencies are computed from the timestamp channel, push latency is the time from package timestamp to ring buffer
+        and retrieval latency is the time from package timestamp to get_board_data call
+
+        :param preset: preset
+        :type preset: int
+        :return: dict with counters, histograms and streamer queue depth
+        :rtype: dict
+        """
+
+        string = numpy.zeros(65536).astype(numpy.ubyte)
+        string_len = numpy.zeros(1).astype(numpy.int32)
+        res = BoardControllerDLL.get_instance().get_board_stats_by_handle(preset, string, string.shape[0],
+                                                                          string_len, self.get_session_handle())
+        if res != BrainFlowExitCodes.STATUS_OK.value:
+            raise BrainFlowError('unable to get stats', res)
+        return json.loads(string.tobytes().decode('utf-8')[0:string_len[0]])
+
+    def start_stream(self, num_samples: int = 1800 * 250, streamer_params: str = None,
+                     buffer_params: BrainFlowBufferParams = None) -> None:
         """Start streaming data, this methods stores data in ringbuffer
 
         :param num_samples: size of ring buffer to keep data
         :type num_samples: int
-        :param streamer_params parameter to stream data from brainflow, supported vals: "file://%file_name%:w", "file://%file_name%:a", "streaming_board://%multicast_group_ip%:%port%". Range for multicast addresses is from "224.0.0.0" to "239.255.255.255"
+        :param streamer_params parameter to stream data from brainflow, supported vals: "file://%file_name%:w", "file://%file_name%:a", "bfbin://%file_name%:w", "bfbin://%file_name%:a", "streaming_board://%multicast_group_ip%:%port%". Range for multicast addresses is from "224.0.0.0" to "239.255.255.255"
         :type streamer_params: str
+        :param buffer_params: ring buffer parameters, if None parameters from previous set_buffer_params call are used
+        :type buffer_params: BrainFlowBufferParams
         """
 
         if streamer_params is None:
@@ -1248,10 +1707,29 @@ class BoardShim(object):
             except BaseException:
                 streamer = streamer_params
 
+        if buffer_params is not None:
+            self.set_buffer_params(buffer_params)
+
         res = BoardControllerDLL.get_instance().start_stream(num_samples, streamer, self.board_id, self.input_json)
         if res != BrainFlowExitCodes.STATUS_OK.value:
             raise BrainFlowError('unable to start streaming session', res)
 
+    def set_buffer_params(self, buffer_params: BrainFlowBufferParams) -> None:
+        """Set ring buffer parameters for this session, they are applied by the next start_stream call
+
+        :param buffer_params: ring buffer parameters
+        :type buffer_params: BrainFlowBufferParams
+        """
+
+        try:
+            buffer_json = buffer_params.to_json().encode()
+        except BaseException:
+            buffer_json = buffer_params.to_json()
+
+        res = BoardControllerDLL.get_instance().set_buffer_params(buffer_json, self.board_id, self.input_json)
+        if res != BrainFlowExitCodes.STATUS_OK.value:
+            raise BrainFlowError('unable to set buffer params', res)
+
     def stop_stream(self) -> None:
         """Stop streaming data"""
 
@@ -1262,27 +1740,45 @@ class BoardShim(object):
     def release_session(self) -> None:
         """release all resources"""
 
+        self._check_not_in_data_callback()
         res = BoardControllerDLL.get_instance().release_session(self.board_id, self.input_json)
+        self._session_handle = None
+        self._num_rows = dict()
+        self._data_callbacks.clear()
         if res != BrainFlowExitCodes.STATUS_OK.value:
             raise BrainFlowError('unable to release streaming session', res)
 
-    def get_current_board_data(self, num_samples: int, preset: int = BrainFlowPresets.DEFAULT_PRESET) -> NDArray[Shape["*, *"], Float64]:
+    def get_current_board_data(self, num_samples: int, preset: int = BrainFlowPresets.DEFAULT_PRESET,
+                               out: NDArray[Shape["*, *"], Float64] = None) -> NDArray[Shape["*, *"], Float64]:
         """Get specified amount of data or less if there is not enough data, doesnt remove data from ringbuffer
 
         :param num_samples: max number of samples
         :type num_samples: int
         :param preset: preset
         :type preset: int
-        :return: latest data from a board
+        :param out: optional preallocated C-contiguous float64 array with shape (num_rows, n), at most min(num_samples, n) latest packages are written directly into it
+        :type out: NDArray[Shape["*, *"], Float64]
+        :return: latest data from a board, if out is provided its a view of out with shape (num_rows, returned_samples)
         :rtype: NDArray[Shape["*, *"], Float64]
         """
 
-        package_length = BoardShim.get_num_rows(self._master_board_id, preset)
-        data_arr = numpy.zeros(int(num_samples * package_length)).astype(numpy.float64)
+        if out is not None:
+            self._check_out_array(out, preset)
+            current_size = numpy.zeros(1).astype(numpy.int32)
+            res = BoardControllerDLL.get_instance().get_current_board_data_into_by_handle(
+                min(num_samples, out.shape[1]), preset, out, out.shape[1], current_size,
+                self.get_session_handle())
+            if res != BrainFlowExitCodes.STATUS_OK.value:
+                raise BrainFlowError('unable to get current data', res)
+            return out[:, 0:current_size[0]]
+
+        package_length = self._get_num_rows(preset)
+        data_arr = numpy.zeros(int(num_samples * package_length), dtype=numpy.float64)
         current_size = numpy.zeros(1).astype(numpy.int32)
 
-        res = BoardControllerDLL.get_instance().get_current_board_data(num_samples, preset, data_arr, current_size,
-                                                                       self.board_id, self.input_json)
+        res = BoardControllerDLL.get_instance().get_current_board_data_by_handle(num_samples, preset, data_arr,
+                                                                                 current_size,
+                                                                                 self.get_session_handle())
         if res != BrainFlowExitCodes.STATUS_OK.value:
             raise BrainFlowError('unable to get current data', res)
 
@@ -1303,11 +1799,140 @@ class BoardShim(object):
 
         data_size = numpy.zeros(1).astype(numpy.int32)
 
-        res = BoardControllerDLL.get_instance().get_board_data_count(preset, data_size, self.board_id, self.input_json)
+        res = BoardControllerDLL.get_instance().get_board_data_count_by_handle(preset, data_size,
+                                                                               self.get_session_handle())
         if res != BrainFlowExitCodes.STATUS_OK.value:
             raise BrainFlowError('unable to obtain buffer size', res)
         return data_size[0]
 
+    def wait_for_data(self, num_samples: int, timeout_ms: int,
+                      preset: int = BrainFlowPresets.DEFAULT_PRESET) -> bool:
+        """Block until ring buffer has at least num_samples packages, GIL is released during the wait so other python
+        threads keep running. Use it instead of polling get_board_data_count in a loop with sleep
+
+        :param num_samples: required number of packages, should not exceed buffer size
+        :type num_samples: int
+        :param timeout_ms: max time to wait in milliseconds
+        :type timeout_ms: int
+        :param preset: preset
+        :type preset: int
+        :return: True if data is available, False on timeout or if session was released or stream was restarted
+        :rtype: bool
+        """
+
+        data_size = numpy.zeros(1).astype(numpy.int32)
+
+        res = BoardControllerDLL.get_instance().wait_for_data_by_handle(num_samples, timeout_ms, preset, data_size,
+                                                                        self.get_session_handle())
+        if res != BrainFlowExitCodes.STATUS_OK.value:
+            raise BrainFlowError('unable to wait for data', res)
+        return bool(data_size[0] >= num_samples)
+
+    def create_reader(self, preset: int = BrainFlowPresets.DEFAULT_PRESET) -> BufferReader:
+        """Create independent cursor over the ring buffer, use it if several consumers need the same data instead of
+        copying overlapping windows with get_current_board_data. Reader created during streaming skips packages
+        which are already in buffer, readers are deleted in release_session
+
+        :param preset: preset
+        :type preset: int
+        :return: reader
+        :rtype: BufferReader
+        """
+
+        reader_id = numpy.zeros(1).astype(numpy.int32)
+
+        res = BoardControllerDLL.get_instance().create_buffer_reader_by_handle(preset, reader_id,
+                                                                               self.get_session_handle())
+        if res != BrainFlowExitCodes.STATUS_OK.value:
+            raise BrainFlowError('unable to create buffer reader', res)
+        return BufferReader(self, preset, int(reader_id[0]))
+
+    def register_data_ready_fd(self, num_samples: int, preset: int = BrainFlowPresets.DEFAULT_PRESET) -> int:
+        """Get file descriptor which becomes readable once ring buffer has at least num_samples packages,
+        it can be watched by event loops instead of polling. Drain it with os.read after each wakeup and read data
+        while get_board_data_count(preset) >= num_samples. Fd becomes readable again after each get_board_data call
+        if there is still enough data. Fd is owned by BrainFlow, do not close it. Not supported on Windows
+
+        :param num_samples: number of packages to wait for
+        :type num_samples: int
+        :param preset: preset
+        :type preset: int
+        :return: file descriptor
+        :rtype: int
+        """
+
+        fd = numpy.zeros(1).astype(numpy.int32)
+
+        res = BoardControllerDLL.get_instance().register_data_ready_fd_by_handle(num_samples, preset, fd,
+                                                                                 self.get_session_handle())
+        if res != BrainFlowExitCodes.STATUS_OK.value:
+            raise BrainFlowError('unable to register data ready fd', res)
+        return int(fd[0])
+
+    def unregister_data_ready_fd(self, preset: int = BrainFlowPresets.DEFAULT_PRESET) -> None:
+        """Close file descriptor created by register_data_ready_fd, remove it from event loop before this call
+
+        :param preset: preset
+        :type preset: int
+        """
+
+        res = BoardControllerDLL.get_instance().unregister_data_ready_fd_by_handle(preset, self.get_session_handle())
+        if res != BrainFlowExitCodes.STATUS_OK.value:
+            raise BrainFlowError('unable to unregister data ready fd', res)
+
+    def register_data_callback(self, callback: Callable[[NDArray[Shape["*, *"], Float64]], None],
+                               preset: int = BrainFlowPresets.DEFAULT_PRESET, min_batch: int = 1) -> None:
+        """Call function for new data instead of polling, data is still added to the ring buffer.
+        Callback is called from a dedicated native thread once at least min_batch new packages are available,
+        so slow callback doesnt block data acquisition. If it can not keep up older packages are dropped.
+
+        Callback receives (num_rows, k) array with k >= min_batch, its a view of native memory which is valid only
+        during the call, copy it to keep data. Exceptions raised by callback are printed and ignored.
+        Dont call unregister_data_callback or release_session from the callback.
+
+        :param callback: function which accepts a single 2d array
+        :type callback: Callable
+        :param preset: preset
+        :type preset: int
+        :param min_batch: min number of packages for a single call
+        :type min_batch: int
+        """
+
+        callback_thread = self._callback_thread
+
+        def data_callback(data, num_rows, num_samples, user_data):
+            callback_thread.active = True
+            try:
+                callback(numpy.ctypeslib.as_array(data, shape=(num_rows, num_samples)))
+            finally:
+                callback_thread.active = False
+
+        c_callback = DataCallbackType(data_callback)
+        res = BoardControllerDLL.get_instance().register_data_callback(c_callback, None, min_batch, preset,
+                                                                       self.board_id, self.input_json)
+        if res != BrainFlowExitCodes.STATUS_OK.value:
+            raise BrainFlowError('unable to register data callback', res)
+        self._data_callbacks[preset] = c_callback
+
+    def unregister_data_callback(self, preset: int = BrainFlowPresets.DEFAULT_PRESET) -> None:
+        """Remove data callback, after this method returns callback is not called anymore
+
+        :param preset: preset
+        :type preset: int
+        """
+
+        self._check_not_in_data_callback()
+        res = BoardControllerDLL.get_instance().unregister_data_callback(preset, self.board_id, self.input_json)
+        if res != BrainFlowExitCodes.STATUS_OK.value:
+            raise BrainFlowError('unable to unregister data callback', res)
+        self._data_callbacks.pop(preset, None)
+
+    def _check_not_in_data_callback(self) -> None:
+        # native side waits for running callback, calling it from the callback would never return
+        if getattr(self._callback_thread, 'active', False):
+            raise BrainFlowError('this method can not be called from data callback',
+                                 BrainFlowExitCodes.INVALID_ARGUMENTS_ERROR.value)
+
     def get_board_id(self) -> int:
         """Get's the actual board id, can be different than provided
 
@@ -1328,7 +1953,7 @@ class BoardShim(object):
         :rtype: int
         """
 
-        res = BoardControllerDLL.get_instance().insert_marker(value, preset, self.board_id, self.input_json)
+        res = BoardControllerDLL.get_instance().insert_marker_by_handle(value, preset, self.get_session_handle())
         if res != BrainFlowExitCodes.STATUS_OK.value:
             raise BrainFlowError('unable to insert marker', res)
 
@@ -1345,31 +1970,53 @@ class BoardShim(object):
             raise BrainFlowError('unable to check session status', res)
         return bool(prepared[0])
 
-    def get_board_data(self, num_samples=None, preset: int = BrainFlowPresets.DEFAULT_PRESET) -> NDArray[Shape["*, *"], Float64]:
+    def get_board_data(self, num_samples=None, preset: int = BrainFlowPresets.DEFAULT_PRESET,
+                       out: NDArray[Shape["*, *"], Float64] = None, return_lost_samples: bool = False):
         """Get board data and remove data from ringbuffer
 
         :param num_samples: number of packages to get
         :type num_samples: int
         :param preset: preset
         :type preset: int
-        :return: all data from a board if num_samples is None, num_samples packages or less if not None
+        :param out: optional preallocated C-contiguous float64 array with shape (num_rows, n), at most n packages are written directly into it
+        :type out: NDArray[Shape["*, *"], Float64]
+        :param return_lost_samples: if True return tuple (data, lost_samples), lost_samples is the number of packages overwritten or dropped by ring buffer since the previous get_board_data call, behavior of full buffer is set by buffer_overflow_policy field of BrainFlowBufferParams
+        :type return_lost_samples: bool
+        :return: all data from a board if num_samples is None, num_samples packages or less if not None, if out is provided its a view of out with shape (num_rows, returned_samples)
         :rtype: NDArray[Shape["*, *"], Float64]
         """
 
-        data_size = self.get_board_data_count(preset)
-        if num_samples is not None:
-            if num_samples < 1:
-                raise BrainFlowError('invalid num_samples', BrainFlowExitCodes.INVALID_ARGUMENTS_ERROR.value)
-            else:
-                data_size = min(data_size, num_samples)
-        package_length = BoardShim.get_num_rows(self._master_board_id, preset)
-        data_arr = numpy.zeros(data_size * package_length).astype(numpy.float64)
+        if num_samples is not None and num_samples < 1:
+            raise BrainFlowError('invalid num_samples', BrainFlowExitCodes.INVALID_ARGUMENTS_ERROR.value)
 
-        res = BoardControllerDLL.get_instance().get_board_data(data_size, preset, data_arr, self.board_id, self.input_json)
+        if out is not None:
+            self._check_out_array(out, preset)
+            max_samples = out.shape[1] if num_samples is None else min(num_samples, out.shape[1])
+        else:
+            max_samples = self.get_board_data_count(preset)
+            if num_samples is not None:
+                max_samples = min(max_samples, num_samples)
+            out = numpy.zeros((self._get_num_rows(preset), max(max_samples, 1)), dtype=numpy.float64)
+        current_size = numpy.zeros(1).astype(numpy.int32)
+        lost_samples = numpy.zeros(1).astype(numpy.int32)
+        res = BoardControllerDLL.get_instance().get_board_data_into_by_handle(max_samples, preset, out,
+                                                                              out.shape[1], current_size, lost_samples,
+                                                                              self.get_session_handle())
         if res != BrainFlowExitCodes.STATUS_OK.value:
             raise BrainFlowError('unable to get board data', res)
-
-        return data_arr.reshape(package_length, data_size)
+        if return_lost_samples:
+            return out[:, 0:current_size[0]], int(lost_samples[0])
+        return out[:, 0:current_size[0]]
+
+    def _check_out_array(self, out, preset: int) -> None:
+        package_length = self._get_num_rows(preset)
+        if not isinstance(out, numpy.ndarray) or out.dtype != numpy.float64 or out.ndim != 2 \
+                or not out.flags['C_CONTIGUOUS'] or not out.flags['WRITEABLE']:
+            raise BrainFlowError('out should be writeable C-contiguous float64 2d array',
+                                 BrainFlowExitCodes.INVALID_ARGUMENTS_ERROR.value)
+        if out.shape[0] != package_length or out.shape[1] < 1:
+            raise BrainFlowError('out should have shape (%d, n), n > 0' % package_length,
+                                 BrainFlowExitCodes.INVALID_ARGUMENTS_ERROR.value)
 
     def config_board(self, config) -> str:
         """Use this method carefully and only if you understand what you are doing, do NOT use it to start or stop streaming
@@ -1388,6 +2035,8 @@ class BoardShim(object):
 
         res = BoardControllerDLL.get_instance().config_board(config_string, string, string_len, self.board_id,
                                                              self.input_json)
+        # config may change number of rows for configurable boards
+        self._num_rows = dict()
         if res != BrainFlowExitCodes.STATUS_OK.value:
             raise BrainFlowError('unable to config board', res)
         return string.tobytes().decode('utf-8')[0:string_len[0]]
@@ -1401,3 +2050,179 @@ class BoardShim(object):
         res = BoardControllerDLL.get_instance().config_board_with_bytes(bytes_to_send, len(bytes_to_send), self.board_id, self.input_json)
         if res != BrainFlowExitCodes.STATUS_OK.value:
             raise BrainFlowError('unable to config board', res)
+
+
+class AsyncBoardShim(object):
+    """asyncio version of BoardShim. All methods are executed in the default executor of the running loop, even
+    methods which only copy data from the ring buffer wait for the session lock which is held by prepare_session,
+    config_board and other long calls from other threads. New data is delivered by chunks() which is driven by a native fd watched by the loop, there is no polling.
+    Other methods are available via board_shim attribute
+
+    :param board_id: Id of your board
+    :type board_id: int
+    :param input_params: board specific structure to pass required arguments
+    :type input_params: BrainFlowInputParams
+    """
+
+    def __init__(self, board_id: int, input_params: BrainFlowInputParams) -> None:
+        self.board_shim = BoardShim(board_id, input_params)
+        self._is_streaming = False
+        # preset -> (fd, event), fd is None if platform doesnt support data ready fd
+        self._chunk_iterators = dict()
+
+    async def _run_in_executor(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+
+    async def prepare_session(self) -> None:
+        """prepare streaming sesssion, init resources, you need to call it before any other BoardShim object methods
+        """
+
+        await self._run_in_executor(self.board_shim.prepare_session)
+
+    async def start_stream(self, num_samples: int = 1800 * 250, streamer_params: str = None,
+                           buffer_params: BrainFlowBufferParams = None) -> None:
+        """Start streaming data, this methods stores data in ringbuffer
+
+        :param num_samples: size of ring buffer to keep data
+        :type num_samples: int
+        :param streamer_params parameter to stream data from brainflow
+        :type streamer_params: str
+        :param buffer_params: ring buffer parameters
+        :type buffer_params: BrainFlowBufferParams
+        """
+
+        await self._run_in_executor(self.board_shim.start_stream, num_samples, streamer_params, buffer_params)
+        self._is_streaming = True
+
+    async def stop_stream(self) -> None:
+        """Stop streaming data, active chunks() iterators yield remaining full chunks and stop"""
+
+        self._is_streaming = False
+        for _, event in self._chunk_iterators.values():
+            event.set()
+        await self._run_in_executor(self.board_shim.stop_stream)
+
+    async def release_session(self) -> None:
+        """release all resources, active chunks() iterators stop immediately"""
+
+        self._is_streaming = False
+        await self._stop_chunk_iterators()
+        await self._run_in_executor(self.board_shim.release_session)
+
+    async def config_board(self, config) -> str:
+        """Use this method carefully and only if you understand what you are doing
+
+        :param config: string to send to a board
+        :type config: str
+        :return: response string if any
+        :rtype: str
+        """
+
+        return await self._run_in_executor(self.board_shim.config_board, config)
+
+    async def get_board_data(self, num_samples=None, preset: int = BrainFlowPresets.DEFAULT_PRESET,
+                             out: NDArray[Shape["*, *"], Float64] = None, return_lost_samples: bool = False):
+        """Get board data and remove data from ringbuffer, see BoardShim.get_board_data"""
+
+        return await self._run_in_executor(self.board_shim.get_board_data, num_samples, preset, out,
+                                           return_lost_samples)
+
+    async def get_current_board_data(self, num_samples: int, preset: int = BrainFlowPresets.DEFAULT_PRESET,
+                                     out: NDArray[Shape["*, *"], Float64] = None) -> NDArray[Shape["*, *"], Float64]:
+        """Get specified amount of data or less if there is not enough data, doesnt remove data from ringbuffer,
+        see BoardShim.get_current_board_data"""
+
+        return await self._run_in_executor(self.board_shim.get_current_board_data, num_samples, preset, out)
+
+    async def get_board_data_count(self, preset: int = BrainFlowPresets.DEFAULT_PRESET) -> int:
+        """Get num of elements in ringbuffer"""
+
+        return await self._run_in_executor(self.board_shim.get_board_data_count, preset)
+
+    async def insert_marker(self, value: float, preset: int = BrainFlowPresets.DEFAULT_PRESET) -> None:
+        """Insert Marker to Data Stream"""
+
+        await self._run_in_executor(self.board_shim.insert_marker, value, preset)
+
+    async def chunks(self, num_samples: int, preset: int = BrainFlowPresets.DEFAULT_PRESET):
+        """Iterate over chunks with exactly num_samples packages, chunks are removed from ring buffer.
+        Iteration stops after stop_stream or release_session. Only one iterator per preset is allowed
+
+        :param num_samples: number of packages in each chunk
+        :type num_samples: int
+        :param preset: preset
+        :type preset: int
+        :return: async iterator over (num_rows, num_samples) arrays
+        """
+
+        if preset in self._chunk_iterators:
+            raise BrainFlowError('chunks are already iterated for preset %d' % preset,
+                                 BrainFlowExitCodes.INVALID_ARGUMENTS_ERROR.value)
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+        try:
+            fd = await self._run_in_executor(self.board_shim.register_data_ready_fd, num_samples, preset)
+            loop.add_reader(fd, event.set)
+        except BrainFlowError as e:
+            # windows, use blocking wait in executor instead
+            if e.exit_code != BrainFlowExitCodes.UNSUPPORTED_BOARD_ERROR.value:
+                raise
+            fd = None
+        entry = (fd, event)
+        self._chunk_iterators[preset] = entry
+        try:
+            while self._chunk_iterators.get(preset) is entry:
+                try:
+                    chunk = await self._run_in_executor(self._get_chunk, num_samples, preset)
+                except BrainFlowError:
+                    # session may be released during the call
+                    if self._chunk_iterators.get(preset) is entry:
+                        raise
+                    break
+                if chunk is not None:
+                    yield chunk
+                    continue
+                if not self._is_streaming:
+                    break
+                if fd is None:
+                    try:
+                        await loop.run_in_executor(None, self.board_shim.wait_for_data, num_samples, 100, preset)
+                    except BrainFlowError:
+                        if self._chunk_iterators.get(preset) is entry:
+                            raise
+                else:
+                    await event.wait()
+                    event.clear()
+                    # fd is closed if session was released during the wait
+                    if self._chunk_iterators.get(preset) is entry:
+                        self._drain_fd(fd)
+        finally:
+            if self._chunk_iterators.get(preset) is entry:
+                await self._stop_chunk_iterator(preset)
+
+    def _get_chunk(self, num_samples: int, preset: int):
+        # single executor call per chunk, only this iterator removes data for the preset so count can not decrease
+        if self.board_shim.get_board_data_count(preset) < num_samples:
+            return None
+        return self.board_shim.get_board_data(num_samples, preset)
+
+    async def _stop_chunk_iterators(self) -> None:
+        for preset in list(self._chunk_iterators.keys()):
+            await self._stop_chunk_iterator(preset)
+
+    async def _stop_chunk_iterator(self, preset: int) -> None:
+        # fd should be removed from the loop before native side closes it
+        fd, event = self._chunk_iterators.pop(preset)
+        event.set()
+        if fd is not None:
+            asyncio.get_running_loop().remove_reader(fd)
+            await self._run_in_executor(self.board_shim.unregister_data_ready_fd, preset)
+
+    @staticmethod
+    def _drain_fd(fd: int) -> None:
+        try:
+            while os.read(fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
@@ -1,5 +1,6 @@
 import ctypes
 import enum
+import json
 import os
 import platform
 import struct
@@ -9,7 +10,7 @@ import numpy
 import pkg_resources
 from brainflow.exit_codes import BrainFlowExitCodes, BrainFlowError
 from brainflow.utils import check_memory_layout_row_major, LogLevels
-from nptyping import NDArray, Float64, Complex128, Shape
+from nptyping import NDArray, Float64, Complex128, Int32, Shape
 from numpy.ctypeslib import ndpointer
 
 
@@ -24,12 +25,23 @@ class FilterTypes(enum.IntEnum):
     BESSEL_ZERO_PHASE = 5  #:
 
 
+class FilterOperations(enum.IntEnum):
+    """Enum to store all supported filter operations for streaming filters"""
+
+    LOWPASS = 0  #:
+    HIGHPASS = 1  #:
+    BANDPASS = 2  #:
+    BANDSTOP = 3  #:
+
+
 class AggOperations(enum.IntEnum):
     """Enum to store all supported aggregation operations"""
 
     MEAN = 0  #:
     MEDIAN = 1  #:
     EACH = 2  #:
+    MIN = 3  #:
+    MAX = 4  #:
 
 
 class WindowOperations(enum.IntEnum):
@@ -528,6 +540,204 @@ class DataHandlerDLL(object):
             ndpointer(ctypes.c_double)
         ]
 
+        self.perform_lowpass_2d = self.lib.perform_lowpass_2d
+        self.perform_lowpass_2d.restype = ctypes.c_int
+        self.perform_lowpass_2d.argtypes = [
+            ndpointer(ctypes.c_double),
+            ctypes.c_int,
+            ctypes.c_int,
+            ndpointer(ctypes.c_int32),
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_double,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_double
+        ]
+
+        self.perform_highpass_2d = self.lib.perform_highpass_2d
+        self.perform_highpass_2d.restype = ctypes.c_int
+        self.perform_highpass_2d.argtypes = [
+            ndpointer(ctypes.c_double),
+            ctypes.c_int,
+            ctypes.c_int,
+            ndpointer(ctypes.c_int32),
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_double,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_double
+        ]
+
+        self.perform_bandpass_2d = self.lib.perform_bandpass_2d
+        self.perform_bandpass_2d.restype = ctypes.c_int
+        self.perform_bandpass_2d.argtypes = [
+            ndpointer(ctypes.c_double),
+            ctypes.c_int,
+            ctypes.c_int,
+            ndpointer(ctypes.c_int32),
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_double,
+            ctypes.c_double,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_double
+        ]
+
+        self.perform_bandstop_2d = self.lib.perform_bandstop_2d
+        self.perform_bandstop_2d.restype = ctypes.c_int
+        self.perform_bandstop_2d.argtypes = [
+            ndpointer(ctypes.c_double),
+            ctypes.c_int,
+            ctypes.c_int,
+            ndpointer(ctypes.c_int32),
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_double,
+            ctypes.c_double,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_double
+        ]
+
+        self.remove_environmental_noise_2d = self.lib.remove_environmental_noise_2d
+        self.remove_environmental_noise_2d.restype = ctypes.c_int
+        self.remove_environmental_noise_2d.argtypes = [
+            ndpointer(ctypes.c_double),
+            ctypes.c_int,
+            ctypes.c_int,
+            ndpointer(ctypes.c_int32),
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int
+        ]
+
+        self.perform_rolling_filter_2d = self.lib.perform_rolling_filter_2d
+        self.perform_rolling_filter_2d.restype = ctypes.c_int
+        self.perform_rolling_filter_2d.argtypes = [
+            ndpointer(ctypes.c_double),
+            ctypes.c_int,
+            ctypes.c_int,
+            ndpointer(ctypes.c_int32),
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int
+        ]
+
+        self.perform_wavelet_denoising_2d = self.lib.perform_wavelet_denoising_2d
+        self.perform_wavelet_denoising_2d.restype = ctypes.c_int
+        self.perform_wavelet_denoising_2d.argtypes = [
+            ndpointer(ctypes.c_double),
+            ctypes.c_int,
+            ctypes.c_int,
+            ndpointer(ctypes.c_int32),
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int
+        ]
+
+        self.detrend_2d = self.lib.detrend_2d
+        self.detrend_2d.restype = ctypes.c_int
+        self.detrend_2d.argtypes = [
+            ndpointer(ctypes.c_double),
+            ctypes.c_int,
+            ctypes.c_int,
+            ndpointer(ctypes.c_int32),
+            ctypes.c_int,
+            ctypes.c_int
+        ]
+
+        self.perform_fft_2d = self.lib.perform_fft_2d
+        self.perform_fft_2d.restype = ctypes.c_int
+        self.perform_fft_2d.argtypes = [
+            ndpointer(ctypes.c_double),
+            ctypes.c_int,
+            ctypes.c_int,
+            ndpointer(ctypes.c_int32),
+            ctypes.c_int,
+            ctypes.c_int,
+            ndpointer(ctypes.c_double),
+            ndpointer(ctypes.c_double)
+        ]
+
+        self.get_psd_welch_2d = self.lib.get_psd_welch_2d
+        self.get_psd_welch_2d.restype = ctypes.c_int
+        self.get_psd_welch_2d.argtypes = [
+            ndpointer(ctypes.c_double),
+            ctypes.c_int,
+            ctypes.c_int,
+            ndpointer(ctypes.c_int32),
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ndpointer(ctypes.c_double),
+            ndpointer(ctypes.c_double)
+        ]
+
+        self.create_filter = self.lib.create_filter
+        self.create_filter.restype = ctypes.c_int
+        self.create_filter.argtypes = [
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_double,
+            ctypes.c_double,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_double,
+            ndpointer(ctypes.c_int32)
+        ]
+
+        self.create_environmental_noise_filter = self.lib.create_environmental_noise_filter
+        self.create_environmental_noise_filter.restype = ctypes.c_int
+        self.create_environmental_noise_filter.argtypes = [
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ndpointer(ctypes.c_int32)
+        ]
+
+        self.process_filter = self.lib.process_filter
+        self.process_filter.restype = ctypes.c_int
+        self.process_filter.argtypes = [
+            ctypes.c_int,
+            ndpointer(ctypes.c_double),
+            ctypes.c_int,
+            ctypes.c_int
+        ]
+
+        self.reset_filter = self.lib.reset_filter
+        self.reset_filter.restype = ctypes.c_int
+        self.reset_filter.argtypes = [
+            ctypes.c_int
+        ]
+
+        self.release_filter = self.lib.release_filter
+        self.release_filter.restype = ctypes.c_int
+        self.release_filter.argtypes = [
+            ctypes.c_int
+        ]
+
+        self.get_dsp_cache_stats = self.lib.get_dsp_cache_stats
+        self.get_dsp_cache_stats.restype = ctypes.c_int
+        self.get_dsp_cache_stats.argtypes = [
+            ndpointer(ctypes.c_int64),
+            ndpointer(ctypes.c_int64),
+            ndpointer(ctypes.c_int32)
+        ]
+
+        self.clear_dsp_cache = self.lib.clear_dsp_cache
+        self.clear_dsp_cache.restype = ctypes.c_int
+        self.clear_dsp_cache.argtypes = []
+
         self.get_version_data_handler = self.lib.get_version_data_handler
         self.get_version_data_handler.restype = ctypes.c_int
         self.get_version_data_handler.argtypes = [
@@ -537,6 +747,242 @@ class DataHandlerDLL(object):
         ]
 
 
+class StreamingFilter(object):
+    """Causal filter which keeps its state between calls, so data can be filtered chunk by chunk without transients
+    at chunk boundaries. Use DataFilter.create_filter or DataFilter.create_environmental_noise_filter to create it
+
+    :param filter_id: handle of native filter
+    :type filter_id: int
+    :param num_channels: number of channels, each channel has its own state
+    :type num_channels: int
+    """
+
+    def __init__(self, filter_id: int, num_channels: int) -> None:
+        self.filter_id = filter_id
+        self.num_channels = num_channels
+
+    def process(self, data: NDArray[Shape["*, *"], Float64]) -> None:
+        """filter next chunk of data in-place
+
+        :param data: 2d array [num_channels x num_samples] or 1d array for single channel filter
+        :type data: NDArray[Shape["*, *"], Float64]
+        """
+        if self.filter_id is None:
+            raise BrainFlowError('filter is released', BrainFlowExitCodes.INVALID_ARGUMENTS_ERROR.value)
+        if data is not None and len(data.shape) == 1 and self.num_channels == 1:
+            check_memory_layout_row_major(data, 1)
+            num_channels, data_len = 1, data.shape[0]
+        else:
+            check_memory_layout_row_major(data, 2)
+            num_channels, data_len = data.shape
+        if data_len == 0:
+            return
+        res = DataHandlerDLL.get_instance().process_filter(self.filter_id, data, num_channels, data_len)
+        if res != BrainFlowExitCodes.STATUS_OK.value:
+            raise BrainFlowError('unable to process data', res)
+
+    def reset(self) -> None:
+        """reset filter state, use it if there is a gap in data"""
+        res = DataHandlerDLL.get_instance().reset_filter(self.filter_id)
+        if res != BrainFlowExitCodes.STATUS_OK.value:
+            raise BrainFlowError('unable to reset filter', res)
+
+    def release(self) -> None:
+        """release native filter"""
+        if self.filter_id is None:
+            return
+        res = DataHandlerDLL.get_instance().release_filter(self.filter_id)
+        self.filter_id = None
+        if res != BrainFlowExitCodes.STATUS_OK.value:
+            raise BrainFlowError('unable to release filter', res)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+    def __del__(self):
+        try:
+            self.release()
+        except BaseException:
+            pass
+
+
+class BrainFlowRecording(object):
+    """Lazy reader for binary .bfbin recordings, file is memory mapped and only requested parts are loaded.
+    Use DataFilter.open_recording to create it
+
+    :param file_name: file name to open
+    :type file_name: str
+    :param timestamp_channel: row with timestamps, if None it is taken from the file header or from board description
+    :type timestamp_channel: int
+    """
+
+    MAGIC = b'BFBIN\x00\x00\x01'
+    VERSION = 1
+
+    def __init__(self, file_name: str, timestamp_channel: int = None) -> None:
+        self.file_name = file_name
+        self._mm = numpy.memmap(file_name, dtype=numpy.uint8, mode='r')
+        header_size = len(self.MAGIC) + 6 * 4
+        if self._mm.size < header_size or self._mm[:len(self.MAGIC)].tobytes() != self.MAGIC:
+            raise BrainFlowError('%s is not a binary brainflow file' % file_name,
+                                 BrainFlowExitCodes.INVALID_ARGUMENTS_ERROR.value)
+        version, board_id, preset, num_rows, sampling_rate, descr_len = numpy.frombuffer(
+            self._mm, dtype='<i4', count=6, offset=len(self.MAGIC))
+        if version != self.VERSION or num_rows < 1 or descr_len < 0:
+            raise BrainFlowError('invalid header in %s' % file_name, BrainFlowExitCodes.INVALID_ARGUMENTS_ERROR.value)
+        self.board_id = int(board_id)
+        self.preset = int(preset)
+        self.num_rows = int(num_rows)
+        self.sampling_rate = int(sampling_rate)
+        self.descr = json.loads(self._mm[header_size:header_size + descr_len].tobytes().decode())
+        self._scan_chunks(header_size + int(descr_len))
+        self.timestamp_channel = self._find_timestamp_channel(timestamp_channel)
+        self._chunk_timestamps = None
+
+    def _read_at(self, offsets: NDArray, dtype: str) -> NDArray:
+        # reads one value at each byte offset without copying the file
+        item_size = numpy.dtype(dtype).itemsize
+        return self._mm[offsets[:, None] + numpy.arange(item_size)].view(dtype).ravel()
+
+    def _scan_chunks(self, offset: int) -> None:
+        offsets = list()
+        sizes = list()
+        file_size = self._mm.size
+        chunk_bytes = self.num_rows * 8
+        while offset + 4 <= file_size:
+            num_cols = int(numpy.frombuffer(self._mm, dtype='<i4', count=1, offset=offset)[0])
+            # last chunk may be incomplete if recording was interrupted
+            if num_cols < 1 or offset + 4 + num_cols * chunk_bytes > file_size:
+                break
+            # streamer writes chunks of the same size, check headers of all of them at once
+            step = 4 + num_cols * chunk_bytes
+            headers = offset + numpy.arange((file_size - offset) // step, dtype=numpy.int64) * step
+            mismatch = numpy.flatnonzero(self._read_at(headers, '<i4') != num_cols)
+            num_chunks = int(mismatch[0]) if mismatch.size else headers.size
+            offsets.append(headers[:num_chunks] + 4)
+            sizes.append(numpy.full(num_chunks, num_cols, dtype=numpy.int64))
+            offset += num_chunks * step
+        self._chunk_offsets = numpy.concatenate(offsets) if offsets else numpy.zeros(0, dtype=numpy.int64)
+        self._chunk_sizes = numpy.concatenate(sizes) if sizes else numpy.zeros(0, dtype=numpy.int64)
+        self._chunk_starts = numpy.concatenate(([0], numpy.cumsum(self._chunk_sizes)))
+        self.num_samples = int(self._chunk_starts[-1])
+
+    def _find_timestamp_channel(self, timestamp_channel):
+        if timestamp_channel is not None:
+            return timestamp_channel
+        if 'timestamp_channel' in self.descr:
+            return self.descr['timestamp_channel']
+        try:
+            from brainflow.board_shim import BoardShim
+            return BoardShim.get_timestamp_channel(self.board_id, self.preset)
+        except BrainFlowError:
+            return None
+
+    def _get_chunk(self, chunk_id: int) -> NDArray[Shape["*, *"], Float64]:
+        return numpy.ndarray((self.num_rows, int(self._chunk_sizes[chunk_id])), dtype='<f8', buffer=self._mm,
+                             offset=int(self._chunk_offsets[chunk_id]))
+
+    @property
+    def shape(self) -> Tuple:
+        return self.num_rows, self.num_samples
+
+    def get_data(self, channels=None, start: int = 0, stop: int = None) -> NDArray[Shape["*, *"], Float64]:
+        """get range of samples, result is a view of memory mapped file if range is inside a single chunk
+        and channels is an int or a slice, otherwise only requested part is copied
+
+        :param channels: int, slice or list of rows to return, None for all rows
+        :type channels: int, slice or List
+        :param start: first sample to return
+        :type start: int
+        :param stop: sample to stop at(not included), None for the end of recording
+        :type stop: int
+        :return: 2d array [channels x samples] or 1d array if channels is int
+        :rtype: NDArray[Shape["*, *"], Float64]
+        """
+        if channels is None:
+            channels = slice(None)
+        start, stop, _ = slice(start, stop).indices(self.num_samples)
+        stop = max(start, stop)
+        first = max(int(numpy.searchsorted(self._chunk_starts, start, side='right')) - 1, 0)
+        last = max(int(numpy.searchsorted(self._chunk_starts, stop, side='left')), first + 1)
+        parts = list()
+        for chunk_id in range(first, min(last, len(self._chunk_offsets))):
+            chunk_start = self._chunk_starts[chunk_id]
+            local_start = max(start - chunk_start, 0)
+            local_stop = min(stop - chunk_start, self._chunk_sizes[chunk_id])
+            parts.append(self._get_chunk(chunk_id)[channels, local_start:local_stop])
+        if len(parts) == 1:
+            return parts[0]
+        if not parts:
+            return numpy.zeros((self.num_rows, 0))[channels, :]
+        return numpy.concatenate(parts, axis=-1)
+
+    def _get_chunk_timestamps(self) -> NDArray[Shape["*"], Float64]:
+        # sparse index, first timestamp from each chunk
+        if self.timestamp_channel is None:
+            raise BrainFlowError('timestamp channel is unknown for %s' % self.file_name,
+                                 BrainFlowExitCodes.INVALID_ARGUMENTS_ERROR.value)
+        if self._chunk_timestamps is None:
+            # chunks are channel major, first timestamp of a chunk starts its timestamp row
+            self._chunk_timestamps = self._read_at(
+                self._chunk_offsets + self.timestamp_channel * self._chunk_sizes * 8, '<f8')
+        return self._chunk_timestamps
+
+    def time_to_index(self, timestamp: float) -> int:
+        """get index of the first sample with timestamp greater or equal to provided value
+
+        :param timestamp: unix timestamp
+        :type timestamp: float
+        :return: sample index
+        :rtype: int
+        """
+        chunk_timestamps = self._get_chunk_timestamps()
+        if self._chunk_offsets.size == 0:
+            return 0
+        chunk_id = max(int(numpy.searchsorted(chunk_timestamps, timestamp, side='right')) - 1, 0)
+        timestamps = self._get_chunk(chunk_id)[self.timestamp_channel]
+        return int(self._chunk_starts[chunk_id] + numpy.searchsorted(timestamps, timestamp, side='left'))
+
+    def get_data_by_time(self, start_time: float, end_time: float, channels=None) -> NDArray[Shape["*, *"], Float64]:
+        """get samples with timestamps in range [start_time, end_time)
+
+        :param start_time: unix timestamp to start from
+        :type start_time: float
+        :param end_time: unix timestamp to stop at
+        :type end_time: float
+        :param channels: int, slice or list of rows to return, None for all rows
+        :type channels: int, slice or List
+        :return: 2d array [channels x samples] or 1d array if channels is int
+        :rtype: NDArray[Shape["*, *"], Float64]
+        """
+        return self.get_data(channels, self.time_to_index(start_time), self.time_to_index(end_time))
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            channels, samples = key
+        else:
+            channels, samples = key, slice(None)
+        if isinstance(samples, int):
+            samples = slice(samples, samples + 1 if samples != -1 else None)
+        if not isinstance(samples, slice) or samples.step not in (None, 1):
+            raise BrainFlowError('only contiguous sample ranges are supported',
+                                 BrainFlowExitCodes.INVALID_ARGUMENTS_ERROR.value)
+        return self.get_data(channels, samples.start if samples.start is not None else 0, samples.stop)
+
+    def close(self) -> None:
+        """release memory mapping, it is unmapped once all returned views are deleted"""
+        self._mm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
 class DataFilter(object):
     """DataFilter class contains methods for signal processig"""
 
@@ -698,6 +1144,354 @@ class DataFilter(object):
         if res != BrainFlowExitCodes.STATUS_OK.value:
             raise BrainFlowError('unable to apply band stop filter', res)
 
+    @classmethod
+    def _get_channels_array(cls, data: NDArray[Shape["*, *"], Float64], channels: List) -> NDArray[Shape["*"], Int32]:
+        check_memory_layout_row_major(data, 2)
+        if channels is None:
+            channels = range(data.shape[0])
+        return numpy.ascontiguousarray(channels, dtype=numpy.int32)
+
+    @classmethod
+    def perform_lowpass_2d(cls, data: NDArray[Shape["*, *"], Float64], channels: List, sampling_rate: int,
+                           cutoff: float, order: int, filter_type: int, ripple: float) -> None:
+        """apply low pass filter to selected rows of 2d array in a single native call, rows are processed in parallel
+
+        :param data: 2d array from board, filter works in-place
+        :type data: NDArray[Shape["*, *"], Float64]
+        :param channels: rows to filter, None for all rows
+        :type channels: List
+        :param sampling_rate: board's sampling rate
+        :type sampling_rate: int
+        :param cutoff: cutoff frequency
+        :type cutoff: float
+        :param order: filter order
+        :type order: int
+        :param filter_type: filter type from special enum
+        :type filter_type: int
+        :param ripple: ripple value for Chebyshev filter
+        :type ripple: float
+        """
+        channels = cls._get_channels_array(data, channels)
+        res = DataHandlerDLL.get_instance().perform_lowpass_2d(data, data.shape[0], data.shape[1], channels,
+                                                               channels.shape[0], sampling_rate, cutoff, order,
+                                                               filter_type, ripple)
+        if res != BrainFlowExitCodes.STATUS_OK.value:
+            raise BrainFlowError('unable to perform low pass filter', res)
+
+    @classmethod
+    def perform_highpass_2d(cls, data: NDArray[Shape["*, *"], Float64], channels: List, sampling_rate: int,
+                            cutoff: float, order: int, filter_type: int, ripple: float) -> None:
+        """apply high pass filter to selected rows of 2d array in a single native call, rows are processed in parallel
+
+        :param data: 2d array from board, filter works in-place
+        :type data: NDArray[Shape["*, *"], Float64]
+        :param channels: rows to filter, None for all rows
+        :type channels: List
+        :param sampling_rate: board's sampling rate
+        :type sampling_rate: int
+        :param cutoff: cutoff frequency
+        :type cutoff: float
+        :param order: filter order
+        :type order: int
+        :param filter_type: filter type from special enum
+        :type filter_type: int
+        :param ripple: ripple value for Chebyshev filter
+        :type ripple: float
+        """
+        channels = cls._get_channels_array(data, channels)
+        res = DataHandlerDLL.get_instance().perform_highpass_2d(data, data.shape[0], data.shape[1], channels,
+                                                                channels.shape[0], sampling_rate, cutoff, order,
+                                                                filter_type, ripple)
+        if res != BrainFlowExitCodes.STATUS_OK.value:
+            raise BrainFlowError('unable to apply high pass filter', res)
+
+    @classmethod
+    def perform_bandpass_2d(cls, data: NDArray[Shape["*, *"], Float64], channels: List, sampling_rate: int,
+                            start_freq: float, stop_freq: float, order: int, filter_type: int, ripple: float) -> None:
+        """apply band pass filter to selected rows of 2d array in a single native call, rows are processed in parallel
+
+        :param data: 2d array from board, filter works in-place
+        :type data: NDArray[Shape["*, *"], Float64]
+        :param channels: rows to filter, None for all rows
+        :type channels: List
+        :param sampling_rate: board's sampling rate
+        :type sampling_rate: int
+        :param start_freq: start frequency
+        :type start_freq: float
+        :param stop_freq: stop frequency
+        :type stop_freq: float
+        :param order: filter order
+        :type order: int
+        :param filter_type: filter type from special enum
+        :type filter_type: int
+        :param ripple: ripple value for Chebyshev filter
+        :type ripple: float
+        """
+        channels = cls._get_channels_array(data, channels)
+        res = DataHandlerDLL.get_instance().perform_bandpass_2d(data, data.shape[0], data.shape[1], channels,
+                                                                channels.shape[0], sampling_rate, start_freq,
+                                                                stop_freq, order, filter_type, ripple)
+        if res != BrainFlowExitCodes.STATUS_OK.value:
+            raise BrainFlowError('unable to apply band pass filter', res)
+
+    @classmethod
+    def perform_bandstop_2d(cls, data: NDArray[Shape["*, *"], Float64], channels: List, sampling_rate: int,
+                            start_freq: float, stop_freq: float, order: int, filter_type: int, ripple: float) -> None:
+        """apply band stop filter to selected rows of 2d array in a single native call, rows are processed in parallel
+
+        :param data: 2d array from board, filter works in-place
+        :type data: NDArray[Shape["*, *"], Float64]
+        :param channels: rows to filter, None for all rows
+        :type channels: List
+        :param sampling_rate: board's sampling rate
+        :type sampling_rate: int
+        :param start_freq: start frequency
+        :type start_freq: float
+        :param stop_freq: stop frequency
+        :type stop_freq: float
+        :param order: filter order
+        :type order: int
+        :param filter_type: filter type from special enum
+        :type filter_type: int
+        :param ripple: ripple value for Chebyshev filter
+        :type ripple: float
+        """
+        channels = cls._get_channels_array(data, channels)
+        res = DataHandlerDLL.get_instance().perform_bandstop_2d(data, data.shape[0], data.shape[1], channels,
+                                                                channels.shape[0], sampling_rate, start_freq,
+                                                                stop_freq, order, filter_type, ripple)
+        if res != BrainFlowExitCodes.STATUS_OK.value:
+            raise BrainFlowError('unable to apply band stop filter', res)
+
+    @classmethod
+    def remove_environmental_noise_2d(cls, data: NDArray[Shape["*, *"], Float64], channels: List, sampling_rate: int,
+                                      noise_type: int) -> None:
+        """remove env noise from selected rows of 2d array using notch filter
+
+        :param data: 2d array from board, filter works in-place
+        :type data: NDArray[Shape["*, *"], Float64]
+        :param channels: rows to filter, None for all rows
+        :type channels: List
+        :param sampling_rate: board's sampling rate
+        :type sampling_rate: int
+        :param noise_type: noise type
+        :type noise_type: int
+        """
+        channels = cls._get_channels_array(data, channels)
+        res = DataHandlerDLL.get_instance().remove_environmental_noise_2d(data, data.shape[0], data.shape[1], channels,
+                                                                          channels.shape[0], sampling_rate, noise_type)
+        if res != BrainFlowExitCodes.STATUS_OK.value:
+            raise BrainFlowError('unable to apply notch filter', res)
+
+    @classmethod
+    def perform_rolling_filter_2d(cls, data: NDArray[Shape["*, *"], Float64], channels: List, period: int,
+                                  operation: int) -> None:
+        """smooth selected rows of 2d array using moving average, median, min or max
+
+        :param data: 2d array from board, it works in-place
+        :type data: NDArray[Shape["*, *"], Float64]
+        :param channels: rows to smooth, None for all rows
+        :type channels: List
+        :param period: window size
+        :type period: int
+        :param operation: int value from AggOperation enum
+        :type operation: int
+        """
+        channels = cls._get_channels_array(data, channels)
+        res = DataHandlerDLL.get_instance().perform_rolling_filter_2d(data, data.shape[0], data.shape[1], channels,
+                                                                      channels.shape[0], period, operation)
+        if res != BrainFlowExitCodes.STATUS_OK.value:
+            raise BrainFlowError('unable to smooth data', res)
+
+    @classmethod
+    def perform_wavelet_denoising_2d(cls, data: NDArray[Shape["*, *"], Float64], channels: List, wavelet: int,
+                                     decomposition_level: int,
+                                     wavelet_denoising=WaveletDenoisingTypes.SURESHRINK,
+                                     threshold=ThresholdTypes.HARD,
+                                     extension_type=WaveletExtensionTypes.SYMMETRIC,
+                                     noise_level=NoiseEstimationLevelTypes.FIRST_LEVEL) -> None:
+        """perform wavelet denoising for selected rows of 2d array
+
+        :param data: 2d array from board, it works in-place
+        :type data: NDArray[Shape["*, *"], Float64]
+        :param channels: rows to denoise, None for all rows
+        :type channels: List
+        :param wavelet: use WaveletTypes enum
+        :type wavelet: int
+        :param decomposition_level: decomposition level
+        :type decomposition_level: int
+        :param wavelet_denoising: use WaveletDenoisingTypes enum
+        :type wavelet_denoising: int
+        :param threshold: use ThresholdTypes enum
+        :type threshold: int
+        :param extension_type: use WaveletExtensionTypes enum
+        :type extension_type: int
+        :param noise_level: use NoiseEstimationLevelTypes enum
+        :type noise_level: int
+        """
+        channels = cls._get_channels_array(data, channels)
+        res = DataHandlerDLL.get_instance().perform_wavelet_denoising_2d(data, data.shape[0], data.shape[1], channels,
+                                                                         channels.shape[0], wavelet,
+                                                                         decomposition_level, wavelet_denoising,
+                                                                         threshold, extension_type, noise_level)
+        if res != BrainFlowExitCodes.STATUS_OK.value:
+            raise BrainFlowError('unable to denoise data', res)
+
+    @classmethod
+    def detrend_2d(cls, data: NDArray[Shape["*, *"], Float64], channels: List, detrend_operation: int) -> None:
+        """detrend selected rows of 2d array
+
+        :param data: 2d array from board, it works in-place
+        :type data: NDArray[Shape["*, *"], Float64]
+        :param channels: rows to detrend, None for all rows
+        :type channels: List
+        :param detrend_operation: Type of detrend operation
+        :type detrend_operation: int
+        """
+        channels = cls._get_channels_array(data, channels)
+        res = DataHandlerDLL.get_instance().detrend_2d(data, data.shape[0], data.shape[1], channels,
+                                                       channels.shape[0], detrend_operation)
+        if res != BrainFlowExitCodes.STATUS_OK.value:
+            raise BrainFlowError('unable to detrend data', res)
+
+    @classmethod
+    def perform_fft_2d(cls, data: NDArray[Shape["*, *"], Float64], channels: List,
+                       window: int) -> NDArray[Shape["*, *"], Complex128]:
+        """perform direct fft for selected rows of 2d array
+
+        :param data: 2d array from board, number of columns must be even
+        :type data: NDArray[Shape["*, *"], Float64]
+        :param channels: rows to use, None for all rows
+        :type channels: List
+        :param window: window function
+        :type window: int
+        :return: 2d array of complex values [len(channels) x (N / 2 + 1)]
+        :rtype: NDArray[Shape["*, *"], Complex128]
+        """
+        channels = cls._get_channels_array(data, channels)
+        output_len = int(data.shape[1] / 2 + 1)
+        temp_re = numpy.zeros((channels.shape[0], output_len), dtype=numpy.float64)
+        temp_im = numpy.zeros((channels.shape[0], output_len), dtype=numpy.float64)
+        res = DataHandlerDLL.get_instance().perform_fft_2d(data, data.shape[0], data.shape[1], channels,
+                                                           channels.shape[0], window, temp_re, temp_im)
+        if res != BrainFlowExitCodes.STATUS_OK.value:
+            raise BrainFlowError('unable to perform fft', res)
+        output = numpy.empty((channels.shape[0], output_len), dtype=numpy.complex128)
+        output.real = temp_re
+        output.imag = temp_im
+        return output
+
+    @classmethod
+    def get_psd_welch_2d(cls, data: NDArray[Shape["*, *"], Float64], channels: List, nfft: int, overlap: int,
+                         sampling_rate: int, window: int) -> Tuple:
+        """calculate PSD using Welch method for selected rows of 2d array
+
+        :param data: 2d array from board
+        :type data: NDArray[Shape["*, *"], Float64]
+        :param channels: rows to use, None for all rows
+        :type channels: List
+        :param nfft: FFT Window size, must be even
+        :type nfft: int
+        :param overlap: overlap of FFT Windows, must be between 0 and nfft
+        :type overlap: int
+        :param sampling_rate: sampling rate
+        :type sampling_rate: int
+        :param window: window function
+        :type window: int
+        :return: 2d amplitude array [len(channels) x (nfft / 2 + 1)] and frequency array of len nfft / 2 + 1
+        :rtype: tuple
+        """
+        channels = cls._get_channels_array(data, channels)
+        ampls = numpy.zeros((channels.shape[0], int(nfft / 2 + 1)), dtype=numpy.float64)
+        freqs = numpy.zeros(int(nfft / 2 + 1), dtype=numpy.float64)
+        res = DataHandlerDLL.get_instance().get_psd_welch_2d(data, data.shape[0], data.shape[1], channels,
+                                                             channels.shape[0], nfft, overlap, sampling_rate, window,
+                                                             ampls, freqs)
+        if res != BrainFlowExitCodes.STATUS_OK.value:
+            raise BrainFlowError('unable to calc psd welch', res)
+        return ampls, freqs
+
+    @classmethod
+    def create_filter(cls, filter_operation: int, sampling_rate: int, start_freq: float, stop_freq: float, order: int,
+                      filter_type: int, ripple: float = 0.0, num_channels: int = 1) -> StreamingFilter:
+        """create filter which keeps state between calls, use it to filter data chunk by chunk in real time
+
+        :param filter_operation: operation from FilterOperations enum
+        :type filter_operation: int
+        :param sampling_rate: board's sampling rate
+        :type sampling_rate: int
+        :param start_freq: cutoff frequency for low and high pass filters, start frequency for band filters
+        :type start_freq: float
+        :param stop_freq: stop frequency for band filters, ignored for low and high pass filters
+        :type stop_freq: float
+        :param order: filter order
+        :type order: int
+        :param filter_type: filter type from special enum, zero phase filters are not supported
+        :type filter_type: int
+        :param ripple: ripple value for Chebyshev filter
+        :type ripple: float
+        :param num_channels: number of rows in 2d arrays passed to process
+        :type num_channels: int
+        :return: stateful filter
+        :rtype: StreamingFilter
+        """
+        if not isinstance(sampling_rate, int):
+            raise BrainFlowError('wrong type for sampling rate', BrainFlowExitCodes.INVALID_ARGUMENTS_ERROR.value)
+        if not isinstance(filter_type, int):
+            raise BrainFlowError('wrong type for filter type', BrainFlowExitCodes.INVALID_ARGUMENTS_ERROR.value)
+        filter_id = numpy.zeros(1).astype(numpy.int32)
+        res = DataHandlerDLL.get_instance().create_filter(filter_operation, num_channels, sampling_rate, start_freq,
+                                                          stop_freq, order, filter_type, ripple, filter_id)
+        if res != BrainFlowExitCodes.STATUS_OK.value:
+            raise BrainFlowError('unable to create filter', res)
+        return StreamingFilter(int(filter_id[0]), num_channels)
+
+    @classmethod
+    def create_environmental_noise_filter(cls, sampling_rate: int, noise_type: int,
+                                          num_channels: int = 1) -> StreamingFilter:
+        """create stateful version of remove_environmental_noise, it uses causal filters instead of zero phase
+
+        :param sampling_rate: board's sampling rate
+        :type sampling_rate: int
+        :param noise_type: type of noise from NoiseTypes enum
+        :type noise_type: int
+        :param num_channels: number of rows in 2d arrays passed to process
+        :type num_channels: int
+        :return: stateful filter
+        :rtype: StreamingFilter
+        """
+        if not isinstance(sampling_rate, int):
+            raise BrainFlowError('wrong type for sampling rate', BrainFlowExitCodes.INVALID_ARGUMENTS_ERROR.value)
+        filter_id = numpy.zeros(1).astype(numpy.int32)
+        res = DataHandlerDLL.get_instance().create_environmental_noise_filter(num_channels, sampling_rate,
+                                                                              noise_type, filter_id)
+        if res != BrainFlowExitCodes.STATUS_OK.value:
+            raise BrainFlowError('unable to create filter', res)
+        return StreamingFilter(int(filter_id[0]), num_channels)
+
+    @classmethod
+    def get_dsp_cache_stats(cls) -> dict:
+        """get counters for cached DSP plans, filter designs, fft setups and windows are reused between calls
+        with the same params
+
+        :return: dict with number of cache hits, misses and number of cached plans
+        :rtype: dict
+        """
+        hits = numpy.zeros(1).astype(numpy.int64)
+        misses = numpy.zeros(1).astype(numpy.int64)
+        num_plans = numpy.zeros(1).astype(numpy.int32)
+        res = DataHandlerDLL.get_instance().get_dsp_cache_stats(hits, misses, num_plans)
+        if res != BrainFlowExitCodes.STATUS_OK.value:
+            raise BrainFlowError('unable to get dsp cache stats', res)
+        return {'hits': int(hits[0]), 'misses': int(misses[0]), 'num_plans': int(num_plans[0])}
+
+    @classmethod
+    def clear_dsp_cache(cls) -> None:
+        """remove all cached DSP plans and reset counters"""
+        res = DataHandlerDLL.get_instance().clear_dsp_cache()
+        if res != BrainFlowExitCodes.STATUS_OK.value:
+            raise BrainFlowError('unable to clear dsp cache', res)
+
     @classmethod
     def remove_environmental_noise(cls, data: NDArray[Shape["*"], Float64], sampling_rate: int, noise_type: float) -> None:
         """remove env noise using notch filter
@@ -720,7 +1514,7 @@ class DataFilter(object):
 
     @classmethod
     def perform_rolling_filter(cls, data: NDArray[Shape["*"], Float64], period: int, operation: int) -> None:
-        """smooth data using moving average or median
+        """smooth data using moving average, median, min or max
 
         :param data: data to smooth, it works in-place
         :type data: NDArray[Shape["*"], Float64]
@@ -1060,9 +1854,9 @@ class DataFilter(object):
         if res != BrainFlowExitCodes.STATUS_OK.value:
             raise BrainFlowError('unable to perform fft', res)
 
-        output = numpy.zeros(int(data.shape[0] / 2 + 1)).astype(numpy.complex128)
-        for i in range(output.shape[0]):
-            output[i] = numpy.complex128(complex(temp_re[i], temp_im[i]))
+        output = numpy.empty(int(data.shape[0] / 2 + 1), dtype=numpy.complex128)
+        output.real = temp_re
+        output.imag = temp_im
 
         return output
 
@@ -1199,15 +1993,11 @@ class DataFilter(object):
         num_bands = len(bands)
         avg_bands = numpy.zeros(num_bands).astype(numpy.float64)
         stddev_bands = numpy.zeros(num_bands).astype(numpy.float64)
-        data_1d = numpy.zeros(len(channels) * data.shape[1])
-        start_freqs = numpy.zeros(num_bands)
-        stop_freqs = numpy.zeros(num_bands)
-        for i in range(num_bands):
-            start_freqs[i] = bands[i][0]
-            stop_freqs[i] = bands[i][1]
-        for i, channel in enumerate(channels):
-            for j in range(data.shape[1]):
-                data_1d[j + data.shape[1] * i] = data[channel][j]
+        # fancy indexing returns a new row major array with selected channels
+        data_1d = numpy.ascontiguousarray(data[list(channels)], dtype=numpy.float64)
+        bands_arr = numpy.asarray(bands, dtype=numpy.float64).reshape(num_bands, 2)
+        start_freqs = numpy.ascontiguousarray(bands_arr[:, 0])
+        stop_freqs = numpy.ascontiguousarray(bands_arr[:, 1])
         res = DataHandlerDLL.get_instance().get_custom_band_powers(data_1d, len(channels), data.shape[1], start_freqs,
                                                                    stop_freqs, num_bands,
                                                                    sampling_rate, int(apply_filter), avg_bands,
@@ -1241,16 +2031,12 @@ class DataFilter(object):
         else:
             channels_to_use = channels
     
-        data_1d = numpy.zeros(len(channels_to_use) * data.shape[1]).astype(numpy.float64)
-
         w = numpy.zeros(num_components * num_components).astype(numpy.float64)
         k = numpy.zeros(len(channels_to_use) * num_components).astype(numpy.float64)
         a = numpy.zeros(num_components * len(channels_to_use)).astype(numpy.float64)
         s = numpy.zeros(data.shape[1] * num_components).astype(numpy.float64)
 
-        for i, channel in enumerate(channels_to_use):
-            for j in range(data.shape[1]):
-                data_1d[j + data.shape[1] * i] = data[channel][j]
+        data_1d = numpy.ascontiguousarray(data[list(channels_to_use)], dtype=numpy.float64)
 
         res = DataHandlerDLL.get_instance().perform_ica(data_1d, len(channels_to_use), data.shape[1],
                                                         num_components, w, k, a, s)
@@ -1273,11 +2059,8 @@ class DataFilter(object):
         :return: restored data
         :rtype: NDArray[Shape["*"], Float64]
         """
-        temp_re = numpy.zeros(data.shape[0]).astype(numpy.float64)
-        temp_im = numpy.zeros(data.shape[0]).astype(numpy.float64)
-        for i in range(data.shape[0]):
-            temp_re[i] = data[i].real
-            temp_im[i] = data[i].imag
+        temp_re = numpy.ascontiguousarray(data.real, dtype=numpy.float64)
+        temp_im = numpy.ascontiguousarray(data.imag, dtype=numpy.float64)
         output = numpy.zeros(2 * (data.shape[0] - 1)).astype(numpy.float64)
 
         res = DataHandlerDLL.get_instance().perform_ifft(temp_re, temp_im, output.shape[0], output)
@@ -1304,7 +2087,7 @@ class DataFilter(object):
 
     @classmethod
     def write_file(cls, data: NDArray[Shape["*, *"], Float64], file_name: str, file_mode: str) -> None:
-        """write data to file, in file data will be transposed
+        """write data to file, in file data will be transposed. If file name ends with .bfbin data are stored in binary channel major format
 
         :param data: data to store in a file
         :type data: NDArray[Shape["*, *"], Float64]
@@ -1330,7 +2113,7 @@ class DataFilter(object):
 
     @classmethod
     def read_file(cls, file_name: str) -> NDArray[Shape["*, *"], Float64]:
-        """read data from file
+        """read data from file, supports tsv/csv files and binary .bfbin files
 
         :param file_name: file name to read
         :type file_name: str
@@ -1361,6 +2144,19 @@ class DataFilter(object):
         data_arr = data_arr[0:num_rows[0] * num_cols[0]].reshape(num_rows[0], num_cols[0])
         return data_arr
 
+    @classmethod
+    def open_recording(cls, file_name: str, timestamp_channel: int = None) -> BrainFlowRecording:
+        """open binary .bfbin file without loading it into memory
+
+        :param file_name: file name to open
+        :type file_name: str
+        :param timestamp_channel: row with timestamps, if None it is taken from the file header or from board description
+        :type timestamp_channel: int
+        :return: lazy reader with channel and time range slicing
+        :rtype: BrainFlowRecording
+        """
+        return BrainFlowRecording(file_name, timestamp_channel)
+
     @classmethod
     def get_version(cls) -> str:
         """get version of brainflow libraries
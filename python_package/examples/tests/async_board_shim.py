@@ -0,0 +1,121 @@
+import asyncio
+import os
+import select
+import time
+
+import numpy as np
+from brainflow.board_shim import AsyncBoardShim, BoardShim, BrainFlowInputParams, BoardIds
+
+
+async def read_board(board_id, params, num_chunks, chunk_size):
+    board = AsyncBoardShim(board_id, params)
+    await board.prepare_session()
+    await board.start_stream()
+    timestamp_channel = BoardShim.get_timestamp_channel(board_id)
+    chunks = list()
+    async for chunk in board.chunks(chunk_size):
+        if chunk.shape[1] != chunk_size:
+            raise ValueError('wrong chunk size: %d' % chunk.shape[1])
+        chunks.append(chunk)
+        if len(chunks) == num_chunks:
+            break
+    await board.stop_stream()
+    await board.release_session()
+    data = np.hstack(chunks)
+    if np.any(np.diff(data[timestamp_channel]) <= 0):
+        raise ValueError('timestamps are not sorted')
+    return data.shape[1]
+
+
+def wait_fd(fd, timeout):
+    readable, _, _ = select.select([fd], [], [], timeout)
+    if not readable:
+        return False
+    try:
+        while os.read(fd, 4096):
+            pass
+    except BlockingIOError:
+        pass
+    return True
+
+
+def check_partial_read(board_id, params, chunk_size):
+    board = BoardShim(board_id, params)
+    board.prepare_session()
+    fd = board.register_data_ready_fd(chunk_size)
+    board.start_stream()
+    if not wait_fd(fd, 5):
+        raise ValueError('fd is not readable after start_stream')
+    # partial read leaves enough data for another chunk, fd should be readable again without new data
+    while board.get_board_data_count() < 3 * chunk_size:
+        time.sleep(0.05)
+    board.get_board_data(chunk_size)
+    if not wait_fd(fd, 0):
+        raise ValueError('fd is not rearmed after partial read')
+    # after full read fd becomes readable only once next chunk is available
+    board.get_board_data()
+    if not wait_fd(fd, 5):
+        raise ValueError('fd is not readable for the next chunk')
+    if board.get_board_data_count() < chunk_size:
+        raise ValueError('fd is readable before chunk is available')
+    board.stop_stream()
+    board.unregister_data_ready_fd()
+    board.release_session()
+
+
+async def ticker(stop_event, ticks):
+    while not stop_event.is_set():
+        ticks.append(time.time())
+        await asyncio.sleep(0.01)
+
+
+async def main():
+    BoardShim.enable_dev_board_logger()
+
+    # two synthetic boards, they should have different serial_port to be different sessions
+    boards = list()
+    for i in range(2):
+        params = BrainFlowInputParams()
+        params.serial_port = 'synthetic_%d' % i
+        boards.append(params)
+
+    # loop is not blocked while boards are waiting for data
+    stop_event = asyncio.Event()
+    ticks = list()
+    ticker_task = asyncio.ensure_future(ticker(stop_event, ticks))
+    start = time.time()
+    num_samples = await asyncio.gather(
+        *[read_board(BoardIds.SYNTHETIC_BOARD.value, params, 8, 64) for params in boards])
+    stop_event.set()
+    await ticker_task
+    print('samples per board: %s, time: %.3f s, ticks: %d' % (str(num_samples), time.time() - start, len(ticks)))
+    if num_samples != [8 * 64, 8 * 64]:
+        raise ValueError('wrong number of samples')
+    if len(ticks) < 50:
+        raise ValueError('event loop was blocked')
+
+    # iterator stops after stop_stream
+    board = AsyncBoardShim(BoardIds.SYNTHETIC_BOARD.value, BrainFlowInputParams())
+    await board.prepare_session()
+    await board.start_stream()
+
+    async def consume():
+        num_chunks = 0
+        async for _ in board.chunks(25):
+            num_chunks += 1
+        return num_chunks
+
+    consumer = asyncio.ensure_future(consume())
+    await asyncio.sleep(1)
+    await board.stop_stream()
+    num_chunks = await asyncio.wait_for(consumer, 5)
+    await board.release_session()
+    print('chunks before stop: %d' % num_chunks)
+    if num_chunks < 5:
+        raise ValueError('not enough chunks: %d' % num_chunks)
+
+    check_partial_read(BoardIds.SYNTHETIC_BOARD.value, BrainFlowInputParams(), 25)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,87 @@
+import time
+
+import numpy as np
+from brainflow.board_shim import BoardShim, BrainFlowInputParams, BoardIds
+from brainflow.data_filter import DataFilter
+from brainflow.exit_codes import BrainFlowError
+
+
+def main():
+    BoardShim.enable_dev_board_logger()
+
+    # use synthetic board for demo
+    params = BrainFlowInputParams()
+    board = BoardShim(BoardIds.SYNTHETIC_BOARD.value, params)
+    board.prepare_session()
+    board.add_streamer('bfbin://streamer_default.bfbin:w')
+    board.start_stream()
+    time.sleep(5)
+    board.stop_stream()
+    data = board.get_board_data()
+    # streamer flushes remaining packages when session is released
+    board.release_session()
+
+    recorded = DataFilter.read_file('streamer_default.bfbin')
+    print(recorded.shape)
+    if not np.array_equal(recorded, data):
+        raise ValueError('data from binary streamer differ from board data')
+
+    # memory mapped reader loads only requested channels and time ranges
+    timestamp_channel = BoardShim.get_timestamp_channel(BoardIds.SYNTHETIC_BOARD.value)
+    eeg_channels = BoardShim.get_eeg_channels(BoardIds.SYNTHETIC_BOARD.value)
+    with DataFilter.open_recording('streamer_default.bfbin') as recording:
+        print(recording.shape)
+        timestamps = data[timestamp_channel]
+        start = data.shape[1] // 4
+        stop = data.shape[1] // 2
+        eeg = recording.get_data_by_time(timestamps[start], timestamps[stop], eeg_channels)
+        if not np.array_equal(eeg, data[eeg_channels, start:stop]):
+            raise ValueError('wrong data for time range')
+        if not np.array_equal(recording[timestamp_channel, start:stop], timestamps[start:stop]):
+            raise ValueError('wrong data for sample range')
+
+    DataFilter.write_file(data, 'test.bfbin', 'w')
+    DataFilter.write_file(data, 'test.bfbin', 'a')
+    restored = DataFilter.read_file('test.bfbin')
+    print(restored.shape)
+    if not np.array_equal(restored, np.concatenate((data, data), axis=1)):
+        raise ValueError('restored data differ from original data')
+
+    # binary data is not appended to files in another format
+    with open('test_text.bfbin', 'w') as f:
+        f.write('1.0\t2.0\n')
+    try:
+        DataFilter.write_file(data, 'test_text.bfbin', 'a')
+        raise ValueError('binary data is appended to text file')
+    except BrainFlowError as e:
+        print('append to text file rejected: %s' % str(e))
+    board.prepare_session()
+    try:
+        board.add_streamer('bfbin://test_text.bfbin:a')
+        raise ValueError('binary streamer is appended to text file')
+    except BrainFlowError as e:
+        print('streamer for text file rejected: %s' % str(e))
+    board.release_session()
+    with open('test_text.bfbin') as f:
+        if f.read() != '1.0\t2.0\n':
+            raise ValueError('text file is changed')
+
+    # chunks with different sizes and interrupted last chunk, timestamps keep growing between chunks
+    chunks = [data.copy(), data.copy(), data[:, 10:].copy()]
+    for i, chunk in enumerate(chunks):
+        chunk[timestamp_channel] += 100 * i
+        DataFilter.write_file(chunk, 'test.bfbin', 'w' if i == 0 else 'a')
+    with open('test.bfbin', 'ab') as f:
+        f.write(b'\x10\x00\x00\x00\x00')
+    expected = np.concatenate(chunks, axis=1)
+    with DataFilter.open_recording('test.bfbin', timestamp_channel) as recording:
+        print(recording.shape)
+        if not np.array_equal(recording[:, :], expected):
+            raise ValueError('wrong data for file with different chunks')
+        index = recording.time_to_index(chunks[2][timestamp_channel, 5])
+        if index != 2 * data.shape[1] + 5:
+            raise ValueError('wrong index for timestamp in chunk with different size')
+
+
+if __name__ == "__main__":
+    main()
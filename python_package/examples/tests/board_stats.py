@@ -0,0 +1,58 @@
+import time
+
+from brainflow.board_shim import BoardShim, BrainFlowInputParams, BoardIds, BrainFlowBufferParams
+
+
+def main():
+    BoardShim.enable_dev_board_logger()
+
+    # use synthetic board for demo
+    params = BrainFlowInputParams()
+    board_id = BoardIds.SYNTHETIC_BOARD.value
+    board = BoardShim(board_id, params)
+    board.prepare_session()
+
+    # stats are disabled by default
+    board.start_stream(45000)
+    time.sleep(1)
+    board.stop_stream()
+    board.get_board_data()
+    stats = board.get_stats()
+    if stats['enabled'] or stats['packages_pushed'] != 0:
+        raise ValueError('stats are collected without collect_stats')
+
+    # small buffer to get overwritten packages
+    buffer_params = BrainFlowBufferParams()
+    buffer_params.collect_stats = True
+    board.set_buffer_params(buffer_params)
+    board.start_stream(100)
+    time.sleep(1)
+    board.stop_stream()
+    stats = board.get_stats()
+    if stats['packages_overwritten'] != stats['packages_pushed'] - stats['buffer_count']:
+        raise ValueError('wrong number of overwritten packages')
+
+    board.start_stream(45000)
+    num_samples = 0
+    for _ in range(10):
+        time.sleep(0.2)
+        num_samples = num_samples + board.get_board_data().shape[1]
+    board.stop_stream()
+    num_samples = num_samples + board.get_board_data().shape[1]
+    stats = board.get_stats()
+    print(stats)
+    if not stats['enabled'] or stats['packages_pushed'] == 0:
+        raise ValueError('stats are not collected')
+    # counters are reset by start_stream
+    if stats['packages_retrieved'] != num_samples or stats['packages_pushed'] != num_samples:
+        raise ValueError('wrong number of retrieved packages')
+    for name in ('push_latency', 'retrieval_latency'):
+        if sum(stats[name]['counts']) != stats[name]['count']:
+            raise ValueError('histogram counts dont match total for %s' % name)
+    if stats['retrieval_latency']['count'] != num_samples:
+        raise ValueError('retrieval latency is not recorded for every package')
+    board.release_session()
+
+
+if __name__ == "__main__":
+    main()
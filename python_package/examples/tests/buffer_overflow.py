@@ -0,0 +1,87 @@
+import time
+
+import numpy as np
+from brainflow.board_shim import BoardShim, BrainFlowInputParams, BoardIds, BrainFlowBufferParams, \
+    BufferOverflowPolicies, BufferTypes
+from brainflow.exit_codes import BrainFlowError
+
+
+def stream(board, buffer_params, buffer_size):
+    # buffer with 100 packages is full after 0.4 seconds
+    board.set_buffer_params(buffer_params)
+    board.start_stream(buffer_size)
+    time.sleep(1.5)
+    board.stop_stream()
+    data, lost = board.get_board_data(return_lost_samples=True)
+    stats = board.get_stats()
+    print('policy %d: %d samples, %d lost, capacity %d' % (
+        buffer_params.buffer_overflow_policy, data.shape[1], lost, stats['buffer_capacity']))
+    if data.shape[1] + lost != stats['packages_pushed']:
+        raise ValueError('some packages are not counted')
+    # next read reports only new losses
+    _, lost_after_read = board.get_board_data(return_lost_samples=True)
+    if lost_after_read != 0:
+        raise ValueError('lost samples are reported twice')
+    return data, lost, stats
+
+
+def main():
+    BoardShim.enable_dev_board_logger()
+
+    # use synthetic board for demo
+    params = BrainFlowInputParams()
+    board_id = BoardIds.SYNTHETIC_BOARD.value
+    package_num_channel = BoardShim.get_package_num_channel(board_id)
+    board = BoardShim(board_id, params)
+    board.prepare_session()
+
+    buffer_params = BrainFlowBufferParams()
+    buffer_params.collect_stats = True
+    buffer_params.buffer_overflow_policy = 10
+    try:
+        board.set_buffer_params(buffer_params)
+        raise ValueError('invalid overflow policy is accepted')
+    except BrainFlowError as e:
+        print('invalid policy rejected: %s' % str(e))
+    buffer_params.buffer_overflow_policy = BufferOverflowPolicies.GROW.value
+    buffer_params.buffer_type = BufferTypes.LOCK_FREE_BUFFER.value
+    try:
+        board.set_buffer_params(buffer_params)
+        raise ValueError('grow policy is accepted for lock free buffer')
+    except BrainFlowError as e:
+        print('grow policy for lock free buffer rejected: %s' % str(e))
+    buffer_params.buffer_type = BufferTypes.SPIN_LOCK_BUFFER.value
+
+    # default policy keeps the latest packages
+    buffer_params.buffer_overflow_policy = BufferOverflowPolicies.OVERWRITE_OLDEST.value
+    data, lost, stats = stream(board, buffer_params, 100)
+    if data.shape[1] != 100 or lost == 0 or stats['packages_overwritten'] != lost:
+        raise ValueError('wrong results for OVERWRITE_OLDEST policy')
+
+    # first packages are kept, package counter has no gaps
+    buffer_params.buffer_overflow_policy = BufferOverflowPolicies.DROP_NEWEST.value
+    for buffer_type in (BufferTypes.SPIN_LOCK_BUFFER.value, BufferTypes.LOCK_FREE_BUFFER.value):
+        buffer_params.buffer_type = buffer_type
+        data, lost, stats = stream(board, buffer_params, 100)
+        steps = np.diff(data[package_num_channel]) % 256
+        if data.shape[1] != 100 or lost == 0 or stats['packages_dropped'] != lost or np.any(steps != 1):
+            raise ValueError('wrong results for DROP_NEWEST policy')
+    buffer_params.buffer_type = BufferTypes.SPIN_LOCK_BUFFER.value
+
+    # capacity is doubled until all packages fit
+    buffer_params.buffer_overflow_policy = BufferOverflowPolicies.GROW.value
+    buffer_params.max_buffer_size = 1000
+    data, lost, stats = stream(board, buffer_params, 100)
+    if lost != 0 or stats['buffer_capacity'] <= 100 or stats['buffer_capacity'] > 1000:
+        raise ValueError('wrong results for GROW policy')
+
+    # cap is reached, the oldest packages are overwritten
+    buffer_params.max_buffer_size = 150
+    data, lost, stats = stream(board, buffer_params, 100)
+    if data.shape[1] != 150 or lost == 0 or stats['buffer_capacity'] != 150:
+        raise ValueError('wrong results for GROW policy with small cap')
+    board.release_session()
+
+
+if __name__ == "__main__":
+    main()
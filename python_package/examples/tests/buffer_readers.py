@@ -0,0 +1,63 @@
+import time
+
+import numpy as np
+from brainflow.board_shim import BoardShim, BrainFlowInputParams, BoardIds
+
+
+def main():
+    BoardShim.enable_dev_board_logger()
+
+    # use synthetic board for demo
+    params = BrainFlowInputParams()
+    board_id = BoardIds.SYNTHETIC_BOARD.value
+    timestamp_channel = BoardShim.get_timestamp_channel(board_id)
+    board = BoardShim(board_id, params)
+    board.prepare_session()
+
+    # each consumer has its own cursor and gets every package once
+    recorder = board.create_reader()
+    plot = board.create_reader()
+    board.start_stream(45000)
+    recorded = list()
+    plotted = list()
+    for _ in range(10):
+        time.sleep(0.2)
+        recorded.append(recorder.get_data())
+        plotted.append(plot.get_data(20))
+    time.sleep(0.2)
+    plotted.append(plot.get_data())
+    recorded.append(recorder.get_data())
+    recorded = np.hstack(recorded)
+    plotted = np.hstack(plotted)
+    print('recorder: %d samples, plot: %d samples' % (recorded.shape[1], plotted.shape[1]))
+    num_samples = min(recorded.shape[1], plotted.shape[1])
+    if num_samples < 400 or not np.array_equal(recorded[:, :num_samples], plotted[:, :num_samples]):
+        raise ValueError('readers got different data')
+    if np.any(np.diff(recorded[timestamp_channel]) <= 0):
+        raise ValueError('timestamps are not sorted')
+    if recorder.missed_samples != 0 or plot.missed_samples != 0:
+        raise ValueError('readers should not miss data')
+    # readers dont remove data from the ring buffer
+    if board.get_board_data_count() < num_samples:
+        raise ValueError('readers removed data from the ring buffer')
+    recorder.close()
+    plot.close()
+    board.stop_stream()
+
+    # slow reader reports packages overwritten before it got them
+    buffer_size = 100
+    with board.create_reader() as slow_reader:
+        board.start_stream(buffer_size)
+        time.sleep(1.5)
+        board.stop_stream()
+        data = slow_reader.get_data()
+        print('slow reader: %d samples, missed: %d' % (data.shape[1], slow_reader.missed_samples))
+        if data.shape[1] != buffer_size or slow_reader.missed_samples < 100:
+            raise ValueError('wrong missed samples for slow reader')
+        if slow_reader.get_data_count() != 0 or slow_reader.get_data().shape[1] != 0:
+            raise ValueError('reader should not return the same data twice')
+    board.release_session()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import os
+import tempfile
+import time
+
+import numpy as np
+from brainflow.board_shim import BoardShim, BrainFlowInputParams, BoardIds, BrainFlowBufferParams, BufferTypes
+from brainflow.data_filter import DataFilter
+
+
+def stream(board, buffer_params, streamer_params=None):
+    board.set_buffer_params(buffer_params)
+    board.start_stream(450000, streamer_params)
+    time.sleep(2)
+    board.stop_stream()
+    stats = board.get_stats()
+    data = board.get_board_data()
+    print('lazy: %s, float32 exg: %s, buffer type: %d, %d samples, memory: %.2f MB' % (
+        buffer_params.lazy_allocation, buffer_params.float32_exg, buffer_params.buffer_type, data.shape[1],
+        stats['session_buffer_memory_bytes'] / 1048576.0))
+    return data, stats
+
+
+def main():
+    BoardShim.enable_dev_board_logger()
+
+    # use synthetic board for demo
+    params = BrainFlowInputParams()
+    board_id = BoardIds.SYNTHETIC_BOARD.value
+    exg_channels = BoardShim.get_exg_channels(board_id)
+    other_rows = [i for i in range(BoardShim.get_num_rows(board_id)) if i not in exg_channels]
+    board = BoardShim(board_id, params)
+    board.prepare_session()
+
+    # whole buffer is allocated by start_stream
+    buffer_params = BrainFlowBufferParams()
+    _, stats = stream(board, buffer_params)
+    eager_memory = stats['buffer_memory_bytes']
+    if eager_memory != 450000 * BoardShim.get_num_rows(board_id) * 8:
+        raise ValueError('wrong memory usage for default storage')
+    if stats['session_buffer_memory_bytes'] < eager_memory:
+        raise ValueError('session memory should include all presets')
+
+    # only chunks with data are allocated
+    buffer_params.lazy_allocation = True
+    _, stats = stream(board, buffer_params)
+    if stats['buffer_memory_bytes'] * 100 > eager_memory:
+        raise ValueError('lazy allocation uses too much memory')
+
+    # exg rows are rounded to float32, other rows are not changed
+    folder = tempfile.mkdtemp()
+    buffer_params.float32_exg = True
+    for buffer_type in (BufferTypes.SPIN_LOCK_BUFFER.value, BufferTypes.LOCK_FREE_BUFFER.value):
+        file_name = os.path.join(folder, 'buffer_storage_%d.bfbin' % buffer_type)
+        buffer_params.buffer_type = buffer_type
+        data, stats = stream(board, buffer_params, 'bfbin://%s:w' % file_name)
+        board.delete_streamer('bfbin://%s:w' % file_name)
+        recorded = DataFilter.read_file(file_name)
+        if data.shape != recorded.shape or data.shape[1] == 0:
+            raise ValueError('ring buffer and file have different number of packages')
+        if not np.array_equal(data[exg_channels], recorded[exg_channels].astype(np.float32).astype(np.float64)):
+            raise ValueError('exg rows are not stored as float32')
+        if not np.array_equal(data[other_rows], recorded[other_rows]):
+            raise ValueError('rows which are not exg should be stored as float64')
+        os.remove(file_name)
+    board.release_session()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+import numpy as np
+from brainflow.board_shim import BoardShim
+from brainflow.data_filter import DataFilter, FilterTypes
+
+
+def get_amplitude(data, sampling_rate):
+    # skip filter transient
+    return np.max(np.abs(data[sampling_rate * 2:]))
+
+
+def filter_tone(freq, sampling_rate, operation, ripple):
+    data = np.sin(2 * np.pi * freq * np.arange(sampling_rate * 4) / sampling_rate)
+    operation(data, sampling_rate, 5.0, 15.0, 4, FilterTypes.CHEBYSHEV_TYPE_1.value, ripple)
+    return get_amplitude(data, sampling_rate)
+
+
+def main():
+    BoardShim.enable_dev_board_logger()
+    sampling_rate = 250
+
+    # 7 Hz is inside of 5-15 Hz band, before the fix ripple overwrote band width
+    # and ripple itself was not set
+    passed = filter_tone(7.0, sampling_rate, DataFilter.perform_bandpass, 1.0)
+    stopped = filter_tone(7.0, sampling_rate, DataFilter.perform_bandstop, 1.0)
+    print('bandpass amplitude: %f, bandstop amplitude: %f' % (passed, stopped))
+    if not 0.8 < passed < 1.01:
+        raise ValueError('wrong chebyshev bandpass amplitude %f' % passed)
+    if not stopped < 0.1:
+        raise ValueError('wrong chebyshev bandstop amplitude %f' % stopped)
+
+    # passband ripple depends on ripple param
+    low_ripple = filter_tone(7.0, sampling_rate, DataFilter.perform_bandpass, 0.1)
+    high_ripple = filter_tone(7.0, sampling_rate, DataFilter.perform_bandpass, 3.0)
+    print('amplitude with 0.1 dB ripple: %f, with 3 dB ripple: %f' % (low_ripple, high_ripple))
+    if not np.all(np.isfinite([low_ripple, high_ripple])) or np.isclose(low_ripple, high_ripple):
+        raise ValueError('ripple is ignored')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import threading
+import time
+
+import numpy as np
+from brainflow.board_shim import BoardShim, BrainFlowInputParams, BoardIds, BrainFlowPresets
+
+
+def main():
+    BoardShim.enable_dev_board_logger()
+
+    # use synthetic board for demo
+    params = BrainFlowInputParams()
+    board_id = BoardIds.SYNTHETIC_BOARD.value
+    num_rows = BoardShim.get_num_rows(board_id, BrainFlowPresets.DEFAULT_PRESET)
+    timestamp_channel = BoardShim.get_timestamp_channel(board_id, BrainFlowPresets.DEFAULT_PRESET)
+    min_batch = 25
+
+    chunks = list()
+    lock = threading.Lock()
+
+    def on_data(data):
+        if data.shape[0] != num_rows or data.shape[1] < min_batch:
+            raise ValueError('wrong shape for data: %s' % str(data.shape))
+        # data is valid only during the call, copy it to keep
+        with lock:
+            chunks.append(data.copy())
+
+    board = BoardShim(board_id, params)
+    board.prepare_session()
+    board.register_data_callback(on_data, BrainFlowPresets.DEFAULT_PRESET, min_batch)
+    board.start_stream()
+    time.sleep(5)
+    board.stop_stream()
+    board.unregister_data_callback(BrainFlowPresets.DEFAULT_PRESET)
+    with lock:
+        num_chunks = len(chunks)
+    time.sleep(0.5)
+    with lock:
+        if len(chunks) != num_chunks:
+            raise ValueError('callback was called after unregister')
+
+    # callback gets the same data as ring buffer
+    buffer_data = board.get_board_data()
+    board.release_session()
+    callback_data = np.hstack(chunks)
+    print('chunks: %d, samples: %d' % (len(chunks), callback_data.shape[1]))
+    if len(chunks) == 0:
+        raise ValueError('callback was not called')
+    if np.any(np.diff(callback_data[timestamp_channel]) < 0):
+        raise ValueError('timestamps are not sorted')
+    num_samples = min(callback_data.shape[1], buffer_data.shape[1])
+    if not np.array_equal(callback_data[:, :num_samples], buffer_data[:, :num_samples]):
+        raise ValueError('callback data doesnt match ring buffer')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import time
+
+import numpy as np
+from brainflow.board_shim import BoardShim, BrainFlowInputParams, BoardIds
+from brainflow.data_filter import DataFilter, FilterTypes, WindowOperations
+
+
+def main():
+    BoardShim.enable_dev_board_logger()
+
+    # use synthetic board for demo
+    params = BrainFlowInputParams()
+    board_id = BoardIds.SYNTHETIC_BOARD.value
+    sampling_rate = BoardShim.get_sampling_rate(board_id)
+    eeg_channels = BoardShim.get_eeg_channels(board_id)
+    board = BoardShim(board_id, params)
+    board.prepare_session()
+    board.start_stream()
+    time.sleep(5)
+    data = board.get_current_board_data(512)
+    board.stop_stream()
+    board.release_session()
+
+    DataFilter.clear_dsp_cache()
+    nfft = DataFilter.get_nearest_power_of_two(sampling_rate)
+    results = list()
+    # same params for each iteration, only the first one designs filter, fft setup and window
+    for _ in range(10):
+        row = data[eeg_channels[0]].copy()
+        DataFilter.perform_bandpass(row, sampling_rate, 3.0, 45.0, 4, FilterTypes.BUTTERWORTH_ZERO_PHASE.value, 0)
+        psd = DataFilter.get_psd_welch(row, nfft, nfft // 2, sampling_rate, WindowOperations.HANNING.value)
+        results.append(psd[0])
+    stats = DataFilter.get_dsp_cache_stats()
+    print(stats)
+    if stats['misses'] != 3 or stats['hits'] < 9 or stats['num_plans'] != 3:
+        raise ValueError('wrong dsp cache stats: %s' % str(stats))
+    for psd in results[1:]:
+        if not np.array_equal(psd, results[0]):
+            raise ValueError('cached plans changed the result')
+
+    DataFilter.clear_dsp_cache()
+    stats = DataFilter.get_dsp_cache_stats()
+    if stats['hits'] != 0 or stats['misses'] != 0 or stats['num_plans'] != 0:
+        raise ValueError('cache was not cleared: %s' % str(stats))
+
+    # fft setup for long data doesnt fit into cache limit, window is small enough
+    DataFilter.perform_fft(np.random.rand(2 ** 20), WindowOperations.HANNING.value)
+    stats = DataFilter.get_dsp_cache_stats()
+    if stats['misses'] != 2 or stats['num_plans'] != 1:
+        raise ValueError('large fft plan is cached: %s' % str(stats))
+
+
+if __name__ == "__main__":
+    main()
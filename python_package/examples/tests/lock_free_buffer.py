@@ -0,0 +1,31 @@
+import time
+
+from brainflow.board_shim import BoardShim, BrainFlowInputParams, BoardIds, BrainFlowBufferParams, BufferTypes
+
+
+def main():
+    BoardShim.enable_dev_board_logger()
+
+    # use synthetic board for demo
+    params = BrainFlowInputParams()
+    board_id = BoardIds.SYNTHETIC_BOARD.value
+
+    # board thread never waits for readers with lock free buffer
+    buffer_params = BrainFlowBufferParams()
+    buffer_params.buffer_type = BufferTypes.LOCK_FREE_BUFFER.value
+
+    board = BoardShim(board_id, params)
+    board.prepare_session()
+    board.start_stream(45000, buffer_params=buffer_params)
+    time.sleep(5)
+    current_data = board.get_current_board_data(256)
+    data = board.get_board_data()
+    board.stop_stream()
+    board.release_session()
+
+    print(current_data.shape)
+    print(data.shape)
+
+
+if __name__ == "__main__":
+    main()
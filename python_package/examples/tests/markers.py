@@ -49,10 +49,15 @@ def main():
         time.sleep(1)
         board.insert_marker(i + 1)
     data = board.get_board_data()
+    marker_channel = board.get_session_board_descr()['marker_channel']
     board.stop_stream()
     board.release_session()
 
     print(data)
+    # each marker is added to a single package, last markers may wait for the next package
+    markers = [int(x) for x in data[marker_channel] if x != 0]
+    if not markers or markers != list(range(1, len(markers) + 1)):
+        raise ValueError('markers are lost or reordered: %s' % markers)
 
 
 if __name__ == "__main__":
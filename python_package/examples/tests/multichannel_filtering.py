@@ -0,0 +1,44 @@
+import time
+
+import numpy as np
+from brainflow.board_shim import BoardShim, BrainFlowInputParams, BoardIds
+from brainflow.data_filter import DataFilter, FilterTypes, DetrendOperations, WindowOperations
+
+
+def main():
+    BoardShim.enable_dev_board_logger()
+
+    # use synthetic board for demo
+    params = BrainFlowInputParams()
+    board_id = BoardIds.SYNTHETIC_BOARD.value
+    sampling_rate = BoardShim.get_sampling_rate(board_id)
+    eeg_channels = BoardShim.get_eeg_channels(board_id)
+    board = BoardShim(board_id, params)
+    board.prepare_session()
+    board.start_stream()
+    time.sleep(5)
+    data = board.get_current_board_data(1024)
+    board.stop_stream()
+    board.release_session()
+
+    # process all eeg channels with a single native call instead of a loop over channels
+    expected = data.copy()
+    for channel in eeg_channels:
+        row = expected[channel].copy()
+        DataFilter.detrend(row, DetrendOperations.CONSTANT.value)
+        DataFilter.perform_bandpass(row, sampling_rate, 3.0, 45.0, 4, FilterTypes.BUTTERWORTH.value, 0)
+        expected[channel] = row
+    DataFilter.detrend_2d(data, eeg_channels, DetrendOperations.CONSTANT.value)
+    DataFilter.perform_bandpass_2d(data, eeg_channels, sampling_rate, 3.0, 45.0, 4, FilterTypes.BUTTERWORTH.value, 0)
+    if not np.allclose(data, expected):
+        raise ValueError('multichannel filtering differs from single channel filtering')
+
+    ampls, freqs = DataFilter.get_psd_welch_2d(data, eeg_channels, 256, 128, sampling_rate,
+                                               WindowOperations.HANNING.value)
+    print(ampls.shape, freqs.shape)
+    fft_data = DataFilter.perform_fft_2d(data, eeg_channels, WindowOperations.HANNING.value)
+    print(fft_data.shape)
+
+
+if __name__ == "__main__":
+    main()
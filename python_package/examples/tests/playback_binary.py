@@ -0,0 +1,89 @@
+import os
+import tempfile
+import time
+
+import numpy as np
+from brainflow.board_shim import BoardShim, BrainFlowInputParams, BoardIds
+from brainflow.data_filter import DataFilter
+
+
+def replay(file_name, master_board_id, commands, speed='max'):
+    params = BrainFlowInputParams()
+    params.file = file_name
+    params.master_board = master_board_id
+    board = BoardShim(BoardIds.PLAYBACK_FILE_BOARD.value, params)
+    start = time.time()
+    board.prepare_session()
+    print('prepare_session for %s took %.3f seconds' % (os.path.basename(file_name), time.time() - start))
+    board.config_board('old_timestamps')
+    board.config_board('set_speed:%s' % speed)
+    board.start_stream()
+    for command in commands:
+        board.config_board(command)
+    time.sleep(1)
+    board.stop_stream()
+    data = board.get_board_data()
+    board.release_session()
+    return data
+
+
+def main():
+    BoardShim.enable_dev_board_logger()
+
+    # record the same data in text and binary formats
+    folder = tempfile.mkdtemp()
+    tsv_file = os.path.join(folder, 'playback.csv')
+    bfbin_file = os.path.join(folder, 'playback.bfbin')
+    master_board_id = BoardIds.SYNTHETIC_BOARD.value
+    timestamp_channel = BoardShim.get_timestamp_channel(master_board_id)
+    board = BoardShim(master_board_id, BrainFlowInputParams())
+    board.prepare_session()
+    board.start_stream(45000, 'file://%s:w' % tsv_file)
+    board.add_streamer('bfbin://%s:w' % bfbin_file)
+    time.sleep(3)
+    board.stop_stream()
+    board.release_session()
+
+    # invalid lines are skipped and not used by index
+    recorded = DataFilter.read_file(tsv_file)
+    with open(tsv_file) as f:
+        lines = f.readlines()
+    invalid_file = os.path.join(folder, 'invalid_lines.csv')
+    with open(invalid_file, 'w') as f:
+        f.writelines(['header\n'] + lines[:511] + ['invalid line\n'] + lines[511:])
+    target = recorded[timestamp_channel, 300]
+    data = replay(invalid_file, master_board_id, ['set_timestamp:%f' % target])
+    if data.shape[1] < recorded.shape[1] - 300 or \
+            not np.allclose(data[:, -(recorded.shape[1] - 300):], recorded[:, 300:]):
+        raise ValueError('seek by timestamp failed for file with invalid lines')
+    os.remove(invalid_file + '.bfidx')
+    os.remove(invalid_file)
+
+    for file_name in (bfbin_file, tsv_file):
+        # text file has less precision, compare with data from the same file
+        recorded = DataFilter.read_file(file_name)
+        print('recorded %d samples' % recorded.shape[1])
+        data = replay(file_name, master_board_id, [])
+        if data.shape != recorded.shape or not np.allclose(data, recorded):
+            raise ValueError('replayed data is different from recorded for %s' % file_name)
+        # sidecar index is created by the first prepare_session and reused later
+        if not os.path.isfile(file_name + '.bfidx'):
+            raise ValueError('index is not created for %s' % file_name)
+        target = recorded[timestamp_channel, recorded.shape[1] // 2]
+        data = replay(file_name, master_board_id, ['set_timestamp:%f' % target])
+        last_part = recorded[:, recorded.shape[1] // 2:]
+        print('after seek: %d samples' % data.shape[1])
+        if not np.allclose(data[:, -last_part.shape[1]:], last_part):
+            raise ValueError('seek by timestamp failed for %s' % file_name)
+        # position is not changed if there is no package with such timestamp
+        data = replay(file_name, master_board_id, ['set_timestamp:%f' % (recorded[timestamp_channel, -1] + 1000)],
+                      speed='1.0')
+        print('after seek past the end: %d samples' % data.shape[1])
+        if data.shape[1] < 100 or not np.allclose(data, recorded[:, :data.shape[1]]):
+            raise ValueError('seek past the end changed position for %s' % file_name)
+        os.remove(file_name + '.bfidx')
+        os.remove(file_name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import os
+import tempfile
+import time
+
+from brainflow.board_shim import BoardShim, BrainFlowInputParams, BoardIds
+from brainflow.data_filter import DataFilter
+from brainflow.exit_codes import BrainFlowError
+
+
+def main():
+    BoardShim.enable_dev_board_logger()
+
+    # record file using synthetic board
+    file_name = os.path.join(tempfile.mkdtemp(), 'playback_speed.csv')
+    master_board_id = BoardIds.SYNTHETIC_BOARD.value
+    sampling_rate = BoardShim.get_sampling_rate(master_board_id)
+    board = BoardShim(master_board_id, BrainFlowInputParams())
+    board.prepare_session()
+    board.start_stream(45000, 'file://%s:w' % file_name)
+    time.sleep(4)
+    board.stop_stream()
+    board.release_session()
+    num_recorded = DataFilter.read_file(file_name).shape[1]
+    print('recorded %d samples' % num_recorded)
+
+    params = BrainFlowInputParams()
+    params.file = file_name
+    params.master_board = master_board_id
+    board = BoardShim(BoardIds.PLAYBACK_FILE_BOARD.value, params)
+    board.prepare_session()
+    try:
+        board.config_board('set_speed:0')
+        raise ValueError('zero speed is accepted')
+    except BrainFlowError as e:
+        print('invalid speed rejected: %s' % str(e))
+
+    board.config_board('set_speed:4')
+    board.start_stream()
+    time.sleep(0.5)
+    count = board.get_board_data_count()
+    print('speed 4: %d samples in 0.5 seconds' % count)
+    if count < sampling_rate:
+        raise ValueError('playback is not faster than real time')
+
+    # rest of the file is pushed without waiting for recorded timestamps
+    board.config_board('set_speed:max')
+    time.sleep(0.5)
+    data = board.get_board_data()
+    print('max speed: %d samples' % data.shape[1])
+    if data.shape[1] != num_recorded:
+        raise ValueError('file is not replayed in unthrottled mode')
+    board.stop_stream()
+    board.release_session()
+    os.remove(file_name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import time
+
+import numpy as np
+from brainflow.board_shim import BoardShim, BrainFlowInputParams, BoardIds, BrainFlowPresets
+
+
+def main():
+    BoardShim.enable_dev_board_logger()
+
+    # use synthetic board for demo
+    params = BrainFlowInputParams()
+    board_id = BoardIds.SYNTHETIC_BOARD.value
+    num_rows = BoardShim.get_num_rows(board_id, BrainFlowPresets.DEFAULT_PRESET)
+    timestamp_channel = BoardShim.get_timestamp_channel(board_id, BrainFlowPresets.DEFAULT_PRESET)
+
+    # allocate once and reuse the same array for each poll
+    buffer = np.zeros((num_rows, 250), dtype=np.float64)
+
+    board = BoardShim(board_id, params)
+    board.prepare_session()
+    board.start_stream()
+    last_timestamp = None
+    for _ in range(10):
+        time.sleep(0.5)
+        current = board.get_current_board_data(50, out=buffer)
+        if current.shape[0] != num_rows or current.shape[1] > 50:
+            raise ValueError('wrong shape for current data: %s' % str(current.shape))
+        data = board.get_board_data(out=buffer)
+        if data.base is not buffer:
+            raise ValueError('returned array is not a view of preallocated buffer')
+        timestamps = data[timestamp_channel]
+        if np.any(np.diff(timestamps) < 0):
+            raise ValueError('timestamps are not sorted')
+        if last_timestamp is not None and data.shape[1] > 0 and timestamps[0] < last_timestamp:
+            raise ValueError('packages were returned twice')
+        if data.shape[1] > 0:
+            last_timestamp = timestamps[-1]
+        print(data.shape)
+    board.stop_stream()
+    board.release_session()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+import os
+import tempfile
+import threading
+import time
+
+from brainflow.board_shim import BoardShim, BrainFlowInputParams, BoardIds, BrainFlowBufferParams, \
+    StreamerOverflowPolicies
+from brainflow.data_filter import DataFilter
+from brainflow.exit_codes import BrainFlowError
+
+
+def main():
+    BoardShim.enable_dev_board_logger()
+
+    # use synthetic board for demo
+    params = BrainFlowInputParams()
+    board_id = BoardIds.SYNTHETIC_BOARD.value
+    board = BoardShim(board_id, params)
+    board.prepare_session()
+
+    buffer_params = BrainFlowBufferParams()
+    buffer_params.streamer_overflow_policy = 10
+    try:
+        board.set_buffer_params(buffer_params)
+        raise ValueError('invalid overflow policy is accepted')
+    except BrainFlowError as e:
+        print('invalid policy rejected: %s' % str(e))
+
+    # streamers are written by a separate thread, BLOCK policy never loses packages
+    file_name = os.path.join(tempfile.mkdtemp(), 'streamer_queue.csv')
+    buffer_params.streamer_overflow_policy = StreamerOverflowPolicies.BLOCK.value
+    buffer_params.streamer_queue_size = 1024
+    board.set_buffer_params(buffer_params)
+    board.start_stream(45000, 'file://%s:w' % file_name)
+    time.sleep(2)
+    board.stop_stream()
+    data = board.get_board_data()
+    stats = board.get_streamer_stats()
+    print(stats)
+    if stats['queued'] != data.shape[1] or stats['dropped'] != 0:
+        raise ValueError('wrong streamer stats')
+    # pending packages are written before streamer is removed
+    board.delete_streamer('file://%s:w' % file_name)
+    if board.get_streamer_stats()['pending'] != 0:
+        raise ValueError('streamer removed before pending packages are written')
+    restored = DataFilter.read_file(file_name)
+    print('ring buffer: %d samples, file: %d samples' % (data.shape[1], restored.shape[1]))
+    if restored.shape != data.shape:
+        raise ValueError('file has different number of packages')
+
+    # packages for presets without streamers are not queued
+    board.start_stream(45000)
+    time.sleep(1)
+    board.stop_stream()
+    if board.get_streamer_stats()['queued'] != stats['queued']:
+        raise ValueError('packages queued without streamers')
+    board.release_session()
+    os.remove(file_name)
+
+    # writer is stuck on a pipe which nobody reads, BLOCK policy waits only streamer_block_timeout_ms
+    if hasattr(os, 'mkfifo'):
+        board.prepare_session()
+        fifo_name = os.path.join(os.path.dirname(file_name), 'streamer_queue.fifo')
+        os.mkfifo(fifo_name)
+        resume_reading = threading.Event()
+
+        def read_fifo():
+            with open(fifo_name, 'rb') as f:
+                resume_reading.wait()
+                while f.read(65536):
+                    pass
+
+        reader = threading.Thread(target=read_fifo)
+        reader.start()
+        buffer_params.streamer_queue_size = 16
+        buffer_params.streamer_block_timeout_ms = 100
+        board.set_buffer_params(buffer_params)
+        board.start_stream(45000, 'file://%s:w' % fifo_name)
+        time.sleep(3)
+        board.stop_stream()
+        data = board.get_board_data()
+        stats = board.get_streamer_stats()
+        print(stats)
+        resume_reading.set()
+        board.delete_streamer('file://%s:w' % fifo_name)
+        reader.join()
+        os.remove(fifo_name)
+        # only one package waits for the timeout, next ones are dropped until writer makes progress
+        if data.shape[1] < 2 * BoardShim.get_sampling_rate(board_id) or stats['dropped'] == 0:
+            raise ValueError('acquisition thread is blocked by stuck streamer')
+        if stats['queued'] + stats['dropped'] != data.shape[1]:
+            raise ValueError('dropped packages are not counted')
+        board.release_session()
+
+
+if __name__ == "__main__":
+    main()
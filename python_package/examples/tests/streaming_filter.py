@@ -0,0 +1,56 @@
+import time
+
+import numpy as np
+from brainflow.board_shim import BoardShim, BrainFlowInputParams, BoardIds
+from brainflow.data_filter import DataFilter, FilterOperations, FilterTypes, NoiseTypes
+
+
+def main():
+    BoardShim.enable_dev_board_logger()
+
+    # use synthetic board for demo
+    params = BrainFlowInputParams()
+    board_id = BoardIds.SYNTHETIC_BOARD.value
+    sampling_rate = BoardShim.get_sampling_rate(board_id)
+    eeg_channels = BoardShim.get_eeg_channels(board_id)
+
+    # filters keep state between calls, so each chunk is filtered as a continuation of previous one
+    bandpass = DataFilter.create_filter(FilterOperations.BANDPASS.value, sampling_rate, 3.0, 45.0, 4,
+                                        FilterTypes.BUTTERWORTH.value, num_channels=len(eeg_channels))
+    notch = DataFilter.create_environmental_noise_filter(sampling_rate, NoiseTypes.FIFTY.value,
+                                                         num_channels=len(eeg_channels))
+
+    board = BoardShim(board_id, params)
+    board.prepare_session()
+    board.start_stream()
+    raw_chunks = list()
+    filtered_chunks = list()
+    for _ in range(10):
+        time.sleep(0.5)
+        data = board.get_board_data()
+        eeg = np.ascontiguousarray(data[eeg_channels])
+        raw_chunks.append(eeg.copy())
+        bandpass.process(eeg)
+        notch.process(eeg)
+        filtered_chunks.append(eeg)
+    board.stop_stream()
+    board.release_session()
+
+    # result should be the same as filtering the whole recording at once
+    whole = np.concatenate(raw_chunks, axis=1)
+    with DataFilter.create_filter(FilterOperations.BANDPASS.value, sampling_rate, 3.0, 45.0, 4,
+                                  FilterTypes.BUTTERWORTH.value, num_channels=len(eeg_channels)) as whole_bandpass:
+        whole_bandpass.process(whole)
+    with DataFilter.create_environmental_noise_filter(sampling_rate, NoiseTypes.FIFTY.value,
+                                                      num_channels=len(eeg_channels)) as whole_notch:
+        whole_notch.process(whole)
+    chunked = np.concatenate(filtered_chunks, axis=1)
+    print(chunked.shape)
+    if not np.allclose(whole, chunked):
+        raise ValueError('chunked filtering differs from filtering the whole array')
+    bandpass.release()
+    notch.release()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import time
+
+import numpy as np
+from brainflow.board_shim import BoardShim, BrainFlowInputParams, BoardIds
+from brainflow.exit_codes import BrainFlowError
+
+
+def main():
+    BoardShim.enable_dev_board_logger()
+
+    # high rate and many channels for load testing, the same commands work in config_board
+    params = BrainFlowInputParams()
+    params.other_info = 'set_sampling_rate:8000;set_eeg_channels:256;set_batch_size:64;vectorized_true'
+    board_id = BoardIds.SYNTHETIC_BOARD.value
+    board = BoardShim(board_id, params)
+    board.prepare_session()
+
+    # static description doesnt know about settings of this session
+    descr = board.get_session_board_descr()
+    print('session description: %d rows, %d Hz' % (descr['num_rows'], descr['sampling_rate']))
+    if descr['sampling_rate'] != 8000 or len(descr['eeg_channels']) != 256 or len(descr['eeg_names'].split(',')) != 256:
+        raise ValueError('wrong session description')
+    if descr['num_rows'] != BoardShim.get_num_rows(board_id) + 256 - 16:
+        raise ValueError('wrong number of rows')
+
+    board.start_stream(450000)
+    try:
+        board.config_board('set_sampling_rate:250')
+        raise ValueError('sampling rate is changed while streaming')
+    except BrainFlowError as e:
+        print('config rejected while streaming: %s' % str(e))
+    time.sleep(2)
+    board.stop_stream()
+    data = board.get_board_data()
+    timestamps = data[descr['timestamp_channel']]
+    duration = timestamps[-1] - timestamps[0]
+    rate = data.shape[1] / duration
+    print('%d rows, %d samples, %.1f Hz' % (data.shape[0], data.shape[1], rate))
+    if data.shape[0] != descr['num_rows'] or abs(rate - 8000) > 800:
+        raise ValueError('wrong data from configured board')
+    if np.any(np.diff(timestamps) <= 0):
+        raise ValueError('timestamps are not increasing')
+
+    # default generation mode with small number of channels
+    board.config_board('vectorized_false')
+    board.config_board('set_eeg_channels:4')
+    board.config_board('set_batch_size:1')
+    try:
+        board.config_board('set_sampling_rate:0')
+        raise ValueError('zero sampling rate is accepted')
+    except BrainFlowError as e:
+        print('invalid sampling rate rejected: %s' % str(e))
+    board.start_stream()
+    time.sleep(1)
+    board.stop_stream()
+    data = board.get_board_data()
+    descr = board.get_session_board_descr()
+    print('%d rows, %d samples' % (data.shape[0], data.shape[1]))
+    if data.shape[0] != descr['num_rows'] or descr['eeg_channels'] != [1, 2, 3, 4]:
+        raise ValueError('wrong data after reconfiguration')
+    board.release_session()
+
+
+if __name__ == "__main__":
+    main()
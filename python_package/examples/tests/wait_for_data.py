@@ -0,0 +1,62 @@
+import threading
+import time
+
+from brainflow.board_shim import BoardShim, BrainFlowInputParams, BoardIds, BrainFlowPresets
+
+
+def main():
+    BoardShim.enable_dev_board_logger()
+
+    # use synthetic board for demo
+    params = BrainFlowInputParams()
+    board_id = BoardIds.SYNTHETIC_BOARD.value
+    sampling_rate = BoardShim.get_sampling_rate(board_id)
+    board = BoardShim(board_id, params)
+    board.prepare_session()
+    board.start_stream(45000)
+
+    # other python threads keep running while main thread waits for data
+    ticks = list()
+    stop_event = threading.Event()
+
+    def ticker():
+        while not stop_event.is_set():
+            ticks.append(time.time())
+            time.sleep(0.01)
+
+    ticker_thread = threading.Thread(target=ticker)
+    ticker_thread.start()
+    for _ in range(5):
+        start = time.time()
+        if not board.wait_for_data(sampling_rate, 5000, BrainFlowPresets.DEFAULT_PRESET):
+            raise ValueError('timeout while waiting for data')
+        data = board.get_board_data(sampling_rate)
+        print('got %d samples after %.3f s' % (data.shape[1], time.time() - start))
+    stop_event.set()
+    ticker_thread.join()
+    if len(ticks) < 100:
+        raise ValueError('GIL was not released during the wait, ticks: %d' % len(ticks))
+
+    # not enough data, wait returns False after timeout
+    board.get_board_data()
+    start = time.time()
+    if board.wait_for_data(sampling_rate * 10, 200):
+        raise ValueError('wait_for_data should timeout')
+    elapsed = time.time() - start
+    if elapsed < 0.15 or elapsed > 2.0:
+        raise ValueError('wrong timeout: %.3f' % elapsed)
+
+    # release from another thread wakes up waiting thread
+    results = list()
+    waiter = threading.Thread(target=lambda: results.append(board.wait_for_data(40000, 60000)))
+    waiter.start()
+    time.sleep(0.5)
+    board.stop_stream()
+    board.release_session()
+    waiter.join(5)
+    if waiter.is_alive() or results != [False]:
+        raise ValueError('waiting thread was not woken up by release_session')
+
+
+if __name__ == "__main__":
+    main()
@@ -118,6 +118,8 @@ pub enum AggOperations {
     Mean = 0,
     Median = 1,
     Each = 2,
+    Min = 3,
+    Max = 4,
 }
 #[repr(i32)]
 #[derive(FromPrimitive, ToPrimitive, Debug, Copy, Clone, Hash, PartialEq, Eq)]
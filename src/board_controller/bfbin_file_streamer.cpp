@@ -0,0 +1,112 @@
+#include "file_offset.h"
+
+#include <string.h>
+
+#include "bfbin_file_streamer.h"
+#include "brainflow_constants.h"
+
+
+BinaryFileStreamer::BinaryFileStreamer (
+    const char *file, const char *file_mode, int data_len, const BFBinHeader &header)
+    : Streamer (data_len, "bfbin", file, file_mode)
+{
+    strncpy (this->file, file, BRAINFLOW_FILE_NAME_LIMIT);
+    strncpy (this->file_mode, file_mode, BRAINFLOW_FILE_NAME_LIMIT);
+    this->header = header;
+    this->header.num_rows = data_len;
+    fp = NULL;
+    chunk_cols = 0;
+}
+
+BinaryFileStreamer::~BinaryFileStreamer ()
+{
+    if (fp != NULL)
+    {
+        flush_chunk ();
+        fclose (fp);
+        fp = NULL;
+    }
+}
+
+int BinaryFileStreamer::init_streamer ()
+{
+    bool append = (strcmp (file_mode, "a") == 0) || (strcmp (file_mode, "a+") == 0);
+    if ((!append) && (strcmp (file_mode, "w") != 0) && (strcmp (file_mode, "w+") != 0))
+    {
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    bool write_header = true;
+    if ((append) && (is_bfbin_file (file)))
+    {
+        FILE *existing = fopen (file, "rb");
+        BFBinHeader existing_header;
+        int res = read_bfbin_header (existing, existing_header);
+        fclose (existing);
+        if ((res != (int)BrainFlowExitCodes::STATUS_OK) ||
+            (existing_header.num_rows != header.num_rows))
+        {
+            return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+        }
+        write_header = false;
+    }
+    fp = fopen (file, append ? "ab" : "wb");
+    if (fp == NULL)
+    {
+        return (int)BrainFlowExitCodes::GENERAL_ERROR;
+    }
+    if ((write_header) && (file_size (fp) != 0))
+    {
+        // appending to non empty file in another format
+        fclose (fp);
+        fp = NULL;
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    if (write_header)
+    {
+        int res = write_bfbin_header (fp, header);
+        if (res != (int)BrainFlowExitCodes::STATUS_OK)
+        {
+            fclose (fp);
+            fp = NULL;
+            return res;
+        }
+    }
+    chunk.resize ((size_t)len * BFBIN_STREAMER_CHUNK_SIZE);
+    chunk_cols = 0;
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
+void BinaryFileStreamer::stream_data (double *data)
+{
+    // store channel major, column is a package
+    for (int i = 0; i < len; i++)
+    {
+        chunk[(size_t)i * BFBIN_STREAMER_CHUNK_SIZE + chunk_cols] = data[i];
+    }
+    chunk_cols++;
+    if (chunk_cols == BFBIN_STREAMER_CHUNK_SIZE)
+    {
+        flush_chunk ();
+    }
+}
+
+void BinaryFileStreamer::flush_chunk ()
+{
+    if ((fp == NULL) || (chunk_cols == 0))
+    {
+        return;
+    }
+    if (chunk_cols < BFBIN_STREAMER_CHUNK_SIZE)
+    {
+        // pack partial chunk so rows are contiguous
+        for (int i = 1; i < len; i++)
+        {
+            memmove (chunk.data () + (size_t)i * chunk_cols,
+                chunk.data () + (size_t)i * BFBIN_STREAMER_CHUNK_SIZE,
+                sizeof (double) * chunk_cols);
+        }
+    }
+    write_bfbin_chunk (fp, chunk.data (), len, chunk_cols);
+    fflush (fp);
+    chunk_cols = 0;
+}
@@ -1,13 +1,17 @@
 #include <algorithm>
+#include <chrono>
 #include <string>
 #include <vector>
 
+#include "bfbin_file_streamer.h"
 #include "board.h"
 #include "board_controller.h"
 #include "custom_cast.h"
 #include "file_streamer.h"
+#include "lock_free_data_buffer.h"
 #include "multicast_streamer.h"
 #include "plotjuggler_udp_streamer.h"
+#include "timestamp.h"
 
 #include "spdlog/sinks/null_sink.h"
 
@@ -82,14 +86,29 @@ int Board::prepare_for_acquisition (int buffer_size, const char *streamer_params
     for (auto it = dbs.begin (), next_it = it; it != dbs.end (); it = next_it)
     {
         ++next_it;
-        delete it->second;
+        // threads blocked in wait_for_data keep their own reference to the buffer
+        it->second->stop_waiting ();
         dbs.erase (it);
     }
-    for (auto it = marker_queues.begin (), next_it = it; it != marker_queues.end (); it = next_it)
+    for (int i = 0; i < MAX_PRESETS; i++)
     {
-        ++next_it;
-        it->second.clear ();
-        marker_queues.erase (it);
+        preset_layouts[i] = PresetLayout ();
+    }
+    for (int i = 0; i < MAX_PRESETS; i++)
+    {
+        marker_queues[i].clear ();
+    }
+    for (int i = 0; i < MAX_PRESETS; i++)
+    {
+        preset_stats[i].reset ();
+    }
+    collect_stats = buffer_params.collect_stats;
+    if ((buffer_params.buffer_overflow_policy == (int)BufferOverflowPolicies::GROW) &&
+        (buffer_params.max_buffer_size != 0) && (buffer_params.max_buffer_size < buffer_size))
+    {
+        safe_logger (spdlog::level::err, "max buffer size {} is less than buffer size {}",
+            buffer_params.max_buffer_size, buffer_size);
+        return (int)BrainFlowExitCodes::INVALID_BUFFER_SIZE_ERROR;
     }
     int res = (int)BrainFlowExitCodes::STATUS_OK;
 
@@ -128,22 +147,33 @@ int Board::prepare_for_acquisition (int buffer_size, const char *streamer_params
         for (auto &el : board_descr.items ())
         {
             json board_preset = el.value ();
-            DataBuffer *db = new DataBuffer ((int)board_preset["num_rows"], buffer_size);
+            int preset_int = preset_to_int (el.key ());
+            // layout is needed to find exg rows for float32 storage
+            if (compile_preset_layout (board_preset, preset_layouts[preset_int]) !=
+                (int)BrainFlowExitCodes::STATUS_OK)
+            {
+                safe_logger (spdlog::level::err, "invalid descriptor for preset {}", el.key ());
+                res = (int)BrainFlowExitCodes::GENERAL_ERROR;
+                continue;
+            }
+            std::shared_ptr<DataBuffer> db (
+                create_data_buffer (preset_layouts[preset_int], buffer_size));
             if (!db->is_ready ())
             {
                 safe_logger (
                     spdlog::level::err, "unable to prepare buffer with size {}", buffer_size);
-                delete db;
-                db = NULL;
                 res = (int)BrainFlowExitCodes::INVALID_BUFFER_SIZE_ERROR;
             }
             else
             {
-                int preset_int = preset_to_int (el.key ());
                 dbs[preset_int] = db;
-                marker_queues[preset_int] = std::deque<double> ();
             }
         }
+        // new buffers start from the first package
+        for (auto &buffer_reader : buffer_readers)
+        {
+            buffer_reader.second.cursor = 0;
+        }
     }
 
     if (res != (int)BrainFlowExitCodes::STATUS_OK)
@@ -154,48 +184,148 @@ int Board::prepare_for_acquisition (int buffer_size, const char *streamer_params
     return res;
 }
 
+int Board::set_buffer_params (struct BrainFlowBufferParams buffer_params)
+{
+    if ((buffer_params.buffer_type != (int)BufferTypes::SPIN_LOCK_BUFFER) &&
+        (buffer_params.buffer_type != (int)BufferTypes::LOCK_FREE_BUFFER))
+    {
+        safe_logger (spdlog::level::err, "unsupported buffer type {}", buffer_params.buffer_type);
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    if ((buffer_params.streamer_queue_size < 1) ||
+        (buffer_params.streamer_queue_size > MAX_CAPTURE_SAMPLES))
+    {
+        safe_logger (spdlog::level::err, "invalid streamer queue size {}",
+            buffer_params.streamer_queue_size);
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    if ((buffer_params.streamer_overflow_policy != (int)StreamerOverflowPolicies::BLOCK) &&
+        (buffer_params.streamer_overflow_policy != (int)StreamerOverflowPolicies::DROP_OLDEST) &&
+        (buffer_params.streamer_overflow_policy != (int)StreamerOverflowPolicies::DROP_NEWEST))
+    {
+        safe_logger (spdlog::level::err, "unsupported streamer overflow policy {}",
+            buffer_params.streamer_overflow_policy);
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    if (buffer_params.streamer_block_timeout_ms < 1)
+    {
+        safe_logger (spdlog::level::err, "invalid streamer block timeout {}",
+            buffer_params.streamer_block_timeout_ms);
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    if ((buffer_params.buffer_overflow_policy != (int)BufferOverflowPolicies::OVERWRITE_OLDEST) &&
+        (buffer_params.buffer_overflow_policy != (int)BufferOverflowPolicies::DROP_NEWEST) &&
+        (buffer_params.buffer_overflow_policy != (int)BufferOverflowPolicies::GROW))
+    {
+        safe_logger (spdlog::level::err, "unsupported buffer overflow policy {}",
+            buffer_params.buffer_overflow_policy);
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    if ((buffer_params.buffer_overflow_policy == (int)BufferOverflowPolicies::GROW) &&
+        (buffer_params.buffer_type == (int)BufferTypes::LOCK_FREE_BUFFER))
+    {
+        safe_logger (spdlog::level::err, "lock free buffer can not grow");
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    if ((buffer_params.max_buffer_size < 0) ||
+        (buffer_params.max_buffer_size > MAX_CAPTURE_SAMPLES))
+    {
+        safe_logger (
+            spdlog::level::err, "invalid max buffer size {}", buffer_params.max_buffer_size);
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    this->buffer_params = buffer_params;
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
+DataBuffer *Board::create_data_buffer (const PresetLayout &layout, int buffer_size)
+{
+    DataBufferStorage storage;
+    storage.lazy_allocation = buffer_params.lazy_allocation;
+    if (buffer_params.float32_exg)
+    {
+        storage.float_rows = layout.exg_channels;
+    }
+    if (buffer_params.buffer_type == (int)BufferTypes::LOCK_FREE_BUFFER)
+    {
+        safe_logger (spdlog::level::trace, "using lock free buffer");
+        return new LockFreeDataBuffer (
+            layout.num_rows, buffer_size, buffer_params.buffer_overflow_policy, storage);
+    }
+    size_t max_buffer_size = (buffer_params.max_buffer_size == 0) ?
+        (size_t)MAX_CAPTURE_SAMPLES :
+        (size_t)buffer_params.max_buffer_size;
+    return new DataBuffer (layout.num_rows, buffer_size, buffer_params.buffer_overflow_policy,
+        max_buffer_size, storage);
+}
+
 void Board::push_package (double *package, int preset)
 {
-    std::string preset_str = preset_to_string (preset);
-    if ((board_descr.find (preset_str) == board_descr.end ()) || (dbs.find (preset) == dbs.end ()))
+    if ((preset < 0) || (preset >= MAX_PRESETS) || (!preset_layouts[preset].is_valid))
     {
         safe_logger (spdlog::level::err, "invalid json or push_package args, no such key");
         return;
     }
+    int marker_channel = preset_layouts[preset].marker_channel;
+    PresetStats &stats = preset_stats[preset];
+    bool with_stats = collect_stats;
 
-    lock.lock ();
-    json board_preset = board_descr[preset_str];
-    try
+    if (!with_stats)
     {
-        int marker_channel = board_preset["marker_channel"];
-        if (marker_queues[preset].empty ())
+        lock.lock ();
+    }
+    else
+    {
+        int timestamp_channel = preset_layouts[preset].timestamp_channel;
+        if (timestamp_channel >= 0)
         {
-            package[marker_channel] = 0.0;
+            stats.push_latency.add (get_timestamp () - package[timestamp_channel]);
         }
-        else
+        if (!lock.try_lock ())
         {
-            double marker = marker_queues[preset].at (0);
-            package[marker_channel] = marker;
-            marker_queues[preset].pop_front ();
+            auto wait_start = std::chrono::steady_clock::now ();
+            lock.lock ();
+            auto wait_ns = std::chrono::duration_cast<std::chrono::nanoseconds> (
+                std::chrono::steady_clock::now () - wait_start)
+                               .count ();
+            stats.lock_waits.fetch_add (1, std::memory_order_relaxed);
+            stats.lock_wait_ns.fetch_add ((long long)wait_ns, std::memory_order_relaxed);
         }
+        stats.pushed.fetch_add (1, std::memory_order_relaxed);
     }
-    catch (...)
+    if (marker_channel >= 0)
+    {
+        double marker = 0.0;
+        package[marker_channel] = marker_queues[preset].pop (marker) ? marker : 0.0;
+    }
+    else
     {
         safe_logger (spdlog::level::err, "Failed to get marker channel/value");
     }
 
-    if (dbs[preset] != NULL)
+    auto db = dbs.find (preset);
+    if ((db != dbs.end ()) && (db->second))
     {
-        dbs[preset]->add_data (package);
+        db->second->add_data (package);
     }
-    if (streamers.find (preset) != streamers.end ())
+    std::shared_ptr<StreamerDispatcher> dispatcher = streamer_dispatcher;
+    auto data_callback = data_callbacks.find (preset);
+    if (data_callback != data_callbacks.end ())
     {
-        for (auto &streamer : streamers[preset])
-        {
-            streamer->stream_data (package);
-        }
+        data_callback->second->add_data (package);
+    }
+    auto data_ready_notifier = data_ready_notifiers.find (preset);
+    if ((data_ready_notifier != data_ready_notifiers.end ()) && (db != dbs.end ()) && (db->second))
+    {
+        data_ready_notifier->second->notify (db->second->get_data_count ());
     }
     lock.unlock ();
+    // queue may be full, with BLOCK policy wait for the writer without holding the lock, the wait
+    // is limited by streamer_block_timeout_ms so a stuck streamer can not stop acquisition
+    if (dispatcher)
+    {
+        dispatcher->add_data (package, preset);
+    }
 }
 
 int Board::insert_marker (double value, int preset)
@@ -206,43 +336,53 @@ int Board::insert_marker (double value, int preset)
         return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
     }
     std::string preset_str = preset_to_string (preset);
-    if ((board_descr.find (preset_str) == board_descr.end ()) ||
-        (marker_queues.find (preset) == marker_queues.end ()))
+    if ((board_descr.find (preset_str) == board_descr.end ()) || (dbs.find (preset) == dbs.end ()))
     {
         safe_logger (spdlog::level::err, "invalid preset");
         return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
     }
-    lock.lock ();
-    marker_queues[preset].push_back (value);
-    lock.unlock ();
+    // board thread takes markers without locks, one marker per package
+    if (!marker_queues[preset].push (value))
+    {
+        safe_logger (spdlog::level::err, "too many markers are waiting for the next package");
+        return (int)BrainFlowExitCodes::GENERAL_ERROR;
+    }
     return (int)BrainFlowExitCodes::STATUS_OK;
 }
 
 void Board::free_packages ()
 {
-    for (auto it = dbs.begin (), next_it = it; it != dbs.end (); it = next_it)
+    for (int i = 0; i < MAX_PRESETS; i++)
     {
-        ++next_it;
-        delete it->second;
-        dbs.erase (it);
+        preset_layouts[i] = PresetLayout ();
     }
 
-    for (auto it = marker_queues.begin (), next_it = it; it != marker_queues.end (); it = next_it)
+    for (auto it = dbs.begin (), next_it = it; it != dbs.end (); it = next_it)
     {
         ++next_it;
-        it->second.clear ();
-        marker_queues.erase (it);
+        // threads blocked in wait_for_data keep their own reference to the buffer
+        it->second->stop_waiting ();
+        dbs.erase (it);
     }
 
-    for (auto it = streamers.begin (), next_it = it; it != streamers.end (); it = next_it)
+    for (int i = 0; i < MAX_PRESETS; i++)
     {
-        ++next_it;
-        for (auto &streamer : it->second)
-        {
-            delete streamer;
-        }
-        streamers.erase (it);
+        marker_queues[i].clear ();
     }
+
+    // dispatcher writes pending packages in destructor, dont hold the lock for it
+    std::shared_ptr<StreamerDispatcher> dispatcher;
+    lock.lock ();
+    dispatcher.swap (streamer_dispatcher);
+    lock.unlock ();
+    dispatcher.reset ();
+
+    std::vector<std::shared_ptr<DataCallbackDispatcher>> dispatchers;
+    remove_data_callbacks (dispatchers);
+
+    lock.lock ();
+    data_ready_notifiers.clear ();
+    lock.unlock ();
 }
 
 int Board::add_streamer (const char *streamer_params, int preset)
@@ -270,6 +410,18 @@ int Board::add_streamer (const char *streamer_params, int preset)
             streamer_dest.c_str (), streamer_mods.c_str ());
         streamer = new FileStreamer (streamer_dest.c_str (), streamer_mods.c_str (), num_rows);
     }
+    if (streamer_type == "bfbin")
+    {
+        safe_logger (spdlog::level::trace, "Binary File Streamer, file: {}, mods: {}",
+            streamer_dest.c_str (), streamer_mods.c_str ());
+        BFBinHeader header;
+        header.board_id = board_id;
+        header.preset = preset;
+        header.sampling_rate = board_descr[preset_str].value ("sampling_rate", 0);
+        header.descr = board_descr[preset_str].dump ();
+        streamer = new BinaryFileStreamer (
+            streamer_dest.c_str (), streamer_mods.c_str (), num_rows, header);
+    }
     if (streamer_type == "streaming_board")
     {
         int port = 0;
@@ -317,11 +469,37 @@ int Board::add_streamer (const char *streamer_params, int preset)
         delete streamer;
         streamer = NULL;
     }
-    else
+    else if (!streamer_dispatcher)
     {
-        lock.lock ();
-        streamers[preset].push_back (streamer);
-        lock.unlock ();
+        std::vector<int> preset_lens (MAX_PRESETS, 0);
+        for (auto &el : board_descr.items ())
+        {
+            int preset_int = preset_to_int (el.key ());
+            if ((preset_int >= 0) && (preset_int < MAX_PRESETS))
+            {
+                preset_lens[preset_int] = (int)el.value ()["num_rows"];
+            }
+        }
+        std::shared_ptr<StreamerDispatcher> dispatcher =
+            std::make_shared<StreamerDispatcher> (preset_lens, buffer_params.streamer_queue_size,
+                buffer_params.streamer_overflow_policy, buffer_params.streamer_block_timeout_ms);
+        res = dispatcher->init_dispatcher ();
+        if (res != (int)BrainFlowExitCodes::STATUS_OK)
+        {
+            safe_logger (spdlog::level::err, "failed to init streamer queue");
+            delete streamer;
+            streamer = NULL;
+        }
+        else
+        {
+            lock.lock ();
+            streamer_dispatcher = dispatcher;
+            lock.unlock ();
+        }
+    }
+    if (streamer != NULL)
+    {
+        streamer_dispatcher->add_streamer (streamer, preset);
     }
 
     return res;
@@ -329,7 +507,7 @@ int Board::add_streamer (const char *streamer_params, int preset)
 
 int Board::delete_streamer (const char *streamer_params, int preset)
 {
-    if (streamers.find (preset) == streamers.end ())
+    if (!streamer_dispatcher)
     {
         safe_logger (spdlog::level::err, "no such streaming preset");
         return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
@@ -343,31 +521,233 @@ int Board::delete_streamer (const char *streamer_params, int preset)
         return res;
     }
 
-    std::vector<Streamer *>::iterator it = streamers[preset].begin ();
-    res = (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
-    while (it != streamers[preset].end ())
+    // pending packages are written to the streamer before removal
+    if (!streamer_dispatcher->delete_streamer (streamer_type, streamer_dest, streamer_mods, preset))
     {
-        if ((*it)->check_equals (streamer_type, streamer_dest, streamer_mods))
-        {
-            lock.lock ();
-            delete *it;
-            it = streamers[preset].erase (it);
-            lock.unlock ();
-            res = (int)BrainFlowExitCodes::STATUS_OK;
-            safe_logger (spdlog::level::info, "streamer {} removed", streamer_params);
-            break;
-        }
-        else
-        {
-            it++;
-        }
+        safe_logger (spdlog::level::err, "no such streamer found");
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
     }
+    safe_logger (spdlog::level::info, "streamer {} removed", streamer_params);
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
 
+int Board::get_streamer_stats (long long *queued, long long *dropped, int *pending)
+{
+    if ((queued == NULL) || (dropped == NULL) || (pending == NULL))
+    {
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    if (!streamer_dispatcher)
+    {
+        *queued = 0;
+        *dropped = 0;
+        *pending = 0;
+        return (int)BrainFlowExitCodes::STATUS_OK;
+    }
+    streamer_dispatcher->get_stats (queued, dropped, pending);
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
+int Board::register_data_callback (
+    DataCallback callback, void *user_data, int min_batch, int preset)
+{
+    std::string preset_str = preset_to_string (preset);
+    if (board_descr.find (preset_str) == board_descr.end ())
+    {
+        safe_logger (spdlog::level::err, "invalid preset");
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    if ((callback == NULL) || (min_batch < 1))
+    {
+        safe_logger (spdlog::level::err, "callback cannot be empty and min_batch must be positive");
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    if (data_callbacks.find (preset) != data_callbacks.end ())
+    {
+        safe_logger (spdlog::level::err, "data callback for preset {} already exists", preset);
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    int num_rows = (int)board_descr[preset_str]["num_rows"];
+    std::shared_ptr<DataCallbackDispatcher> dispatcher =
+        std::make_shared<DataCallbackDispatcher> (callback, user_data, num_rows, min_batch);
+    int res = dispatcher->init_dispatcher ();
     if (res != (int)BrainFlowExitCodes::STATUS_OK)
     {
-        safe_logger (spdlog::level::err, "no such streamer found");
+        return res;
     }
-    return res;
+    lock.lock ();
+    data_callbacks[preset] = dispatcher;
+    lock.unlock ();
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
+int Board::unregister_data_callback (
+    int preset, std::shared_ptr<DataCallbackDispatcher> &dispatcher)
+{
+    lock.lock ();
+    auto it = data_callbacks.find (preset);
+    if (it != data_callbacks.end ())
+    {
+        dispatcher = it->second;
+        data_callbacks.erase (it);
+    }
+    lock.unlock ();
+    if (!dispatcher)
+    {
+        safe_logger (spdlog::level::err, "no data callback for preset {}", preset);
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
+void Board::remove_data_callbacks (
+    std::vector<std::shared_ptr<DataCallbackDispatcher>> &dispatchers)
+{
+    lock.lock ();
+    for (auto &data_callback : data_callbacks)
+    {
+        dispatchers.push_back (data_callback.second);
+    }
+    data_callbacks.clear ();
+    lock.unlock ();
+}
+
+int Board::register_data_ready_fd (int num_samples, int preset, int *fd)
+{
+    std::string preset_str = preset_to_string (preset);
+    if (board_descr.find (preset_str) == board_descr.end ())
+    {
+        safe_logger (spdlog::level::err, "invalid preset");
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    if ((fd == NULL) || (num_samples < 1))
+    {
+        safe_logger (spdlog::level::err, "num_samples must be positive");
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    if (data_ready_notifiers.find (preset) != data_ready_notifiers.end ())
+    {
+        safe_logger (spdlog::level::err, "data ready fd for preset {} already exists", preset);
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    std::shared_ptr<DataReadyNotifier> notifier =
+        std::make_shared<DataReadyNotifier> ((size_t)num_samples);
+    int res = notifier->init_notifier ();
+    if (res != (int)BrainFlowExitCodes::STATUS_OK)
+    {
+        safe_logger (spdlog::level::err, "failed to create data ready fd: {}", res);
+        return res;
+    }
+    *fd = notifier->get_fd ();
+    lock.lock ();
+    data_ready_notifiers[preset] = notifier;
+    lock.unlock ();
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
+int Board::unregister_data_ready_fd (int preset)
+{
+    // notifier closes its fds in destructor, dont hold the lock for it
+    std::shared_ptr<DataReadyNotifier> notifier;
+    lock.lock ();
+    auto it = data_ready_notifiers.find (preset);
+    if (it != data_ready_notifiers.end ())
+    {
+        notifier = it->second;
+        data_ready_notifiers.erase (it);
+    }
+    lock.unlock ();
+    if (!notifier)
+    {
+        safe_logger (spdlog::level::err, "no data ready fd for preset {}", preset);
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
+int Board::create_buffer_reader (int preset, int *reader_id)
+{
+    std::string preset_str = preset_to_string (preset);
+    if ((board_descr.find (preset_str) == board_descr.end ()) || (reader_id == NULL))
+    {
+        safe_logger (spdlog::level::err, "invalid preset");
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    BufferReader buffer_reader;
+    buffer_reader.preset = preset;
+    // reader created during streaming skips packages which are already in buffer
+    buffer_reader.cursor = 0;
+    auto db = dbs.find (preset);
+    if ((db != dbs.end ()) && (db->second))
+    {
+        buffer_reader.cursor = db->second->get_total_count ();
+    }
+    last_reader_id++;
+    buffer_readers[last_reader_id] = buffer_reader;
+    *reader_id = last_reader_id;
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
+int Board::delete_buffer_reader (int reader_id)
+{
+    if (buffer_readers.erase (reader_id) == 0)
+    {
+        safe_logger (spdlog::level::err, "no buffer reader with id {}", reader_id);
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
+int Board::get_buffer_reader_data (int reader_id, int max_samples, double *data_buf,
+    int data_buf_cols, int *returned_samples, int *missed_samples)
+{
+    auto buffer_reader = buffer_readers.find (reader_id);
+    if (buffer_reader == buffer_readers.end ())
+    {
+        safe_logger (spdlog::level::err, "no buffer reader with id {}", reader_id);
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    int preset = buffer_reader->second.preset;
+    int res = check_data_buffer (preset);
+    if (res != (int)BrainFlowExitCodes::STATUS_OK)
+    {
+        return res;
+    }
+    if ((!data_buf) || (!returned_samples) || (!missed_samples) || (max_samples < 0) ||
+        (data_buf_cols < 1))
+    {
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+
+    size_t missed = 0;
+    *returned_samples = (int)dbs[preset]->get_new_data_transposed (
+        buffer_reader->second.cursor, (size_t)max_samples, data_buf, (size_t)data_buf_cols, missed);
+    *missed_samples = (int)missed;
+    add_retrieval_stats (preset, data_buf, (size_t)data_buf_cols, (size_t)*returned_samples);
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
+int Board::get_buffer_reader_data_count (int reader_id, int *result)
+{
+    auto buffer_reader = buffer_readers.find (reader_id);
+    if (buffer_reader == buffer_readers.end ())
+    {
+        safe_logger (spdlog::level::err, "no buffer reader with id {}", reader_id);
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    int preset = buffer_reader->second.preset;
+    int res = check_data_buffer (preset);
+    if (res != (int)BrainFlowExitCodes::STATUS_OK)
+    {
+        return res;
+    }
+    if (!result)
+    {
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+
+    *result = (int)dbs[preset]->get_new_data_count (buffer_reader->second.cursor);
+    return (int)BrainFlowExitCodes::STATUS_OK;
 }
 
 int Board::parse_streamer_params (const char *streamer_params, std::string &streamer_type,
@@ -401,8 +781,7 @@ int Board::parse_streamer_params (const char *streamer_params, std::string &stre
     return (int)BrainFlowExitCodes::STATUS_OK;
 }
 
-int Board::get_current_board_data (
-    int num_samples, int preset, double *data_buf, int *returned_samples)
+int Board::check_data_buffer (int preset)
 {
     std::string preset_str = preset_to_string (preset);
     if (board_descr.find (preset_str) == board_descr.end ())
@@ -420,18 +799,23 @@ int Board::get_current_board_data (
     {
         return (int)BrainFlowExitCodes::EMPTY_BUFFER_ERROR;
     }
-    if ((!data_buf) || (!returned_samples))
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
+int Board::get_current_board_data (
+    int num_samples, int preset, double *data_buf, int *returned_samples)
+{
+    int res = check_data_buffer (preset);
+    if (res != (int)BrainFlowExitCodes::STATUS_OK)
+    {
+        return res;
+    }
+    if ((!data_buf) || (!returned_samples) || (num_samples < 0))
     {
         return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
     }
 
-    int num_rows = (int)board_descr[preset_str]["num_rows"];
-
-    double *buf = new double[num_samples * num_rows];
-    int num_data_points = (int)dbs[preset]->get_current_data (num_samples, buf);
-    reshape_data (num_data_points, preset, buf, data_buf);
-    delete[] buf;
-    *returned_samples = num_data_points;
+    *returned_samples = (int)dbs[preset]->get_current_data_transposed (num_samples, data_buf, 0);
     return (int)BrainFlowExitCodes::STATUS_OK;
 }
 
@@ -456,48 +840,188 @@ int Board::get_board_data_count (int preset, int *result)
     return (int)BrainFlowExitCodes::STATUS_OK;
 }
 
-int Board::get_board_data (int data_count, int preset, double *data_buf)
+int Board::get_board_data (int data_count, int preset, double *data_buf, int *lost_samples)
 {
-    std::string preset_str = preset_to_string (preset);
-    if (board_descr.find (preset_str) == board_descr.end ())
+    int res = check_data_buffer (preset);
+    if (res != (int)BrainFlowExitCodes::STATUS_OK)
+    {
+        return res;
+    }
+    if ((!data_buf) || (data_count < 0))
     {
-        safe_logger (spdlog::level::err, "invalid preset");
         return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
     }
-    if (dbs.find (preset) == dbs.end ())
+
+    size_t lost = 0;
+    size_t count = dbs[preset]->get_data_transposed (data_count, data_buf, 0, lost);
+    if (lost_samples != NULL)
+    {
+        *lost_samples = (int)lost;
+    }
+    add_retrieval_stats (preset, data_buf, count, count);
+    rearm_data_ready_notifier (preset);
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
+int Board::get_board_data_into (int max_samples, int preset, double *data_buf, int data_buf_cols,
+    int *returned_samples, int *lost_samples)
+{
+    int res = check_data_buffer (preset);
+    if (res != (int)BrainFlowExitCodes::STATUS_OK)
+    {
+        return res;
+    }
+    if ((!data_buf) || (!returned_samples) || (max_samples < 0) || (data_buf_cols < 1))
     {
-        safe_logger (spdlog::level::err,
-            "stream is not startted or no preset: {} found for this board", preset);
         return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
     }
-    if (!dbs[preset])
+
+    size_t lost = 0;
+    *returned_samples =
+        (int)dbs[preset]->get_data_transposed (max_samples, data_buf, (size_t)data_buf_cols, lost);
+    if (lost_samples != NULL)
     {
-        return (int)BrainFlowExitCodes::EMPTY_BUFFER_ERROR;
+        *lost_samples = (int)lost;
     }
-    if (!data_buf)
+    add_retrieval_stats (preset, data_buf, (size_t)data_buf_cols, (size_t)*returned_samples);
+    rearm_data_ready_notifier (preset);
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
+int Board::get_current_board_data_into (
+    int max_samples, int preset, double *data_buf, int data_buf_cols, int *returned_samples)
+{
+    int res = check_data_buffer (preset);
+    if (res != (int)BrainFlowExitCodes::STATUS_OK)
+    {
+        return res;
+    }
+    if ((!data_buf) || (!returned_samples) || (max_samples < 0) || (data_buf_cols < 1))
     {
         return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
     }
-    int num_rows = (int)board_descr[preset_str]["num_rows"];
-    double *buf = new double[data_count * num_rows];
-    int num_data_points = (int)dbs[preset]->get_data (data_count, buf);
-    reshape_data (num_data_points, preset, buf, data_buf);
-    delete[] buf;
+
+    *returned_samples = (int)dbs[preset]->get_current_data_transposed (
+        max_samples, data_buf, (size_t)data_buf_cols);
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
+int Board::get_data_buffer_for_wait (
+    int num_samples, int timeout_ms, int preset, std::shared_ptr<DataBuffer> &db)
+{
+    int res = check_data_buffer (preset);
+    if (res != (int)BrainFlowExitCodes::STATUS_OK)
+    {
+        return res;
+    }
+    if ((num_samples < 1) || ((size_t)num_samples > dbs[preset]->get_capacity ()) ||
+        (timeout_ms < 0))
+    {
+        safe_logger (spdlog::level::err,
+            "invalid wait params, num_samples: {}, timeout_ms: {}, buffer size: {}", num_samples,
+            timeout_ms, dbs[preset]->get_capacity ());
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    db = dbs[preset];
     return (int)BrainFlowExitCodes::STATUS_OK;
 }
 
-void Board::reshape_data (int data_count, int preset, const double *buf, double *output_buf)
+void Board::rearm_data_ready_notifier (int preset)
+{
+    // notifiers are added and removed only by user calls which are serialized with this one, board
+    // thread only reads the map, so the lock is not needed here
+    auto data_ready_notifier = data_ready_notifiers.find (preset);
+    if (data_ready_notifier != data_ready_notifiers.end ())
+    {
+        std::shared_ptr<DataReadyNotifier> notifier = data_ready_notifier->second;
+        notifier->rearm ();
+        // data count is checked after rearm, so package pushed concurrently can not be missed
+        notifier->notify (dbs[preset]->get_data_count ());
+    }
+}
+
+int Board::get_board_descr (int preset, char *descr, int max_len, int *len)
 {
     std::string preset_str = preset_to_string (preset);
-    int num_rows = (int)board_descr[preset_str]["num_rows"];
+    if (board_descr.find (preset_str) == board_descr.end ())
+    {
+        safe_logger (spdlog::level::err, "invalid preset");
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    if ((descr == NULL) || (len == NULL))
+    {
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    std::string res = board_descr[preset_str].dump ();
+    if ((int)res.size () >= max_len)
+    {
+        safe_logger (spdlog::level::err, "board description is longer than {} bytes", max_len);
+        return (int)BrainFlowExitCodes::INVALID_BUFFER_SIZE_ERROR;
+    }
+    strcpy (descr, res.c_str ());
+    *len = (int)res.size ();
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
 
-    for (int i = 0; i < data_count; i++)
+void Board::add_retrieval_stats (int preset, double *data_buf, size_t data_buf_cols, size_t count)
+{
+    int timestamp_channel = preset_layouts[preset].timestamp_channel;
+    if ((!collect_stats) || (count == 0) || (timestamp_channel < 0))
     {
-        for (int j = 0; j < num_rows; j++)
-        {
-            output_buf[j * data_count + i] = buf[i * num_rows + j];
-        }
+        return;
     }
+    PresetStats &stats = preset_stats[preset];
+    double retrieval_time = get_timestamp ();
+    double *timestamps = data_buf + (size_t)timestamp_channel * data_buf_cols;
+    for (size_t i = 0; i < count; i++)
+    {
+        stats.retrieval_latency.add (retrieval_time - timestamps[i]);
+    }
+    stats.retrieved.fetch_add ((long long)count, std::memory_order_relaxed);
+}
+
+int Board::get_stats (int preset, char *stats, int max_len, int *len)
+{
+    std::string preset_str = preset_to_string (preset);
+    if ((board_descr.find (preset_str) == board_descr.end ()) || (stats == NULL) || (len == NULL))
+    {
+        safe_logger (spdlog::level::err, "invalid preset or output buffer");
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    json res = preset_stats[preset].to_json ();
+    res["enabled"] = collect_stats;
+    res["preset"] = preset;
+    auto db = dbs.find (preset);
+    bool has_buffer = (db != dbs.end ()) && (db->second);
+    res["buffer_count"] = has_buffer ? db->second->get_data_count () : 0;
+    res["buffer_capacity"] = has_buffer ? db->second->get_capacity () : 0;
+    res["packages_overwritten"] = has_buffer ? db->second->get_overwritten_count () : 0;
+    res["packages_dropped"] = has_buffer ? db->second->get_dropped_count () : 0;
+    res["buffer_memory_bytes"] = has_buffer ? db->second->get_memory_usage () : 0;
+    size_t session_memory = 0;
+    for (auto &preset_db : dbs)
+    {
+        session_memory += preset_db.second ? preset_db.second->get_memory_usage () : 0;
+    }
+    // sum for buffers of all presets of this session
+    res["session_buffer_memory_bytes"] = session_memory;
+    long long streamer_queued = 0;
+    long long streamer_dropped = 0;
+    int streamer_pending = 0;
+    get_streamer_stats (&streamer_queued, &streamer_dropped, &streamer_pending);
+    // streamer queue is shared by all presets
+    res["streamer_queue_depth"] = streamer_pending;
+    res["streamer_queued"] = streamer_queued;
+    res["streamer_dropped"] = streamer_dropped;
+    std::string res_str = res.dump ();
+    if ((int)res_str.size () >= max_len)
+    {
+        safe_logger (spdlog::level::err, "stats are longer than {} bytes", max_len);
+        return (int)BrainFlowExitCodes::INVALID_BUFFER_SIZE_ERROR;
+    }
+    strcpy (stats, res_str.c_str ());
+    *len = (int)res_str.size ();
+    return (int)BrainFlowExitCodes::STATUS_OK;
 }
 
 std::string Board::preset_to_string (int preset)
@@ -22,6 +22,7 @@
 #include "brainalive.h"
 #include "brainbit.h"
 #include "brainbit_bled.h"
+#include "brainflow_buffer_params.h"
 #include "brainflow_constants.h"
 #include "brainflow_input_params.h"
 #include "brainflow_version.h"
@@ -61,15 +62,33 @@
 using json = nlohmann::json;
 
 
-std::map<std::pair<int, struct BrainFlowInputParams>, std::shared_ptr<Board>> boards;
+// api calls for one board are serialized by its own mutex, global mutex protects boards map
+struct BoardSession
+{
+    std::shared_ptr<Board> board;
+    std::mutex mutex;
+    int handle;
+};
+
+std::map<std::pair<int, struct BrainFlowInputParams>, std::shared_ptr<BoardSession>> boards;
 std::mutex mutex;
+// handle based methods dont touch global mutex and dont parse json
+std::map<int, std::shared_ptr<BoardSession>> sessions;
+std::mutex sessions_mutex;
+int last_session_handle = 0;
 
 std::pair<int, struct BrainFlowInputParams> get_key (
     int board_id, struct BrainFlowInputParams params);
-static int check_board_session (int board_id, const char *json_brainflow_input_params,
+int check_board_session (int board_id, const char *json_brainflow_input_params,
     std::pair<int, struct BrainFlowInputParams> &key, bool log_error = true);
 static int string_to_brainflow_input_params (
     const char *json_brainflow_input_params, struct BrainFlowInputParams *params);
+static std::shared_ptr<BoardSession> get_session (int session_handle);
+static void erase_session (int session_handle);
+static int wait_for_data_buffer (
+    std::shared_ptr<DataBuffer> db, int num_samples, int timeout_ms, int *result);
+static int string_to_brainflow_buffer_params (
+    const char *json_buffer_params, struct BrainFlowBufferParams *buffer_params);
 
 
 int prepare_session (int board_id, const char *json_brainflow_input_params)
@@ -296,7 +315,12 @@ int prepare_session (int board_id, const char *json_brainflow_input_params)
     }
     else
     {
-        boards[key] = board;
+        std::shared_ptr<BoardSession> session = std::make_shared<BoardSession> ();
+        session->board = board;
+        std::lock_guard<std::mutex> handles_lock (sessions_mutex);
+        session->handle = ++last_session_handle;
+        sessions[session->handle] = session;
+        boards[key] = session;
     }
     return res;
 }
@@ -330,8 +354,9 @@ int start_stream (int buffer_size, const char *streamer_params, int board_id,
     {
         return res;
     }
-    auto board_it = boards.find (key);
-    return board_it->second->start_stream (buffer_size, streamer_params);
+    std::shared_ptr<BoardSession> session = boards.find (key)->second;
+    std::lock_guard<std::mutex> session_lock (session->mutex);
+    return session->board->start_stream (buffer_size, streamer_params);
 }
 
 int stop_stream (int board_id, const char *json_brainflow_input_params)
@@ -344,8 +369,9 @@ int stop_stream (int board_id, const char *json_brainflow_input_params)
     {
         return res;
     }
-    auto board_it = boards.find (key);
-    return board_it->second->stop_stream ();
+    std::shared_ptr<BoardSession> session = boards.find (key)->second;
+    std::lock_guard<std::mutex> session_lock (session->mutex);
+    return session->board->stop_stream ();
 }
 
 int insert_marker (double value, int preset, int board_id, const char *json_brainflow_input_params)
@@ -358,12 +384,15 @@ int insert_marker (double value, int preset, int board_id, const char *json_brai
     {
         return res;
     }
-    auto board_it = boards.find (key);
-    return board_it->second->insert_marker (value, preset);
+    std::shared_ptr<BoardSession> session = boards.find (key)->second;
+    std::lock_guard<std::mutex> session_lock (session->mutex);
+    return session->board->insert_marker (value, preset);
 }
 
 int release_session (int board_id, const char *json_brainflow_input_params)
 {
+    // destroyed after all locks are released, it waits for running data callback
+    std::vector<std::shared_ptr<DataCallbackDispatcher>> dispatchers;
     std::lock_guard<std::mutex> lock (mutex);
 
     std::pair<int, struct BrainFlowInputParams> key;
@@ -372,9 +401,12 @@ int release_session (int board_id, const char *json_brainflow_input_params)
     {
         return res;
     }
-    auto board_it = boards.find (key);
-    res = board_it->second->release_session ();
-    boards.erase (board_it);
+    std::shared_ptr<BoardSession> session = boards.find (key)->second;
+    std::lock_guard<std::mutex> session_lock (session->mutex);
+    session->board->remove_data_callbacks (dispatchers);
+    res = session->board->release_session ();
+    boards.erase (key);
+    erase_session (session->handle);
     return res;
 }
 
@@ -389,9 +421,9 @@ int get_current_board_data (int num_samples, int preset, double *data_buf, int *
     {
         return res;
     }
-    auto board_it = boards.find (key);
-    return board_it->second->get_current_board_data (
-        num_samples, preset, data_buf, returned_samples);
+    std::shared_ptr<BoardSession> session = boards.find (key)->second;
+    std::lock_guard<std::mutex> session_lock (session->mutex);
+    return session->board->get_current_board_data (num_samples, preset, data_buf, returned_samples);
 }
 
 int get_board_data_count (
@@ -405,8 +437,9 @@ int get_board_data_count (
     {
         return res;
     }
-    auto board_it = boards.find (key);
-    return board_it->second->get_board_data_count (preset, result);
+    std::shared_ptr<BoardSession> session = boards.find (key)->second;
+    std::lock_guard<std::mutex> session_lock (session->mutex);
+    return session->board->get_board_data_count (preset, result);
 }
 
 int get_board_data (int data_count, int preset, double *data_buf, int board_id,
@@ -420,8 +453,287 @@ int get_board_data (int data_count, int preset, double *data_buf, int board_id,
     {
         return res;
     }
-    auto board_it = boards.find (key);
-    return board_it->second->get_board_data (data_count, preset, data_buf);
+    std::shared_ptr<BoardSession> session = boards.find (key)->second;
+    std::lock_guard<std::mutex> session_lock (session->mutex);
+    return session->board->get_board_data (data_count, preset, data_buf);
+}
+
+int get_board_data_into (int max_samples, int preset, double *data_buf, int data_buf_cols,
+    int *returned_samples, int board_id, const char *json_brainflow_input_params)
+{
+    std::lock_guard<std::mutex> lock (mutex);
+
+    std::pair<int, struct BrainFlowInputParams> key;
+    int res = check_board_session (board_id, json_brainflow_input_params, key, false);
+    if (res != (int)BrainFlowExitCodes::STATUS_OK)
+    {
+        return res;
+    }
+    std::shared_ptr<BoardSession> session = boards.find (key)->second;
+    std::lock_guard<std::mutex> session_lock (session->mutex);
+    return session->board->get_board_data_into (
+        max_samples, preset, data_buf, data_buf_cols, returned_samples);
+}
+
+int get_current_board_data_into (int max_samples, int preset, double *data_buf, int data_buf_cols,
+    int *returned_samples, int board_id, const char *json_brainflow_input_params)
+{
+    std::lock_guard<std::mutex> lock (mutex);
+
+    std::pair<int, struct BrainFlowInputParams> key;
+    int res = check_board_session (board_id, json_brainflow_input_params, key, false);
+    if (res != (int)BrainFlowExitCodes::STATUS_OK)
+    {
+        return res;
+    }
+    std::shared_ptr<BoardSession> session = boards.find (key)->second;
+    std::lock_guard<std::mutex> session_lock (session->mutex);
+    return session->board->get_current_board_data_into (
+        max_samples, preset, data_buf, data_buf_cols, returned_samples);
+}
+
+int wait_for_data (int num_samples, int timeout_ms, int preset, int *result, int board_id,
+    const char *json_brainflow_input_params)
+{
+    if (result == NULL)
+    {
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    std::shared_ptr<DataBuffer> db;
+    {
+        std::lock_guard<std::mutex> lock (mutex);
+
+        std::pair<int, struct BrainFlowInputParams> key;
+        int res = check_board_session (board_id, json_brainflow_input_params, key, false);
+        if (res != (int)BrainFlowExitCodes::STATUS_OK)
+        {
+            return res;
+        }
+        std::shared_ptr<BoardSession> session = boards.find (key)->second;
+        std::lock_guard<std::mutex> session_lock (session->mutex);
+        res = session->board->get_data_buffer_for_wait (num_samples, timeout_ms, preset, db);
+        if (res != (int)BrainFlowExitCodes::STATUS_OK)
+        {
+            return res;
+        }
+    }
+    return wait_for_data_buffer (db, num_samples, timeout_ms, result);
+}
+
+int get_session_handle (int *session_handle, int board_id, const char *json_brainflow_input_params)
+{
+    std::lock_guard<std::mutex> lock (mutex);
+    if (session_handle == NULL)
+    {
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+
+    std::pair<int, struct BrainFlowInputParams> key;
+    int res = check_board_session (board_id, json_brainflow_input_params, key, false);
+    if (res != (int)BrainFlowExitCodes::STATUS_OK)
+    {
+        return res;
+    }
+    *session_handle = boards.find (key)->second->handle;
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
+int get_current_board_data_by_handle (
+    int num_samples, int preset, double *data_buf, int *returned_samples, int session_handle)
+{
+    std::shared_ptr<BoardSession> session = get_session (session_handle);
+    if (!session)
+    {
+        return (int)BrainFlowExitCodes::BOARD_NOT_CREATED_ERROR;
+    }
+    std::lock_guard<std::mutex> session_lock (session->mutex);
+    return session->board->get_current_board_data (num_samples, preset, data_buf, returned_samples);
+}
+
+int get_board_data_count_by_handle (int preset, int *result, int session_handle)
+{
+    std::shared_ptr<BoardSession> session = get_session (session_handle);
+    if (!session)
+    {
+        return (int)BrainFlowExitCodes::BOARD_NOT_CREATED_ERROR;
+    }
+    std::lock_guard<std::mutex> session_lock (session->mutex);
+    return session->board->get_board_data_count (preset, result);
+}
+
+int get_board_data_by_handle (int data_count, int preset, double *data_buf, int session_handle)
+{
+    std::shared_ptr<BoardSession> session = get_session (session_handle);
+    if (!session)
+    {
+        return (int)BrainFlowExitCodes::BOARD_NOT_CREATED_ERROR;
+    }
+    std::lock_guard<std::mutex> session_lock (session->mutex);
+    return session->board->get_board_data (data_count, preset, data_buf);
+}
+
+int get_board_data_into_by_handle (int max_samples, int preset, double *data_buf, int data_buf_cols,
+    int *returned_samples, int *lost_samples, int session_handle)
+{
+    std::shared_ptr<BoardSession> session = get_session (session_handle);
+    if (!session)
+    {
+        return (int)BrainFlowExitCodes::BOARD_NOT_CREATED_ERROR;
+    }
+    std::lock_guard<std::mutex> session_lock (session->mutex);
+    return session->board->get_board_data_into (
+        max_samples, preset, data_buf, data_buf_cols, returned_samples, lost_samples);
+}
+
+int get_current_board_data_into_by_handle (int max_samples, int preset, double *data_buf,
+    int data_buf_cols, int *returned_samples, int session_handle)
+{
+    std::shared_ptr<BoardSession> session = get_session (session_handle);
+    if (!session)
+    {
+        return (int)BrainFlowExitCodes::BOARD_NOT_CREATED_ERROR;
+    }
+    std::lock_guard<std::mutex> session_lock (session->mutex);
+    return session->board->get_current_board_data_into (
+        max_samples, preset, data_buf, data_buf_cols, returned_samples);
+}
+
+int insert_marker_by_handle (double value, int preset, int session_handle)
+{
+    std::shared_ptr<BoardSession> session = get_session (session_handle);
+    if (!session)
+    {
+        return (int)BrainFlowExitCodes::BOARD_NOT_CREATED_ERROR;
+    }
+    std::lock_guard<std::mutex> session_lock (session->mutex);
+    return session->board->insert_marker (value, preset);
+}
+
+int wait_for_data_by_handle (
+    int num_samples, int timeout_ms, int preset, int *result, int session_handle)
+{
+    if (result == NULL)
+    {
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    std::shared_ptr<BoardSession> session = get_session (session_handle);
+    if (!session)
+    {
+        return (int)BrainFlowExitCodes::BOARD_NOT_CREATED_ERROR;
+    }
+    std::shared_ptr<DataBuffer> db;
+    {
+        std::lock_guard<std::mutex> session_lock (session->mutex);
+        int res = session->board->get_data_buffer_for_wait (num_samples, timeout_ms, preset, db);
+        if (res != (int)BrainFlowExitCodes::STATUS_OK)
+        {
+            return res;
+        }
+    }
+    return wait_for_data_buffer (db, num_samples, timeout_ms, result);
+}
+
+int register_data_ready_fd_by_handle (int num_samples, int preset, int *fd, int session_handle)
+{
+    std::shared_ptr<BoardSession> session = get_session (session_handle);
+    if (!session)
+    {
+        return (int)BrainFlowExitCodes::BOARD_NOT_CREATED_ERROR;
+    }
+    std::lock_guard<std::mutex> session_lock (session->mutex);
+    return session->board->register_data_ready_fd (num_samples, preset, fd);
+}
+
+int unregister_data_ready_fd_by_handle (int preset, int session_handle)
+{
+    std::shared_ptr<BoardSession> session = get_session (session_handle);
+    if (!session)
+    {
+        return (int)BrainFlowExitCodes::BOARD_NOT_CREATED_ERROR;
+    }
+    std::lock_guard<std::mutex> session_lock (session->mutex);
+    return session->board->unregister_data_ready_fd (preset);
+}
+
+int create_buffer_reader_by_handle (int preset, int *reader_id, int session_handle)
+{
+    std::shared_ptr<BoardSession> session = get_session (session_handle);
+    if (!session)
+    {
+        return (int)BrainFlowExitCodes::BOARD_NOT_CREATED_ERROR;
+    }
+    std::lock_guard<std::mutex> session_lock (session->mutex);
+    return session->board->create_buffer_reader (preset, reader_id);
+}
+
+int delete_buffer_reader_by_handle (int reader_id, int session_handle)
+{
+    std::shared_ptr<BoardSession> session = get_session (session_handle);
+    if (!session)
+    {
+        return (int)BrainFlowExitCodes::BOARD_NOT_CREATED_ERROR;
+    }
+    std::lock_guard<std::mutex> session_lock (session->mutex);
+    return session->board->delete_buffer_reader (reader_id);
+}
+
+int get_buffer_reader_data_by_handle (int reader_id, int max_samples, double *data_buf,
+    int data_buf_cols, int *returned_samples, int *missed_samples, int session_handle)
+{
+    std::shared_ptr<BoardSession> session = get_session (session_handle);
+    if (!session)
+    {
+        return (int)BrainFlowExitCodes::BOARD_NOT_CREATED_ERROR;
+    }
+    std::lock_guard<std::mutex> session_lock (session->mutex);
+    return session->board->get_buffer_reader_data (
+        reader_id, max_samples, data_buf, data_buf_cols, returned_samples, missed_samples);
+}
+
+int get_buffer_reader_data_count_by_handle (int reader_id, int *result, int session_handle)
+{
+    std::shared_ptr<BoardSession> session = get_session (session_handle);
+    if (!session)
+    {
+        return (int)BrainFlowExitCodes::BOARD_NOT_CREATED_ERROR;
+    }
+    std::lock_guard<std::mutex> session_lock (session->mutex);
+    return session->board->get_buffer_reader_data_count (reader_id, result);
+}
+
+int get_streamer_stats_by_handle (
+    long long *queued, long long *dropped, int *pending, int session_handle)
+{
+    std::shared_ptr<BoardSession> session = get_session (session_handle);
+    if (!session)
+    {
+        return (int)BrainFlowExitCodes::BOARD_NOT_CREATED_ERROR;
+    }
+    std::lock_guard<std::mutex> session_lock (session->mutex);
+    return session->board->get_streamer_stats (queued, dropped, pending);
+}
+
+int get_board_stats_by_handle (int preset, char *stats, int max_len, int *len, int session_handle)
+{
+    std::shared_ptr<BoardSession> session = get_session (session_handle);
+    if (!session)
+    {
+        return (int)BrainFlowExitCodes::BOARD_NOT_CREATED_ERROR;
+    }
+    std::lock_guard<std::mutex> session_lock (session->mutex);
+    return session->board->get_stats (preset, stats, max_len, len);
+}
+
+int get_board_descr_by_handle (
+    int preset, char *board_descr, int max_len, int *len, int session_handle)
+{
+    std::shared_ptr<BoardSession> session = get_session (session_handle);
+    if (!session)
+    {
+        return (int)BrainFlowExitCodes::BOARD_NOT_CREATED_ERROR;
+    }
+    std::lock_guard<std::mutex> session_lock (session->mutex);
+    return session->board->get_board_descr (preset, board_descr, max_len, len);
 }
 
 int set_log_level_board_controller (int log_level)
@@ -478,10 +790,11 @@ int config_board (const char *config, char *response, int *response_len, int boa
     {
         return res;
     }
-    auto board_it = boards.find (key);
+    std::shared_ptr<BoardSession> session = boards.find (key)->second;
+    std::lock_guard<std::mutex> session_lock (session->mutex);
     std::string conf = config;
     std::string resp = "";
-    res = board_it->second->config_board (conf, resp);
+    res = session->board->config_board (conf, resp);
     if (res == (int)BrainFlowExitCodes::STATUS_OK)
     {
         *response_len = (int)resp.length ();
@@ -505,8 +818,9 @@ int config_board_with_bytes (
     {
         return res;
     }
-    auto board_it = boards.find (key);
-    return board_it->second->config_board_with_bytes (bytes, len);
+    std::shared_ptr<BoardSession> session = boards.find (key)->second;
+    std::lock_guard<std::mutex> session_lock (session->mutex);
+    return session->board->config_board_with_bytes (bytes, len);
 }
 
 int add_streamer (
@@ -524,8 +838,9 @@ int add_streamer (
     {
         return res;
     }
-    auto board_it = boards.find (key);
-    return board_it->second->add_streamer (streamer, preset);
+    std::shared_ptr<BoardSession> session = boards.find (key)->second;
+    std::lock_guard<std::mutex> session_lock (session->mutex);
+    return session->board->add_streamer (streamer, preset);
 }
 
 int delete_streamer (
@@ -543,18 +858,83 @@ int delete_streamer (
     {
         return res;
     }
-    auto board_it = boards.find (key);
-    return board_it->second->delete_streamer (streamer, preset);
+    std::shared_ptr<BoardSession> session = boards.find (key)->second;
+    std::lock_guard<std::mutex> session_lock (session->mutex);
+    return session->board->delete_streamer (streamer, preset);
+}
+
+int set_buffer_params (
+    const char *json_buffer_params, int board_id, const char *json_brainflow_input_params)
+{
+    std::lock_guard<std::mutex> lock (mutex);
+    if (json_buffer_params == NULL)
+    {
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+
+    std::pair<int, struct BrainFlowInputParams> key;
+    int res = check_board_session (board_id, json_brainflow_input_params, key, false);
+    if (res != (int)BrainFlowExitCodes::STATUS_OK)
+    {
+        return res;
+    }
+    struct BrainFlowBufferParams buffer_params;
+    res = string_to_brainflow_buffer_params (json_buffer_params, &buffer_params);
+    if (res != (int)BrainFlowExitCodes::STATUS_OK)
+    {
+        return res;
+    }
+    std::shared_ptr<BoardSession> session = boards.find (key)->second;
+    std::lock_guard<std::mutex> session_lock (session->mutex);
+    return session->board->set_buffer_params (buffer_params);
+}
+
+int register_data_callback (DataCallback callback, void *user_data, int min_batch, int preset,
+    int board_id, const char *json_brainflow_input_params)
+{
+    std::lock_guard<std::mutex> lock (mutex);
+
+    std::pair<int, struct BrainFlowInputParams> key;
+    int res = check_board_session (board_id, json_brainflow_input_params, key, false);
+    if (res != (int)BrainFlowExitCodes::STATUS_OK)
+    {
+        return res;
+    }
+    std::shared_ptr<BoardSession> session = boards.find (key)->second;
+    std::lock_guard<std::mutex> session_lock (session->mutex);
+    return session->board->register_data_callback (callback, user_data, min_batch, preset);
+}
+
+int unregister_data_callback (int preset, int board_id, const char *json_brainflow_input_params)
+{
+    // destroyed after all locks are released, it waits for running data callback
+    std::shared_ptr<DataCallbackDispatcher> dispatcher;
+    std::lock_guard<std::mutex> lock (mutex);
+
+    std::pair<int, struct BrainFlowInputParams> key;
+    int res = check_board_session (board_id, json_brainflow_input_params, key, false);
+    if (res != (int)BrainFlowExitCodes::STATUS_OK)
+    {
+        return res;
+    }
+    std::shared_ptr<BoardSession> session = boards.find (key)->second;
+    std::lock_guard<std::mutex> session_lock (session->mutex);
+    return session->board->unregister_data_callback (preset, dispatcher);
 }
 
 int release_all_sessions ()
 {
+    std::vector<std::shared_ptr<DataCallbackDispatcher>> dispatchers;
     std::lock_guard<std::mutex> lock (mutex);
 
     for (auto it = boards.begin (), next_it = it; it != boards.end (); it = next_it)
     {
         ++next_it;
-        it->second->release_session ();
+        std::shared_ptr<BoardSession> session = it->second;
+        std::lock_guard<std::mutex> session_lock (session->mutex);
+        session->board->remove_data_callbacks (dispatchers);
+        session->board->release_session ();
+        erase_session (session->handle);
         boards.erase (it);
     }
 
@@ -579,6 +959,32 @@ std::pair<int, struct BrainFlowInputParams> get_key (
     return key;
 }
 
+std::shared_ptr<BoardSession> get_session (int session_handle)
+{
+    std::lock_guard<std::mutex> handles_lock (sessions_mutex);
+    auto session_it = sessions.find (session_handle);
+    if (session_it == sessions.end ())
+    {
+        return std::shared_ptr<BoardSession> ();
+    }
+    return session_it->second;
+}
+
+void erase_session (int session_handle)
+{
+    std::lock_guard<std::mutex> handles_lock (sessions_mutex);
+    sessions.erase (session_handle);
+}
+
+int wait_for_data_buffer (
+    std::shared_ptr<DataBuffer> db, int num_samples, int timeout_ms, int *result)
+{
+    // no locks are held here, so other threads can read data and release session during the wait
+    db->wait_for_data ((size_t)num_samples, timeout_ms);
+    *result = (int)db->get_data_count ();
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
 int check_board_session (int board_id, const char *json_brainflow_input_params,
     std::pair<int, struct BrainFlowInputParams> &key, bool log_error)
 {
@@ -634,3 +1040,34 @@ int string_to_brainflow_input_params (
         return (int)BrainFlowExitCodes::GENERAL_ERROR;
     }
 }
+
+int string_to_brainflow_buffer_params (
+    const char *json_buffer_params, struct BrainFlowBufferParams *buffer_params)
+{
+    // unlike BrainFlowInputParams all fields are optional
+    try
+    {
+        json config = json::parse (std::string (json_buffer_params));
+        buffer_params->buffer_type = config.value ("buffer_type", buffer_params->buffer_type);
+        buffer_params->streamer_queue_size =
+            config.value ("streamer_queue_size", buffer_params->streamer_queue_size);
+        buffer_params->streamer_overflow_policy =
+            config.value ("streamer_overflow_policy", buffer_params->streamer_overflow_policy);
+        buffer_params->streamer_block_timeout_ms =
+            config.value ("streamer_block_timeout_ms", buffer_params->streamer_block_timeout_ms);
+        buffer_params->collect_stats = config.value ("collect_stats", buffer_params->collect_stats);
+        buffer_params->buffer_overflow_policy =
+            config.value ("buffer_overflow_policy", buffer_params->buffer_overflow_policy);
+        buffer_params->max_buffer_size =
+            config.value ("max_buffer_size", buffer_params->max_buffer_size);
+        buffer_params->lazy_allocation =
+            config.value ("lazy_allocation", buffer_params->lazy_allocation);
+        buffer_params->float32_exg = config.value ("float32_exg", buffer_params->float32_exg);
+        return (int)BrainFlowExitCodes::STATUS_OK;
+    }
+    catch (json::exception &e)
+    {
+        Board::board_logger->error ("invalid buffer params json, {}", e.what ());
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+}
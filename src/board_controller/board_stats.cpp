@@ -0,0 +1,88 @@
+#include <math.h>
+#include <vector>
+
+#include "board_stats.h"
+
+
+LatencyHistogram::LatencyHistogram ()
+{
+    reset ();
+}
+
+void LatencyHistogram::reset ()
+{
+    for (int i = 0; i < LATENCY_HISTOGRAM_BUCKETS; i++)
+    {
+        counts[i].store (0, std::memory_order_relaxed);
+    }
+    total_count.store (0, std::memory_order_relaxed);
+    total_us.store (0, std::memory_order_relaxed);
+    max_us.store (0, std::memory_order_relaxed);
+}
+
+void LatencyHistogram::add (double latency)
+{
+    long long latency_us = (latency > 0) ? (long long)(latency * 1000000.0) : 0;
+    int bucket = 0;
+    for (long long value = latency_us; (value > 0) && (bucket < LATENCY_HISTOGRAM_BUCKETS - 1);
+         value >>= 1)
+    {
+        bucket++;
+    }
+    counts[bucket].fetch_add (1, std::memory_order_relaxed);
+    total_count.fetch_add (1, std::memory_order_relaxed);
+    total_us.fetch_add (latency_us, std::memory_order_relaxed);
+    // retrieval latency is added by all threads which read data, so update can race
+    long long current_max = max_us.load (std::memory_order_relaxed);
+    while ((latency_us > current_max) &&
+        (!max_us.compare_exchange_weak (current_max, latency_us, std::memory_order_relaxed)))
+    {
+    }
+}
+
+json LatencyHistogram::to_json ()
+{
+    std::vector<long long> bucket_counts (LATENCY_HISTOGRAM_BUCKETS);
+    std::vector<long long> upper_bounds (LATENCY_HISTOGRAM_BUCKETS);
+    for (int i = 0; i < LATENCY_HISTOGRAM_BUCKETS; i++)
+    {
+        bucket_counts[i] = counts[i].load (std::memory_order_relaxed);
+        upper_bounds[i] = 1LL << i;
+    }
+    long long count = total_count.load (std::memory_order_relaxed);
+    json res;
+    res["counts"] = bucket_counts;
+    res["upper_bounds_us"] = upper_bounds;
+    res["count"] = count;
+    res["mean_us"] =
+        (count > 0) ? (double)total_us.load (std::memory_order_relaxed) / (double)count : 0.0;
+    res["max_us"] = max_us.load (std::memory_order_relaxed);
+    return res;
+}
+
+PresetStats::PresetStats ()
+{
+    reset ();
+}
+
+void PresetStats::reset ()
+{
+    pushed.store (0, std::memory_order_relaxed);
+    retrieved.store (0, std::memory_order_relaxed);
+    lock_waits.store (0, std::memory_order_relaxed);
+    lock_wait_ns.store (0, std::memory_order_relaxed);
+    push_latency.reset ();
+    retrieval_latency.reset ();
+}
+
+json PresetStats::to_json ()
+{
+    json res;
+    res["packages_pushed"] = pushed.load (std::memory_order_relaxed);
+    res["packages_retrieved"] = retrieved.load (std::memory_order_relaxed);
+    res["lock_waits"] = lock_waits.load (std::memory_order_relaxed);
+    res["lock_wait_us"] = (double)lock_wait_ns.load (std::memory_order_relaxed) / 1000.0;
+    res["push_latency"] = push_latency.to_json ();
+    res["retrieval_latency"] = retrieval_latency.to_json ();
+    return res;
+}
@@ -25,6 +25,8 @@ endif (CMAKE_SIZEOF_VOID_P EQUAL 8)
 SET (BOARD_CONTROLLER_SRC
     ${CMAKE_CURRENT_SOURCE_DIR}/src/utils/timestamp.cpp
     ${CMAKE_CURRENT_SOURCE_DIR}/src/utils/data_buffer.cpp
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/utils/lock_free_data_buffer.cpp
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/utils/bfbin_file.cpp
     ${CMAKE_CURRENT_SOURCE_DIR}/src/utils/os_serial.cpp
     ${CMAKE_CURRENT_SOURCE_DIR}/src/utils/os_serial_ioctl.cpp
     ${CMAKE_CURRENT_SOURCE_DIR}/src/utils/serial.cpp
@@ -59,8 +61,15 @@ SET (BOARD_CONTROLLER_SRC
     ${CMAKE_CURRENT_SOURCE_DIR}/src/board_controller/dyn_lib_board.cpp
     ${CMAKE_CURRENT_SOURCE_DIR}/src/board_controller/bt_lib_board.cpp
     ${CMAKE_CURRENT_SOURCE_DIR}/src/board_controller/playback_file_board.cpp
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/board_controller/playback_file_reader.cpp
     ${CMAKE_CURRENT_SOURCE_DIR}/src/board_controller/file_streamer.cpp
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/board_controller/bfbin_file_streamer.cpp
     ${CMAKE_CURRENT_SOURCE_DIR}/src/board_controller/multicast_streamer.cpp
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/board_controller/data_callback_dispatcher.cpp
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/board_controller/data_ready_notifier.cpp
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/board_controller/preset_layout.cpp
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/board_controller/streamer_dispatcher.cpp
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/board_controller/board_stats.cpp
     ${CMAKE_CURRENT_SOURCE_DIR}/src/board_controller/plotjuggler_udp_streamer.cpp
     ${CMAKE_CURRENT_SOURCE_DIR}/src/board_controller/gtec/unicorn_board.cpp
     ${CMAKE_CURRENT_SOURCE_DIR}/src/board_controller/neuromd/neuromd_board.cpp
@@ -0,0 +1,92 @@
+#include <algorithm>
+
+#include "board.h"
+#include "brainflow_constants.h"
+#include "data_callback_dispatcher.h"
+
+
+DataCallbackDispatcher::DataCallbackDispatcher (
+    DataCallback callback, void *user_data, int data_len, int min_batch)
+{
+    this->callback = callback;
+    this->user_data = user_data;
+    this->len = data_len;
+    this->min_batch = min_batch;
+    queue_size = std::max ((size_t)min_batch * 16, (size_t)MIN_CALLBACK_QUEUE_SIZE);
+    db = NULL;
+    is_running = false;
+}
+
+DataCallbackDispatcher::~DataCallbackDispatcher ()
+{
+    {
+        std::lock_guard<std::mutex> lock (m);
+        is_running = false;
+    }
+    cv.notify_one ();
+    if (dispatch_thread.joinable ())
+    {
+        dispatch_thread.join ();
+    }
+    if (db != NULL)
+    {
+        delete db;
+        db = NULL;
+    }
+}
+
+int DataCallbackDispatcher::init_dispatcher ()
+{
+    if ((is_running) || (db != NULL))
+    {
+        Board::board_logger->error ("data callback dispatcher is running");
+        return (int)BrainFlowExitCodes::GENERAL_ERROR;
+    }
+    db = new DataBuffer (len, queue_size);
+    if (!db->is_ready ())
+    {
+        Board::board_logger->error ("unable to prepare buffer for data callback");
+        delete db;
+        db = NULL;
+        return (int)BrainFlowExitCodes::INVALID_BUFFER_SIZE_ERROR;
+    }
+    batch.resize (queue_size * (size_t)len);
+    is_running = true;
+    dispatch_thread = std::thread ([this] { this->thread_worker (); });
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
+void DataCallbackDispatcher::add_data (double *data)
+{
+    db->add_data (data);
+    if (db->get_data_count () >= (size_t)min_batch)
+    {
+        // lock is required to not lose notification if worker is checking the condition right now
+        {
+            std::lock_guard<std::mutex> lock (m);
+        }
+        cv.notify_one ();
+    }
+}
+
+void DataCallbackDispatcher::thread_worker ()
+{
+    while (true)
+    {
+        {
+            std::unique_lock<std::mutex> lock (m);
+            cv.wait (lock,
+                [this] { return (!is_running) || (db->get_data_count () >= (size_t)min_batch); });
+            if (!is_running)
+            {
+                break;
+            }
+        }
+        // row major (len x num_samples) array, valid until the next callback call
+        size_t num_samples = db->get_data_transposed (queue_size, batch.data (), 0);
+        if (num_samples > 0)
+        {
+            callback (batch.data (), len, (int)num_samples, user_data);
+        }
+    }
+}
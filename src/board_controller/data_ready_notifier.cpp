@@ -0,0 +1,84 @@
+#ifndef _WIN32
+#include <fcntl.h>
+#include <unistd.h>
+#endif
+
+#include "brainflow_constants.h"
+#include "data_ready_notifier.h"
+
+
+DataReadyNotifier::DataReadyNotifier (size_t num_samples)
+{
+    this->num_samples = num_samples;
+    armed = true;
+    read_fd = -1;
+    write_fd = -1;
+}
+
+DataReadyNotifier::~DataReadyNotifier ()
+{
+#ifndef _WIN32
+    if (read_fd >= 0)
+    {
+        close (read_fd);
+        read_fd = -1;
+    }
+    if (write_fd >= 0)
+    {
+        close (write_fd);
+        write_fd = -1;
+    }
+#endif
+}
+
+int DataReadyNotifier::init_notifier ()
+{
+#ifdef _WIN32
+    // pipes are not selectable on windows
+    return (int)BrainFlowExitCodes::UNSUPPORTED_BOARD_ERROR;
+#else
+    if (read_fd >= 0)
+    {
+        return (int)BrainFlowExitCodes::GENERAL_ERROR;
+    }
+    int fds[2];
+    if (pipe (fds) != 0)
+    {
+        return (int)BrainFlowExitCodes::GENERAL_ERROR;
+    }
+    read_fd = fds[0];
+    write_fd = fds[1];
+    // producer must never block and reader drains the pipe until it is empty
+    for (int i = 0; i < 2; i++)
+    {
+        fcntl (fds[i], F_SETFL, fcntl (fds[i], F_GETFL) | O_NONBLOCK);
+        fcntl (fds[i], F_SETFD, fcntl (fds[i], F_GETFD) | FD_CLOEXEC);
+    }
+    return (int)BrainFlowExitCodes::STATUS_OK;
+#endif
+}
+
+int DataReadyNotifier::get_fd ()
+{
+    return read_fd;
+}
+
+void DataReadyNotifier::notify (size_t data_count)
+{
+#ifndef _WIN32
+    // notify is called by acquisition thread and by reader thread after rearm, exchange makes sure
+    // that only one of them writes the byte
+    if ((data_count >= num_samples) && (armed.exchange (false)))
+    {
+        char value = 1;
+        // if pipe is full reader is already notified
+        ssize_t res = write (write_fd, &value, 1);
+        (void)res;
+    }
+#endif
+}
+
+void DataReadyNotifier::rearm ()
+{
+    armed = true;
+}
@@ -1,3 +1,4 @@
+#include <stdio.h>
 #include <string.h>
 #include <typeinfo>
 
@@ -45,3 +46,35 @@ void FileStreamer::stream_data (double *data)
     }
     fprintf (fp, "%lf\n", data[len - 1]);
 }
+
+void FileStreamer::stream_data_batch (double *data, int num_packages)
+{
+    if (text.empty ())
+    {
+        text.resize (4096);
+    }
+    size_t pos = 0;
+    for (int i = 0; i < num_packages; i++)
+    {
+        double *package = data + (size_t)i * len;
+        for (int j = 0; j < len; j++)
+        {
+            const char *format = (j == len - 1) ? "%lf\n" : "%lf\t";
+            while (true)
+            {
+                int res = snprintf (text.data () + pos, text.size () - pos, format, package[j]);
+                if (res < 0)
+                {
+                    return;
+                }
+                if ((size_t)res < text.size () - pos)
+                {
+                    pos += (size_t)res;
+                    break;
+                }
+                text.resize (text.size () * 2 + (size_t)res);
+            }
+        }
+    }
+    fwrite (text.data (), 1, pos, fp);
+}
@@ -0,0 +1,33 @@
+#pragma once
+
+#include <stdio.h>
+#include <vector>
+
+#include "bfbin_file.h"
+#include "file_streamer.h"
+#include "streamer.h"
+
+#define BFBIN_STREAMER_CHUNK_SIZE 256
+
+// writes packages in binary channel major format, packages are accumulated and flushed in chunks
+class BinaryFileStreamer : public Streamer
+{
+
+public:
+    BinaryFileStreamer (
+        const char *file, const char *file_mode, int data_len, const BFBinHeader &header);
+    ~BinaryFileStreamer ();
+
+    int init_streamer ();
+    void stream_data (double *data);
+
+private:
+    char file[BRAINFLOW_FILE_NAME_LIMIT];
+    char file_mode[BRAINFLOW_FILE_NAME_LIMIT];
+    FILE *fp;
+    BFBinHeader header;
+    std::vector<double> chunk;
+    int chunk_cols;
+
+    void flush_chunk ();
+};
@@ -4,21 +4,37 @@
 #include <deque>
 #include <limits>
 #include <map>
+#include <memory>
 #include <string>
+#include <vector>
 
 #include "board_controller.h"
+#include "board_stats.h"
 #include "brainflow_boards.h"
+#include "brainflow_buffer_params.h"
 #include "brainflow_constants.h"
 #include "brainflow_input_params.h"
 #include "data_buffer.h"
+#include "data_callback_dispatcher.h"
+#include "data_ready_notifier.h"
+#include "marker_queue.h"
+#include "preset_layout.h"
 #include "spinlock.h"
 #include "streamer.h"
+#include "streamer_dispatcher.h"
 
 #include "spdlog/spdlog.h"
 
 #define MAX_CAPTURE_SAMPLES (86400 * 250) // should be enough for one day of capturing
 
 
+// independent cursor over the ring buffer of a preset
+struct BufferReader
+{
+    int preset;
+    unsigned long long cursor;
+};
+
 class Board
 {
 public:
@@ -37,6 +53,8 @@ public:
     Board (int board_id, struct BrainFlowInputParams params)
     {
         skip_logs = false;
+        collect_stats = false;
+        last_reader_id = 0;
         this->board_id = board_id;
         this->params = params;
         try
@@ -64,10 +82,45 @@ public:
     int get_current_board_data (
         int num_samples, int preset, double *data_buf, int *returned_samples);
     int get_board_data_count (int preset, int *result);
-    int get_board_data (int data_count, int preset, double *data_buf);
+    // lost_samples is optional, its the number of packages overwritten or dropped by ring buffer
+    // since the previous call which removed data for this preset
+    int get_board_data (int data_count, int preset, double *data_buf, int *lost_samples = NULL);
+    // write to preallocated row major (num_rows x data_buf_cols) array, no intermediate copies
+    int get_board_data_into (int max_samples, int preset, double *data_buf, int data_buf_cols,
+        int *returned_samples, int *lost_samples = NULL);
+    int get_current_board_data_into (
+        int max_samples, int preset, double *data_buf, int data_buf_cols, int *returned_samples);
     int insert_marker (double value, int preset);
     int add_streamer (const char *streamer_params, int preset);
     int delete_streamer (const char *streamer_params, int preset);
+    // applied to buffers created by the next start_stream call
+    int set_buffer_params (struct BrainFlowBufferParams buffer_params);
+    int register_data_callback (DataCallback callback, void *user_data, int min_batch, int preset);
+    // dispatcher waits for running callback in destructor, callback may call other methods for
+    // this board, so removed dispatchers should be destroyed without holding any locks
+    int unregister_data_callback (int preset, std::shared_ptr<DataCallbackDispatcher> &dispatcher);
+    void remove_data_callbacks (std::vector<std::shared_ptr<DataCallbackDispatcher>> &dispatchers);
+    // returns fd which becomes readable once buffer has at least num_samples packages
+    int register_data_ready_fd (int num_samples, int preset, int *fd);
+    int unregister_data_ready_fd (int preset);
+    // readers get only packages they have not seen yet without removing them for other readers
+    int create_buffer_reader (int preset, int *reader_id);
+    int delete_buffer_reader (int reader_id);
+    int get_buffer_reader_data (int reader_id, int max_samples, double *data_buf, int data_buf_cols,
+        int *returned_samples, int *missed_samples);
+    int get_buffer_reader_data_count (int reader_id, int *result);
+    // validates wait params and returns buffer for the preset, wait itself should be done without
+    // holding any locks, buffer stays valid even if session is released during the wait
+    int get_data_buffer_for_wait (
+        int num_samples, int timeout_ms, int preset, std::shared_ptr<DataBuffer> &db);
+    // description of this session, configurable boards may change it in prepare_session or
+    // config_board, so it can be different from description returned by get_board_descr(board_id)
+    int get_board_descr (int preset, char *descr, int max_len, int *len);
+    // counters of the queue between acquisition thread and streamers
+    int get_streamer_stats (long long *queued, long long *dropped, int *pending);
+    // counters and latency histograms of a preset as json, collected only if collect_stats field
+    // of buffer params was set before start_stream
+    int get_stats (int preset, char *stats, int max_len, int *len);
 
     // Board::board_logger should not be called from destructors, to ensure that there are safe log
     // methods Board::board_logger still available but should be used only outside destructors
@@ -98,14 +151,28 @@ public:
     }
 
 protected:
-    std::map<int, DataBuffer *> dbs;
-    std::map<int, std::vector<Streamer *>> streamers;
+    std::map<int, std::shared_ptr<DataBuffer>> dbs;
+    // created by the first add_streamer call, owns streamers of all presets
+    std::shared_ptr<StreamerDispatcher> streamer_dispatcher;
+    std::map<int, std::shared_ptr<DataCallbackDispatcher>> data_callbacks;
+    std::map<int, std::shared_ptr<DataReadyNotifier>> data_ready_notifiers;
+    std::map<int, BufferReader> buffer_readers;
+    int last_reader_id;
     bool skip_logs;
     int board_id;
     struct BrainFlowInputParams params;
+    struct BrainFlowBufferParams buffer_params;
     json board_descr;
+    // user calls are serialized by session mutex, lock orders only changes of callbacks, data
+    // ready fds and streamers with push_package. Reads and markers never take it, so consumers
+    // can not stall the board thread
     SpinLock lock;
-    std::map<int, std::deque<double>> marker_queues;
+    MarkerQueue marker_queues[MAX_PRESETS];
+    // compiled in prepare_for_acquisition, use it instead of board_descr in board threads
+    PresetLayout preset_layouts[MAX_PRESETS];
+    // applied from buffer_params in prepare_for_acquisition
+    bool collect_stats;
+    PresetStats preset_stats[MAX_PRESETS];
 
     int prepare_for_acquisition (int buffer_size, const char *streamer_params);
     void free_packages ();
@@ -116,6 +183,11 @@ protected:
         std::string &streamer_dest, std::string &streamer_mods);
 
 private:
-    // reshapes data from DataBuffer format where all channels are mixed to linear buffer
-    void reshape_data (int data_count, int preset, const double *buf, double *output_buf);
+    int check_data_buffer (int preset);
+    DataBuffer *create_data_buffer (const PresetLayout &layout, int buffer_size);
+    // data_buf is row major with data_buf_cols columns
+    void add_retrieval_stats (int preset, double *data_buf, size_t data_buf_cols, size_t count);
+    // called after data was removed from ring buffer, fd becomes readable again if there is still
+    // enough data
+    void rearm_data_ready_notifier (int preset);
 };
@@ -7,6 +7,10 @@
 extern "C"
 {
 #endif
+    // data is row major (num_rows x num_samples) array which is valid only during the call
+    typedef void (*DataCallback) (
+        const double *data, int num_rows, int num_samples, void *user_data);
+
     // data acquisition methods
     SHARED_EXPORT int CALLING_CONVENTION prepare_session (
         int board_id, const char *json_brainflow_input_params);
@@ -22,6 +26,16 @@ extern "C"
         int preset, int *result, int board_id, const char *json_brainflow_input_params);
     SHARED_EXPORT int CALLING_CONVENTION get_board_data (int data_count, int preset,
         double *data_buf, int board_id, const char *json_brainflow_input_params);
+    SHARED_EXPORT int CALLING_CONVENTION get_board_data_into (int max_samples, int preset,
+        double *data_buf, int data_buf_cols, int *returned_samples, int board_id,
+        const char *json_brainflow_input_params);
+    SHARED_EXPORT int CALLING_CONVENTION get_current_board_data_into (int max_samples, int preset,
+        double *data_buf, int data_buf_cols, int *returned_samples, int board_id,
+        const char *json_brainflow_input_params);
+    // blocks until buffer has at least num_samples packages or timeout expires, result is the
+    // number of packages available when the wait is over
+    SHARED_EXPORT int CALLING_CONVENTION wait_for_data (int num_samples, int timeout_ms, int preset,
+        int *result, int board_id, const char *json_brainflow_input_params);
     SHARED_EXPORT int CALLING_CONVENTION config_board (const char *config, char *response,
         int *response_len, int board_id, const char *json_brainflow_input_params);
     SHARED_EXPORT int CALLING_CONVENTION config_board_with_bytes (
@@ -34,7 +48,66 @@ extern "C"
         const char *streamer, int preset, int board_id, const char *json_brainflow_input_params);
     SHARED_EXPORT int CALLING_CONVENTION delete_streamer (
         const char *streamer, int preset, int board_id, const char *json_brainflow_input_params);
+    SHARED_EXPORT int CALLING_CONVENTION set_buffer_params (
+        const char *json_buffer_params, int board_id, const char *json_brainflow_input_params);
     SHARED_EXPORT int CALLING_CONVENTION release_all_sessions ();
+    // callback is called from a dedicated thread once at least min_batch new packages are
+    // available, one callback per preset, unregister it before registering a new one
+    SHARED_EXPORT int CALLING_CONVENTION register_data_callback (DataCallback callback,
+        void *user_data, int min_batch, int preset, int board_id,
+        const char *json_brainflow_input_params);
+    SHARED_EXPORT int CALLING_CONVENTION unregister_data_callback (
+        int preset, int board_id, const char *json_brainflow_input_params);
+
+    // session handle methods, they skip json parsing and lock only a single board
+    SHARED_EXPORT int CALLING_CONVENTION get_session_handle (
+        int *session_handle, int board_id, const char *json_brainflow_input_params);
+    SHARED_EXPORT int CALLING_CONVENTION get_current_board_data_by_handle (
+        int num_samples, int preset, double *data_buf, int *returned_samples, int session_handle);
+    SHARED_EXPORT int CALLING_CONVENTION get_board_data_count_by_handle (
+        int preset, int *result, int session_handle);
+    SHARED_EXPORT int CALLING_CONVENTION get_board_data_by_handle (
+        int data_count, int preset, double *data_buf, int session_handle);
+    // lost_samples is the number of packages overwritten or dropped by ring buffer since the
+    // previous call which removed data, see buffer_overflow_policy
+    SHARED_EXPORT int CALLING_CONVENTION get_board_data_into_by_handle (int max_samples, int preset,
+        double *data_buf, int data_buf_cols, int *returned_samples, int *lost_samples,
+        int session_handle);
+    SHARED_EXPORT int CALLING_CONVENTION get_current_board_data_into_by_handle (int max_samples,
+        int preset, double *data_buf, int data_buf_cols, int *returned_samples, int session_handle);
+    SHARED_EXPORT int CALLING_CONVENTION insert_marker_by_handle (
+        double marker_value, int preset, int session_handle);
+    SHARED_EXPORT int CALLING_CONVENTION wait_for_data_by_handle (
+        int num_samples, int timeout_ms, int preset, int *result, int session_handle);
+    // fd becomes readable once buffer has at least num_samples packages, reader should drain it,
+    // fd is owned by the board and closed in unregister_data_ready_fd or release_session.
+    // Not supported on windows
+    SHARED_EXPORT int CALLING_CONVENTION register_data_ready_fd_by_handle (
+        int num_samples, int preset, int *fd, int session_handle);
+    SHARED_EXPORT int CALLING_CONVENTION unregister_data_ready_fd_by_handle (
+        int preset, int session_handle);
+    // buffer readers are independent cursors, each reader gets only packages it has not seen yet
+    // and doesnt remove them for others. missed_samples is the number of packages overwritten
+    // before reader got them
+    SHARED_EXPORT int CALLING_CONVENTION create_buffer_reader_by_handle (
+        int preset, int *reader_id, int session_handle);
+    SHARED_EXPORT int CALLING_CONVENTION delete_buffer_reader_by_handle (
+        int reader_id, int session_handle);
+    SHARED_EXPORT int CALLING_CONVENTION get_buffer_reader_data_by_handle (int reader_id,
+        int max_samples, double *data_buf, int data_buf_cols, int *returned_samples,
+        int *missed_samples, int session_handle);
+    SHARED_EXPORT int CALLING_CONVENTION get_buffer_reader_data_count_by_handle (
+        int reader_id, int *result, int session_handle);
+    // streamers are fed from a bounded queue by a writer thread, queued and dropped are totals
+    // since the first add_streamer call, pending is the current queue depth
+    SHARED_EXPORT int CALLING_CONVENTION get_streamer_stats_by_handle (
+        long long *queued, long long *dropped, int *pending, int session_handle);
+    // per preset counters and latency histograms as json, requires collect_stats in buffer params
+    SHARED_EXPORT int CALLING_CONVENTION get_board_stats_by_handle (
+        int preset, char *stats, int max_len, int *len, int session_handle);
+    // description of prepared session, differs from get_board_descr for configurable boards
+    SHARED_EXPORT int CALLING_CONVENTION get_board_descr_by_handle (
+        int preset, char *board_descr, int max_len, int *len, int session_handle);
 
     // logging methods
     SHARED_EXPORT int CALLING_CONVENTION set_log_level_board_controller (int log_level);
@@ -0,0 +1,47 @@
+#pragma once
+
+#include <atomic>
+
+#include "brainflow_boards.h"
+
+// bucket 0 counts latencies below 1us, bucket i counts latencies in [2^(i-1), 2^i) us, the last
+// bucket also counts all larger values
+#define LATENCY_HISTOGRAM_BUCKETS 24
+
+
+// lock free log2 histogram, can be written and read by get_stats from any thread
+class LatencyHistogram
+{
+
+public:
+    LatencyHistogram ();
+
+    void reset ();
+    // latency in seconds, negative values(e.g. device clock is ahead of host clock) go to bucket 0
+    void add (double latency);
+    json to_json ();
+
+private:
+    std::atomic<long long> counts[LATENCY_HISTOGRAM_BUCKETS];
+    std::atomic<long long> total_count;
+    std::atomic<long long> total_us;
+    std::atomic<long long> max_us;
+};
+
+// opt-in counters of a preset, enabled by collect_stats field of BrainFlowBufferParams
+struct PresetStats
+{
+    std::atomic<long long> pushed;
+    std::atomic<long long> retrieved;
+    // number of push_package calls which waited for the board lock and total wait time
+    std::atomic<long long> lock_waits;
+    std::atomic<long long> lock_wait_ns;
+    // from timestamp set by board thread on read to push_package and to retrieval by user
+    LatencyHistogram push_latency;
+    LatencyHistogram retrieval_latency;
+
+    PresetStats ();
+
+    void reset ();
+    json to_json ();
+};
@@ -0,0 +1,37 @@
+#pragma once
+
+#include "brainflow_constants.h"
+
+#define DEFAULT_STREAMER_QUEUE_SIZE 16384
+#define DEFAULT_STREAMER_BLOCK_TIMEOUT_MS 1000
+
+// we pass this structure from user API as a json string, all fields are optional
+struct BrainFlowBufferParams
+{
+    int buffer_type;
+    int streamer_queue_size;
+    int streamer_overflow_policy;
+    // max time to wait for free space in streamer queue with BLOCK policy
+    int streamer_block_timeout_ms;
+    bool collect_stats;
+    int buffer_overflow_policy;
+    // max capacity for GROW policy, 0 means MAX_CAPTURE_SAMPLES
+    int max_buffer_size;
+    // allocate ring buffer in chunks when they are written first time
+    bool lazy_allocation;
+    // store exg rows as float32, values are converted to double on retrieval
+    bool float32_exg;
+
+    BrainFlowBufferParams ()
+    {
+        buffer_type = (int)BufferTypes::SPIN_LOCK_BUFFER;
+        streamer_queue_size = DEFAULT_STREAMER_QUEUE_SIZE;
+        streamer_overflow_policy = (int)StreamerOverflowPolicies::BLOCK;
+        streamer_block_timeout_ms = DEFAULT_STREAMER_BLOCK_TIMEOUT_MS;
+        collect_stats = false;
+        buffer_overflow_policy = (int)BufferOverflowPolicies::OVERWRITE_OLDEST;
+        max_buffer_size = 0;
+        lazy_allocation = false;
+        float32_exg = false;
+    }
+};
@@ -0,0 +1,42 @@
+#pragma once
+
+#include <condition_variable>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+#include "board_controller.h"
+#include "data_buffer.h"
+
+#define MIN_CALLBACK_QUEUE_SIZE 1024
+
+
+// delivers packages to user callback from a dedicated thread, so slow callback never blocks
+// acquisition thread. If callback can not keep up, queue keeps the latest
+// max(16 * min_batch, MIN_CALLBACK_QUEUE_SIZE) packages and older packages are dropped
+class DataCallbackDispatcher
+{
+
+public:
+    DataCallbackDispatcher (DataCallback callback, void *user_data, int data_len, int min_batch);
+    ~DataCallbackDispatcher ();
+
+    int init_dispatcher ();
+    // called from push_package, doesnt wait for callback
+    void add_data (double *data);
+
+private:
+    DataCallback callback;
+    void *user_data;
+    int len;
+    int min_batch;
+    size_t queue_size;
+    DataBuffer *db;
+    std::vector<double> batch;
+    bool is_running;
+    std::mutex m;
+    std::condition_variable cv;
+    std::thread dispatch_thread;
+
+    void thread_worker ();
+};
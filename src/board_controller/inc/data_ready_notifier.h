@@ -0,0 +1,31 @@
+#pragma once
+
+#include <atomic>
+#include <stddef.h>
+
+
+// makes a file descriptor readable once ring buffer has at least num_samples packages, so event
+// loops like asyncio can watch it instead of polling. Byte is written once threshold is reached,
+// notifier is rearmed after each read which removes data from ring buffer, so fd becomes readable
+// again if there is still enough data or once threshold is reached again
+class DataReadyNotifier
+{
+
+public:
+    DataReadyNotifier (size_t num_samples);
+    ~DataReadyNotifier ();
+
+    int init_notifier ();
+    // read end of the pipe, it is closed in destructor
+    int get_fd ();
+    // called from push_package and after rearm with the number of packages in ring buffer
+    void notify (size_t data_count);
+    // called after data was removed from ring buffer, next notify call with enough data writes fd
+    void rearm ();
+
+private:
+    size_t num_samples;
+    std::atomic<bool> armed;
+    int read_fd;
+    int write_fd;
+};
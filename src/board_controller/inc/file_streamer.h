@@ -1,6 +1,7 @@
 #pragma once
 
 #include <stdio.h>
+#include <vector>
 
 #include "streamer.h"
 
@@ -15,9 +16,12 @@ public:
 
     int init_streamer ();
     void stream_data (double *data);
+    // formats whole batch in memory and writes it with a single call
+    void stream_data_batch (double *data, int num_packages);
 
 private:
     char file[BRAINFLOW_FILE_NAME_LIMIT];
     char file_mode[BRAINFLOW_FILE_NAME_LIMIT];
     FILE *fp;
+    std::vector<char> text;
 };
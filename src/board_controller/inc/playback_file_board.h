@@ -1,12 +1,15 @@
 #pragma once
 
+#include <atomic>
 #include <condition_variable>
+#include <memory>
 #include <mutex>
 #include <thread>
 #include <vector>
 
 #include "board.h"
 #include "board_controller.h"
+#include "playback_file_reader.h"
 
 
 class PlaybackFileBoard : public Board
@@ -16,13 +19,18 @@ private:
     volatile bool keep_alive;
     volatile bool loopback;
     volatile bool use_new_timestamps;
+    // multiplier for recorded time between packages, 0 means unthrottled. Set by config_board and
+    // read by streaming threads
+    std::atomic<double> speed;
     std::vector<double> pos_percentage;
+    std::vector<double> seek_timestamps;
     std::vector<std::thread> streaming_threads;
     bool initialized;
-    std::vector<std::vector<long int>> file_offsets;
+    // indexed by preset, empty if there is no file for preset
+    std::vector<std::shared_ptr<PlaybackFileReader>> readers;
 
-    void read_thread (int preset, std::string filename);
-    int get_file_offsets (std::string filename, std::vector<long int> &offsets);
+    void read_thread (int preset);
+    int create_reader (int preset, std::string filename);
 
 public:
     PlaybackFileBoard (struct BrainFlowInputParams params);
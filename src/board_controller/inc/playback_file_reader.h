@@ -0,0 +1,96 @@
+#pragma once
+
+#include <stdio.h>
+#include <string>
+#include <vector>
+
+// sidecar index is stored next to the recording as file_name + PLAYBACK_INDEX_EXTENSION and reused
+// while size, modification time and hash of the head and tail of the recording dont change,
+// format(native byte order): magic(8 bytes), version, is_binary, num_rows, timestamp_channel
+//     (int32), file_size, file_mtime, num_samples, num_entries, content_hash (int64), entries:
+//     offset, sample (int64), timestamp (double)
+
+#define PLAYBACK_INDEX_EXTENSION ".bfidx"
+#define PLAYBACK_INDEX_VERSION 2
+// tsv files are indexed every PLAYBACK_INDEX_STEP lines, invalid lines are not indexed and the
+// next valid line is used instead, bfbin files are indexed by chunks
+#define PLAYBACK_INDEX_STEP 256
+// number of bytes from the beginning and from the end of recording used for content_hash
+#define PLAYBACK_INDEX_HASH_BYTES 4096
+#define MAX_LINE_LENGTH 8192
+
+
+struct PlaybackIndexEntry
+{
+    long long offset;
+    long long sample; // number of the first package at offset
+    double timestamp; // recorded timestamp of this package
+};
+
+// reads packages from tsv/csv or bfbin recording, supports seeking by package number and timestamp
+class PlaybackFileReader
+{
+
+public:
+    PlaybackFileReader (std::string file, int num_rows, int timestamp_channel);
+    ~PlaybackFileReader ();
+
+    // loads sidecar index or scans the file and tries to save the index next to it
+    int init_reader ();
+    // returns 1 if package is read, 0 at the end of file, -1 for invalid line which is skipped
+    int read_package (double *package);
+    void rewind ();
+    int seek_to_sample (long long sample);
+    // next package is the first package with recorded timestamp >= timestamp, position is not
+    // changed if there is no such package
+    int seek_to_timestamp (double timestamp);
+
+    long long get_num_samples ()
+    {
+        return num_samples;
+    }
+
+    bool is_binary_file ()
+    {
+        return is_binary;
+    }
+
+    // true if index was loaded from sidecar file instead of scanning the recording
+    bool is_index_cached ()
+    {
+        return index_cached;
+    }
+
+private:
+    std::string file;
+    int num_rows;
+    int timestamp_channel;
+    FILE *fp;
+    bool is_binary;
+    bool index_cached;
+    long long data_offset;
+    long long num_samples;
+    std::vector<PlaybackIndexEntry> entries;
+    // bfbin chunk, channel major
+    std::vector<double> chunk;
+    int chunk_cols;
+    int chunk_pos;
+    // package read by seek_to_timestamp and returned by the next read_package call
+    std::vector<double> pending_package;
+    bool has_pending_package;
+    char line[MAX_LINE_LENGTH];
+
+    int build_index (long long file_size);
+    long long get_content_hash (long long file_size);
+    bool load_index (const std::string &index_file, long long file_size, long long file_mtime,
+        long long content_hash);
+    void save_index (const std::string &index_file, long long file_size, long long file_mtime,
+        long long content_hash);
+    int read_chunk ();
+    void seek_to_entry (size_t entry);
+    void reset_position ();
+};
+
+// parses tsv or csv line, returns number of values written to package or -1 if line has more
+// than num_rows values
+int parse_playback_line (const char *line, double *package, int num_rows);
@@ -0,0 +1,36 @@
+#pragma once
+
+#include <vector>
+
+#include "brainflow_boards.h"
+
+#define MAX_PRESETS 3
+
+
+// fields of board descriptor which are used for each package. Json lookups are too slow for board
+// threads, so descriptor is compiled into this struct once per stream. Missing channels are -1 or
+// empty
+struct PresetLayout
+{
+    bool is_valid;
+    int num_rows;
+    int sampling_rate;
+    int package_num_channel;
+    int timestamp_channel;
+    int marker_channel;
+    int battery_channel;
+    std::vector<int> eeg_channels;
+    std::vector<int> accel_channels;
+    std::vector<int> gyro_channels;
+    std::vector<int> eda_channels;
+    std::vector<int> ppg_channels;
+    std::vector<int> temperature_channels;
+    std::vector<int> resistance_channels;
+    std::vector<int> other_channels;
+    // sorted eeg, emg, ecg and eog channels without duplicates
+    std::vector<int> exg_channels;
+
+    PresetLayout ();
+};
+
+int compile_preset_layout (const json &board_preset, PresetLayout &layout);
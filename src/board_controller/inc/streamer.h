@@ -20,6 +20,15 @@ public:
     virtual int init_streamer () = 0;
     virtual void stream_data (double *data) = 0;
 
+    // data has num_packages packages of len values each, called from streamer writer thread
+    virtual void stream_data_batch (double *data, int num_packages)
+    {
+        for (int i = 0; i < num_packages; i++)
+        {
+            stream_data (data + (size_t)i * len);
+        }
+    }
+
     virtual bool check_equals (std::string type, std::string dest, std::string mods)
     {
         return ((streamer_type == type) && (streamer_dest == dest) && (streamer_mods == mods));
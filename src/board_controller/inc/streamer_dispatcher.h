@@ -0,0 +1,78 @@
+#pragma once
+
+#include <condition_variable>
+#include <map>
+#include <mutex>
+#include <string>
+#include <thread>
+#include <vector>
+
+#include "streamer.h"
+
+#define STREAMER_WRITE_BATCH 256
+
+
+// feeds streamers of all presets from a dedicated writer thread, so slow disk or network never
+// blocks acquisition thread. Packages are copied to a bounded queue, if writer can not keep up
+// queue overflow is handled according to StreamerOverflowPolicies. BLOCK policy makes the
+// acquisition thread wait for free space at most block_timeout_ms, if writer makes no progress
+// during this time package is dropped and next packages are dropped without waiting until writer
+// takes the next batch
+class StreamerDispatcher
+{
+
+public:
+    // preset_lens[preset] is package size for preset, 0 for presets not supported by board
+    StreamerDispatcher (
+        std::vector<int> preset_lens, int queue_size, int overflow_policy, int block_timeout_ms);
+    // writes pending packages and deletes all streamers
+    ~StreamerDispatcher ();
+
+    int init_dispatcher ();
+    // called from push_package without holding board lock, may wait only with BLOCK policy and
+    // not longer than block_timeout_ms
+    void add_data (double *data, int preset);
+    // takes ownership of initialized streamer
+    void add_streamer (Streamer *streamer, int preset);
+    // packages queued before this call are written to removed streamer
+    bool delete_streamer (std::string type, std::string dest, std::string mods, int preset);
+    void get_stats (long long *queued, long long *dropped, int *pending);
+
+private:
+    std::vector<int> preset_lens;
+    size_t stride;
+    size_t queue_size;
+    int overflow_policy;
+    int block_timeout_ms;
+    // set if BLOCK wait timed out, reset when writer takes packages from the queue
+    bool writer_stalled;
+    // ring of queue_size slots, each slot has stride values
+    std::vector<double> queue;
+    std::vector<int> queue_presets;
+    size_t first_used;
+    size_t count;
+    // packages which left the queue and being written right now
+    size_t in_flight;
+    // number of streamers per preset, packages for presets without streamers are not queued
+    std::vector<int> num_streamers;
+    long long queued;
+    long long dropped;
+    // number of packages removed from queue by writer or by overflow
+    long long completed;
+    int blocked_producers;
+    bool is_running;
+    std::mutex m;
+    std::condition_variable data_cv;
+    std::condition_variable space_cv;
+    std::condition_variable completed_cv;
+    std::thread writer_thread;
+
+    // only writer thread touches streamers during write, others wait for the current batch
+    std::mutex streamers_mutex;
+    std::map<int, std::vector<Streamer *>> streamers;
+    std::vector<double> batch;
+    std::vector<int> batch_presets;
+
+    void thread_worker ();
+    void write_batch (size_t num_packages);
+};
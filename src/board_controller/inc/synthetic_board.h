@@ -1,10 +1,22 @@
 #pragma once
 
+#include <string>
 #include <thread>
 
 #include "board.h"
 #include "board_controller.h"
 
+// commands for config_board, the same commands separated by ';' can be passed via other_info
+#define SET_SAMPLING_RATE_PREFIX "set_sampling_rate:"
+#define SET_EEG_CHANNELS_PREFIX "set_eeg_channels:"
+#define SET_BATCH_SIZE_PREFIX "set_batch_size:"
+#define VECTORIZED_TRUE "vectorized_true"
+#define VECTORIZED_FALSE "vectorized_false"
+
+#define MAX_SYNTHETIC_SAMPLING_RATE 1000000
+#define MAX_SYNTHETIC_EEG_CHANNELS 1024
+#define MAX_SYNTHETIC_BATCH_SIZE 10000
+
 
 class SyntheticBoard : public Board
 {
@@ -14,8 +26,15 @@ private:
     bool initialized;
     bool is_streaming;
     std::thread streaming_thread;
+    int sampling_rate;
+    int num_eeg_channels;
+    int batch_size;
+    bool vectorized;
 
     void read_thread ();
+    // is_known is false if config is not a command of synthetic board
+    int apply_command (const std::string &config, bool &is_known);
+    void update_board_descr ();
 
 public:
     SyntheticBoard (struct BrainFlowInputParams params);
@@ -1,6 +1,5 @@
 #include <algorithm>
 #include <chrono>
-#include <sstream>
 #include <stdio.h>
 #include <string.h>
 #include <string>
@@ -19,7 +18,9 @@
 #define NEW_TIMESTAMPS "new_timestamps"
 #define OLD_TIMESTAMPS "old_timestamps"
 #define SET_INDEX_PREFIX "set_index_percentage:"
-#define MAX_LINE_LENGTH 8192
+#define SET_TIMESTAMP_PREFIX "set_timestamp:"
+#define SET_SPEED_PREFIX "set_speed:"
+#define UNTHROTTLED_SPEED "max"
 
 
 PlaybackFileBoard::PlaybackFileBoard (struct BrainFlowInputParams params)
@@ -32,8 +33,12 @@ PlaybackFileBoard::PlaybackFileBoard (struct BrainFlowInputParams params)
     loopback = false;
     initialized = false;
     use_new_timestamps = true;
+    speed.store (1.0);
     pos_percentage.resize (3);
     std::fill (pos_percentage.begin (), pos_percentage.end (), -1);
+    seek_timestamps.resize (3);
+    std::fill (seek_timestamps.begin (), seek_timestamps.end (), -1);
+    readers.resize (3);
 }
 
 PlaybackFileBoard::~PlaybackFileBoard ()
@@ -74,44 +79,23 @@ int PlaybackFileBoard::prepare_session ()
         return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
     }
 
+    int res = (int)BrainFlowExitCodes::STATUS_OK;
     if (!params.file.empty ())
     {
-        std::vector<long int> offsets;
-        int res = get_file_offsets (params.file, offsets);
-        if (res != (int)BrainFlowExitCodes::STATUS_OK)
-        {
-            return res;
-        }
-        else
-        {
-            file_offsets.push_back (offsets);
-        }
+        res = create_reader ((int)BrainFlowPresets::DEFAULT_PRESET, params.file);
     }
-    if (!params.file_aux.empty ())
+    if ((res == (int)BrainFlowExitCodes::STATUS_OK) && (!params.file_aux.empty ()))
     {
-        std::vector<long int> offsets;
-        int res = get_file_offsets (params.file_aux, offsets);
-        if (res != (int)BrainFlowExitCodes::STATUS_OK)
-        {
-            return res;
-        }
-        else
-        {
-            file_offsets.push_back (offsets);
-        }
+        res = create_reader ((int)BrainFlowPresets::AUXILIARY_PRESET, params.file_aux);
     }
-    if (!params.file_anc.empty ())
+    if ((res == (int)BrainFlowExitCodes::STATUS_OK) && (!params.file_anc.empty ()))
     {
-        std::vector<long int> offsets;
-        int res = get_file_offsets (params.file_anc, offsets);
-        if (res != (int)BrainFlowExitCodes::STATUS_OK)
-        {
-            return res;
-        }
-        else
-        {
-            file_offsets.push_back (offsets);
-        }
+        res = create_reader ((int)BrainFlowPresets::ANCILLARY_PRESET, params.file_anc);
+    }
+    if (res != (int)BrainFlowExitCodes::STATUS_OK)
+    {
+        std::fill (readers.begin (), readers.end (), nullptr);
+        return res;
     }
 
     initialized = true;
@@ -134,20 +118,13 @@ int PlaybackFileBoard::start_stream (int buffer_size, const char *streamer_param
     }
 
     keep_alive = true;
-    if (!params.file.empty ())
+    for (int preset = 0; preset < (int)readers.size (); preset++)
     {
-        streaming_threads.push_back (std::thread (
-            [this] { this->read_thread ((int)BrainFlowPresets::DEFAULT_PRESET, params.file); }));
-    }
-    if (!params.file_aux.empty ())
-    {
-        streaming_threads.push_back (std::thread ([this]
-            { this->read_thread ((int)BrainFlowPresets::AUXILIARY_PRESET, params.file_aux); }));
-    }
-    if (!params.file_anc.empty ())
-    {
-        streaming_threads.push_back (std::thread ([this]
-            { this->read_thread ((int)BrainFlowPresets::ANCILLARY_PRESET, params.file_anc); }));
+        if (readers[preset])
+        {
+            streaming_threads.push_back (
+                std::thread ([this, preset] { this->read_thread (preset); }));
+        }
     }
 
     return (int)BrainFlowExitCodes::STATUS_OK;
@@ -179,11 +156,11 @@ int PlaybackFileBoard::release_session ()
         free_packages ();
         initialized = false;
     }
-    file_offsets.clear ();
+    std::fill (readers.begin (), readers.end (), nullptr);
     return (int)BrainFlowExitCodes::STATUS_OK;
 }
 
-void PlaybackFileBoard::read_thread (int preset, std::string file)
+void PlaybackFileBoard::read_thread (int preset)
 {
     std::string preset_str = preset_to_string (preset);
     if (board_descr.find (preset_str) == board_descr.end ())
@@ -192,14 +169,8 @@ void PlaybackFileBoard::read_thread (int preset, std::string file)
         return;
     }
 
-    FILE *fp;
-    fp = fopen (file.c_str (), "rb");
-    if (fp == NULL)
-    {
-        safe_logger (spdlog::level::err, "failed to open file in thread");
-        return;
-    }
-
+    std::shared_ptr<PlaybackFileReader> reader = readers[preset];
+    reader->rewind ();
     json board_preset = board_descr[preset_str];
     int num_rows = board_preset["num_rows"];
     double *package = new double[num_rows];
@@ -207,11 +178,11 @@ void PlaybackFileBoard::read_thread (int preset, std::string file)
     {
         package[i] = 0.0;
     }
-    char buf[MAX_LINE_LENGTH];
     double last_timestamp = -1.0;
     bool new_timestamps = use_new_timestamps; // to prevent changing during streaming
     int timestamp_channel = board_preset["timestamp_channel"];
     double accumulated_time_delta = 0.0;
+    double last_speed = speed.load ();
 
     bool reached_end = false;
     while (keep_alive)
@@ -220,31 +191,49 @@ void PlaybackFileBoard::read_thread (int preset, std::string file)
         // prevent race condition with another config_board method call
         lock.lock ();
         double cur_index = pos_percentage[preset];
+        double cur_seek_timestamp = seek_timestamps[preset];
+        pos_percentage[preset] = -1;
+        seek_timestamps[preset] = -1;
+        lock.unlock ();
         if ((int)cur_index >= 0)
         {
-            int new_pos = (int)(cur_index * (file_offsets[preset].size () / 100.0));
-            try
+            long long new_pos = (long long)(cur_index * (reader->get_num_samples () / 100.0));
+            if (reader->seek_to_sample (new_pos) == (int)BrainFlowExitCodes::STATUS_OK)
             {
-                fseek (fp, file_offsets[preset][new_pos], SEEK_SET);
                 safe_logger (spdlog::level::trace, "set position in a file to {}", new_pos);
             }
-            catch (...)
+            else
             {
                 // should never happen since input is already validated
                 safe_logger (spdlog::level::warn, "invalid position in a file");
             }
             last_timestamp = -1;
-            pos_percentage[preset] = -1;
+            reached_end = false;
         }
-        lock.unlock ();
-        char *res = fgets (buf, sizeof (buf), fp);
-        if ((loopback) && (res == NULL))
+        if (cur_seek_timestamp >= 0)
+        {
+            if (reader->seek_to_timestamp (cur_seek_timestamp) ==
+                (int)BrainFlowExitCodes::STATUS_OK)
+            {
+                safe_logger (
+                    spdlog::level::trace, "set position in a file to {}", cur_seek_timestamp);
+            }
+            else
+            {
+                safe_logger (spdlog::level::warn, "timestamp {} is after the end of file",
+                    cur_seek_timestamp);
+            }
+            last_timestamp = -1;
+            reached_end = false;
+        }
+        int res = reader->read_package (package);
+        if ((loopback) && (res == 0))
         {
-            fseek (fp, 0, SEEK_SET); // go to beginning'
+            reader->rewind (); // go to beginning
             last_timestamp = -1.0;
             continue;
         }
-        if ((!loopback) && (res == NULL))
+        if ((!loopback) && (res == 0))
         {
             if (!reached_end)
             {
@@ -263,44 +252,23 @@ void PlaybackFileBoard::read_thread (int preset, std::string file)
 #endif
             continue;
         }
-        // res not NULL
-        std::string tsv_string (buf);
-        std::stringstream ss (tsv_string);
-        std::vector<std::string> splitted;
-        std::string tmp;
-        char sep = '\t';
-        if (tsv_string.find ('\t') == std::string::npos)
-        {
-            sep = ',';
-        }
-        while (std::getline (ss, tmp, sep))
-        {
-            if (tmp != "\n")
-            {
-                splitted.push_back (tmp);
-            }
-        }
-        if (splitted.size () != num_rows)
+        if (res < 0)
         {
             safe_logger (spdlog::level::err,
-                "invalid string in file, check provided board id. String size {}, expected size {}",
-                splitted.size (), num_rows);
+                "invalid string in file, check provided board id. Expected size {}", num_rows);
             continue;
         }
-        for (int i = 0; i < num_rows; i++)
+        double cur_speed = speed.load (); // can be changed by config_board during streaming
+        if (cur_speed != last_speed)
         {
-            try
-            {
-                package[i] = std::stod (splitted[i]);
-            }
-            catch (...)
-            {
-                safe_logger (spdlog::level::err, "failed to parse value: {}", splitted[i].c_str ());
-            }
+            accumulated_time_delta = 0.0;
+            last_speed = cur_speed;
         }
-        if (last_timestamp > 0)
+        // in unthrottled mode packages are pushed back to back without sleeping
+        if ((last_timestamp > 0) && (cur_speed > 0))
         {
-            double time_wait = (package[timestamp_channel] - last_timestamp) * 1000; // in ms
+            double time_wait =
+                (package[timestamp_channel] - last_timestamp) * 1000 / cur_speed; // in ms
             if (time_wait - accumulated_time_delta > 1)
             {
 #ifdef _WIN32
@@ -323,7 +291,6 @@ void PlaybackFileBoard::read_thread (int preset, std::string file)
         }
         push_package (package, preset);
     }
-    fclose (fp);
     delete[] package;
 }
 
@@ -345,6 +312,59 @@ int PlaybackFileBoard::config_board (std::string config, std::string &response)
     {
         use_new_timestamps = false;
     }
+    else if (strncmp (config.c_str (), SET_SPEED_PREFIX, strlen (SET_SPEED_PREFIX)) == 0)
+    {
+        std::string speed_str = config.substr (strlen (SET_SPEED_PREFIX));
+        if (speed_str == UNTHROTTLED_SPEED)
+        {
+            speed.store (0.0);
+            return (int)BrainFlowExitCodes::STATUS_OK;
+        }
+        try
+        {
+            double new_speed = std::stod (speed_str);
+            if (new_speed > 0)
+            {
+                speed.store (new_speed);
+            }
+            else
+            {
+                safe_logger (spdlog::level::err, "invalid speed value, should be positive");
+                return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+            }
+        }
+        catch (const std::exception &e)
+        {
+            safe_logger (spdlog::level::err,
+                "need to write a number or {} after {}, exception is: {}", UNTHROTTLED_SPEED,
+                SET_SPEED_PREFIX, e.what ());
+            return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+        }
+    }
+    else if (strncmp (config.c_str (), SET_TIMESTAMP_PREFIX, strlen (SET_TIMESTAMP_PREFIX)) == 0)
+    {
+        try
+        {
+            double new_timestamp = std::stod (config.substr (strlen (SET_TIMESTAMP_PREFIX)));
+            if (new_timestamp >= 0)
+            {
+                lock.lock ();
+                std::fill (seek_timestamps.begin (), seek_timestamps.end (), new_timestamp);
+                lock.unlock ();
+            }
+            else
+            {
+                safe_logger (spdlog::level::err, "invalid timestamp value, should be positive");
+                return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+            }
+        }
+        catch (const std::exception &e)
+        {
+            safe_logger (spdlog::level::err, "need to write a number after {}, exception is: {}",
+                SET_TIMESTAMP_PREFIX, e.what ());
+            return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+        }
+    }
     else if (strncmp (config.c_str (), SET_INDEX_PREFIX, strlen (SET_INDEX_PREFIX)) == 0)
     {
         try
@@ -378,36 +398,26 @@ int PlaybackFileBoard::config_board (std::string config, std::string &response)
     return (int)BrainFlowExitCodes::STATUS_OK;
 }
 
-int PlaybackFileBoard::get_file_offsets (std::string filename, std::vector<long int> &offsets)
+int PlaybackFileBoard::create_reader (int preset, std::string filename)
 {
-    offsets.clear ();
-
-    FILE *fp = fopen (filename.c_str (), "rb");
-    if (fp == NULL)
+    std::string preset_str = preset_to_string (preset);
+    if (board_descr.find (preset_str) == board_descr.end ())
     {
-        safe_logger (spdlog::level::err, "failed to open file: {}", filename.c_str ());
+        safe_logger (spdlog::level::err, "no preset {} for board {}", preset, board_id);
         return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
     }
-
-    char buf[MAX_LINE_LENGTH];
-    long int bytes_read = 0;
-    while (true)
-    {
-        offsets.push_back (bytes_read);
-        char *res = fgets (buf, sizeof (buf), fp);
-        bytes_read += (long int)strlen (buf);
-        if (res == NULL)
-        {
-            break;
-        }
-    }
-
-    fclose (fp);
-    if (offsets.size () < 2)
+    std::shared_ptr<PlaybackFileReader> reader =
+        std::make_shared<PlaybackFileReader> (filename, (int)board_descr[preset_str]["num_rows"],
+            (int)board_descr[preset_str]["timestamp_channel"]);
+    int res = reader->init_reader ();
+    if (res != (int)BrainFlowExitCodes::STATUS_OK)
     {
-        safe_logger (spdlog::level::err, "empty file: {}", filename);
-        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+        safe_logger (spdlog::level::err, "failed to open file: {}", filename.c_str ());
+        return res;
     }
-
+    safe_logger (spdlog::level::trace, "{} file {} with {} samples, index is {}",
+        reader->is_binary_file () ? "binary" : "text", filename.c_str (),
+        reader->get_num_samples (), reader->is_index_cached () ? "cached" : "created");
+    readers[preset] = reader;
     return (int)BrainFlowExitCodes::STATUS_OK;
 }
@@ -0,0 +1,452 @@
+#include "file_offset.h"
+
+#include <algorithm>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+#include <sys/stat.h>
+
+#include "bfbin_file.h"
+#include "brainflow_constants.h"
+#include "playback_file_reader.h"
+
+static const char index_magic[8] = {'B', 'F', 'I', 'D', 'X', '\0', '\0', '\1'};
+
+
+static bool is_line_end (char c)
+{
+    return (c == ' ') || (c == '\t') || (c == '\r') || (c == '\n');
+}
+
+int parse_playback_line (const char *line, double *package, int num_rows)
+{
+    char sep = (strchr (line, '\t') != NULL) ? '\t' : ',';
+    const char *pos = line;
+    int count = 0;
+    while (count < num_rows)
+    {
+        char *end = NULL;
+        double value = strtod (pos, &end);
+        if (end == pos)
+        {
+            break;
+        }
+        package[count++] = value;
+        pos = end;
+        if (*pos != sep)
+        {
+            break;
+        }
+        pos++;
+    }
+    while ((*pos != '\0') && (is_line_end (*pos)))
+    {
+        pos++;
+    }
+    if (*pos != '\0')
+    {
+        return -1;
+    }
+    return count;
+}
+
+PlaybackFileReader::PlaybackFileReader (std::string file, int num_rows, int timestamp_channel)
+{
+    this->file = file;
+    this->num_rows = num_rows;
+    this->timestamp_channel = timestamp_channel;
+    fp = NULL;
+    is_binary = false;
+    index_cached = false;
+    data_offset = 0;
+    num_samples = 0;
+    chunk_cols = 0;
+    chunk_pos = 0;
+    has_pending_package = false;
+}
+
+PlaybackFileReader::~PlaybackFileReader ()
+{
+    if (fp != NULL)
+    {
+        fclose (fp);
+        fp = NULL;
+    }
+}
+
+int PlaybackFileReader::init_reader ()
+{
+    if ((fp != NULL) || (num_rows < 1) || (timestamp_channel < 0) ||
+        (timestamp_channel >= num_rows))
+    {
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+#ifdef _WIN32
+    struct _stat64 file_info;
+    if (_stat64 (file.c_str (), &file_info) != 0)
+#else
+    struct stat file_info;
+    if (stat (file.c_str (), &file_info) != 0)
+#endif
+    {
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    fp = fopen (file.c_str (), "rb");
+    if (fp == NULL)
+    {
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    is_binary = is_bfbin_file (file.c_str ());
+    if (is_binary)
+    {
+        BFBinHeader header;
+        int res = read_bfbin_header (fp, header);
+        if ((res != (int)BrainFlowExitCodes::STATUS_OK) || (header.num_rows != num_rows))
+        {
+            fclose (fp);
+            fp = NULL;
+            return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+        }
+        data_offset = file_tell (fp);
+        chunk.resize ((size_t)num_rows * PLAYBACK_INDEX_STEP);
+    }
+    pending_package.resize (num_rows);
+
+    std::string index_file = file + PLAYBACK_INDEX_EXTENSION;
+    long long file_size = (long long)file_info.st_size;
+    long long file_mtime = (long long)file_info.st_mtime;
+    long long content_hash = get_content_hash (file_size);
+    index_cached = load_index (index_file, file_size, file_mtime, content_hash);
+    if (!index_cached)
+    {
+        int res = build_index (file_size);
+        if (res != (int)BrainFlowExitCodes::STATUS_OK)
+        {
+            fclose (fp);
+            fp = NULL;
+            return res;
+        }
+        save_index (index_file, file_size, file_mtime, content_hash);
+    }
+    if (num_samples < 1)
+    {
+        fclose (fp);
+        fp = NULL;
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    rewind ();
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
+int PlaybackFileReader::build_index (long long file_size)
+{
+    entries.clear ();
+    num_samples = 0;
+    file_seek (fp, data_offset, SEEK_SET);
+    if (is_binary)
+    {
+        int32_t num_cols = 0;
+        while (fread (&num_cols, sizeof (num_cols), 1, fp) == 1)
+        {
+            long long offset = file_tell (fp) - (long long)sizeof (num_cols);
+            long long chunk_end = offset + (long long)sizeof (num_cols) +
+                (long long)num_cols * num_rows * (long long)sizeof (double);
+            // last chunk may be incomplete if recording was interrupted, skip it
+            if ((num_cols < 1) || (chunk_end > file_size))
+            {
+                break;
+            }
+            PlaybackIndexEntry entry;
+            entry.offset = offset;
+            entry.sample = num_samples;
+            file_seek (
+                fp, (long long)timestamp_channel * num_cols * (long long)sizeof (double), SEEK_CUR);
+            if (fread (&entry.timestamp, sizeof (double), 1, fp) != 1)
+            {
+                break;
+            }
+            entries.push_back (entry);
+            num_samples += num_cols;
+            file_seek (fp, chunk_end, SEEK_SET);
+        }
+    }
+    else
+    {
+        std::vector<double> package (num_rows);
+        long long offset = 0;
+        // timestamps of entries must be sorted for seek_to_timestamp, so invalid lines are not
+        // indexed. The first entry is always at the beginning of data for seek_to_sample, it gets
+        // timestamp of the first valid line
+        bool add_entry = false;
+        bool has_timestamp = false;
+        while (fgets (line, sizeof (line), fp) != NULL)
+        {
+            if (entries.empty ())
+            {
+                PlaybackIndexEntry entry;
+                entry.offset = offset;
+                entry.sample = num_samples;
+                entry.timestamp = 0.0;
+                entries.push_back (entry);
+            }
+            else if ((num_samples % PLAYBACK_INDEX_STEP) == 0)
+            {
+                add_entry = true;
+            }
+            if (((add_entry) || (!has_timestamp)) &&
+                (parse_playback_line (line, package.data (), num_rows) == num_rows))
+            {
+                if (!has_timestamp)
+                {
+                    entries[0].timestamp = package[timestamp_channel];
+                    has_timestamp = true;
+                }
+                if (add_entry)
+                {
+                    PlaybackIndexEntry entry;
+                    entry.offset = offset;
+                    entry.sample = num_samples;
+                    entry.timestamp = package[timestamp_channel];
+                    entries.push_back (entry);
+                    add_entry = false;
+                }
+            }
+            offset += (long long)strlen (line);
+            num_samples++;
+        }
+    }
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
+long long PlaybackFileReader::get_content_hash (long long file_size)
+{
+    // FNV-1a of the head and the tail of the file, recording which was changed without changing
+    // its size and mtime is detected without reading the whole file
+    unsigned long long hash = 14695981039346656037ULL;
+    char buf[PLAYBACK_INDEX_HASH_BYTES];
+    long long offsets[2] = {0, std::max (0LL, file_size - PLAYBACK_INDEX_HASH_BYTES)};
+    for (int i = 0; i < 2; i++)
+    {
+        file_seek (fp, offsets[i], SEEK_SET);
+        size_t num_read = fread (buf, 1, sizeof (buf), fp);
+        for (size_t j = 0; j < num_read; j++)
+        {
+            hash ^= (unsigned char)buf[j];
+            hash *= 1099511628211ULL;
+        }
+    }
+    file_seek (fp, data_offset, SEEK_SET);
+    return (long long)hash;
+}
+
+bool PlaybackFileReader::load_index (const std::string &index_file, long long file_size,
+    long long file_mtime, long long content_hash)
+{
+    FILE *index_fp = fopen (index_file.c_str (), "rb");
+    if (index_fp == NULL)
+    {
+        return false;
+    }
+    char magic[8];
+    int32_t ints[4];
+    int64_t longs[5];
+    bool res = (fread (magic, 1, 8, index_fp) == 8) && (memcmp (magic, index_magic, 8) == 0) &&
+        (fread (ints, sizeof (int32_t), 4, index_fp) == 4) &&
+        (fread (longs, sizeof (int64_t), 5, index_fp) == 5);
+    res = res && (ints[0] == PLAYBACK_INDEX_VERSION) && ((ints[1] != 0) == is_binary) &&
+        (ints[2] == num_rows) && (ints[3] == timestamp_channel) && (longs[0] == file_size) &&
+        (longs[1] == file_mtime) && (longs[3] >= 0) && (longs[3] <= longs[2] + 1) &&
+        (longs[4] == content_hash);
+    if (res)
+    {
+        num_samples = (long long)longs[2];
+        entries.resize ((size_t)longs[3]);
+        for (size_t i = 0; (res) && (i < entries.size ()); i++)
+        {
+            int64_t position[2];
+            res = (fread (position, sizeof (int64_t), 2, index_fp) == 2) &&
+                (fread (&entries[i].timestamp, sizeof (double), 1, index_fp) == 1);
+            entries[i].offset = (long long)position[0];
+            entries[i].sample = (long long)position[1];
+        }
+    }
+    fclose (index_fp);
+    if (!res)
+    {
+        entries.clear ();
+        num_samples = 0;
+    }
+    return res;
+}
+
+void PlaybackFileReader::save_index (const std::string &index_file, long long file_size,
+    long long file_mtime, long long content_hash)
+{
+    // index is an optimization, recording can be in read only directory
+    FILE *index_fp = fopen (index_file.c_str (), "wb");
+    if (index_fp == NULL)
+    {
+        return;
+    }
+    int32_t ints[4] = {PLAYBACK_INDEX_VERSION, is_binary ? 1 : 0, num_rows, timestamp_channel};
+    int64_t longs[5] = {file_size, file_mtime, num_samples, (int64_t)entries.size (), content_hash};
+    bool res = (fwrite (index_magic, 1, 8, index_fp) == 8) &&
+        (fwrite (ints, sizeof (int32_t), 4, index_fp) == 4) &&
+        (fwrite (longs, sizeof (int64_t), 5, index_fp) == 5);
+    for (size_t i = 0; (res) && (i < entries.size ()); i++)
+    {
+        int64_t position[2] = {entries[i].offset, entries[i].sample};
+        res = (fwrite (position, sizeof (int64_t), 2, index_fp) == 2) &&
+            (fwrite (&entries[i].timestamp, sizeof (double), 1, index_fp) == 1);
+    }
+    fclose (index_fp);
+    if (!res)
+    {
+        remove (index_file.c_str ());
+    }
+}
+
+int PlaybackFileReader::read_chunk ()
+{
+    int32_t num_cols = 0;
+    if ((fread (&num_cols, sizeof (num_cols), 1, fp) != 1) || (num_cols < 1))
+    {
+        return 0;
+    }
+    size_t num_values = (size_t)num_cols * num_rows;
+    if (chunk.size () < num_values)
+    {
+        chunk.resize (num_values);
+    }
+    if (fread (chunk.data (), sizeof (double), num_values, fp) != num_values)
+    {
+        return 0;
+    }
+    chunk_cols = num_cols;
+    chunk_pos = 0;
+    return 1;
+}
+
+int PlaybackFileReader::read_package (double *package)
+{
+    if (has_pending_package)
+    {
+        memcpy (package, pending_package.data (), sizeof (double) * num_rows);
+        has_pending_package = false;
+        return 1;
+    }
+    if (is_binary)
+    {
+        if ((chunk_pos >= chunk_cols) && (read_chunk () == 0))
+        {
+            return 0;
+        }
+        for (int i = 0; i < num_rows; i++)
+        {
+            package[i] = chunk[(size_t)i * chunk_cols + chunk_pos];
+        }
+        chunk_pos++;
+        return 1;
+    }
+    if (fgets (line, sizeof (line), fp) == NULL)
+    {
+        return 0;
+    }
+    if (parse_playback_line (line, package, num_rows) != num_rows)
+    {
+        return -1;
+    }
+    return 1;
+}
+
+void PlaybackFileReader::reset_position ()
+{
+    chunk_cols = 0;
+    chunk_pos = 0;
+    has_pending_package = false;
+}
+
+void PlaybackFileReader::rewind ()
+{
+    reset_position ();
+    file_seek (fp, data_offset, SEEK_SET);
+}
+
+void PlaybackFileReader::seek_to_entry (size_t entry)
+{
+    reset_position ();
+    file_seek (fp, entries[entry].offset, SEEK_SET);
+}
+
+int PlaybackFileReader::seek_to_sample (long long sample)
+{
+    if ((sample < 0) || (sample >= num_samples) || (entries.empty ()))
+    {
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    // last entry which starts before or at sample
+    auto it = std::upper_bound (entries.begin (), entries.end (), sample,
+        [] (long long value, const PlaybackIndexEntry &entry) { return value < entry.sample; });
+    size_t entry = (size_t)(it - entries.begin ()) - 1;
+    seek_to_entry (entry);
+    long long num_skipped = sample - entries[entry].sample;
+    if (is_binary)
+    {
+        if (read_chunk () == 0)
+        {
+            return (int)BrainFlowExitCodes::GENERAL_ERROR;
+        }
+        chunk_pos = (int)num_skipped;
+    }
+    else
+    {
+        for (long long i = 0; i < num_skipped; i++)
+        {
+            if (fgets (line, sizeof (line), fp) == NULL)
+            {
+                return (int)BrainFlowExitCodes::GENERAL_ERROR;
+            }
+        }
+    }
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
+int PlaybackFileReader::seek_to_timestamp (double timestamp)
+{
+    if (entries.empty ())
+    {
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    // recorded timestamps are increasing, packages before the first entry above timestamp are
+    // scanned sequentially
+    auto it = std::upper_bound (entries.begin (), entries.end (), timestamp,
+        [] (double value, const PlaybackIndexEntry &entry) { return value < entry.timestamp; });
+    size_t entry = (it == entries.begin ()) ? 0 : (size_t)(it - entries.begin ()) - 1;
+    // current position is restored if there is no package with such timestamp
+    long long saved_offset = file_tell (fp);
+    std::vector<double> saved_chunk = chunk;
+    int saved_chunk_cols = chunk_cols;
+    int saved_chunk_pos = chunk_pos;
+    std::vector<double> saved_package = pending_package;
+    bool saved_has_package = has_pending_package;
+    seek_to_entry (entry);
+    while (true)
+    {
+        int res = read_package (pending_package.data ());
+        if (res == 0)
+        {
+            file_seek (fp, saved_offset, SEEK_SET);
+            chunk.swap (saved_chunk);
+            chunk_cols = saved_chunk_cols;
+            chunk_pos = saved_chunk_pos;
+            pending_package.swap (saved_package);
+            has_pending_package = saved_has_package;
+            return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+        }
+        if ((res == 1) && (pending_package[timestamp_channel] >= timestamp))
+        {
+            has_pending_package = true;
+            return (int)BrainFlowExitCodes::STATUS_OK;
+        }
+    }
+}
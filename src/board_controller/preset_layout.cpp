@@ -0,0 +1,59 @@
+#include <set>
+
+#include "brainflow_constants.h"
+#include "preset_layout.h"
+
+
+PresetLayout::PresetLayout ()
+{
+    is_valid = false;
+    num_rows = 0;
+    sampling_rate = 0;
+    package_num_channel = -1;
+    timestamp_channel = -1;
+    marker_channel = -1;
+    battery_channel = -1;
+}
+
+int compile_preset_layout (const json &board_preset, PresetLayout &layout)
+{
+    layout = PresetLayout ();
+    try
+    {
+        layout.num_rows = board_preset.value ("num_rows", 0);
+        layout.sampling_rate = board_preset.value ("sampling_rate", 0);
+        layout.package_num_channel = board_preset.value ("package_num_channel", -1);
+        layout.timestamp_channel = board_preset.value ("timestamp_channel", -1);
+        layout.marker_channel = board_preset.value ("marker_channel", -1);
+        layout.battery_channel = board_preset.value ("battery_channel", -1);
+        layout.eeg_channels = board_preset.value ("eeg_channels", std::vector<int> ());
+        layout.accel_channels = board_preset.value ("accel_channels", std::vector<int> ());
+        layout.gyro_channels = board_preset.value ("gyro_channels", std::vector<int> ());
+        layout.eda_channels = board_preset.value ("eda_channels", std::vector<int> ());
+        layout.ppg_channels = board_preset.value ("ppg_channels", std::vector<int> ());
+        layout.temperature_channels =
+            board_preset.value ("temperature_channels", std::vector<int> ());
+        layout.resistance_channels =
+            board_preset.value ("resistance_channels", std::vector<int> ());
+        layout.other_channels = board_preset.value ("other_channels", std::vector<int> ());
+        std::set<int> exg_channels;
+        for (const char *field : {"eeg_channels", "emg_channels", "ecg_channels", "eog_channels"})
+        {
+            std::vector<int> channels = board_preset.value (field, std::vector<int> ());
+            exg_channels.insert (channels.begin (), channels.end ());
+        }
+        layout.exg_channels = std::vector<int> (exg_channels.begin (), exg_channels.end ());
+    }
+    catch (json::exception &)
+    {
+        layout = PresetLayout ();
+        return (int)BrainFlowExitCodes::GENERAL_ERROR;
+    }
+    if (layout.num_rows < 1)
+    {
+        layout = PresetLayout ();
+        return (int)BrainFlowExitCodes::GENERAL_ERROR;
+    }
+    layout.is_valid = true;
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
@@ -0,0 +1,263 @@
+#include <algorithm>
+#include <chrono>
+#include <string.h>
+
+#include "brainflow_constants.h"
+#include "streamer_dispatcher.h"
+
+
+StreamerDispatcher::StreamerDispatcher (
+    std::vector<int> preset_lens, int queue_size, int overflow_policy, int block_timeout_ms)
+{
+    this->preset_lens = preset_lens;
+    this->queue_size = (size_t)queue_size;
+    this->overflow_policy = overflow_policy;
+    this->block_timeout_ms = block_timeout_ms;
+    writer_stalled = false;
+    stride = 0;
+    for (int len : preset_lens)
+    {
+        stride = std::max (stride, (size_t)len);
+    }
+    num_streamers.resize (preset_lens.size (), 0);
+    first_used = 0;
+    count = 0;
+    in_flight = 0;
+    queued = 0;
+    dropped = 0;
+    completed = 0;
+    blocked_producers = 0;
+    is_running = false;
+}
+
+StreamerDispatcher::~StreamerDispatcher ()
+{
+    {
+        std::lock_guard<std::mutex> lock (m);
+        is_running = false;
+    }
+    data_cv.notify_one ();
+    space_cv.notify_all ();
+    // writer exits only after the queue is empty
+    if (writer_thread.joinable ())
+    {
+        writer_thread.join ();
+    }
+    std::lock_guard<std::mutex> streamers_lock (streamers_mutex);
+    for (auto &preset_streamers : streamers)
+    {
+        for (Streamer *streamer : preset_streamers.second)
+        {
+            delete streamer;
+        }
+    }
+    streamers.clear ();
+}
+
+int StreamerDispatcher::init_dispatcher ()
+{
+    if (is_running)
+    {
+        return (int)BrainFlowExitCodes::GENERAL_ERROR;
+    }
+    if ((queue_size < 1) || (stride < 1))
+    {
+        return (int)BrainFlowExitCodes::INVALID_BUFFER_SIZE_ERROR;
+    }
+    try
+    {
+        queue.resize (queue_size * stride);
+        queue_presets.resize (queue_size);
+        batch.resize (std::min (queue_size, (size_t)STREAMER_WRITE_BATCH) * stride);
+        batch_presets.resize (std::min (queue_size, (size_t)STREAMER_WRITE_BATCH));
+    }
+    catch (...)
+    {
+        return (int)BrainFlowExitCodes::INVALID_BUFFER_SIZE_ERROR;
+    }
+    is_running = true;
+    writer_thread = std::thread ([this] { this->thread_worker (); });
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
+void StreamerDispatcher::add_data (double *data, int preset)
+{
+    bool notify = false;
+    {
+        std::unique_lock<std::mutex> lock (m);
+        if ((preset < 0) || ((size_t)preset >= num_streamers.size ()) ||
+            (num_streamers[preset] == 0))
+        {
+            return;
+        }
+        if (count == queue_size)
+        {
+            if ((overflow_policy == (int)StreamerOverflowPolicies::BLOCK) && (!writer_stalled))
+            {
+                blocked_producers++;
+                writer_stalled =
+                    !space_cv.wait_for (lock, std::chrono::milliseconds (block_timeout_ms),
+                        [this] { return (!is_running) || (count < queue_size); });
+                blocked_producers--;
+            }
+            else if (overflow_policy == (int)StreamerOverflowPolicies::DROP_OLDEST)
+            {
+                first_used = (first_used + 1) % queue_size;
+                count--;
+                dropped++;
+                completed++;
+            }
+            if ((!is_running) || (count == queue_size))
+            {
+                dropped++;
+                return;
+            }
+        }
+        size_t slot = (first_used + count) % queue_size;
+        memcpy (queue.data () + slot * stride, data, sizeof (double) * preset_lens[preset]);
+        queue_presets[slot] = preset;
+        notify = (count == 0);
+        count++;
+        queued++;
+    }
+    // writer sleeps only if queue is empty
+    if (notify)
+    {
+        data_cv.notify_one ();
+    }
+}
+
+void StreamerDispatcher::add_streamer (Streamer *streamer, int preset)
+{
+    {
+        std::lock_guard<std::mutex> streamers_lock (streamers_mutex);
+        streamers[preset].push_back (streamer);
+    }
+    std::lock_guard<std::mutex> lock (m);
+    num_streamers[preset]++;
+}
+
+bool StreamerDispatcher::delete_streamer (
+    std::string type, std::string dest, std::string mods, int preset)
+{
+    {
+        std::unique_lock<std::mutex> lock (m);
+        long long target = completed + (long long)count + (long long)in_flight;
+        completed_cv.wait (lock, [this, target] { return (!is_running) || (completed >= target); });
+    }
+    Streamer *removed = NULL;
+    {
+        std::lock_guard<std::mutex> streamers_lock (streamers_mutex);
+        auto preset_streamers = streamers.find (preset);
+        if (preset_streamers == streamers.end ())
+        {
+            return false;
+        }
+        std::vector<Streamer *> &vec = preset_streamers->second;
+        for (auto it = vec.begin (); it != vec.end (); it++)
+        {
+            if ((*it)->check_equals (type, dest, mods))
+            {
+                removed = *it;
+                vec.erase (it);
+                break;
+            }
+        }
+    }
+    if (removed == NULL)
+    {
+        return false;
+    }
+    {
+        std::lock_guard<std::mutex> lock (m);
+        num_streamers[preset]--;
+    }
+    delete removed;
+    return true;
+}
+
+void StreamerDispatcher::get_stats (long long *queued, long long *dropped, int *pending)
+{
+    std::lock_guard<std::mutex> lock (m);
+    *queued = this->queued;
+    *dropped = this->dropped;
+    *pending = (int)(count + in_flight);
+}
+
+void StreamerDispatcher::thread_worker ()
+{
+    while (true)
+    {
+        size_t num_packages = 0;
+        bool notify_producers = false;
+        {
+            std::unique_lock<std::mutex> lock (m);
+            data_cv.wait (lock, [this] { return (!is_running) || (count > 0); });
+            if (count == 0)
+            {
+                break;
+            }
+            // copy packages out of the ring, slots can be reused by producer during the write
+            num_packages = std::min (count, batch_presets.size ());
+            for (size_t i = 0; i < num_packages; i++)
+            {
+                size_t slot = (first_used + i) % queue_size;
+                batch_presets[i] = queue_presets[slot];
+                memcpy (batch.data () + i * stride, queue.data () + slot * stride,
+                    sizeof (double) * preset_lens[batch_presets[i]]);
+            }
+            first_used = (first_used + num_packages) % queue_size;
+            count -= num_packages;
+            in_flight = num_packages;
+            writer_stalled = false;
+            notify_producers = (blocked_producers > 0);
+        }
+        if (notify_producers)
+        {
+            space_cv.notify_all ();
+        }
+        write_batch (num_packages);
+        {
+            std::lock_guard<std::mutex> lock (m);
+            in_flight = 0;
+            completed += (long long)num_packages;
+        }
+        completed_cv.notify_all ();
+    }
+    completed_cv.notify_all ();
+}
+
+void StreamerDispatcher::write_batch (size_t num_packages)
+{
+    std::lock_guard<std::mutex> streamers_lock (streamers_mutex);
+    size_t start = 0;
+    while (start < num_packages)
+    {
+        // runs of packages from the same preset are written with a single call
+        int preset = batch_presets[start];
+        int len = preset_lens[preset];
+        size_t end = start;
+        while ((end < num_packages) && (batch_presets[end] == preset))
+        {
+            end++;
+        }
+        auto preset_streamers = streamers.find (preset);
+        if (preset_streamers != streamers.end ())
+        {
+            // compact packages to contiguous len sized rows in place
+            if ((size_t)len != stride)
+            {
+                for (size_t i = start + 1; i < end; i++)
+                {
+                    memmove (batch.data () + start * stride + (i - start) * len,
+                        batch.data () + i * stride, sizeof (double) * len);
+                }
+            }
+            for (Streamer *streamer : preset_streamers->second)
+            {
+                streamer->stream_data_batch (batch.data () + start * stride, (int)(end - start));
+            }
+        }
+        start = end;
+    }
+}
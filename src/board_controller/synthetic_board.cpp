@@ -1,7 +1,10 @@
+#include <algorithm>
 #include <chrono>
 #include <fstream>
 #include <math.h>
 #include <random>
+#include <sstream>
+#include <stdexcept>
 #include <string.h>
 #include <string>
 #include <vector>
@@ -26,6 +29,10 @@ SyntheticBoard::SyntheticBoard (struct BrainFlowInputParams params)
     is_streaming = false;
     keep_alive = false;
     initialized = false;
+    sampling_rate = (int)board_descr["default"]["sampling_rate"];
+    num_eeg_channels = (int)board_descr["default"]["eeg_channels"].size ();
+    batch_size = 1;
+    vectorized = false;
 }
 
 SyntheticBoard::~SyntheticBoard ()
@@ -42,6 +49,27 @@ int SyntheticBoard::prepare_session ()
         return (int)BrainFlowExitCodes::STATUS_OK;
     }
 
+    // other_info may contain config commands separated by ';' to configure board before streaming
+    std::stringstream ss (params.other_info);
+    std::string command;
+    while (std::getline (ss, command, ';'))
+    {
+        if (command.empty ())
+        {
+            continue;
+        }
+        bool is_known = false;
+        int res = apply_command (command, is_known);
+        if (res != (int)BrainFlowExitCodes::STATUS_OK)
+        {
+            return res;
+        }
+        if (!is_known)
+        {
+            safe_logger (spdlog::level::warn, "Unknown command in other_info: {}", command);
+        }
+    }
+
     initialized = true;
     return (int)BrainFlowExitCodes::STATUS_OK;
 }
@@ -92,173 +120,379 @@ int SyntheticBoard::release_session ()
     return (int)BrainFlowExitCodes::STATUS_OK;
 }
 
-void SyntheticBoard::read_thread ()
+// xorshift64* generator, much cheaper than std::mt19937 with distributions, used in vectorized mode
+struct FastRandom
 {
-    unsigned char counter = 0;
-    std::vector<int> exg_channels =
-        board_descr["default"]["eeg_channels"]; // same channels for eeg\emg\ecg
-    double *sin_phase_rad = new double[exg_channels.size ()];
-    for (unsigned int i = 0; i < board_descr["default"]["eeg_channels"].size (); i++)
+    uint64_t state;
+
+    FastRandom (uint64_t seed)
+    {
+        state = (seed == 0) ? 0x9E3779B97F4A7C15ULL : seed;
+    }
+
+    // uniform value in [0, 1)
+    inline double next ()
     {
-        sin_phase_rad[i] = 0.0;
+        state ^= state >> 12;
+        state ^= state << 25;
+        state ^= state >> 27;
+        return (double)((state * 0x2545F4914F6CDD1DULL) >> 11) * (1.0 / 9007199254740992.0);
     }
-    int sampling_rate = board_descr["default"]["sampling_rate"];
-    int sleep_time = (int)((1000.0 / sampling_rate));
+
+    inline double around_one ()
+    {
+        return 0.9 + 0.2 * next ();
+    }
+};
+
+void SyntheticBoard::read_thread ()
+{
+    unsigned char counter = 0;
+    // layouts are compiled in prepare_for_acquisition, copies are not affected by other calls
+    PresetLayout layout = preset_layouts[(int)BrainFlowPresets::DEFAULT_PRESET];
+    PresetLayout aux_layout = preset_layouts[(int)BrainFlowPresets::AUXILIARY_PRESET];
+    std::vector<int> &exg_channels = layout.eeg_channels; // same channels for eeg\emg\ecg
+    int num_exg_channels = (int)exg_channels.size ();
+    int sampling_rate = layout.sampling_rate;
+    // settings can not be changed while streaming, but keep local copies for the thread
+    int batch_size = this->batch_size;
+    bool vectorized = this->vectorized;
+    // packages are generated in blocks of batch_size packages, sleep once per block
+    double block_time_ms = 1000.0 * batch_size / sampling_rate;
     std::uniform_real_distribution<double> dist_around_one (0.90, 1.10);
     uint64_t seed = std::chrono::high_resolution_clock::now ().time_since_epoch ().count ();
     std::mt19937 mt (static_cast<uint32_t> (seed));
+    FastRandom fast_random (seed);
+    auto around_one = [&] () -> double
+    { return vectorized ? fast_random.around_one () : dist_around_one (mt); };
     double accumulated_time_delta = 0.0;
+    double last_timestamp = 0.0;
 
-    int num_rows = board_descr["default"]["num_rows"];
-    double *package = new double[num_rows];
-    for (int i = 0; i < num_rows; i++)
+    // signal parameters repeat every 16 channels
+    std::vector<double> amplitudes (num_exg_channels);
+    std::vector<double> phase_steps (num_exg_channels);
+    std::vector<double> shifts (num_exg_channels);
+    std::vector<double> sin_phase_rad (num_exg_channels, 0.0);
+    // sin and cos of current phase for vectorized mode, updated by rotation instead of sin calls
+    std::vector<double> sin_values (num_exg_channels);
+    std::vector<double> cos_values (num_exg_channels);
+    std::vector<double> sin_steps (num_exg_channels);
+    std::vector<double> cos_steps (num_exg_channels);
+    for (int i = 0; i < num_exg_channels; i++)
     {
-        package[i] = 0.0;
-    }
-    int num_aux_rows = board_descr["auxiliary"]["num_rows"];
-    double *aux_package = new double[num_aux_rows];
-    for (int i = 0; i < num_aux_rows; i++)
-    {
-        aux_package[i] = 0.0;
+        int param_id = i % 16;
+        amplitudes[i] = 10.0 * (param_id + 1);
+        phase_steps[i] = 2.0 * M_PI * 5.0 * (param_id + 1) / (double)sampling_rate;
+        shifts[i] = 0.05 * param_id;
+        sin_values[i] = sin (shifts[i]);
+        cos_values[i] = cos (shifts[i]);
+        sin_steps[i] = sin (phase_steps[i]);
+        cos_steps[i] = cos (phase_steps[i]);
     }
 
+    int num_rows = layout.num_rows;
+    int num_aux_rows = aux_layout.num_rows;
+    std::vector<double> block ((size_t)num_rows * batch_size, 0.0);
+    std::vector<double> aux_block ((size_t)num_aux_rows * batch_size, 0.0);
+
     while (keep_alive)
     {
         auto start = std::chrono::high_resolution_clock::now ();
-        package[board_descr["default"]["package_num_channel"].get<int> ()] = (double)counter;
-        for (unsigned int i = 0; i < exg_channels.size (); i++)
+        if (vectorized)
         {
-            double amplitude = 10.0 * (i + 1);
-            double noise = 0.1 * (i + 1);
-            double freq = 5.0 * (i + 1);
-            int peak_frequency = (int)(sampling_rate / (i + 1));
-            double shift = 0.05 * i;
-            double range = (amplitude * noise) / 2.0;
-            std::uniform_real_distribution<double> dist (0 - range, range);
-            sin_phase_rad[i] += 2.0f * M_PI * freq / (double)sampling_rate;
-            if (sin_phase_rad[i] > 2.0f * M_PI)
-            {
-                sin_phase_rad[i] -= 2.0f * M_PI;
-            }
-            if ((i > 5) &&
-                ((counter % peak_frequency == 0) || ((counter - 1) % peak_frequency == 0) ||
-                    (((counter + 1) % peak_frequency == 0))))
+            // channel by channel for the whole block, inner loop has no branches and calls
+            for (int i = 0; i < num_exg_channels; i++)
             {
-                amplitude *= dist_around_one (mt) * 2;
+                double amplitude = amplitudes[i];
+                double range = amplitude * 0.1 * ((i % 16) + 1);
+                double s = sin_values[i];
+                double c = cos_values[i];
+                double sin_step = sin_steps[i];
+                double cos_step = cos_steps[i];
+                double *value = block.data () + exg_channels[i];
+                for (int k = 0; k < batch_size; k++, value += num_rows)
+                {
+                    double next_s = s * cos_step + c * sin_step;
+                    c = c * cos_step - s * sin_step;
+                    s = next_s;
+                    double noise = range * (fast_random.next () - 0.5);
+                    *value = amplitude + (amplitude + noise) * M_SQRT2 * s;
+                }
+                // normalize to avoid accumulation of rounding errors
+                double norm = 1.0 / sqrt (s * s + c * c);
+                sin_values[i] = s * norm;
+                cos_values[i] = c * norm;
             }
-            package[exg_channels[i]] =
-                amplitude + (amplitude + dist (mt)) * sqrt (2.0) * sin (sin_phase_rad[i] + shift);
         }
-        for (int channel : board_descr["default"]["accel_channels"])
+        for (int k = 0; k < batch_size; k++, counter++)
         {
-            package[channel] = dist_around_one (mt) - 0.1;
-        }
-        for (int channel : board_descr["default"]["gyro_channels"])
-        {
-            package[channel] = dist_around_one (mt) - 0.1;
-        }
-        for (int channel : board_descr["default"]["eda_channels"])
-        {
-            package[channel] = dist_around_one (mt);
-        }
-        for (int chan_num = 0; chan_num < (int)board_descr["default"]["ppg_channels"].size ();
-             chan_num++)
-        {
-            int channel = board_descr["default"]["ppg_channels"][chan_num];
-            if (chan_num == 0)
+            double *package = block.data () + (size_t)k * num_rows;
+            package[layout.package_num_channel] = (double)counter;
+            for (int i = 0; (!vectorized) && (i < num_exg_channels); i++)
             {
-                package[channel] = 500.0 * dist_around_one (mt);
+                int param_id = i % 16;
+                double amplitude = amplitudes[i];
+                double noise = 0.1 * (param_id + 1);
+                int peak_frequency = std::max (1, sampling_rate / (param_id + 1));
+                double range = (amplitude * noise) / 2.0;
+                std::uniform_real_distribution<double> dist (0 - range, range);
+                sin_phase_rad[i] += phase_steps[i];
+                if (sin_phase_rad[i] > 2.0f * M_PI)
+                {
+                    sin_phase_rad[i] -= 2.0f * M_PI;
+                }
+                if ((param_id > 5) &&
+                    ((counter % peak_frequency == 0) || ((counter - 1) % peak_frequency == 0) ||
+                        (((counter + 1) % peak_frequency == 0))))
+                {
+                    amplitude *= dist_around_one (mt) * 2;
+                }
+                package[exg_channels[i]] = amplitude +
+                    (amplitude + dist (mt)) * sqrt (2.0) * sin (sin_phase_rad[i] + shifts[i]);
             }
-            else
+            for (int channel : layout.accel_channels)
             {
-                package[channel] = 253500.0 * dist_around_one (mt);
+                package[channel] = around_one () - 0.1;
             }
-        }
-        for (int channel : board_descr["default"]["temperature_channels"])
-        {
-            package[channel] = dist_around_one (mt) / 10.0 + 36.5;
-        }
-        for (int channel : board_descr["default"]["resistance_channels"])
-        {
-            package[channel] = 1000.0 * dist_around_one (mt);
-        }
-        package[board_descr["default"]["battery_channel"].get<int> ()] =
-            (dist_around_one (mt) - 0.1) * 100;
-        package[board_descr["default"]["timestamp_channel"].get<int> ()] = get_timestamp ();
-
-        push_package (package); // use this method to submit data to buffers
+            for (int channel : layout.gyro_channels)
+            {
+                package[channel] = around_one () - 0.1;
+            }
+            for (int channel : layout.eda_channels)
+            {
+                package[channel] = around_one ();
+            }
+            for (int chan_num = 0; chan_num < (int)layout.ppg_channels.size (); chan_num++)
+            {
+                int channel = layout.ppg_channels[chan_num];
+                if (chan_num == 0)
+                {
+                    package[channel] = 500.0 * around_one ();
+                }
+                else
+                {
+                    package[channel] = 253500.0 * around_one ();
+                }
+            }
+            for (int channel : layout.temperature_channels)
+            {
+                package[channel] = around_one () / 10.0 + 36.5;
+            }
+            for (int channel : layout.resistance_channels)
+            {
+                package[channel] = 1000.0 * around_one ();
+            }
+            package[layout.battery_channel] = (around_one () - 0.1) * 100;
 
-        // push aux package
-        for (int channel : board_descr["auxiliary"]["other_channels"])
-        {
-            aux_package[channel] = (double)channel;
-        }
-        aux_package[board_descr["auxiliary"]["timestamp_channel"].get<int> ()] = get_timestamp ();
-        aux_package[board_descr["auxiliary"]["package_num_channel"].get<int> ()] = (double)counter;
-        aux_package[board_descr["auxiliary"]["battery_channel"].get<int> ()] =
-            (dist_around_one (mt) - 0.1) * 100;
-        for (int channel : board_descr["auxiliary"]["accel_channels"])
-        {
-            aux_package[channel] = dist_around_one (mt) - 0.1;
-        }
-        for (int channel : board_descr["auxiliary"]["gyro_channels"])
-        {
-            aux_package[channel] = dist_around_one (mt) - 0.1;
-        }
-        for (int channel : board_descr["auxiliary"]["eda_channels"])
-        {
-            aux_package[channel] = dist_around_one (mt);
-        }
-        for (int chan_num = 0; chan_num < (int)board_descr["auxiliary"]["ppg_channels"].size ();
-             chan_num++)
-        {
-            int channel = board_descr["auxiliary"]["ppg_channels"][chan_num];
-            if (chan_num == 0)
+            double *aux_package = aux_block.data () + (size_t)k * num_aux_rows;
+            for (int channel : aux_layout.other_channels)
+            {
+                aux_package[channel] = (double)channel;
+            }
+            aux_package[aux_layout.package_num_channel] = (double)counter;
+            aux_package[aux_layout.battery_channel] = (around_one () - 0.1) * 100;
+            for (int channel : aux_layout.accel_channels)
+            {
+                aux_package[channel] = around_one () - 0.1;
+            }
+            for (int channel : aux_layout.gyro_channels)
+            {
+                aux_package[channel] = around_one () - 0.1;
+            }
+            for (int channel : aux_layout.eda_channels)
+            {
+                aux_package[channel] = around_one ();
+            }
+            for (int chan_num = 0; chan_num < (int)aux_layout.ppg_channels.size (); chan_num++)
             {
-                aux_package[channel] = 500.0 * dist_around_one (mt);
+                int channel = aux_layout.ppg_channels[chan_num];
+                if (chan_num == 0)
+                {
+                    aux_package[channel] = 500.0 * around_one ();
+                }
+                else
+                {
+                    aux_package[channel] = 253500.0 * around_one ();
+                }
             }
-            else
+            for (int channel : aux_layout.temperature_channels)
             {
-                aux_package[channel] = 253500.0 * dist_around_one (mt);
+                aux_package[channel] = around_one () / 10.0 + 36.5;
+            }
+            for (int channel : aux_layout.resistance_channels)
+            {
+                aux_package[channel] = 1000.0 * around_one ();
             }
         }
-        for (int channel : board_descr["auxiliary"]["temperature_channels"])
+
+        // one timestamp per block, packages inside the block are spaced by sampling period or
+        // closer if thread catches up after a delay, so timestamps are increasing
+        double timestamp = get_timestamp ();
+        double timestamp_step = 1.0 / sampling_rate;
+        if (last_timestamp > 0)
         {
-            aux_package[channel] = dist_around_one (mt) / 10.0 + 36.5;
+            timestamp_step = std::min (timestamp_step, (timestamp - last_timestamp) / batch_size);
         }
-        for (int channel : board_descr["auxiliary"]["resistance_channels"])
+        last_timestamp = timestamp;
+        for (int k = 0; k < batch_size; k++)
         {
-            aux_package[channel] = 1000.0 * dist_around_one (mt);
+            double package_timestamp = timestamp - (batch_size - 1 - k) * timestamp_step;
+            double *package = block.data () + (size_t)k * num_rows;
+            double *aux_package = aux_block.data () + (size_t)k * num_aux_rows;
+            package[layout.timestamp_channel] = package_timestamp;
+            aux_package[aux_layout.timestamp_channel] = package_timestamp;
+            push_package (package); // use this method to submit data to buffers
+            push_package (aux_package, (int)BrainFlowPresets::AUXILIARY_PRESET);
         }
 
-        push_package (aux_package, (int)BrainFlowPresets::AUXILIARY_PRESET);
-
-        if (sleep_time - accumulated_time_delta > 1)
+        // for high sampling rates block time can be less than 1ms, in this case sleep only when
+        // accumulated time is large enough
+        if (block_time_ms - accumulated_time_delta > 1)
         {
 #ifdef _WIN32
-            Sleep ((int)(sleep_time - accumulated_time_delta));
+            Sleep ((int)(block_time_ms - accumulated_time_delta));
 #else
-            usleep ((int)(1000 * (sleep_time - accumulated_time_delta)));
+            usleep ((int)(1000 * (block_time_ms - accumulated_time_delta)));
 #endif
         }
 
-        counter++;
         auto stop = std::chrono::high_resolution_clock::now ();
         auto duration =
             std::chrono::duration_cast<std::chrono::microseconds> (stop - start).count ();
-        accumulated_time_delta += (duration / 1000.0 - sleep_time);
+        accumulated_time_delta += (duration / 1000.0 - block_time_ms);
     }
-    delete[] sin_phase_rad;
-    delete[] package;
-    delete[] aux_package;
 }
 
 int SyntheticBoard::config_board (std::string config, std::string &response)
 {
     response = "Config:" + config;
+    bool is_known = false;
+    return apply_command (config, is_known);
+}
+
+int SyntheticBoard::apply_command (const std::string &config, bool &is_known)
+{
+    const char *prefixes[] = {
+        SET_SAMPLING_RATE_PREFIX, SET_EEG_CHANNELS_PREFIX, SET_BATCH_SIZE_PREFIX};
+    const int max_values[] = {
+        MAX_SYNTHETIC_SAMPLING_RATE, MAX_SYNTHETIC_EEG_CHANNELS, MAX_SYNTHETIC_BATCH_SIZE};
+    int *fields[] = {&sampling_rate, &num_eeg_channels, &batch_size};
+    int command_id = -1;
+    for (int i = 0; i < 3; i++)
+    {
+        if (strncmp (config.c_str (), prefixes[i], strlen (prefixes[i])) == 0)
+        {
+            command_id = i;
+        }
+    }
+    is_known = (command_id >= 0) || (config == VECTORIZED_TRUE) || (config == VECTORIZED_FALSE);
+    if (!is_known)
+    {
+        return (int)BrainFlowExitCodes::STATUS_OK;
+    }
+    // data layout and timing are used by streaming thread and buffers
+    if (is_streaming)
+    {
+        safe_logger (spdlog::level::err, "Stop streaming before {}", config);
+        return (int)BrainFlowExitCodes::STREAM_ALREADY_RUN_ERROR;
+    }
+    if (command_id < 0)
+    {
+        vectorized = (config == VECTORIZED_TRUE);
+        return (int)BrainFlowExitCodes::STATUS_OK;
+    }
+    int value = 0;
+    try
+    {
+        size_t pos = 0;
+        std::string value_str = config.substr (strlen (prefixes[command_id]));
+        value = std::stoi (value_str, &pos);
+        if (pos != value_str.size ())
+        {
+            throw std::invalid_argument ("trailing characters");
+        }
+    }
+    catch (const std::exception &e)
+    {
+        safe_logger (spdlog::level::err, "need to write a number after {}, exception is: {}",
+            prefixes[command_id], e.what ());
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    if ((value < 1) || (value > max_values[command_id]))
+    {
+        safe_logger (spdlog::level::err, "invalid value for {}, should be in range [1, {}]",
+            prefixes[command_id], max_values[command_id]);
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    *fields[command_id] = value;
+    // buffers from previous stream have old number of rows
+    free_packages ();
+    update_board_descr ();
     return (int)BrainFlowExitCodes::STATUS_OK;
 }
 
+void SyntheticBoard::update_board_descr ()
+{
+    json default_descr =
+        boards_struct.brainflow_boards_json["boards"][std::to_string (board_id)]["default"];
+    json aux_descr =
+        boards_struct.brainflow_boards_json["boards"][std::to_string (board_id)]["auxiliary"];
+    int default_num_exg = (int)default_descr["eeg_channels"].size ();
+    // exg channels start from 1, other channels are moved after them
+    int shift = num_eeg_channels - default_num_exg;
+    for (auto &el : default_descr.items ())
+    {
+        std::string key = el.key ();
+        if ((key == "eeg_channels") || (key == "emg_channels") || (key == "ecg_channels") ||
+            (key == "eog_channels"))
+        {
+            std::vector<int> channels (num_eeg_channels);
+            for (int i = 0; i < num_eeg_channels; i++)
+            {
+                channels[i] = i + 1;
+            }
+            el.value () = channels;
+        }
+        else if ((key.size () > 9) && (key.compare (key.size () - 9, 9, "_channels") == 0))
+        {
+            for (auto &channel : el.value ())
+            {
+                channel = (int)channel + shift;
+            }
+        }
+        else if ((key.size () > 8) && (key.compare (key.size () - 8, 8, "_channel") == 0) &&
+            ((int)el.value () > default_num_exg))
+        {
+            el.value () = (int)el.value () + shift;
+        }
+    }
+    default_descr["num_rows"] = (int)default_descr["num_rows"] + shift;
+
+    std::vector<std::string> default_names;
+    std::stringstream ss (default_descr["eeg_names"].get<std::string> ());
+    std::string name;
+    while (std::getline (ss, name, ','))
+    {
+        default_names.push_back (name);
+    }
+    std::string eeg_names = "";
+    for (int i = 0; i < num_eeg_channels; i++)
+    {
+        if (i > 0)
+        {
+            eeg_names += ",";
+        }
+        eeg_names +=
+            (i < (int)default_names.size ()) ? default_names[i] : "E" + std::to_string (i + 1);
+    }
+    default_descr["eeg_names"] = eeg_names;
+
+    default_descr["sampling_rate"] = sampling_rate;
+    aux_descr["sampling_rate"] = sampling_rate;
+    board_descr["default"] = default_descr;
+    board_descr["auxiliary"] = aux_descr;
+}
+
 // if you use this board as a reference, more likely you dont need to implement this method
 int SyntheticBoard::config_board_with_bytes (const char *bytes, int len)
 {
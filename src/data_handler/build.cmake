@@ -28,7 +28,10 @@ endif (CMAKE_SIZEOF_VOID_P EQUAL 8)
 
 SET (DATA_HANDLER_SRC
     ${CMAKE_CURRENT_SOURCE_DIR}/src/data_handler/data_handler.cpp
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/data_handler/dsp_plan_cache.cpp
     ${CMAKE_CURRENT_SOURCE_DIR}/src/data_handler/fastica.cpp
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/data_handler/streaming_filter.cpp
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/utils/bfbin_file.cpp
 )
 
 add_library (
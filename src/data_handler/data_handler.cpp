@@ -1,5 +1,9 @@
+#include "file_offset.h"
+
 #include <algorithm>
+#include <map>
 #include <math.h>
+#include <memory>
 #include <mutex>
 #include <sstream>
 #include <stdexcept>
@@ -8,14 +12,18 @@
 #include <string.h>
 #include <string>
 #include <thread>
+#include <tuple>
 #include <vector>
 
+#include "bfbin_file.h"
 #include "brainflow_constants.h"
 #include "brainflow_version.h"
 #include "common_data_handler_helpers.h"
 #include "data_handler.h"
 #include "downsample_operators.h"
+#include "dsp_plan_cache.h"
 #include "rolling_filter.h"
+#include "streaming_filter.h"
 #include "wavelet_helpers.h"
 #include "window_functions.h"
 
@@ -50,6 +58,17 @@ std::shared_ptr<spdlog::logger> data_logger = spdlog::stderr_logger_mt (LOGGER_N
 
 // its only for logging methods, other methods can be executed simultaneously
 std::mutex data_mutex;
+std::map<int, std::shared_ptr<StreamingFilter>> streaming_filters;
+std::mutex streaming_filters_mutex;
+int last_filter_id = 0;
+// plans are reused between calls with the same params, keys are:
+// (filter_operation, filter_type, params[0..4]), (nfft, inverse) and (window_function, window_len).
+// Size of fft and window plans depends on data_len, so their caches are limited by bytes as well
+typedef std::tuple<int, int, double, double, double, double, double> FilterPlanKey;
+LRUCache<FilterPlanKey, FilterPlan> filter_plans (DSP_PLAN_CACHE_SIZE);
+LRUCache<std::pair<int, int>, FftPlan> fft_plans (DSP_PLAN_CACHE_SIZE, DSP_PLAN_CACHE_MAX_BYTES);
+LRUCache<std::pair<int, int>, std::vector<double>> window_plans (
+    DSP_PLAN_CACHE_SIZE, DSP_PLAN_CACHE_MAX_BYTES);
 
 
 int log_message_data_handler (int log_level, char *log_message)
@@ -123,6 +142,25 @@ int set_log_level_data_handler (int level)
 }
 
 
+static int apply_filter_plan (
+    int filter_operation, double *data, int data_len, int filter_type, const Dsp::Params &params)
+{
+    FilterPlanKey key = std::make_tuple (
+        filter_operation, filter_type, params[0], params[1], params[2], params[3], params[4]);
+    std::shared_ptr<FilterPlan> plan = filter_plans.get (
+        key, [&] () { return FilterPlan::create (filter_operation, filter_type, params); });
+    if (!plan)
+    {
+        data_logger->error ("Filter type {} is Invalid", filter_type);
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    bool zero_phase = (filter_type == (int)FilterTypes::BUTTERWORTH_ZERO_PHASE) ||
+        (filter_type == (int)FilterTypes::CHEBYSHEV_TYPE_1_ZERO_PHASE) ||
+        (filter_type == (int)FilterTypes::BESSEL_ZERO_PHASE);
+    plan->process (data, data_len, zero_phase);
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
 int perform_lowpass (double *data, int data_len, int sampling_rate, double cutoff, int order,
     int filter_type, double ripple)
 {
@@ -134,36 +172,8 @@ int perform_lowpass (double *data, int data_len, int sampling_rate, double cutof
         return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
     }
 
-    double *filter_data[1];
-    filter_data[0] = data;
-    Dsp::Filter *f = NULL;
-
-    switch (static_cast<FilterTypes> (filter_type))
-    {
-        case FilterTypes::BUTTERWORTH:
-            f = new Dsp::FilterDesign<Dsp::Butterworth::Design::LowPass<MAX_FILTER_ORDER>, 1> ();
-            break;
-        case FilterTypes::BUTTERWORTH_ZERO_PHASE:
-            f = new Dsp::FilterDesign<Dsp::Butterworth::Design::LowPass<MAX_FILTER_ORDER>, 1> ();
-            break;
-        case FilterTypes::CHEBYSHEV_TYPE_1:
-            f = new Dsp::FilterDesign<Dsp::ChebyshevI::Design::LowPass<MAX_FILTER_ORDER>, 1> ();
-            break;
-        case FilterTypes::CHEBYSHEV_TYPE_1_ZERO_PHASE:
-            f = new Dsp::FilterDesign<Dsp::ChebyshevI::Design::LowPass<MAX_FILTER_ORDER>, 1> ();
-            break;
-        case FilterTypes::BESSEL:
-            f = new Dsp::FilterDesign<Dsp::Bessel::Design::LowPass<MAX_FILTER_ORDER>, 1> ();
-            break;
-        case FilterTypes::BESSEL_ZERO_PHASE:
-            f = new Dsp::FilterDesign<Dsp::Bessel::Design::LowPass<MAX_FILTER_ORDER>, 1> ();
-            break;
-        default:
-            data_logger->error ("Filter type {} is Invalid", filter_type);
-            return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
-    }
-
     Dsp::Params params;
+    params.clear ();
     params[0] = sampling_rate; // sample rate
     params[1] = order;         // order
     params[2] = cutoff;        // cutoff
@@ -172,19 +182,7 @@ int perform_lowpass (double *data, int data_len, int sampling_rate, double cutof
     {
         params[3] = ripple; // ripple
     }
-    f->setParams (params);
-    f->process (data_len, filter_data);
-    if ((filter_type == (int)FilterTypes::BUTTERWORTH_ZERO_PHASE) ||
-        (filter_type == (int)FilterTypes::CHEBYSHEV_TYPE_1_ZERO_PHASE) ||
-        (filter_type == (int)FilterTypes::BESSEL_ZERO_PHASE))
-    {
-        reverse_array (data, data_len);
-        f->process (data_len, filter_data);
-        reverse_array (data, data_len);
-    }
-    delete f;
-
-    return (int)BrainFlowExitCodes::STATUS_OK;
+    return apply_filter_plan ((int)FilterOperations::LOWPASS, data, data_len, filter_type, params);
 }
 
 int perform_highpass (double *data, int data_len, int sampling_rate, double cutoff, int order,
@@ -198,35 +196,8 @@ int perform_highpass (double *data, int data_len, int sampling_rate, double cuto
         return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
     }
 
-    Dsp::Filter *f = NULL;
-    double *filter_data[1];
-    filter_data[0] = data;
-
-    switch (static_cast<FilterTypes> (filter_type))
-    {
-        case FilterTypes::BUTTERWORTH:
-            f = new Dsp::FilterDesign<Dsp::Butterworth::Design::HighPass<MAX_FILTER_ORDER>, 1> ();
-            break;
-        case FilterTypes::BUTTERWORTH_ZERO_PHASE:
-            f = new Dsp::FilterDesign<Dsp::Butterworth::Design::HighPass<MAX_FILTER_ORDER>, 1> ();
-            break;
-        case FilterTypes::CHEBYSHEV_TYPE_1:
-            f = new Dsp::FilterDesign<Dsp::ChebyshevI::Design::HighPass<MAX_FILTER_ORDER>, 1> ();
-            break;
-        case FilterTypes::CHEBYSHEV_TYPE_1_ZERO_PHASE:
-            f = new Dsp::FilterDesign<Dsp::ChebyshevI::Design::HighPass<MAX_FILTER_ORDER>, 1> ();
-            break;
-        case FilterTypes::BESSEL:
-            f = new Dsp::FilterDesign<Dsp::Bessel::Design::HighPass<MAX_FILTER_ORDER>, 1> ();
-            break;
-        case FilterTypes::BESSEL_ZERO_PHASE:
-            f = new Dsp::FilterDesign<Dsp::Bessel::Design::HighPass<MAX_FILTER_ORDER>, 1> ();
-            break;
-        default:
-            data_logger->error ("Filter type {} is Invalid", filter_type);
-            return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
-    }
     Dsp::Params params;
+    params.clear ();
     params[0] = sampling_rate; // sample rate
     params[1] = order;         // order
     params[2] = cutoff;        // cutoff
@@ -235,19 +206,7 @@ int perform_highpass (double *data, int data_len, int sampling_rate, double cuto
     {
         params[3] = ripple; // ripple
     }
-    f->setParams (params);
-    f->process (data_len, filter_data);
-    if ((filter_type == (int)FilterTypes::BUTTERWORTH_ZERO_PHASE) ||
-        (filter_type == (int)FilterTypes::CHEBYSHEV_TYPE_1_ZERO_PHASE) ||
-        (filter_type == (int)FilterTypes::BESSEL_ZERO_PHASE))
-    {
-        reverse_array (data, data_len);
-        f->process (data_len, filter_data);
-        reverse_array (data, data_len);
-    }
-    delete f;
-
-    return (int)BrainFlowExitCodes::STATUS_OK;
+    return apply_filter_plan ((int)FilterOperations::HIGHPASS, data, data_len, filter_type, params);
 }
 
 int perform_bandpass (double *data, int data_len, int sampling_rate, double start_freq,
@@ -264,58 +223,18 @@ int perform_bandpass (double *data, int data_len, int sampling_rate, double star
 
     double center_freq = (start_freq + stop_freq) / 2.0;
     double band_width = stop_freq - start_freq;
-    Dsp::Filter *f = NULL;
-    double *filter_data[1];
-    filter_data[0] = data;
-
-    switch (static_cast<FilterTypes> (filter_type))
-    {
-        case FilterTypes::BUTTERWORTH:
-            f = new Dsp::FilterDesign<Dsp::Butterworth::Design::BandPass<MAX_FILTER_ORDER>, 1> ();
-            break;
-        case FilterTypes::BUTTERWORTH_ZERO_PHASE:
-            f = new Dsp::FilterDesign<Dsp::Butterworth::Design::BandPass<MAX_FILTER_ORDER>, 1> ();
-            break;
-        case FilterTypes::CHEBYSHEV_TYPE_1:
-            f = new Dsp::FilterDesign<Dsp::ChebyshevI::Design::BandPass<MAX_FILTER_ORDER>, 1> ();
-            break;
-        case FilterTypes::CHEBYSHEV_TYPE_1_ZERO_PHASE:
-            f = new Dsp::FilterDesign<Dsp::ChebyshevI::Design::BandPass<MAX_FILTER_ORDER>, 1> ();
-            break;
-        case FilterTypes::BESSEL:
-            f = new Dsp::FilterDesign<Dsp::Bessel::Design::BandPass<MAX_FILTER_ORDER>, 1> ();
-            break;
-        case FilterTypes::BESSEL_ZERO_PHASE:
-            f = new Dsp::FilterDesign<Dsp::Bessel::Design::BandPass<MAX_FILTER_ORDER>, 1> ();
-            break;
-        default:
-            data_logger->error ("Filter type {} is Invalid. ", filter_type);
-            return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
-    }
-
     Dsp::Params params;
+    params.clear ();
     params[0] = sampling_rate; // sample rate
     params[1] = order;         // order
     params[2] = center_freq;   // center freq
-    params[3] = band_width;
+    params[3] = band_width;    // band width
     if ((filter_type == (int)FilterTypes::CHEBYSHEV_TYPE_1) ||
         (filter_type == (int)FilterTypes::CHEBYSHEV_TYPE_1_ZERO_PHASE))
     {
-        params[3] = ripple; // ripple
-    }
-    f->setParams (params);
-    f->process (data_len, filter_data);
-    if ((filter_type == (int)FilterTypes::BUTTERWORTH_ZERO_PHASE) ||
-        (filter_type == (int)FilterTypes::CHEBYSHEV_TYPE_1_ZERO_PHASE) ||
-        (filter_type == (int)FilterTypes::BESSEL_ZERO_PHASE))
-    {
-        reverse_array (data, data_len);
-        f->process (data_len, filter_data);
-        reverse_array (data, data_len);
+        params[4] = ripple; // ripple
     }
-    delete f;
-
-    return (int)BrainFlowExitCodes::STATUS_OK;
+    return apply_filter_plan ((int)FilterOperations::BANDPASS, data, data_len, filter_type, params);
 }
 
 int perform_bandstop (double *data, int data_len, int sampling_rate, double start_freq,
@@ -332,58 +251,18 @@ int perform_bandstop (double *data, int data_len, int sampling_rate, double star
 
     double center_freq = (start_freq + stop_freq) / 2.0;
     double band_width = stop_freq - start_freq;
-    Dsp::Filter *f = NULL;
-    double *filter_data[1];
-    filter_data[0] = data;
-
-    switch (static_cast<FilterTypes> (filter_type))
-    {
-        case FilterTypes::BUTTERWORTH:
-            f = new Dsp::FilterDesign<Dsp::Butterworth::Design::BandStop<MAX_FILTER_ORDER>, 1> ();
-            break;
-        case FilterTypes::BUTTERWORTH_ZERO_PHASE:
-            f = new Dsp::FilterDesign<Dsp::Butterworth::Design::BandStop<MAX_FILTER_ORDER>, 1> ();
-            break;
-        case FilterTypes::CHEBYSHEV_TYPE_1:
-            f = new Dsp::FilterDesign<Dsp::ChebyshevI::Design::BandStop<MAX_FILTER_ORDER>, 1> ();
-            break;
-        case FilterTypes::CHEBYSHEV_TYPE_1_ZERO_PHASE:
-            f = new Dsp::FilterDesign<Dsp::ChebyshevI::Design::BandStop<MAX_FILTER_ORDER>, 1> ();
-            break;
-        case FilterTypes::BESSEL:
-            f = new Dsp::FilterDesign<Dsp::Bessel::Design::BandStop<MAX_FILTER_ORDER>, 1> ();
-            break;
-        case FilterTypes::BESSEL_ZERO_PHASE:
-            f = new Dsp::FilterDesign<Dsp::Bessel::Design::BandStop<MAX_FILTER_ORDER>, 1> ();
-            break;
-        default:
-            data_logger->error ("Filter type {} is Invalid", filter_type);
-            return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
-    }
-
     Dsp::Params params;
+    params.clear ();
     params[0] = sampling_rate; // sample rate
     params[1] = order;         // order
     params[2] = center_freq;   // center freq
-    params[3] = band_width;
+    params[3] = band_width;    // band width
     if ((filter_type == (int)FilterTypes::CHEBYSHEV_TYPE_1) ||
         (filter_type == (int)FilterTypes::CHEBYSHEV_TYPE_1_ZERO_PHASE))
     {
-        params[3] = ripple; // ripple
+        params[4] = ripple; // ripple
     }
-    f->setParams (params);
-    f->process (data_len, filter_data);
-    if ((filter_type == (int)FilterTypes::BUTTERWORTH_ZERO_PHASE) ||
-        (filter_type == (int)FilterTypes::CHEBYSHEV_TYPE_1_ZERO_PHASE) ||
-        (filter_type == (int)FilterTypes::BESSEL_ZERO_PHASE))
-    {
-        reverse_array (data, data_len);
-        f->process (data_len, filter_data);
-        reverse_array (data, data_len);
-    }
-    delete f;
-
-    return (int)BrainFlowExitCodes::STATUS_OK;
+    return apply_filter_plan ((int)FilterOperations::BANDSTOP, data, data_len, filter_type, params);
 }
 
 int remove_environmental_noise (double *data, int data_len, int sampling_rate, int noise_type)
@@ -422,6 +301,154 @@ int remove_environmental_noise (double *data, int data_len, int sampling_rate, i
     return res;
 }
 
+static int add_streaming_filter (std::shared_ptr<StreamingFilter> filter, int *filter_id)
+{
+    std::lock_guard<std::mutex> lock (streaming_filters_mutex);
+    last_filter_id++;
+    streaming_filters[last_filter_id] = filter;
+    *filter_id = last_filter_id;
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
+static std::shared_ptr<StreamingFilter> get_streaming_filter (int filter_id)
+{
+    std::lock_guard<std::mutex> lock (streaming_filters_mutex);
+    auto it = streaming_filters.find (filter_id);
+    if (it == streaming_filters.end ())
+    {
+        return nullptr;
+    }
+    return it->second;
+}
+
+int create_filter (int filter_operation, int num_channels, int sampling_rate, double start_freq,
+    double stop_freq, int order, int filter_type, double ripple, int *filter_id)
+{
+    if ((num_channels < 1) || (filter_id == NULL))
+    {
+        data_logger->error ("Number of channels must be positive. Num Channels:{}", num_channels);
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    std::shared_ptr<StreamingFilter> filter = std::make_shared<StreamingFilter> (num_channels);
+    int res = filter->add_stage (
+        filter_operation, sampling_rate, start_freq, stop_freq, order, filter_type, ripple);
+    if (res != (int)BrainFlowExitCodes::STATUS_OK)
+    {
+        data_logger->error (
+            "Invalid filter params, zero phase filters are not supported for "
+            "streaming. Operation:{}, Type:{}, Order:{}, Start Freq:{}, Stop Freq:{}",
+            filter_operation, filter_type, order, start_freq, stop_freq);
+        return res;
+    }
+    return add_streaming_filter (filter, filter_id);
+}
+
+int create_environmental_noise_filter (
+    int num_channels, int sampling_rate, int noise_type, int *filter_id)
+{
+    if ((num_channels < 1) || (sampling_rate < 1) || (filter_id == NULL))
+    {
+        data_logger->error ("Number of channels and sampling rate must be positive.");
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    std::shared_ptr<StreamingFilter> filter = std::make_shared<StreamingFilter> (num_channels);
+    int res = (int)BrainFlowExitCodes::STATUS_OK;
+    switch (static_cast<NoiseTypes> (noise_type))
+    {
+        case NoiseTypes::FIFTY:
+            res = filter->add_stage ((int)FilterOperations::BANDSTOP, sampling_rate, 48.0, 52.0, 4,
+                (int)FilterTypes::BUTTERWORTH, 0.0);
+            break;
+        case NoiseTypes::SIXTY:
+            res = filter->add_stage ((int)FilterOperations::BANDSTOP, sampling_rate, 58.0, 62.0, 4,
+                (int)FilterTypes::BUTTERWORTH, 0.0);
+            break;
+        case NoiseTypes::FIFTY_AND_SIXTY:
+            res = filter->add_stage ((int)FilterOperations::BANDSTOP, sampling_rate, 48.0, 52.0, 4,
+                (int)FilterTypes::BUTTERWORTH, 0.0);
+            if (res == (int)BrainFlowExitCodes::STATUS_OK)
+            {
+                res = filter->add_stage ((int)FilterOperations::BANDSTOP, sampling_rate, 58.0, 62.0,
+                    4, (int)FilterTypes::BUTTERWORTH, 0.0);
+            }
+            break;
+        default:
+            data_logger->error ("Invalid noise type");
+            return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    if (res != (int)BrainFlowExitCodes::STATUS_OK)
+    {
+        return res;
+    }
+    return add_streaming_filter (filter, filter_id);
+}
+
+int process_filter (int filter_id, double *data, int num_channels, int data_len)
+{
+    std::shared_ptr<StreamingFilter> filter = get_streaming_filter (filter_id);
+    if (filter == nullptr)
+    {
+        data_logger->error ("No filter with id {}", filter_id);
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    int res = filter->process (data, num_channels, data_len);
+    if (res != (int)BrainFlowExitCodes::STATUS_OK)
+    {
+        data_logger->error ("Invalid data for filter. Num Channels:{}, Expected:{}, Data Len:{}",
+            num_channels, filter->get_num_channels (), data_len);
+    }
+    return res;
+}
+
+int reset_filter (int filter_id)
+{
+    std::shared_ptr<StreamingFilter> filter = get_streaming_filter (filter_id);
+    if (filter == nullptr)
+    {
+        data_logger->error ("No filter with id {}", filter_id);
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    filter->reset ();
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
+int release_filter (int filter_id)
+{
+    std::lock_guard<std::mutex> lock (streaming_filters_mutex);
+    if (streaming_filters.erase (filter_id) == 0)
+    {
+        data_logger->error ("No filter with id {}", filter_id);
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
+int get_dsp_cache_stats (long long *hits, long long *misses, int *num_plans)
+{
+    if ((hits == NULL) || (misses == NULL) || (num_plans == NULL))
+    {
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    long long cache_hits[3] = {0};
+    long long cache_misses[3] = {0};
+    int cache_sizes[3] = {0};
+    filter_plans.get_stats (&cache_hits[0], &cache_misses[0], &cache_sizes[0]);
+    fft_plans.get_stats (&cache_hits[1], &cache_misses[1], &cache_sizes[1]);
+    window_plans.get_stats (&cache_hits[2], &cache_misses[2], &cache_sizes[2]);
+    *hits = cache_hits[0] + cache_hits[1] + cache_hits[2];
+    *misses = cache_misses[0] + cache_misses[1] + cache_misses[2];
+    *num_plans = cache_sizes[0] + cache_sizes[1] + cache_sizes[2];
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
+int clear_dsp_cache ()
+{
+    filter_plans.clear ();
+    fft_plans.clear ();
+    window_plans.clear ();
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
 int perform_rolling_filter (double *data, int data_len, int period, int agg_operation)
 {
     if ((data == NULL) || (period <= 0))
@@ -442,6 +469,12 @@ int perform_rolling_filter (double *data, int data_len, int period, int agg_oper
             break;
         case AggOperations::EACH:
             return (int)BrainFlowExitCodes::STATUS_OK;
+        case AggOperations::MIN:
+            filter = new RollingMin<double> (period);
+            break;
+        case AggOperations::MAX:
+            filter = new RollingMax<double> (period);
+            break;
         default:
             data_logger->error ("Invalid aggregate opteration:{}", agg_operation);
             return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
@@ -475,9 +508,16 @@ int perform_downsampling (
         case AggOperations::EACH:
             downsampling_op = downsample_each;
             break;
+        case AggOperations::MIN:
+            downsampling_op = downsample_min;
+            break;
+        case AggOperations::MAX:
+            downsampling_op = downsample_max;
+            break;
         default:
             data_logger->error (
-                "Invalid aggregate opteration:{}. Must be mean,median, or each", agg_operation);
+                "Invalid aggregate opteration:{}. Must be mean, median, each, min or max",
+                agg_operation);
             return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
     }
     int num_values = data_len / period;
@@ -747,6 +787,46 @@ int get_csp (const double *data, const double *labels, int n_epochs, int n_chann
     return (int)BrainFlowExitCodes::STATUS_OK;
 }
 
+static std::shared_ptr<std::vector<double>> get_window_plan (int window_function, int window_len)
+{
+    return window_plans.get (
+        std::make_pair (window_function, window_len),
+        [&] ()
+        {
+            std::shared_ptr<std::vector<double>> window =
+                std::make_shared<std::vector<double>> (window_len);
+            // from https://www.edn.com/windowing-functions-improve-fft-results-part-i/
+            switch (static_cast<WindowOperations> (window_function))
+            {
+                case WindowOperations::NO_WINDOW:
+                    no_window_function (window_len, window->data ());
+                    break;
+                case WindowOperations::HAMMING:
+                    hamming_function (window_len, window->data ());
+                    break;
+                case WindowOperations::HANNING:
+                    hanning_function (window_len, window->data ());
+                    break;
+                case WindowOperations::BLACKMAN_HARRIS:
+                    blackman_harris_function (window_len, window->data ());
+                    break;
+                default:
+                    window = nullptr;
+                    break;
+            }
+            return window;
+        },
+        sizeof (double) * (size_t)window_len);
+}
+
+static std::shared_ptr<FftPlan> get_fft_plan (int nfft, int inverse)
+{
+    return fft_plans.get (
+        std::make_pair (nfft, inverse),
+        [&] () { return std::make_shared<FftPlan> (nfft, inverse); },
+        FftPlan::get_max_bytes (nfft, inverse));
+}
+
 int get_window (int window_function, int window_len, double *output_window)
 {
     if ((window_len <= 0) || (window_function < 0) || (output_window == NULL))
@@ -755,25 +835,13 @@ int get_window (int window_function, int window_len, double *output_window)
                             "0 and output_window cannot be empty.");
         return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
     }
-    // from https://www.edn.com/windowing-functions-improve-fft-results-part-i/
-    switch (static_cast<WindowOperations> (window_function))
+    std::shared_ptr<std::vector<double>> window = get_window_plan (window_function, window_len);
+    if (!window)
     {
-        case WindowOperations::NO_WINDOW:
-            no_window_function (window_len, output_window);
-            break;
-        case WindowOperations::HAMMING:
-            hamming_function (window_len, output_window);
-            break;
-        case WindowOperations::HANNING:
-            hanning_function (window_len, output_window);
-            break;
-        case WindowOperations::BLACKMAN_HARRIS:
-            blackman_harris_function (window_len, output_window);
-            break;
-        default:
-            data_logger->error ("Invalid Window function. Window function:{}", window_function);
-            return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+        data_logger->error ("Invalid Window function. Window function:{}", window_function);
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
     }
+    memcpy (output_window, window->data (), sizeof (double) * window_len);
     return (int)BrainFlowExitCodes::STATUS_OK;
 }
 
@@ -786,43 +854,43 @@ int perform_fft (
             "Please check to make sure all arguments aren't empty and data_len is even.");
         return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
     }
-
-    double *windowed_data = new double[data_len];
-    get_window (window_function, data_len, windowed_data);
-    for (int i = 0; i < data_len; i++)
+    std::shared_ptr<std::vector<double>> window = get_window_plan (window_function, data_len);
+    if (!window)
     {
-        windowed_data[i] *= data[i];
+        data_logger->error ("Invalid Window function. Window function:{}", window_function);
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
     }
-    kiss_fft_cpx *sout = new kiss_fft_cpx[data_len];
+
+    std::shared_ptr<FftPlan> plan = NULL;
     kiss_fftr_cfg cfg = NULL;
     try
     {
-        cfg = kiss_fftr_alloc (data_len, 0, 0, 0);
-        kiss_fftr (cfg, windowed_data, sout);
+        std::vector<double> windowed_data (data_len);
+        for (int i = 0; i < data_len; i++)
+        {
+            windowed_data[i] = (*window)[i] * data[i];
+        }
+        std::vector<kiss_fft_cpx> sout (data_len);
+        plan = get_fft_plan (data_len, 0);
+        cfg = plan->acquire ();
+        if (cfg == NULL)
+        {
+            throw std::runtime_error ("failed to allocate fft cfg");
+        }
+        kiss_fftr (cfg, windowed_data.data (), sout.data ());
+        plan->release (cfg);
+        cfg = NULL;
         for (int i = 0; i < data_len / 2 + 1; i++)
         {
             output_re[i] = sout[i].r;
             output_im[i] = sout[i].i;
         }
-        delete[] sout;
-        delete[] windowed_data;
-        windowed_data = NULL;
-        sout = NULL;
-        kiss_fftr_free (cfg);
     }
     catch (...)
     {
-        if (sout)
-        {
-            delete[] sout;
-        }
-        if (windowed_data)
-        {
-            delete[] windowed_data;
-        }
         if (cfg)
         {
-            kiss_fftr_free (cfg);
+            plan->release (cfg);
         }
         data_logger->error ("Error with doing FFT processing.");
         return (int)BrainFlowExitCodes::GENERAL_ERROR;
@@ -839,41 +907,36 @@ int perform_ifft (double *input_re, double *input_im, int data_len, double *rest
             "Please check to make sure all arguments aren't empty and data_len is even.");
         return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
     }
-    double *temp = new double[data_len];
-    kiss_fft_cpx *cin = new kiss_fft_cpx[data_len];
-    for (int i = 0; i < data_len / 2 + 1; i++)
-    {
-        cin[i].r = input_re[i];
-        cin[i].i = input_im[i];
-    }
+    std::shared_ptr<FftPlan> plan = NULL;
     kiss_fftr_cfg cfg = NULL;
     try
     {
-        cfg = kiss_fftr_alloc (data_len, 1, 0, 0);
-        kiss_fftri (cfg, cin, temp);
+        std::vector<double> temp (data_len);
+        std::vector<kiss_fft_cpx> cin (data_len);
+        for (int i = 0; i < data_len / 2 + 1; i++)
+        {
+            cin[i].r = input_re[i];
+            cin[i].i = input_im[i];
+        }
+        plan = get_fft_plan (data_len, 1);
+        cfg = plan->acquire ();
+        if (cfg == NULL)
+        {
+            throw std::runtime_error ("failed to allocate fft cfg");
+        }
+        kiss_fftri (cfg, cin.data (), temp.data ());
+        plan->release (cfg);
+        cfg = NULL;
         for (int i = 0; i < data_len; i++)
         {
             restored_data[i] = temp[i] / data_len;
         }
-        delete[] cin;
-        cin = NULL;
-        delete[] temp;
-        temp = NULL;
-        kiss_fftr_free (cfg);
     }
     catch (...)
     {
-        if (temp)
-        {
-            delete[] temp;
-        }
-        if (cin)
-        {
-            delete[] cin;
-        }
         if (cfg)
         {
-            kiss_fftr_free (cfg);
+            plan->release (cfg);
         }
         data_logger->error ("Error with doing inverse FFT.");
         return (int)BrainFlowExitCodes::GENERAL_ERROR;
@@ -976,6 +1039,119 @@ int get_nearest_power_of_two (int value, int *output)
     return (int)BrainFlowExitCodes::STATUS_OK;
 }
 
+static int write_bfbin_file (
+    const double *data, int num_rows, int num_cols, const char *file_name, const char *file_mode)
+{
+    bool append = (strcmp (file_mode, "a") == 0) || (strcmp (file_mode, "a+") == 0);
+    bool write_header = true;
+    if ((append) && (is_bfbin_file (file_name)))
+    {
+        FILE *existing = fopen (file_name, "rb");
+        BFBinHeader header;
+        int res = read_bfbin_header (existing, header);
+        fclose (existing);
+        if ((res != (int)BrainFlowExitCodes::STATUS_OK) || (header.num_rows != num_rows))
+        {
+            data_logger->error ("Can't append {} rows to file {}", num_rows, file_name);
+            return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+        }
+        write_header = false;
+    }
+    FILE *fp = fopen (file_name, append ? "ab" : "wb");
+    if (fp == NULL)
+    {
+        data_logger->error (
+            "Couldn't open file with file_name and file_mode argument. File_Mode:{}, File_name:{}",
+            file_mode, file_name);
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    if ((write_header) && (file_size (fp) != 0))
+    {
+        fclose (fp);
+        data_logger->error ("File {} exists and is not a binary brainflow file", file_name);
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    int res = (int)BrainFlowExitCodes::STATUS_OK;
+    if (write_header)
+    {
+        BFBinHeader header;
+        header.num_rows = num_rows;
+        res = write_bfbin_header (fp, header);
+    }
+    // data is already channel major, write it as a single chunk
+    if (res == (int)BrainFlowExitCodes::STATUS_OK)
+    {
+        res = write_bfbin_chunk (fp, data, num_rows, num_cols);
+    }
+    fclose (fp);
+    if (res != (int)BrainFlowExitCodes::STATUS_OK)
+    {
+        data_logger->error ("Failed to write binary file {}", file_name);
+    }
+    return res;
+}
+
+static int read_bfbin_file (
+    double *data, int *num_rows, int *num_cols, const char *file_name, int num_elements)
+{
+    FILE *fp = fopen (file_name, "rb");
+    if (fp == NULL)
+    {
+        data_logger->error ("Couldn't read file {}", file_name);
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    BFBinHeader header;
+    int res = read_bfbin_header (fp, header);
+    if (res != (int)BrainFlowExitCodes::STATUS_OK)
+    {
+        fclose (fp);
+        data_logger->error ("Invalid header in file {}", file_name);
+        return res;
+    }
+    int max_cols = num_elements / header.num_rows;
+    if (max_cols < 1)
+    {
+        fclose (fp);
+        data_logger->error ("Number of elements is less than number of rows in file.");
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    res = read_bfbin_data (fp, header.num_rows, max_cols, data, num_cols);
+    fclose (fp);
+    *num_rows = header.num_rows;
+    return res;
+}
+
+static int get_num_elements_in_bfbin_file (const char *file_name, int *num_elements)
+{
+    FILE *fp = fopen (file_name, "rb");
+    if (fp == NULL)
+    {
+        data_logger->error ("Couldn't read file {}", file_name);
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    BFBinHeader header;
+    long long total_cols = 0;
+    int res = read_bfbin_header (fp, header);
+    if (res == (int)BrainFlowExitCodes::STATUS_OK)
+    {
+        res = get_bfbin_num_cols (fp, header.num_rows, &total_cols);
+    }
+    fclose (fp);
+    if (res != (int)BrainFlowExitCodes::STATUS_OK)
+    {
+        data_logger->error ("Invalid binary file {}", file_name);
+        return res;
+    }
+    if (total_cols == 0)
+    {
+        *num_elements = 0;
+        data_logger->error ("Empty file {}", file_name);
+        return (int)BrainFlowExitCodes::EMPTY_BUFFER_ERROR;
+    }
+    *num_elements = (int)(total_cols * header.num_rows);
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
 int write_file (
     const double *data, int num_rows, int num_cols, const char *file_name, const char *file_mode)
 {
@@ -985,6 +1161,10 @@ int write_file (
         data_logger->error ("Incorrect file_mode. File_mode:{}", file_mode);
         return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
     }
+    if (has_bfbin_extension (file_name))
+    {
+        return write_bfbin_file (data, num_rows, num_cols, file_name, file_mode);
+    }
     FILE *fp;
     fp = fopen (file_name, file_mode);
     if (fp == NULL)
@@ -1015,6 +1195,10 @@ int read_file (double *data, int *num_rows, int *num_cols, const char *file_name
         data_logger->error ("Nummber or elements must be greater than 0.");
         return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
     }
+    if (is_bfbin_file (file_name))
+    {
+        return read_bfbin_file (data, num_rows, num_cols, file_name, num_elements);
+    }
     FILE *fp;
     fp = fopen (file_name, "r");
     if (fp == NULL)
@@ -1120,6 +1304,10 @@ int calc_stddev (double *data, int start_pos, int end_pos, double *output)
 
 int get_num_elements_in_file (const char *file_name, int *num_elements)
 {
+    if (is_bfbin_file (file_name))
+    {
+        return get_num_elements_in_bfbin_file (file_name, num_elements);
+    }
     FILE *fp;
     fp = fopen (file_name, "r");
     if (fp == NULL)
@@ -1428,6 +1616,171 @@ int get_custom_band_powers (double *raw_data, int rows, int cols, double *start_
     return (int)BrainFlowExitCodes::STATUS_OK;
 }
 
+static int check_channels (double *data, int rows, int cols, int *channels, int num_channels)
+{
+    if ((data == NULL) || (channels == NULL) || (rows < 1) || (cols < 1) || (num_channels < 1))
+    {
+        data_logger->error (
+            "Invalid 2d data. Rows:{}, Cols:{}, Num Channels:{}", rows, cols, num_channels);
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    std::vector<bool> used (rows, false);
+    for (int i = 0; i < num_channels; i++)
+    {
+        // duplicates are not allowed since rows are processed inplace in parallel
+        if ((channels[i] < 0) || (channels[i] >= rows) || (used[channels[i]]))
+        {
+            data_logger->error ("Invalid or duplicated channel {}", channels[i]);
+            return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+        }
+        used[channels[i]] = true;
+    }
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
+// calls func (channel_num, row) for each channel in parallel
+template <typename F>
+static int process_channels (
+    double *data, int rows, int cols, int *channels, int num_channels, F func)
+{
+    int res = check_channels (data, rows, cols, channels, num_channels);
+    if (res != (int)BrainFlowExitCodes::STATUS_OK)
+    {
+        return res;
+    }
+    std::vector<int> results (num_channels, (int)BrainFlowExitCodes::STATUS_OK);
+#pragma omp parallel for
+    for (int i = 0; i < num_channels; i++)
+    {
+        results[i] = func (i, data + (size_t)channels[i] * cols);
+    }
+    for (int i = 0; i < num_channels; i++)
+    {
+        if (results[i] != (int)BrainFlowExitCodes::STATUS_OK)
+        {
+            return results[i];
+        }
+    }
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
+int perform_lowpass_2d (double *data, int rows, int cols, int *channels, int num_channels,
+    int sampling_rate, double cutoff, int order, int filter_type, double ripple)
+{
+    return process_channels (data, rows, cols, channels, num_channels,
+        [&] (int, double *row)
+        { return perform_lowpass (row, cols, sampling_rate, cutoff, order, filter_type, ripple); });
+}
+
+int perform_highpass_2d (double *data, int rows, int cols, int *channels, int num_channels,
+    int sampling_rate, double cutoff, int order, int filter_type, double ripple)
+{
+    return process_channels (data, rows, cols, channels, num_channels,
+        [&] (int, double *row) {
+            return perform_highpass (row, cols, sampling_rate, cutoff, order, filter_type, ripple);
+        });
+}
+
+int perform_bandpass_2d (double *data, int rows, int cols, int *channels, int num_channels,
+    int sampling_rate, double start_freq, double stop_freq, int order, int filter_type,
+    double ripple)
+{
+    return process_channels (data, rows, cols, channels, num_channels,
+        [&] (int, double *row)
+        {
+            return perform_bandpass (
+                row, cols, sampling_rate, start_freq, stop_freq, order, filter_type, ripple);
+        });
+}
+
+int perform_bandstop_2d (double *data, int rows, int cols, int *channels, int num_channels,
+    int sampling_rate, double start_freq, double stop_freq, int order, int filter_type,
+    double ripple)
+{
+    return process_channels (data, rows, cols, channels, num_channels,
+        [&] (int, double *row)
+        {
+            return perform_bandstop (
+                row, cols, sampling_rate, start_freq, stop_freq, order, filter_type, ripple);
+        });
+}
+
+int remove_environmental_noise_2d (double *data, int rows, int cols, int *channels,
+    int num_channels, int sampling_rate, int noise_type)
+{
+    return process_channels (data, rows, cols, channels, num_channels,
+        [&] (int, double *row)
+        { return remove_environmental_noise (row, cols, sampling_rate, noise_type); });
+}
+
+int perform_rolling_filter_2d (double *data, int rows, int cols, int *channels, int num_channels,
+    int period, int agg_operation)
+{
+    return process_channels (data, rows, cols, channels, num_channels,
+        [&] (int, double *row)
+        { return perform_rolling_filter (row, cols, period, agg_operation); });
+}
+
+int perform_wavelet_denoising_2d (double *data, int rows, int cols, int *channels, int num_channels,
+    int wavelet, int decomposition_level, int wavelet_denoising, int threshold, int extenstion_type,
+    int noise_level)
+{
+    return process_channels (data, rows, cols, channels, num_channels,
+        [&] (int, double *row)
+        {
+            return perform_wavelet_denoising (row, cols, wavelet, decomposition_level,
+                wavelet_denoising, threshold, extenstion_type, noise_level);
+        });
+}
+
+int detrend_2d (
+    double *data, int rows, int cols, int *channels, int num_channels, int detrend_operation)
+{
+    return process_channels (data, rows, cols, channels, num_channels,
+        [&] (int, double *row) { return detrend (row, cols, detrend_operation); });
+}
+
+int perform_fft_2d (double *data, int rows, int cols, int *channels, int num_channels,
+    int window_function, double *output_re, double *output_im)
+{
+    if ((output_re == NULL) || (output_im == NULL))
+    {
+        data_logger->error ("Output arrays cannot be empty.");
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    size_t output_len = (size_t)cols / 2 + 1;
+    return process_channels (data, rows, cols, channels, num_channels,
+        [&] (int i, double *row)
+        {
+            return perform_fft (
+                row, cols, window_function, output_re + i * output_len, output_im + i * output_len);
+        });
+}
+
+int get_psd_welch_2d (double *data, int rows, int cols, int *channels, int num_channels, int nfft,
+    int overlap, int sampling_rate, int window_function, double *output_ampl, double *output_freq)
+{
+    if ((output_ampl == NULL) || (output_freq == NULL) || (nfft < 2))
+    {
+        data_logger->error ("Output arrays cannot be empty and nfft must be positive.");
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    size_t output_len = (size_t)nfft / 2 + 1;
+    return process_channels (data, rows, cols, channels, num_channels,
+        [&] (int i, double *row)
+        {
+            // freqs are the same for all channels, dont share output buffer between threads
+            std::vector<double> freqs (output_len);
+            int res = get_psd_welch (row, cols, nfft, overlap, sampling_rate, window_function,
+                output_ampl + i * output_len, freqs.data ());
+            if ((res == (int)BrainFlowExitCodes::STATUS_OK) && (i == 0))
+            {
+                memcpy (output_freq, freqs.data (), sizeof (double) * output_len);
+            }
+            return res;
+        });
+}
+
 int get_railed_percentage (double *raw_data, int data_len, int gain, double *output)
 {
     if ((raw_data == NULL) || (data_len < 1) || (gain < 1) || (output == NULL))
@@ -0,0 +1,105 @@
+#include "dsp_plan_cache.h"
+#include "brainflow_constants.h"
+
+#define MAX_FILTER_ORDER 8
+
+
+FftPlan::FftPlan (int nfft, int inverse)
+{
+    this->nfft = nfft;
+    this->inverse = inverse;
+}
+
+FftPlan::~FftPlan ()
+{
+    for (size_t i = 0; i < free_cfgs.size (); i++)
+    {
+        kiss_fftr_free (free_cfgs[i]);
+    }
+    free_cfgs.clear ();
+}
+
+kiss_fftr_cfg FftPlan::acquire ()
+{
+    {
+        std::lock_guard<std::mutex> lock (m);
+        if (!free_cfgs.empty ())
+        {
+            kiss_fftr_cfg cfg = free_cfgs.back ();
+            free_cfgs.pop_back ();
+            return cfg;
+        }
+    }
+    return kiss_fftr_alloc (nfft, inverse, 0, 0);
+}
+
+void FftPlan::release (kiss_fftr_cfg cfg)
+{
+    if (cfg == NULL)
+    {
+        return;
+    }
+    {
+        std::lock_guard<std::mutex> lock (m);
+        if (free_cfgs.size () < FFT_PLAN_MAX_FREE_CFGS)
+        {
+            free_cfgs.push_back (cfg);
+            return;
+        }
+    }
+    kiss_fftr_free (cfg);
+}
+
+size_t FftPlan::get_max_bytes (int nfft, int inverse)
+{
+    // with lenmem kiss_fftr_alloc only computes required size
+    size_t cfg_bytes = 0;
+    kiss_fftr_alloc (nfft, inverse, NULL, &cfg_bytes);
+    return cfg_bytes * FFT_PLAN_MAX_FREE_CFGS;
+}
+
+template <template <int> class Butterworth, template <int> class ChebyshevI,
+    template <int> class Bessel>
+static std::shared_ptr<FilterPlan> create_filter_plan (int filter_type, const Dsp::Params &params)
+{
+    switch (static_cast<FilterTypes> (filter_type))
+    {
+        case FilterTypes::BUTTERWORTH:
+        case FilterTypes::BUTTERWORTH_ZERO_PHASE:
+            return std::make_shared<DesignedFilterPlan<Butterworth<MAX_FILTER_ORDER>>> (params);
+        case FilterTypes::CHEBYSHEV_TYPE_1:
+        case FilterTypes::CHEBYSHEV_TYPE_1_ZERO_PHASE:
+            return std::make_shared<DesignedFilterPlan<ChebyshevI<MAX_FILTER_ORDER>>> (params);
+        case FilterTypes::BESSEL:
+        case FilterTypes::BESSEL_ZERO_PHASE:
+            return std::make_shared<DesignedFilterPlan<Bessel<MAX_FILTER_ORDER>>> (params);
+        default:
+            return nullptr;
+    }
+}
+
+std::shared_ptr<FilterPlan> FilterPlan::create (
+    int filter_operation, int filter_type, const Dsp::Params &params)
+{
+    switch (static_cast<FilterOperations> (filter_operation))
+    {
+        case FilterOperations::LOWPASS:
+            return create_filter_plan<Dsp::Butterworth::Design::LowPass,
+                Dsp::ChebyshevI::Design::LowPass, Dsp::Bessel::Design::LowPass> (
+                filter_type, params);
+        case FilterOperations::HIGHPASS:
+            return create_filter_plan<Dsp::Butterworth::Design::HighPass,
+                Dsp::ChebyshevI::Design::HighPass, Dsp::Bessel::Design::HighPass> (
+                filter_type, params);
+        case FilterOperations::BANDPASS:
+            return create_filter_plan<Dsp::Butterworth::Design::BandPass,
+                Dsp::ChebyshevI::Design::BandPass, Dsp::Bessel::Design::BandPass> (
+                filter_type, params);
+        case FilterOperations::BANDSTOP:
+            return create_filter_plan<Dsp::Butterworth::Design::BandStop,
+                Dsp::ChebyshevI::Design::BandStop, Dsp::Bessel::Design::BandStop> (
+                filter_type, params);
+        default:
+            return nullptr;
+    }
+}
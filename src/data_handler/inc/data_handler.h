@@ -70,6 +70,52 @@ extern "C"
     SHARED_EXPORT int CALLING_CONVENTION perform_ica (double *data, int rows, int cols,
         int num_components, double *w_mat, double *k_mat, double *a_mat, double *s_mat);
 
+    // multichannel versions, process rows from channels array of [rows x cols] data in parallel
+    SHARED_EXPORT int CALLING_CONVENTION perform_lowpass_2d (double *data, int rows, int cols,
+        int *channels, int num_channels, int sampling_rate, double cutoff, int order,
+        int filter_type, double ripple);
+    SHARED_EXPORT int CALLING_CONVENTION perform_highpass_2d (double *data, int rows, int cols,
+        int *channels, int num_channels, int sampling_rate, double cutoff, int order,
+        int filter_type, double ripple);
+    SHARED_EXPORT int CALLING_CONVENTION perform_bandpass_2d (double *data, int rows, int cols,
+        int *channels, int num_channels, int sampling_rate, double start_freq, double stop_freq,
+        int order, int filter_type, double ripple);
+    SHARED_EXPORT int CALLING_CONVENTION perform_bandstop_2d (double *data, int rows, int cols,
+        int *channels, int num_channels, int sampling_rate, double start_freq, double stop_freq,
+        int order, int filter_type, double ripple);
+    SHARED_EXPORT int CALLING_CONVENTION remove_environmental_noise_2d (double *data, int rows,
+        int cols, int *channels, int num_channels, int sampling_rate, int noise_type);
+    SHARED_EXPORT int CALLING_CONVENTION perform_rolling_filter_2d (double *data, int rows,
+        int cols, int *channels, int num_channels, int period, int agg_operation);
+    SHARED_EXPORT int CALLING_CONVENTION perform_wavelet_denoising_2d (double *data, int rows,
+        int cols, int *channels, int num_channels, int wavelet, int decomposition_level,
+        int wavelet_denoising, int threshold, int extenstion_type, int noise_level);
+    SHARED_EXPORT int CALLING_CONVENTION detrend_2d (
+        double *data, int rows, int cols, int *channels, int num_channels, int detrend_operation);
+    // output arrays are [num_channels x (cols / 2 + 1)]
+    SHARED_EXPORT int CALLING_CONVENTION perform_fft_2d (double *data, int rows, int cols,
+        int *channels, int num_channels, int window_function, double *output_re, double *output_im);
+    // output_ampl is [num_channels x (nfft / 2 + 1)], output_freq is [nfft / 2 + 1]
+    SHARED_EXPORT int CALLING_CONVENTION get_psd_welch_2d (double *data, int rows, int cols,
+        int *channels, int num_channels, int nfft, int overlap, int sampling_rate,
+        int window_function, double *output_ampl, double *output_freq);
+
+    // stateful filters for streaming data, filter_id is used as a handle
+    SHARED_EXPORT int CALLING_CONVENTION create_filter (int filter_operation, int num_channels,
+        int sampling_rate, double start_freq, double stop_freq, int order, int filter_type,
+        double ripple, int *filter_id);
+    SHARED_EXPORT int CALLING_CONVENTION create_environmental_noise_filter (
+        int num_channels, int sampling_rate, int noise_type, int *filter_id);
+    SHARED_EXPORT int CALLING_CONVENTION process_filter (
+        int filter_id, double *data, int num_channels, int data_len);
+    SHARED_EXPORT int CALLING_CONVENTION reset_filter (int filter_id);
+    SHARED_EXPORT int CALLING_CONVENTION release_filter (int filter_id);
+
+    // filter designs, fft setups and windows are cached between calls with the same params
+    SHARED_EXPORT int CALLING_CONVENTION get_dsp_cache_stats (
+        long long *hits, long long *misses, int *num_plans);
+    SHARED_EXPORT int CALLING_CONVENTION clear_dsp_cache ();
+
     // logging methods
     SHARED_EXPORT int CALLING_CONVENTION set_log_level_data_handler (int log_level);
     SHARED_EXPORT int CALLING_CONVENTION set_log_file_data_handler (const char *log_file);
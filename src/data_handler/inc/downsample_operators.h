@@ -32,3 +32,13 @@ inline double downsample_median (double *data, int len)
     std::sort (values.begin (), values.end ());
     return values[len / 2];
 }
+
+inline double downsample_min (double *data, int len)
+{
+    return *std::min_element (data, data + len);
+}
+
+inline double downsample_max (double *data, int len)
+{
+    return *std::max_element (data, data + len);
+}
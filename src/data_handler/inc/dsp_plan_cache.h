@@ -0,0 +1,88 @@
+#pragma once
+
+#include <algorithm>
+#include <memory>
+#include <mutex>
+#include <vector>
+
+#include "lru_cache.h"
+
+#include "DspFilters/Dsp.h"
+
+#include "kiss_fftr.h"
+
+#define DSP_PLAN_CACHE_SIZE 64
+// limit for each cache, plans for long data are not cached if they dont fit
+#define DSP_PLAN_CACHE_MAX_BYTES (32 * 1024 * 1024)
+// cfgs of concurrent callers above this number are freed after use
+#define FFT_PLAN_MAX_FREE_CFGS 4
+
+
+// kiss_fftr uses scratch memory from cfg, so cfg can not be shared between threads. Plan keeps
+// up to FFT_PLAN_MAX_FREE_CFGS cfgs with precomputed twiddles and gives each concurrent caller its
+// own cfg
+class FftPlan
+{
+
+public:
+    FftPlan (int nfft, int inverse);
+    ~FftPlan ();
+
+    // returns NULL if cfg can not be allocated, returned cfg must be released
+    kiss_fftr_cfg acquire ();
+    void release (kiss_fftr_cfg cfg);
+
+    // max memory kept by plan
+    static size_t get_max_bytes (int nfft, int inverse);
+
+private:
+    int nfft;
+    int inverse;
+    std::vector<kiss_fftr_cfg> free_cfgs;
+    std::mutex m;
+};
+
+// designed IIR filter, coefficients are immutable and state is created for each call
+class FilterPlan
+{
+
+public:
+    virtual ~FilterPlan ()
+    {
+    }
+
+    // filters data inplace, for zero phase data is filtered forward and backward
+    virtual void process (double *data, int data_len, bool zero_phase) const = 0;
+
+    // returns nullptr for unsupported operation or filter type, zero phase types are mapped to
+    // their causal versions
+    static std::shared_ptr<FilterPlan> create (
+        int filter_operation, int filter_type, const Dsp::Params &params);
+};
+
+template <class DesignClass>
+class DesignedFilterPlan : public FilterPlan
+{
+
+public:
+    DesignedFilterPlan (const Dsp::Params &params)
+    {
+        design.setParams (params);
+    }
+
+    void process (double *data, int data_len, bool zero_phase) const
+    {
+        typename DesignClass::template State<Dsp::DirectFormII> state;
+        design.process (data_len, data, state);
+        if (zero_phase)
+        {
+            // backward pass continues with the state from forward pass
+            std::reverse (data, data + data_len);
+            design.process (data_len, data, state);
+            std::reverse (data, data + data_len);
+        }
+    }
+
+private:
+    DesignClass design;
+};
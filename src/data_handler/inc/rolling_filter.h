@@ -1,7 +1,8 @@
 #pragma once
 
-#include <deque>
-#include <set>
+#include <functional>
+#include <utility>
+#include <vector>
 
 template <typename T>
 class RollingFilter
@@ -24,80 +25,318 @@ public:
     virtual T get_value () = 0;
 };
 
+// median over the last period values using two indexed heaps, lower half is a max heap and upper
+// half is a min heap. Each value in the window knows its position in a heap, so the oldest value
+// is replaced in place and only one sift is required per sample. O(log(period)) per sample and no
+// allocations after construction
 template <typename T>
 class RollingMedian : public RollingFilter<T>
 {
 
 private:
-    std::multiset<T> dataset;
-    std::deque<T> deque;
+    std::vector<T> values; // ring buffer with values in window
+    std::vector<int> lo;   // max heap with ids of values
+    std::vector<int> hi;   // min heap with ids of values
+    std::vector<int> heap_pos;
+    std::vector<bool> in_lo;
+    int lo_size;
+    int hi_size;
+    int count;
+    int oldest;
+    T last;
+
+    bool heap_less (bool is_lo, int first, int second)
+    {
+        // returns true if first element should be closer to the root
+        if (is_lo)
+        {
+            return values[first] > values[second];
+        }
+        return values[first] < values[second];
+    }
+
+    void heap_swap (bool is_lo, int i, int j)
+    {
+        std::vector<int> &heap = is_lo ? lo : hi;
+        std::swap (heap[i], heap[j]);
+        heap_pos[heap[i]] = i;
+        heap_pos[heap[j]] = j;
+    }
+
+    void sift_up (bool is_lo, int i)
+    {
+        std::vector<int> &heap = is_lo ? lo : hi;
+        while (i > 0)
+        {
+            int parent = (i - 1) / 2;
+            if (!heap_less (is_lo, heap[i], heap[parent]))
+            {
+                break;
+            }
+            heap_swap (is_lo, i, parent);
+            i = parent;
+        }
+    }
+
+    void sift_down (bool is_lo, int i)
+    {
+        std::vector<int> &heap = is_lo ? lo : hi;
+        int size = is_lo ? lo_size : hi_size;
+        while (true)
+        {
+            int best = i;
+            int left = 2 * i + 1;
+            int right = left + 1;
+            if ((left < size) && (heap_less (is_lo, heap[left], heap[best])))
+            {
+                best = left;
+            }
+            if ((right < size) && (heap_less (is_lo, heap[right], heap[best])))
+            {
+                best = right;
+            }
+            if (best == i)
+            {
+                break;
+            }
+            heap_swap (is_lo, i, best);
+            i = best;
+        }
+    }
+
+    void push (bool is_lo, int id)
+    {
+        std::vector<int> &heap = is_lo ? lo : hi;
+        int &size = is_lo ? lo_size : hi_size;
+        heap[size] = id;
+        heap_pos[id] = size;
+        in_lo[id] = is_lo;
+        size++;
+        sift_up (is_lo, size - 1);
+    }
+
+    int pop (bool is_lo)
+    {
+        std::vector<int> &heap = is_lo ? lo : hi;
+        int &size = is_lo ? lo_size : hi_size;
+        int id = heap[0];
+        size--;
+        if (size > 0)
+        {
+            heap[0] = heap[size];
+            heap_pos[heap[0]] = 0;
+            sift_down (is_lo, 0);
+        }
+        return id;
+    }
+
+    void fix_heaps ()
+    {
+        // after replacement both heaps keep their sizes, at most one pair is out of order
+        if ((lo_size > 0) && (hi_size > 0) && (values[lo[0]] > values[hi[0]]))
+        {
+            std::swap (lo[0], hi[0]);
+            heap_pos[lo[0]] = 0;
+            heap_pos[hi[0]] = 0;
+            in_lo[lo[0]] = true;
+            in_lo[hi[0]] = false;
+            sift_down (true, 0);
+            sift_down (false, 0);
+        }
+    }
+
+    void insert (int id)
+    {
+        if ((lo_size == 0) || (values[id] <= values[lo[0]]))
+        {
+            push (true, id);
+        }
+        else
+        {
+            push (false, id);
+        }
+        // lower half has the same size as upper half or one more element
+        if (lo_size > hi_size + 1)
+        {
+            push (false, pop (true));
+        }
+        else if (hi_size > lo_size)
+        {
+            push (true, pop (false));
+        }
+    }
 
 public:
-    RollingMedian (int period) : RollingFilter<T> (period)
+    RollingMedian (int period)
+        : RollingFilter<T> (period)
+        , values (period)
+        , lo (period / 2 + 1)
+        , hi (period / 2 + 1)
+        , heap_pos (period)
+        , in_lo (period)
     {
+        lo_size = 0;
+        hi_size = 0;
+        count = 0;
+        oldest = 0;
+        last = 0;
     }
 
     void add_data (T num)
     {
-        this->deque.push_back (num);
-        this->dataset.insert (num);
+        last = num;
+        if (count < this->period)
+        {
+            values[count] = num;
+            insert (count);
+            count++;
+            return;
+        }
+        // replace the oldest value inplace
+        int id = oldest;
+        oldest = (oldest + 1) % this->period;
+        bool is_lo = in_lo[id];
+        values[id] = num;
+        sift_up (is_lo, heap_pos[id]);
+        sift_down (is_lo, heap_pos[id]);
+        fix_heaps ();
     }
 
-    // https://leetcode.com/problems/sliding-window-median/
     T get_value ()
     {
-        if ((int)this->dataset.size () < this->period)
+        if (count < this->period)
         {
             // to simplify algorithm if there are less data just return the last value
-            return this->deque.back ();
-        }
-        auto it1 = this->dataset.begin ();
-        auto it2 = it1;
-        std::advance (it1, (this->period - 1) / 2);
-        it2 = it1;
-        std::advance (it2, (int)((this->period & 1) == 0));
-        T res = (*it1 + *it2) / 2.0;
-        T val = deque.front ();
-        deque.pop_front ();
-        this->dataset.erase (this->dataset.find (val));
-        return res;
+            return last;
+        }
+        if ((this->period & 1) == 0)
+        {
+            return (values[lo[0]] + values[hi[0]]) / 2.0;
+        }
+        return values[lo[0]];
     }
 };
 
+// sum over the last period values stored in a ring buffer
 template <typename T>
-class RollingAverage : public RollingFilter<T>
+class RollingSum : public RollingFilter<T>
 {
 
-private:
-    std::deque<T> dataset;
+protected:
+    std::vector<T> values;
+    int count;
+    int oldest;
     T sum;
 
 public:
-    RollingAverage (int period) : RollingFilter<T> (period)
+    RollingSum (int period) : RollingFilter<T> (period), values (period)
     {
-        this->sum = 0;
+        count = 0;
+        oldest = 0;
+        sum = 0;
     }
 
     void add_data (T num)
     {
-        this->sum += num;
-        this->dataset.push_back (num);
-        if ((int)this->dataset.size () > this->period)
+        sum += num;
+        if (count < this->period)
         {
-            this->sum -= this->dataset.front ();
-            this->dataset.pop_front ();
+            values[count] = num;
+            count++;
+        }
+        else
+        {
+            sum -= values[oldest];
+            values[oldest] = num;
+            oldest = (oldest + 1) % this->period;
         }
     }
 
     T get_value ()
     {
-        if ((int)this->dataset.size () < this->period)
+        return sum;
+    }
+};
+
+template <typename T>
+class RollingAverage : public RollingSum<T>
+{
+
+public:
+    RollingAverage (int period) : RollingSum<T> (period)
+    {
+    }
+
+    T get_value ()
+    {
+        return this->sum / this->count;
+    }
+};
+
+// min or max over the last period values, uses monotonic queue stored in a ring buffer,
+// amortized O(1) per sample
+template <typename T, typename Compare>
+class RollingExtremum : public RollingFilter<T>
+{
+
+private:
+    std::vector<T> queue_values;
+    std::vector<long long> queue_ids;
+    int head;
+    int size;
+    long long count;
+    Compare compare;
+
+public:
+    RollingExtremum (int period)
+        : RollingFilter<T> (period), queue_values (period), queue_ids (period)
+    {
+        head = 0;
+        size = 0;
+        count = 0;
+    }
+
+    void add_data (T num)
+    {
+        // drop values which can not be an extremum anymore
+        while ((size > 0) && (!compare (queue_values[(head + size - 1) % this->period], num)))
         {
-            return this->sum / this->dataset.size ();
+            size--;
         }
-        else
+        if ((size > 0) && (queue_ids[head] <= count - this->period))
         {
-            return this->sum / this->period;
+            head = (head + 1) % this->period;
+            size--;
         }
+        int tail = (head + size) % this->period;
+        queue_values[tail] = num;
+        queue_ids[tail] = count;
+        size++;
+        count++;
+    }
+
+    T get_value ()
+    {
+        return queue_values[head];
+    }
+};
+
+template <typename T>
+class RollingMin : public RollingExtremum<T, std::less<T>>
+{
+
+public:
+    RollingMin (int period) : RollingExtremum<T, std::less<T>> (period)
+    {
+    }
+};
+
+template <typename T>
+class RollingMax : public RollingExtremum<T, std::greater<T>>
+{
+
+public:
+    RollingMax (int period) : RollingExtremum<T, std::greater<T>> (period)
+    {
     }
 };
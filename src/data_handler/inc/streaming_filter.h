@@ -0,0 +1,35 @@
+#pragma once
+
+#include <mutex>
+#include <vector>
+
+#include "DspFilters/Dsp.h"
+
+
+// causal IIR filter which keeps state between calls, each channel has its own state
+class StreamingFilter
+{
+
+public:
+    StreamingFilter (int num_channels);
+    ~StreamingFilter ();
+
+    // stages are applied one after another, e.g. to remove both 50 and 60 Hz
+    int add_stage (int filter_operation, int sampling_rate, double start_freq, double stop_freq,
+        int order, int filter_type, double ripple);
+    // data is row major [num_channels x data_len], filtered inplace
+    int process (double *data, int num_channels, int data_len);
+    void reset ();
+
+    int get_num_channels ()
+    {
+        return num_channels;
+    }
+
+private:
+    int num_channels;
+    std::vector<std::vector<Dsp::Filter *>> stages;
+    std::mutex lock;
+
+    static Dsp::Filter *create_dsp_filter (int filter_operation, int filter_type);
+};
@@ -0,0 +1,173 @@
+#include "streaming_filter.h"
+#include "brainflow_constants.h"
+
+#define MAX_FILTER_ORDER 8
+
+
+StreamingFilter::StreamingFilter (int num_channels)
+{
+    this->num_channels = num_channels;
+}
+
+StreamingFilter::~StreamingFilter ()
+{
+    for (size_t i = 0; i < stages.size (); i++)
+    {
+        for (size_t j = 0; j < stages[i].size (); j++)
+        {
+            delete stages[i][j];
+        }
+    }
+    stages.clear ();
+}
+
+Dsp::Filter *StreamingFilter::create_dsp_filter (int filter_operation, int filter_type)
+{
+    switch (static_cast<FilterOperations> (filter_operation))
+    {
+        case FilterOperations::LOWPASS:
+            switch (static_cast<FilterTypes> (filter_type))
+            {
+                case FilterTypes::BUTTERWORTH:
+                    return new Dsp::FilterDesign<
+                        Dsp::Butterworth::Design::LowPass<MAX_FILTER_ORDER>, 1> ();
+                case FilterTypes::CHEBYSHEV_TYPE_1:
+                    return new Dsp::FilterDesign<Dsp::ChebyshevI::Design::LowPass<MAX_FILTER_ORDER>,
+                        1> ();
+                case FilterTypes::BESSEL:
+                    return new Dsp::FilterDesign<Dsp::Bessel::Design::LowPass<MAX_FILTER_ORDER>,
+                        1> ();
+                default:
+                    return NULL;
+            }
+        case FilterOperations::HIGHPASS:
+            switch (static_cast<FilterTypes> (filter_type))
+            {
+                case FilterTypes::BUTTERWORTH:
+                    return new Dsp::FilterDesign<
+                        Dsp::Butterworth::Design::HighPass<MAX_FILTER_ORDER>, 1> ();
+                case FilterTypes::CHEBYSHEV_TYPE_1:
+                    return new Dsp::FilterDesign<
+                        Dsp::ChebyshevI::Design::HighPass<MAX_FILTER_ORDER>, 1> ();
+                case FilterTypes::BESSEL:
+                    return new Dsp::FilterDesign<Dsp::Bessel::Design::HighPass<MAX_FILTER_ORDER>,
+                        1> ();
+                default:
+                    return NULL;
+            }
+        case FilterOperations::BANDPASS:
+            switch (static_cast<FilterTypes> (filter_type))
+            {
+                case FilterTypes::BUTTERWORTH:
+                    return new Dsp::FilterDesign<
+                        Dsp::Butterworth::Design::BandPass<MAX_FILTER_ORDER>, 1> ();
+                case FilterTypes::CHEBYSHEV_TYPE_1:
+                    return new Dsp::FilterDesign<
+                        Dsp::ChebyshevI::Design::BandPass<MAX_FILTER_ORDER>, 1> ();
+                case FilterTypes::BESSEL:
+                    return new Dsp::FilterDesign<Dsp::Bessel::Design::BandPass<MAX_FILTER_ORDER>,
+                        1> ();
+                default:
+                    return NULL;
+            }
+        case FilterOperations::BANDSTOP:
+            switch (static_cast<FilterTypes> (filter_type))
+            {
+                case FilterTypes::BUTTERWORTH:
+                    return new Dsp::FilterDesign<
+                        Dsp::Butterworth::Design::BandStop<MAX_FILTER_ORDER>, 1> ();
+                case FilterTypes::CHEBYSHEV_TYPE_1:
+                    return new Dsp::FilterDesign<
+                        Dsp::ChebyshevI::Design::BandStop<MAX_FILTER_ORDER>, 1> ();
+                case FilterTypes::BESSEL:
+                    return new Dsp::FilterDesign<Dsp::Bessel::Design::BandStop<MAX_FILTER_ORDER>,
+                        1> ();
+                default:
+                    return NULL;
+            }
+        default:
+            return NULL;
+    }
+}
+
+int StreamingFilter::add_stage (int filter_operation, int sampling_rate, double start_freq,
+    double stop_freq, int order, int filter_type, double ripple)
+{
+    if ((order < 1) || (order > MAX_FILTER_ORDER) || (sampling_rate < 1) || (start_freq < 0))
+    {
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    bool is_band = (filter_operation == (int)FilterOperations::BANDPASS) ||
+        (filter_operation == (int)FilterOperations::BANDSTOP);
+    if ((is_band) && (stop_freq <= start_freq))
+    {
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+
+    Dsp::Params params;
+    params[0] = sampling_rate; // sample rate
+    params[1] = order;         // order
+    if (is_band)
+    {
+        params[2] = (start_freq + stop_freq) / 2.0; // center freq
+        params[3] = stop_freq - start_freq;         // band width
+        params[4] = ripple;                         // ripple, used only by chebyshev
+    }
+    else
+    {
+        params[2] = start_freq; // cutoff
+        params[3] = ripple;     // ripple, used only by chebyshev
+    }
+
+    std::vector<Dsp::Filter *> stage;
+    for (int i = 0; i < num_channels; i++)
+    {
+        // zero phase filters are not causal and cant be used for streaming
+        Dsp::Filter *f = create_dsp_filter (filter_operation, filter_type);
+        if (f == NULL)
+        {
+            for (size_t j = 0; j < stage.size (); j++)
+            {
+                delete stage[j];
+            }
+            return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+        }
+        f->setParams (params);
+        stage.push_back (f);
+    }
+
+    std::lock_guard<std::mutex> lock_guard (lock);
+    stages.push_back (stage);
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
+int StreamingFilter::process (double *data, int num_channels, int data_len)
+{
+    if ((data == NULL) || (num_channels != this->num_channels) || (data_len < 1))
+    {
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    std::lock_guard<std::mutex> lock_guard (lock);
+    for (size_t i = 0; i < stages.size (); i++)
+    {
+        for (int j = 0; j < num_channels; j++)
+        {
+            double *filter_data[1];
+            filter_data[0] = data + (size_t)j * data_len;
+            stages[i][j]->process (data_len, filter_data);
+        }
+    }
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
+void StreamingFilter::reset ()
+{
+    std::lock_guard<std::mutex> lock_guard (lock);
+    for (size_t i = 0; i < stages.size (); i++)
+    {
+        for (size_t j = 0; j < stages[i].size (); j++)
+        {
+            stages[i][j]->reset ();
+        }
+    }
+}
@@ -30,9 +30,14 @@ enable_testing()
 SET (TESTS_SRC
     ${CMAKE_CURRENT_SOURCE_DIR}/src/utils/bluetooth/bluetooth_functions.cpp
     ${CMAKE_CURRENT_SOURCE_DIR}/src/utils/data_buffer.cpp
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/utils/lock_free_data_buffer.cpp
     ${CMAKE_CURRENT_SOURCE_DIR}/src/tests/utils/bluetooth/socket_bluetooth_test.cpp
     ${CMAKE_CURRENT_SOURCE_DIR}/src/tests/utils/bluetooth/bluetooth_functions_unittest.cpp
     ${CMAKE_CURRENT_SOURCE_DIR}/src/tests/utils/data_buffer_unittest.cpp
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/tests/utils/lock_free_data_buffer_unittest.cpp
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/tests/utils/lru_cache_unittest.cpp
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/tests/utils/marker_queue_unittest.cpp
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/tests/utils/rolling_filter_unittest.cpp
 )
 
 add_executable(
@@ -43,6 +48,7 @@ add_executable(
 target_include_directories (
     ${TESTS_EXE_NAME} PRIVATE
     ${CMAKE_CURRENT_SOURCE_DIR}/src/utils/inc
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/data_handler/inc
     ${CMAKE_CURRENT_SOURCE_DIR}/src/utils/bluetooth/inc
     ${CMAKE_CURRENT_SOURCE_DIR}/src/tests/utils/bluetooth/inc
     ${CMAKE_CURRENT_SOURCE_DIR}/src/utils/bluetooth/macos_third_party
@@ -61,4 +67,98 @@ set_target_properties (${TESTS_EXE_NAME}
 )
 
 include(GoogleTest)
-gtest_discover_tests(${TESTS_EXE_NAME})
\ No newline at end of file
+gtest_discover_tests(${TESTS_EXE_NAME})
+
+SET (DATA_BUFFER_BENCHMARK_NAME "data_buffer_benchmark")
+
+add_executable (
+    ${DATA_BUFFER_BENCHMARK_NAME}
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/utils/data_buffer.cpp
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/utils/lock_free_data_buffer.cpp
+    ${CMAKE_CURRENT_SOURCE_DIR}/benchmark/native/data_buffer_benchmark.cpp
+)
+
+target_include_directories (
+    ${DATA_BUFFER_BENCHMARK_NAME} PRIVATE
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/utils/inc
+)
+
+if (UNIX)
+    target_link_libraries (${DATA_BUFFER_BENCHMARK_NAME} PRIVATE pthread)
+endif (UNIX)
+
+set_target_properties (${DATA_BUFFER_BENCHMARK_NAME}
+    PROPERTIES
+    ARCHIVE_OUTPUT_DIRECTORY ${CMAKE_CURRENT_SOURCE_DIR}/build/tests
+    LIBRARY_OUTPUT_DIRECTORY ${CMAKE_CURRENT_SOURCE_DIR}/build/tests
+    RUNTIME_OUTPUT_DIRECTORY ${CMAKE_CURRENT_SOURCE_DIR}/build/tests
+)
+
+SET (RECORDING_FORMAT_BENCHMARK_NAME "recording_format_benchmark")
+
+add_executable (
+    ${RECORDING_FORMAT_BENCHMARK_NAME}
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/utils/bfbin_file.cpp
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/board_controller/file_streamer.cpp
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/board_controller/bfbin_file_streamer.cpp
+    ${CMAKE_CURRENT_SOURCE_DIR}/benchmark/native/recording_format_benchmark.cpp
+)
+
+target_include_directories (
+    ${RECORDING_FORMAT_BENCHMARK_NAME} PRIVATE
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/utils/inc
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/board_controller/inc
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/data_handler/inc
+)
+
+target_link_libraries (${RECORDING_FORMAT_BENCHMARK_NAME} PRIVATE ${DATA_HANDLER_NAME})
+
+set_target_properties (${RECORDING_FORMAT_BENCHMARK_NAME}
+    PROPERTIES
+    ARCHIVE_OUTPUT_DIRECTORY ${CMAKE_CURRENT_SOURCE_DIR}/build/tests
+    LIBRARY_OUTPUT_DIRECTORY ${CMAKE_CURRENT_SOURCE_DIR}/build/tests
+    RUNTIME_OUTPUT_DIRECTORY ${CMAKE_CURRENT_SOURCE_DIR}/build/tests
+)
+
+SET (PUSH_PACKAGE_BENCHMARK_NAME "push_package_benchmark")
+
+add_executable (
+    ${PUSH_PACKAGE_BENCHMARK_NAME}
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/utils/data_buffer.cpp
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/board_controller/brainflow_boards.cpp
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/board_controller/preset_layout.cpp
+    ${CMAKE_CURRENT_SOURCE_DIR}/benchmark/native/push_package_benchmark.cpp
+)
+
+target_include_directories (
+    ${PUSH_PACKAGE_BENCHMARK_NAME} PRIVATE
+    ${CMAKE_CURRENT_SOURCE_DIR}/third_party/json
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/utils/inc
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/board_controller/inc
+)
+
+set_target_properties (${PUSH_PACKAGE_BENCHMARK_NAME}
+    PROPERTIES
+    ARCHIVE_OUTPUT_DIRECTORY ${CMAKE_CURRENT_SOURCE_DIR}/build/tests
+    LIBRARY_OUTPUT_DIRECTORY ${CMAKE_CURRENT_SOURCE_DIR}/build/tests
+    RUNTIME_OUTPUT_DIRECTORY ${CMAKE_CURRENT_SOURCE_DIR}/build/tests
+)
+
+SET (ROLLING_FILTER_BENCHMARK_NAME "rolling_filter_benchmark")
+
+add_executable (
+    ${ROLLING_FILTER_BENCHMARK_NAME}
+    ${CMAKE_CURRENT_SOURCE_DIR}/benchmark/native/rolling_filter_benchmark.cpp
+)
+
+target_include_directories (
+    ${ROLLING_FILTER_BENCHMARK_NAME} PRIVATE
+    ${CMAKE_CURRENT_SOURCE_DIR}/src/data_handler/inc
+)
+
+set_target_properties (${ROLLING_FILTER_BENCHMARK_NAME}
+    PROPERTIES
+    ARCHIVE_OUTPUT_DIRECTORY ${CMAKE_CURRENT_SOURCE_DIR}/build/tests
+    LIBRARY_OUTPUT_DIRECTORY ${CMAKE_CURRENT_SOURCE_DIR}/build/tests
+    RUNTIME_OUTPUT_DIRECTORY ${CMAKE_CURRENT_SOURCE_DIR}/build/tests
+)
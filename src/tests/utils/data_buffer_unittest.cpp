@@ -1,4 +1,5 @@
 #include <array>
+#include <chrono>
 #include <future>
 #include <gmock/gmock-matchers.h>
 #include <gmock/gmock.h>
@@ -424,4 +425,324 @@ TEST (DataBufferTest, IsReady_BufferSizeIsZero_ReturnFalse)
 {
     DataBuffer buffer_zero (4, 0);
     EXPECT_EQ (buffer_zero.is_ready (), false);
-}
\ No newline at end of file
+}
+TEST (DataBufferTest, GetDataTransposed_ZeroOutputCols_ReturnRowMajorTightlyPacked)
+{
+    DataBuffer buffer (2, 4);
+    double first_values[2] = {1.0, 2.0};
+    double second_values[2] = {3.0, 4.0};
+    double third_values[2] = {5.0, 6.0};
+
+    buffer.add_data (first_values);
+    buffer.add_data (second_values);
+    buffer.add_data (third_values);
+
+    double retrieved[6];
+    auto result = buffer.get_data_transposed (3, retrieved, 0);
+
+    EXPECT_EQ (result, 3);
+    EXPECT_EQ (buffer.get_data_count (), 0);
+    double expected[6] = {1.0, 3.0, 5.0, 2.0, 4.0, 6.0};
+    for (int i = 0; i < 6; i++)
+    {
+        EXPECT_EQ (retrieved[i], expected[i]);
+    }
+}
+
+TEST (DataBufferTest, GetDataTransposed_OutputColsLessThanAvailableCount_ReturnOutputColsElements)
+{
+    DataBuffer buffer (2, 4);
+    double values[2] = {1.0, 2.0};
+
+    for (int i = 0; i < 3; i++)
+    {
+        buffer.add_data (values);
+    }
+
+    double retrieved[4];
+    auto result = buffer.get_data_transposed (3, retrieved, 2);
+
+    EXPECT_EQ (result, 2);
+    EXPECT_EQ (buffer.get_data_count (), 1);
+}
+
+TEST (DataBufferTest, GetCurrentDataTransposed_BufferWrappedAround_ReturnLatestWithOutputStride)
+{
+    DataBuffer buffer (2, 2);
+    double first_values[2] = {1.0, 2.0};
+    double second_values[2] = {3.0, 4.0};
+    double third_values[2] = {5.0, 6.0};
+
+    buffer.add_data (first_values);
+    buffer.add_data (second_values);
+    buffer.add_data (third_values);
+
+    double retrieved[8] = {0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0};
+    auto result = buffer.get_current_data_transposed (2, retrieved, 4);
+
+    EXPECT_EQ (result, 2);
+    EXPECT_EQ (buffer.get_data_count (), 2);
+    double expected[8] = {3.0, 5.0, 0.0, 0.0, 4.0, 6.0, 0.0, 0.0};
+    for (int i = 0; i < 8; i++)
+    {
+        EXPECT_EQ (retrieved[i], expected[i]);
+    }
+}
+
+TEST (DataBufferTest, WaitForData_EnoughDataAlreadyAvailable_ReturnImmediately)
+{
+    DataBuffer buffer (1, 4);
+    double value = 1.0;
+    buffer.add_data (&value);
+    buffer.add_data (&value);
+
+    EXPECT_TRUE (buffer.wait_for_data (2, 0));
+}
+
+TEST (DataBufferTest, WaitForData_NotEnoughData_ReturnFalseAfterTimeout)
+{
+    DataBuffer buffer (1, 4);
+    double value = 1.0;
+    buffer.add_data (&value);
+
+    auto start = std::chrono::steady_clock::now ();
+    EXPECT_FALSE (buffer.wait_for_data (2, 50));
+    EXPECT_GE (std::chrono::steady_clock::now () - start, std::chrono::milliseconds (50));
+}
+
+TEST (DataBufferTest, WaitForData_DataAddedFromAnotherThread_WakeUpWhenThresholdReached)
+{
+    DataBuffer buffer (1, 100);
+    std::future<bool> waiter =
+        std::async (std::launch::async, [&buffer] { return buffer.wait_for_data (50, 10000); });
+    std::future<bool> small_waiter =
+        std::async (std::launch::async, [&buffer] { return buffer.wait_for_data (10, 10000); });
+    for (int i = 0; i < 50; i++)
+    {
+        double value = (double)i;
+        buffer.add_data (&value);
+        std::this_thread::sleep_for (std::chrono::microseconds (100));
+    }
+
+    EXPECT_TRUE (small_waiter.get ());
+    EXPECT_TRUE (waiter.get ());
+    EXPECT_EQ (buffer.get_data_count (), 50);
+}
+
+TEST (DataBufferTest, WaitForData_StopWaiting_ReturnFalseImmediately)
+{
+    DataBuffer buffer (1, 4);
+    std::future<bool> waiter =
+        std::async (std::launch::async, [&buffer] { return buffer.wait_for_data (2, 10000); });
+    std::this_thread::sleep_for (std::chrono::milliseconds (10));
+    buffer.stop_waiting ();
+
+    EXPECT_EQ (waiter.wait_for (std::chrono::seconds (5)), std::future_status::ready);
+    EXPECT_FALSE (waiter.get ());
+    EXPECT_FALSE (buffer.wait_for_data (2, 10000));
+}
+
+TEST (DataBufferTest, GetNewDataTransposed_TwoCursors_EachCursorGetsAllPackages)
+{
+    DataBuffer buffer (2, 8);
+    unsigned long long first_cursor = buffer.get_total_count ();
+    unsigned long long second_cursor = first_cursor;
+    for (int i = 0; i < 4; i++)
+    {
+        double values[2] = {(double)i, (double)(i + 10)};
+        buffer.add_data (values);
+    }
+    double retrieved[8];
+    size_t missed = 1;
+
+    EXPECT_EQ (buffer.get_new_data_transposed (first_cursor, 3, retrieved, 0, missed), 3);
+    EXPECT_EQ (missed, 0);
+    double expected_first[6] = {0.0, 1.0, 2.0, 10.0, 11.0, 12.0};
+    for (int i = 0; i < 6; i++)
+    {
+        EXPECT_EQ (retrieved[i], expected_first[i]);
+    }
+    EXPECT_EQ (buffer.get_new_data_count (first_cursor), 1);
+    EXPECT_EQ (buffer.get_new_data_count (second_cursor), 4);
+
+    // destructive read doesnt move cursors
+    EXPECT_EQ (buffer.get_data (4, retrieved), 4);
+    EXPECT_EQ (buffer.get_new_data_transposed (first_cursor, 8, retrieved, 0, missed), 1);
+    EXPECT_EQ (retrieved[0], 3.0);
+    EXPECT_EQ (retrieved[1], 13.0);
+    EXPECT_EQ (buffer.get_new_data_transposed (second_cursor, 8, retrieved, 0, missed), 4);
+    EXPECT_EQ (buffer.get_new_data_transposed (second_cursor, 8, retrieved, 0, missed), 0);
+}
+
+TEST (DataBufferTest, GetNewDataTransposed_PackagesOverwritten_ReportMissedPackages)
+{
+    DataBuffer buffer (1, 4);
+    unsigned long long cursor = 0;
+    for (int i = 0; i < 10; i++)
+    {
+        double value = (double)i;
+        buffer.add_data (&value);
+    }
+    double retrieved[4];
+    size_t missed = 0;
+
+    EXPECT_EQ (buffer.get_new_data_count (cursor), 4);
+    EXPECT_EQ (buffer.get_new_data_transposed (cursor, 4, retrieved, 0, missed), 4);
+    EXPECT_EQ (missed, 6);
+    EXPECT_EQ (cursor, 10);
+    for (int i = 0; i < 4; i++)
+    {
+        EXPECT_EQ (retrieved[i], (double)(i + 6));
+    }
+}
+
+TEST (DataBufferTest, GetDataTransposed_PackagesOverwritten_ReportLostSinceLastRead)
+{
+    DataBuffer buffer (1, 4);
+    for (int i = 0; i < 10; i++)
+    {
+        double value = (double)i;
+        buffer.add_data (&value);
+    }
+    double retrieved[4];
+    size_t lost = 0;
+
+    EXPECT_EQ (buffer.get_data_transposed (2, retrieved, 0, lost), 2);
+    EXPECT_EQ (lost, 6);
+    EXPECT_EQ (retrieved[0], 6.0);
+    EXPECT_EQ (buffer.get_data_transposed (4, retrieved, 0, lost), 2);
+    EXPECT_EQ (lost, 0);
+    EXPECT_EQ (buffer.get_overwritten_count (), 6);
+    EXPECT_EQ (buffer.get_dropped_count (), 0);
+}
+
+TEST (DataBufferTest, AddData_DropNewestPolicy_KeepOldestData)
+{
+    DataBuffer buffer (1, 4, (int)BufferOverflowPolicies::DROP_NEWEST);
+    for (int i = 0; i < 10; i++)
+    {
+        double value = (double)i;
+        buffer.add_data (&value);
+    }
+    double retrieved[4];
+    size_t lost = 0;
+
+    EXPECT_EQ (buffer.get_total_count (), 4);
+    EXPECT_EQ (buffer.get_data_transposed (4, retrieved, 0, lost), 4);
+    EXPECT_EQ (lost, 6);
+    for (int i = 0; i < 4; i++)
+    {
+        EXPECT_EQ (retrieved[i], (double)i);
+    }
+    EXPECT_EQ (buffer.get_dropped_count (), 6);
+    EXPECT_EQ (buffer.get_overwritten_count (), 0);
+}
+
+TEST (DataBufferTest, AddData_GrowPolicy_GrowUpToMaxSizeAndOverwriteAfterThat)
+{
+    DataBuffer buffer (1, 2, (int)BufferOverflowPolicies::GROW, 6);
+    unsigned long long cursor = 0;
+    for (int i = 0; i < 5; i++)
+    {
+        double value = (double)i;
+        buffer.add_data (&value);
+    }
+    double retrieved[6];
+    size_t missed = 0;
+
+    EXPECT_EQ (buffer.get_capacity (), 6);
+    EXPECT_EQ (buffer.get_data_count (), 5);
+    // packages added before reallocation are still available for cursors
+    EXPECT_EQ (buffer.get_new_data_transposed (cursor, 6, retrieved, 0, missed), 5);
+    EXPECT_EQ (missed, 0);
+    for (int i = 5; i < 8; i++)
+    {
+        double value = (double)i;
+        buffer.add_data (&value);
+    }
+    size_t lost = 0;
+    EXPECT_EQ (buffer.get_data_transposed (6, retrieved, 0, lost), 6);
+    EXPECT_EQ (lost, 2);
+    for (int i = 0; i < 6; i++)
+    {
+        EXPECT_EQ (retrieved[i], (double)(i + 2));
+    }
+    EXPECT_EQ (buffer.get_overwritten_count (), 2);
+}
+
+TEST (DataBufferTest, AddData_LazyAllocation_AllocateChunksOnFirstWrite)
+{
+    DataBufferStorage storage;
+    storage.lazy_allocation = true;
+    size_t buffer_size = DATA_BUFFER_CHUNK_SIZE * 2 + 10;
+    DataBuffer buffer (2, buffer_size, (int)BufferOverflowPolicies::OVERWRITE_OLDEST, 0, storage);
+
+    EXPECT_EQ (buffer.is_ready (), true);
+    EXPECT_EQ (buffer.get_memory_usage (), 0);
+    double values[2] = {0.0, 0.0};
+    buffer.add_data (values);
+    EXPECT_EQ (buffer.get_memory_usage (), DATA_BUFFER_CHUNK_SIZE * 2 * sizeof (double));
+    for (size_t i = 1; i < buffer_size + 5; i++)
+    {
+        values[0] = (double)i;
+        values[1] = -(double)i;
+        buffer.add_data (values);
+    }
+    // the last chunk is smaller
+    EXPECT_EQ (buffer.get_memory_usage (), buffer_size * 2 * sizeof (double));
+    std::vector<double> retrieved (buffer_size * 2);
+    EXPECT_EQ (buffer.get_data_transposed (buffer_size, retrieved.data (), 0), buffer_size);
+    for (size_t i = 0; i < buffer_size; i++)
+    {
+        EXPECT_EQ (retrieved[i], (double)(i + 5));
+        EXPECT_EQ (retrieved[buffer_size + i], -(double)(i + 5));
+    }
+}
+
+TEST (DataBufferTest, GetData_FloatRows_ReturnWidenedValues)
+{
+    DataBufferStorage storage;
+    storage.float_rows = {1, 2};
+    DataBuffer buffer (4, 4, (int)BufferOverflowPolicies::OVERWRITE_OLDEST, 0, storage);
+    double values[4] = {1.0 / 3.0, 1.0 / 3.0, 2.5, 1234567.891};
+    double retrieved[8];
+
+    // 2 doubles and 2 floats take the same space as 3 doubles
+    EXPECT_EQ (buffer.get_memory_usage (), 4 * 3 * sizeof (double));
+    buffer.add_data (values);
+    buffer.add_data (values);
+    EXPECT_EQ (buffer.get_current_data (1, retrieved), 1);
+    EXPECT_EQ (retrieved[0], values[0]);
+    EXPECT_EQ (retrieved[1], (double)(float)values[1]);
+    EXPECT_EQ (retrieved[2], values[2]);
+    EXPECT_EQ (retrieved[3], values[3]);
+    EXPECT_EQ (buffer.get_data_transposed (2, retrieved, 0), 2);
+    EXPECT_EQ (retrieved[1], values[0]);
+    EXPECT_EQ (retrieved[2], (double)(float)values[1]);
+    EXPECT_EQ (retrieved[5], values[2]);
+    EXPECT_EQ (retrieved[7], values[3]);
+}
+
+TEST (DataBufferTest, AddData_GrowPolicyWithLazyFloatStorage_KeepAllPackages)
+{
+    DataBufferStorage storage;
+    storage.lazy_allocation = true;
+    storage.float_rows = {0};
+    DataBuffer buffer (2, 1000, (int)BufferOverflowPolicies::GROW, 4000, storage);
+    for (int i = 0; i < 3000; i++)
+    {
+        double values[2] = {(double)i, (double)i};
+        buffer.add_data (values);
+    }
+    std::vector<double> retrieved (6000);
+    size_t lost = 0;
+
+    EXPECT_EQ (buffer.get_capacity (), 4000);
+    EXPECT_EQ (buffer.get_data_transposed (3000, retrieved.data (), 0, lost), 3000);
+    EXPECT_EQ (lost, 0);
+    for (int i = 0; i < 3000; i++)
+    {
+        EXPECT_EQ (retrieved[i], (double)i);
+        EXPECT_EQ (retrieved[3000 + i], (double)i);
+    }
+}
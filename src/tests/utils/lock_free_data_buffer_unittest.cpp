@@ -0,0 +1,348 @@
+#include <atomic>
+#include <chrono>
+#include <future>
+#include <gmock/gmock-matchers.h>
+#include <gmock/gmock.h>
+#include <thread>
+#include <vector>
+
+#include "lock_free_data_buffer.h"
+
+using namespace testing;
+
+
+TEST (LockFreeDataBufferTest, AddData_AddLessDataThanBufferCapacity_StoreAllData)
+{
+    LockFreeDataBuffer buffer (4, 2);
+    double values[4] = {1.0, 2.0, 3.0, 4.0};
+    double retrieved[4];
+
+    buffer.add_data (values);
+    buffer.get_current_data (1, retrieved);
+
+    EXPECT_EQ (buffer.get_data_count (), 1);
+    for (int i = 0; i < 4; i++)
+    {
+        EXPECT_EQ (retrieved[i], values[i]);
+    }
+}
+
+TEST (LockFreeDataBufferTest, AddData_AddMoreDataThanBufferCapacity_OverwriteOldestData)
+{
+    LockFreeDataBuffer buffer (4, 2);
+    double first_values[4] = {1.0, 2.0, 3.0, 4.0};
+    double second_values[4] = {5.0, 6.0, 7.0, 8.0};
+    double third_values[4] = {9.0, 10.0, 11.0, 12.0};
+    double retrieved[8];
+
+    buffer.add_data (first_values);
+    buffer.add_data (second_values);
+    buffer.add_data (third_values);
+
+    EXPECT_EQ (buffer.get_data_count (), 2);
+
+    auto result = buffer.get_data (2, retrieved);
+    EXPECT_EQ (result, 2);
+    for (int i = 0; i < 4; i++)
+    {
+        EXPECT_EQ (retrieved[i], second_values[i]);
+        EXPECT_EQ (retrieved[i + 4], third_values[i]);
+    }
+    EXPECT_EQ (buffer.get_data_count (), 0);
+}
+
+TEST (LockFreeDataBufferTest, AddData_BufferIsNotReady_DoNothing)
+{
+    LockFreeDataBuffer buffer_zero (4, 0);
+    double values[4] = {1.0, 2.0, 3.0, 4.0};
+    double retrieved[4];
+
+    buffer_zero.add_data (values);
+
+    EXPECT_EQ (buffer_zero.is_ready (), false);
+    EXPECT_EQ (buffer_zero.get_data_count (), 0);
+    EXPECT_EQ (buffer_zero.get_data (1, retrieved), 0);
+}
+
+TEST (LockFreeDataBufferTest, GetData_CalledMultipleTimes_ReturnEachValueSetOnceStartingWithOldest)
+{
+    LockFreeDataBuffer buffer (4, 2);
+    double first_values[4] = {1.0, 2.0, 3.0, 4.0};
+    double second_values[4] = {5.0, 6.0, 7.0, 8.0};
+
+    buffer.add_data (first_values);
+    buffer.add_data (second_values);
+
+    double retrieved[4];
+    EXPECT_EQ (buffer.get_data (1, retrieved), 1);
+    for (int i = 0; i < 4; i++)
+    {
+        EXPECT_EQ (retrieved[i], first_values[i]);
+    }
+
+    EXPECT_EQ (buffer.get_data (1, retrieved), 1);
+    for (int i = 0; i < 4; i++)
+    {
+        EXPECT_EQ (retrieved[i], second_values[i]);
+    }
+
+    EXPECT_EQ (buffer.get_data (1, retrieved), 0);
+}
+
+TEST (LockFreeDataBufferTest, GetCurrentData_MaxCountLessThanAvailableCount_ReturnMostRecent)
+{
+    LockFreeDataBuffer buffer (1, 4);
+    for (int i = 0; i < 6; i++)
+    {
+        double value = (double)i;
+        buffer.add_data (&value);
+    }
+
+    double retrieved[2];
+    auto result = buffer.get_current_data (2, retrieved);
+
+    EXPECT_EQ (result, 2);
+    EXPECT_EQ (retrieved[0], 4.0);
+    EXPECT_EQ (retrieved[1], 5.0);
+    EXPECT_EQ (buffer.get_data_count (), 4);
+}
+
+TEST (LockFreeDataBufferTest, GetDataTransposed_BufferWrappedAround_ReturnRowMajorData)
+{
+    LockFreeDataBuffer buffer (2, 2);
+    double first_values[2] = {1.0, 2.0};
+    double second_values[2] = {3.0, 4.0};
+    double third_values[2] = {5.0, 6.0};
+
+    buffer.add_data (first_values);
+    buffer.add_data (second_values);
+    buffer.add_data (third_values);
+
+    double retrieved[6] = {0.0, 0.0, 0.0, 0.0, 0.0, 0.0};
+    auto result = buffer.get_data_transposed (3, retrieved, 3);
+
+    EXPECT_EQ (result, 2);
+    double expected[6] = {3.0, 5.0, 0.0, 4.0, 6.0, 0.0};
+    for (int i = 0; i < 6; i++)
+    {
+        EXPECT_EQ (retrieved[i], expected[i]);
+    }
+}
+
+TEST (LockFreeDataBufferTest,
+    GetData_InvokedInMoreThreadsThanAvailableData_SummedReturnsEqualAvailableData)
+{
+    LockFreeDataBuffer buffer (4, 1024);
+    double values[4] = {1.0, 2.0, 3.0, 4.0};
+
+    for (int i = 0; i < 1024; i++)
+    {
+        buffer.add_data (values);
+    }
+
+    std::thread threads[2048];
+    double retrieved[2048][4];
+    std::promise<size_t> promises[2048];
+    std::future<size_t> counts[2048];
+
+    for (int i = 0; i < 2048; i++)
+    {
+        counts[i] = promises[i].get_future ();
+        threads[i] = std::thread ([&] (double *retrieval_buffer, std::promise<size_t> count)
+            { count.set_value (buffer.get_data (1, retrieval_buffer)); },
+            retrieved[i], std::move (promises[i]));
+    }
+
+    for (int i = 0; i < 2048; i++)
+    {
+        threads[i].join ();
+    }
+
+    size_t total = 0;
+    for (int i = 0; i < 2048; i++)
+    {
+        total += counts[i].get ();
+    }
+
+    ASSERT_EQ (total, 1024);
+}
+
+TEST (LockFreeDataBufferTest, GetCurrentData_ProducerOverwritesConcurrently_SnapshotsAreConsistent)
+{
+    // each package is filled with its sequence number, consistent snapshot has equal values in
+    // every package and consecutive sequence numbers
+    LockFreeDataBuffer buffer (16, 8);
+    std::atomic<bool> stop (false);
+
+    std::thread producer (
+        [&] ()
+        {
+            double package[16];
+            for (int i = 0; i < 200000; i++)
+            {
+                for (int j = 0; j < 16; j++)
+                {
+                    package[j] = (double)i;
+                }
+                buffer.add_data (package);
+            }
+            stop = true;
+        });
+
+    bool consistent = true;
+    double retrieved[8 * 16];
+    while (!stop)
+    {
+        size_t result = buffer.get_current_data (8, retrieved);
+        for (size_t i = 0; i < result; i++)
+        {
+            for (int j = 0; j < 16; j++)
+            {
+                if ((retrieved[i * 16 + j] != retrieved[i * 16]) ||
+                    (retrieved[i * 16] != retrieved[0] + (double)i))
+                {
+                    consistent = false;
+                }
+            }
+        }
+    }
+    producer.join ();
+
+    EXPECT_TRUE (consistent);
+}
+
+TEST (LockFreeDataBufferTest, WaitForData_NotEnoughData_ReturnFalseAfterTimeout)
+{
+    LockFreeDataBuffer buffer (1, 4);
+    double value = 1.0;
+    buffer.add_data (&value);
+
+    EXPECT_FALSE (buffer.wait_for_data (2, 20));
+    buffer.add_data (&value);
+    EXPECT_TRUE (buffer.wait_for_data (2, 0));
+}
+
+TEST (LockFreeDataBufferTest, WaitForData_DataAddedFromAnotherThread_WakeUpWhenThresholdReached)
+{
+    LockFreeDataBuffer buffer (1, 16);
+    std::future<bool> waiter =
+        std::async (std::launch::async, [&buffer] { return buffer.wait_for_data (16, 10000); });
+    // more data than capacity, waiter must wake up even if old data was overwritten
+    for (int i = 0; i < 64; i++)
+    {
+        double value = (double)i;
+        buffer.add_data (&value);
+        std::this_thread::sleep_for (std::chrono::microseconds (100));
+    }
+
+    EXPECT_EQ (waiter.wait_for (std::chrono::seconds (5)), std::future_status::ready);
+    EXPECT_TRUE (waiter.get ());
+}
+
+TEST (LockFreeDataBufferTest, GetNewDataTransposed_PackagesOverwritten_ReportMissedPackages)
+{
+    LockFreeDataBuffer buffer (1, 4);
+    unsigned long long first_cursor = 0;
+    unsigned long long second_cursor = 0;
+    for (int i = 0; i < 3; i++)
+    {
+        double value = (double)i;
+        buffer.add_data (&value);
+    }
+    double retrieved[4];
+    size_t missed = 1;
+
+    EXPECT_EQ (buffer.get_new_data_transposed (first_cursor, 4, retrieved, 0, missed), 3);
+    EXPECT_EQ (missed, 0);
+    for (int i = 3; i < 10; i++)
+    {
+        double value = (double)i;
+        buffer.add_data (&value);
+    }
+    // consuming read doesnt affect cursors
+    EXPECT_EQ (buffer.get_data (4, retrieved), 4);
+    EXPECT_EQ (buffer.get_total_count (), 10);
+    EXPECT_EQ (buffer.get_new_data_count (first_cursor), 4);
+    EXPECT_EQ (buffer.get_new_data_transposed (first_cursor, 4, retrieved, 0, missed), 4);
+    EXPECT_EQ (missed, 3);
+    for (int i = 0; i < 4; i++)
+    {
+        EXPECT_EQ (retrieved[i], (double)(i + 6));
+    }
+    EXPECT_EQ (buffer.get_new_data_transposed (second_cursor, 2, retrieved, 0, missed), 2);
+    EXPECT_EQ (missed, 6);
+    EXPECT_EQ (retrieved[0], 6.0);
+    EXPECT_EQ (second_cursor, 8);
+}
+
+TEST (LockFreeDataBufferTest, GetDataTransposed_PackagesOverwritten_ReportLostSinceLastRead)
+{
+    LockFreeDataBuffer buffer (1, 4);
+    for (int i = 0; i < 10; i++)
+    {
+        double value = (double)i;
+        buffer.add_data (&value);
+    }
+    double retrieved[4];
+    size_t lost = 0;
+
+    EXPECT_EQ (buffer.get_overwritten_count (), 6);
+    EXPECT_EQ (buffer.get_data_transposed (2, retrieved, 0, lost), 2);
+    EXPECT_EQ (lost, 6);
+    EXPECT_EQ (retrieved[0], 6.0);
+    EXPECT_EQ (buffer.get_data_transposed (4, retrieved, 0, lost), 2);
+    EXPECT_EQ (lost, 0);
+    EXPECT_EQ (buffer.get_overwritten_count (), 6);
+}
+
+TEST (LockFreeDataBufferTest, AddData_DropNewestPolicy_KeepOldestData)
+{
+    LockFreeDataBuffer buffer (1, 4, (int)BufferOverflowPolicies::DROP_NEWEST);
+    for (int i = 0; i < 10; i++)
+    {
+        double value = (double)i;
+        buffer.add_data (&value);
+    }
+    double retrieved[4];
+    size_t lost = 0;
+
+    EXPECT_EQ (buffer.get_data_transposed (4, retrieved, 0, lost), 4);
+    EXPECT_EQ (lost, 6);
+    for (int i = 0; i < 4; i++)
+    {
+        EXPECT_EQ (retrieved[i], (double)i);
+    }
+    double value = 10.0;
+    buffer.add_data (&value);
+    EXPECT_EQ (buffer.get_data_transposed (4, retrieved, 0, lost), 1);
+    EXPECT_EQ (lost, 0);
+    EXPECT_EQ (retrieved[0], 10.0);
+    EXPECT_EQ (buffer.get_dropped_count (), 6);
+    EXPECT_EQ (buffer.get_overwritten_count (), 0);
+}
+
+TEST (LockFreeDataBufferTest, GetDataTransposed_LazyFloatStorage_ReturnWidenedValues)
+{
+    DataBufferStorage storage;
+    storage.lazy_allocation = true;
+    storage.float_rows = {1};
+    LockFreeDataBuffer buffer (
+        2, DATA_BUFFER_CHUNK_SIZE * 2, (int)BufferOverflowPolicies::OVERWRITE_OLDEST, storage);
+
+    EXPECT_EQ (buffer.get_memory_usage (), 0);
+    for (int i = 0; i < DATA_BUFFER_CHUNK_SIZE + 1; i++)
+    {
+        double values[2] = {(double)i, i + 0.1};
+        buffer.add_data (values);
+    }
+    // double and float rounded up to 2 doubles
+    EXPECT_EQ (buffer.get_memory_usage (), DATA_BUFFER_CHUNK_SIZE * 2 * 2 * sizeof (double));
+    std::vector<double> retrieved ((DATA_BUFFER_CHUNK_SIZE + 1) * 2);
+    EXPECT_EQ (buffer.get_data_transposed (DATA_BUFFER_CHUNK_SIZE + 1, retrieved.data (), 0),
+        DATA_BUFFER_CHUNK_SIZE + 1);
+    for (int i = 0; i < DATA_BUFFER_CHUNK_SIZE + 1; i++)
+    {
+        EXPECT_EQ (retrieved[i], (double)i);
+        EXPECT_EQ (retrieved[DATA_BUFFER_CHUNK_SIZE + 1 + i], (double)(float)(i + 0.1));
+    }
+}
@@ -0,0 +1,107 @@
+#include <gmock/gmock-matchers.h>
+#include <gmock/gmock.h>
+#include <memory>
+
+#include "lru_cache.h"
+
+using namespace testing;
+
+
+static void expect_stats (LRUCache<int, int> &cache, long long hits, long long misses, int size)
+{
+    long long cache_hits = -1;
+    long long cache_misses = -1;
+    int cache_size = -1;
+    cache.get_stats (&cache_hits, &cache_misses, &cache_size);
+    EXPECT_EQ (cache_hits, hits);
+    EXPECT_EQ (cache_misses, misses);
+    EXPECT_EQ (cache_size, size);
+}
+
+TEST (LRUCacheTest, CreatesValueOnce)
+{
+    LRUCache<int, int> cache (2);
+    int num_created = 0;
+    auto factory = [&] ()
+    {
+        num_created++;
+        return std::make_shared<int> (42);
+    };
+    std::shared_ptr<int> first = cache.get (1, factory);
+    std::shared_ptr<int> second = cache.get (1, factory);
+    EXPECT_EQ (num_created, 1);
+    EXPECT_EQ (first, second);
+    EXPECT_EQ (*second, 42);
+    expect_stats (cache, 1, 1, 1);
+}
+
+TEST (LRUCacheTest, EvictsLeastRecentlyUsed)
+{
+    LRUCache<int, int> cache (2);
+    int num_created = 0;
+    auto factory = [&] ()
+    {
+        num_created++;
+        return std::make_shared<int> (num_created);
+    };
+    std::shared_ptr<int> evicted = cache.get (1, factory);
+    cache.get (2, factory);
+    cache.get (1, factory); // now 2 is the least recently used
+    cache.get (3, factory);
+    expect_stats (cache, 1, 3, 2);
+    EXPECT_EQ (num_created, 3);
+    cache.get (1, factory);
+    EXPECT_EQ (num_created, 3);
+    cache.get (2, factory);
+    EXPECT_EQ (num_created, 4);
+    // evicted value is still valid for its owner
+    EXPECT_EQ (*evicted, 1);
+}
+
+TEST (LRUCacheTest, FactoryErrorIsNotCached)
+{
+    LRUCache<int, int> cache (2);
+    std::shared_ptr<int> value = cache.get (1, [] () { return std::shared_ptr<int> (); });
+    EXPECT_EQ (value, nullptr);
+    expect_stats (cache, 0, 1, 0);
+}
+
+TEST (LRUCacheTest, ClearResetsStats)
+{
+    LRUCache<int, int> cache (2);
+    auto factory = [] () { return std::make_shared<int> (1); };
+    cache.get (1, factory);
+    cache.get (1, factory);
+    cache.clear ();
+    expect_stats (cache, 0, 0, 0);
+    cache.get (1, factory);
+    expect_stats (cache, 0, 1, 1);
+}
+
+TEST (LRUCacheTest, EvictsByBytes)
+{
+    LRUCache<int, int> cache (10, 100);
+    auto factory = [] () { return std::make_shared<int> (1); };
+    cache.get (1, factory, 40);
+    cache.get (2, factory, 40);
+    EXPECT_EQ (cache.get_bytes (), (size_t)80);
+    cache.get (3, factory, 40);
+    // the least recently used item is evicted to fit the new one
+    expect_stats (cache, 0, 3, 2);
+    EXPECT_EQ (cache.get_bytes (), (size_t)80);
+    cache.get (2, factory, 40);
+    expect_stats (cache, 1, 3, 2);
+    cache.clear ();
+    EXPECT_EQ (cache.get_bytes (), (size_t)0);
+}
+
+TEST (LRUCacheTest, LargeValueIsNotCached)
+{
+    LRUCache<int, int> cache (10, 100);
+    auto factory = [] () { return std::make_shared<int> (1); };
+    cache.get (1, factory, 40);
+    std::shared_ptr<int> value = cache.get (2, factory, 101);
+    EXPECT_EQ (*value, 1);
+    expect_stats (cache, 0, 2, 1);
+    EXPECT_EQ (cache.get_bytes (), (size_t)40);
+}
@@ -0,0 +1,62 @@
+#include <gmock/gmock-matchers.h>
+#include <gmock/gmock.h>
+#include <thread>
+#include <vector>
+
+#include "marker_queue.h"
+
+using namespace testing;
+
+
+TEST (MarkerQueueTest, KeepsOrderAndCapacity)
+{
+    MarkerQueue queue;
+    double value = 0.0;
+    EXPECT_FALSE (queue.pop (value));
+    for (int i = 1; i < MARKER_QUEUE_SIZE; i++)
+    {
+        EXPECT_TRUE (queue.push ((double)i));
+    }
+    EXPECT_FALSE (queue.push (-1.0));
+    for (int i = 1; i < MARKER_QUEUE_SIZE; i++)
+    {
+        EXPECT_TRUE (queue.pop (value));
+        EXPECT_EQ (value, (double)i);
+    }
+    EXPECT_FALSE (queue.pop (value));
+    EXPECT_TRUE (queue.push (5.0));
+    queue.clear ();
+    EXPECT_FALSE (queue.pop (value));
+}
+
+TEST (MarkerQueueTest, ConsumerGetsAllMarkersInOrder)
+{
+    MarkerQueue queue;
+    const int num_markers = 200000;
+    std::vector<double> received;
+    std::thread consumer (
+        [&] ()
+        {
+            double value = 0.0;
+            while ((int)received.size () < num_markers)
+            {
+                if (queue.pop (value))
+                {
+                    received.push_back (value);
+                }
+            }
+        });
+    for (int i = 1; i <= num_markers; i++)
+    {
+        while (!queue.push ((double)i))
+        {
+            std::this_thread::yield ();
+        }
+    }
+    consumer.join ();
+    ASSERT_EQ ((int)received.size (), num_markers);
+    for (int i = 0; i < num_markers; i++)
+    {
+        ASSERT_EQ (received[i], (double)(i + 1));
+    }
+}
@@ -0,0 +1,136 @@
+#include <algorithm>
+#include <gmock/gmock-matchers.h>
+#include <gmock/gmock.h>
+#include <random>
+#include <vector>
+
+#include "rolling_filter.h"
+
+using namespace testing;
+
+
+// reference implementations, value is computed from the last period samples
+static std::vector<double> naive_median (const std::vector<double> &data, int period)
+{
+    std::vector<double> output (data.size ());
+    for (int i = 0; i < (int)data.size (); i++)
+    {
+        if (i < period - 1)
+        {
+            output[i] = data[i];
+            continue;
+        }
+        std::vector<double> window (data.begin () + i - period + 1, data.begin () + i + 1);
+        std::sort (window.begin (), window.end ());
+        output[i] = (window[(period - 1) / 2] + window[period / 2]) / 2.0;
+    }
+    return output;
+}
+
+static std::vector<double> naive_extremum (const std::vector<double> &data, int period, bool is_min)
+{
+    std::vector<double> output (data.size ());
+    for (int i = 0; i < (int)data.size (); i++)
+    {
+        auto first = data.begin () + std::max (0, i - period + 1);
+        auto last = data.begin () + i + 1;
+        output[i] = is_min ? *std::min_element (first, last) : *std::max_element (first, last);
+    }
+    return output;
+}
+
+static std::vector<double> apply_filter (
+    RollingFilter<double> &filter, const std::vector<double> &data)
+{
+    std::vector<double> output (data.size ());
+    for (size_t i = 0; i < data.size (); i++)
+    {
+        filter.add_data (data[i]);
+        output[i] = filter.get_value ();
+    }
+    return output;
+}
+
+static std::vector<double> get_random_data (int len, bool with_duplicates)
+{
+    std::mt19937 gen (42);
+    std::uniform_real_distribution<double> dist (-100.0, 100.0);
+    std::uniform_int_distribution<int> int_dist (-5, 5);
+    std::vector<double> data (len);
+    for (int i = 0; i < len; i++)
+    {
+        data[i] = with_duplicates ? (double)int_dist (gen) : dist (gen);
+    }
+    return data;
+}
+
+
+TEST (RollingFilterTest, RollingMedian_RandomData_MatchesNaiveMedian)
+{
+    for (int period : {1, 2, 3, 4, 5, 8, 31, 64, 101})
+    {
+        for (bool with_duplicates : {false, true})
+        {
+            std::vector<double> data = get_random_data (1000, with_duplicates);
+            RollingMedian<double> filter (period);
+            EXPECT_THAT (
+                apply_filter (filter, data), ElementsAreArray (naive_median (data, period)))
+                << "period " << period;
+        }
+    }
+}
+
+TEST (RollingFilterTest, RollingMedian_SortedData_MatchesNaiveMedian)
+{
+    std::vector<double> data (500);
+    for (int i = 0; i < 500; i++)
+    {
+        data[i] = (i < 250) ? i : 500 - i;
+    }
+    RollingMedian<double> filter (20);
+    EXPECT_THAT (apply_filter (filter, data), ElementsAreArray (naive_median (data, 20)));
+}
+
+TEST (RollingFilterTest, RollingAverage_RandomData_MatchesNaiveAverage)
+{
+    std::vector<double> data = get_random_data (1000, false);
+    int period = 7;
+    RollingAverage<double> filter (period);
+    std::vector<double> output = apply_filter (filter, data);
+    for (int i = 0; i < (int)data.size (); i++)
+    {
+        int first = std::max (0, i - period + 1);
+        double sum = 0.0;
+        for (int j = first; j <= i; j++)
+        {
+            sum += data[j];
+        }
+        EXPECT_NEAR (output[i], sum / (i - first + 1), 1e-9);
+    }
+}
+
+TEST (RollingFilterTest, RollingSum_LessDataThanPeriod_SumsAllData)
+{
+    RollingSum<double> filter (10);
+    filter.add_data (1.0);
+    filter.add_data (2.0);
+    filter.add_data (3.0);
+    EXPECT_EQ (filter.get_value (), 6.0);
+}
+
+TEST (RollingFilterTest, RollingMinMax_RandomData_MatchesNaiveExtremum)
+{
+    for (int period : {1, 2, 3, 10, 100})
+    {
+        for (bool with_duplicates : {false, true})
+        {
+            std::vector<double> data = get_random_data (1000, with_duplicates);
+            RollingMin<double> min_filter (period);
+            RollingMax<double> max_filter (period);
+            EXPECT_THAT (apply_filter (min_filter, data),
+                ElementsAreArray (naive_extremum (data, period, true)));
+            EXPECT_THAT (apply_filter (max_filter, data),
+                ElementsAreArray (naive_extremum (data, period, false)));
+        }
+    }
+}
@@ -0,0 +1,206 @@
+#include "file_offset.h"
+
+#include <algorithm>
+#include <stdint.h>
+#include <string.h>
+#include <vector>
+
+#include "bfbin_file.h"
+#include "brainflow_constants.h"
+
+static const char bfbin_magic[BFBIN_MAGIC_LEN] = {'B', 'F', 'B', 'I', 'N', '\0', '\0', '\1'};
+
+
+static bool write_int (FILE *fp, int value)
+{
+    int32_t val = (int32_t)value;
+    return fwrite (&val, sizeof (val), 1, fp) == 1;
+}
+
+static bool read_int (FILE *fp, int *value)
+{
+    int32_t val = 0;
+    if (fread (&val, sizeof (val), 1, fp) != 1)
+    {
+        return false;
+    }
+    *value = (int)val;
+    return true;
+}
+
+bool is_bfbin_file (const char *file_name)
+{
+    FILE *fp = fopen (file_name, "rb");
+    if (fp == NULL)
+    {
+        return false;
+    }
+    char magic[BFBIN_MAGIC_LEN];
+    bool res = (fread (magic, 1, BFBIN_MAGIC_LEN, fp) == BFBIN_MAGIC_LEN) &&
+        (memcmp (magic, bfbin_magic, BFBIN_MAGIC_LEN) == 0);
+    fclose (fp);
+    return res;
+}
+
+bool has_bfbin_extension (const char *file_name)
+{
+    size_t name_len = strlen (file_name);
+    size_t ext_len = strlen (BFBIN_FILE_EXTENSION);
+    if (name_len < ext_len)
+    {
+        return false;
+    }
+    return strcmp (file_name + name_len - ext_len, BFBIN_FILE_EXTENSION) == 0;
+}
+
+int write_bfbin_header (FILE *fp, const BFBinHeader &header)
+{
+    if ((fp == NULL) || (header.num_rows < 1))
+    {
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    bool res = fwrite (bfbin_magic, 1, BFBIN_MAGIC_LEN, fp) == BFBIN_MAGIC_LEN;
+    res = res && write_int (fp, header.version);
+    res = res && write_int (fp, header.board_id);
+    res = res && write_int (fp, header.preset);
+    res = res && write_int (fp, header.num_rows);
+    res = res && write_int (fp, header.sampling_rate);
+    res = res && write_int (fp, (int)header.descr.size ());
+    if ((res) && (!header.descr.empty ()))
+    {
+        res = fwrite (header.descr.c_str (), 1, header.descr.size (), fp) == header.descr.size ();
+    }
+    if (!res)
+    {
+        return (int)BrainFlowExitCodes::GENERAL_ERROR;
+    }
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
+int read_bfbin_header (FILE *fp, BFBinHeader &header)
+{
+    if (fp == NULL)
+    {
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    char magic[BFBIN_MAGIC_LEN];
+    if ((fread (magic, 1, BFBIN_MAGIC_LEN, fp) != BFBIN_MAGIC_LEN) ||
+        (memcmp (magic, bfbin_magic, BFBIN_MAGIC_LEN) != 0))
+    {
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    int descr_len = 0;
+    bool res = read_int (fp, &header.version);
+    res = res && read_int (fp, &header.board_id);
+    res = res && read_int (fp, &header.preset);
+    res = res && read_int (fp, &header.num_rows);
+    res = res && read_int (fp, &header.sampling_rate);
+    res = res && read_int (fp, &descr_len);
+    if ((!res) || (header.version != BFBIN_VERSION) || (header.num_rows < 1) || (descr_len < 0))
+    {
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    std::vector<char> descr (descr_len);
+    if ((descr_len > 0) && (fread (descr.data (), 1, descr_len, fp) != (size_t)descr_len))
+    {
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    header.descr = std::string (descr.begin (), descr.end ());
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
+int write_bfbin_chunk (FILE *fp, const double *data, int num_rows, int num_cols)
+{
+    if ((fp == NULL) || (data == NULL) || (num_rows < 1) || (num_cols < 1))
+    {
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    size_t num_values = (size_t)num_rows * (size_t)num_cols;
+    if ((!write_int (fp, num_cols)) ||
+        (fwrite (data, sizeof (double), num_values, fp) != num_values))
+    {
+        return (int)BrainFlowExitCodes::GENERAL_ERROR;
+    }
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
+int get_bfbin_num_cols (FILE *fp, int num_rows, long long *total_cols)
+{
+    if ((fp == NULL) || (num_rows < 1) || (total_cols == NULL))
+    {
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    long long start_pos = file_tell (fp);
+    file_seek (fp, 0, SEEK_END);
+    long long file_size = file_tell (fp);
+    file_seek (fp, start_pos, SEEK_SET);
+
+    *total_cols = 0;
+    long long pos = start_pos;
+    int num_cols = 0;
+    while (read_int (fp, &num_cols))
+    {
+        long long chunk_size = (long long)num_cols * num_rows * (long long)sizeof (double);
+        pos += (long long)sizeof (int32_t) + chunk_size;
+        // last chunk may be incomplete if recording was interrupted, skip it
+        if ((num_cols < 1) || (pos > file_size))
+        {
+            break;
+        }
+        *total_cols += num_cols;
+        file_seek (fp, chunk_size, SEEK_CUR);
+    }
+    file_seek (fp, start_pos, SEEK_SET);
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
+
+int read_bfbin_data (FILE *fp, int num_rows, int max_cols, double *data, int *num_cols)
+{
+    if ((fp == NULL) || (num_rows < 1) || (max_cols < 1) || (data == NULL) || (num_cols == NULL))
+    {
+        return (int)BrainFlowExitCodes::INVALID_ARGUMENTS_ERROR;
+    }
+    int cols_read = 0;
+    int chunk_cols = 0;
+    while ((cols_read < max_cols) && (read_int (fp, &chunk_cols)))
+    {
+        if (chunk_cols < 1)
+        {
+            break;
+        }
+        int cols_to_copy = std::min (chunk_cols, max_cols - cols_read);
+        long long cols_to_skip =
+            (long long)(chunk_cols - cols_to_copy) * (long long)sizeof (double);
+        bool complete = true;
+        for (int i = 0; i < num_rows; i++)
+        {
+            // channel major chunk maps to a contiguous segment of each output row
+            if (fread (data + (size_t)i * max_cols + cols_read, sizeof (double), cols_to_copy,
+                    fp) != (size_t)cols_to_copy)
+            {
+                complete = false;
+                break;
+            }
+            if (cols_to_skip > 0)
+            {
+                file_seek (fp, cols_to_skip, SEEK_CUR);
+            }
+        }
+        if (!complete)
+        {
+            break;
+        }
+        cols_read += cols_to_copy;
+    }
+    // pack rows if file had less data than requested
+    if (cols_read < max_cols)
+    {
+        for (int i = 1; i < num_rows; i++)
+        {
+            memmove (data + (size_t)i * cols_read, data + (size_t)i * max_cols,
+                sizeof (double) * cols_read);
+        }
+    }
+    *num_cols = cols_read;
+    return (int)BrainFlowExitCodes::STATUS_OK;
+}
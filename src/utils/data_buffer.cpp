@@ -1,38 +1,181 @@
 #include "data_buffer.h"
 
+#include <algorithm>
+#include <chrono>
+#include <limits>
 #include <new>
 
-DataBuffer::DataBuffer (int num_samples, size_t buffer_size)
+DataBuffer::DataBuffer (int num_samples, size_t buffer_size, int overflow_policy,
+    size_t max_buffer_size, const DataBufferStorage &storage)
 {
     this->buffer_size = buffer_size;
     this->num_samples = num_samples;
+    this->overflow_policy = overflow_policy;
+    this->max_buffer_size = max_buffer_size;
     first_free = first_used = count = 0;
+    total_count = 0;
+    stored_count = 0;
+    overwritten_count = 0;
+    dropped_count = 0;
+    lost_count = 0;
+    wake_threshold = std::numeric_limits<size_t>::max ();
+    is_waiting_stopped = false;
 
-    if (buffer_size == 0)
+    lazy_allocation = storage.lazy_allocation;
+    package_bytes = sizeof (double) * this->num_samples;
+    ready = (buffer_size != 0) && (package_bytes != 0) && (init_rows (storage.float_rows)) &&
+        (buffer_size <= std::numeric_limits<size_t>::max () / package_bytes);
+    allocated_bytes = 0;
+    chunk_size = 0;
+    ready = (ready) && (init_chunks ());
+}
+
+DataBuffer::~DataBuffer ()
+{
+    free_chunks (chunks, buffer_size, chunk_size);
+}
+
+bool DataBuffer::is_ready ()
+{
+    return ready;
+}
+
+bool DataBuffer::init_rows (const std::vector<int> &rows)
+{
+    // package is copied as is if there are no float rows
+    if (rows.empty ())
     {
-        data = NULL;
+        return true;
     }
-    else
+    try
     {
-        try
+        std::vector<bool> is_float_row (num_samples, false);
+        for (int row : rows)
         {
-            data = new double[buffer_size * num_samples];
+            if ((row >= 0) && ((size_t)row < num_samples))
+            {
+                is_float_row[row] = true;
+            }
         }
-        catch (const std::bad_alloc &)
+        for (size_t i = 0; i < num_samples; i++)
         {
-            data = NULL;
+            if (is_float_row[i])
+            {
+                float_rows.push_back (i);
+            }
+            else
+            {
+                double_rows.push_back (i);
+            }
         }
     }
+    catch (const std::bad_alloc &)
+    {
+        return false;
+    }
+    package_bytes = double_rows.size () * sizeof (double) + float_rows.size () * sizeof (float);
+    // doubles of the next package should be aligned
+    package_bytes = (package_bytes + sizeof (double) - 1) / sizeof (double) * sizeof (double);
+    return true;
 }
 
-DataBuffer::~DataBuffer ()
+bool DataBuffer::init_chunks ()
 {
-    delete[] data;
+    chunk_size = lazy_allocation ? DATA_BUFFER_CHUNK_SIZE : buffer_size;
+    try
+    {
+        chunks.assign ((buffer_size + chunk_size - 1) / chunk_size, NULL);
+    }
+    catch (const std::bad_alloc &)
+    {
+        chunks.clear ();
+        return false;
+    }
+    // without lazy allocation whole buffer is a single chunk
+    return (lazy_allocation) || (get_package_for_write (0) != NULL);
 }
 
-bool DataBuffer::is_ready ()
+void DataBuffer::free_chunks (
+    std::vector<char *> &chunks_to_free, size_t num_packages, size_t packages_in_chunk)
+{
+    for (size_t i = 0; i < chunks_to_free.size (); i++)
+    {
+        if (chunks_to_free[i] != NULL)
+        {
+            size_t chunk_packages =
+                std::min (packages_in_chunk, num_packages - i * packages_in_chunk);
+            allocated_bytes.fetch_sub (chunk_packages * package_bytes, std::memory_order_relaxed);
+            delete[] chunks_to_free[i];
+            chunks_to_free[i] = NULL;
+        }
+    }
+}
+
+char *DataBuffer::get_package_for_write (size_t slot)
 {
-    return (data != NULL);
+    size_t chunk = slot / chunk_size;
+    if (chunks[chunk] == NULL)
+    {
+        // the last chunk can be smaller
+        size_t chunk_bytes =
+            std::min (chunk_size, buffer_size - chunk * chunk_size) * package_bytes;
+        chunks[chunk] = new (std::nothrow) char[chunk_bytes];
+        if (chunks[chunk] == NULL)
+        {
+            return NULL;
+        }
+        allocated_bytes.fetch_add (chunk_bytes, std::memory_order_relaxed);
+    }
+    return chunks[chunk] + (slot % chunk_size) * package_bytes;
+}
+
+bool DataBuffer::write_package (size_t slot, const double *value)
+{
+    char *package = get_package_for_write (slot);
+    if (package == NULL)
+    {
+        return false;
+    }
+    if (float_rows.empty ())
+    {
+        memcpy (package, value, package_bytes);
+        return true;
+    }
+    double *doubles = (double *)package;
+    for (size_t i = 0; i < double_rows.size (); i++)
+    {
+        doubles[i] = value[double_rows[i]];
+    }
+    float *floats = (float *)(doubles + double_rows.size ());
+    for (size_t i = 0; i < float_rows.size (); i++)
+    {
+        floats[i] = (float)value[float_rows[i]];
+    }
+    return true;
+}
+
+void DataBuffer::read_package (const char *package, double *value)
+{
+    if (package == NULL)
+    {
+        memset (value, 0, sizeof (double) * num_samples);
+        return;
+    }
+    const double *doubles = (const double *)package;
+    for (size_t i = 0; i < double_rows.size (); i++)
+    {
+        value[double_rows[i]] = doubles[i];
+    }
+    const float *floats = (const float *)(doubles + double_rows.size ());
+    for (size_t i = 0; i < float_rows.size (); i++)
+    {
+        value[float_rows[i]] = (double)floats[i];
+    }
+}
+
+size_t DataBuffer::get_memory_usage ()
+{
+    return allocated_bytes.load (std::memory_order_relaxed);
 }
 
 void DataBuffer::add_data (double *value)
@@ -44,36 +187,191 @@ void DataBuffer::add_data (double *value)
 
     lock.lock ();
 
-    if (count == 0)
+    // positions are not reset if buffer is empty, reader cursors may still need old packages. If
+    // buffer is full policy decides which package is lost
+    bool overwrite = false;
+    if ((count == buffer_size) &&
+        ((overflow_policy != (int)BufferOverflowPolicies::GROW) || (!grow ())))
     {
-        first_used = first_free = 0;
+        if (overflow_policy == (int)BufferOverflowPolicies::DROP_NEWEST)
+        {
+            lost_count++;
+            dropped_count++;
+            lock.unlock ();
+            return;
+        }
+        overwrite = true;
     }
-    else if (first_free == first_used)
+
+    // chunk of lazily allocated buffer may not fit in memory, the oldest package is removed only
+    // after successful write, so exactly one package is lost in both cases
+    if (!write_package (first_free, value))
+    {
+        lost_count++;
+        dropped_count++;
+        lock.unlock ();
+        return;
+    }
+    if (overwrite)
     {
         first_used = next (first_used);
         count--;
+        lost_count++;
+        overwritten_count++;
     }
-
-    memcpy (this->data + first_free * num_samples, value, sizeof (double) * num_samples);
     first_free = next (first_free);
     count++;
+    total_count++;
+    if (stored_count < buffer_size)
+    {
+        stored_count++;
+    }
+    size_t data_count = count;
 
     lock.unlock ();
+    notify_waiters (data_count);
+}
+
+bool DataBuffer::grow ()
+{
+    if (buffer_size >= max_buffer_size)
+    {
+        return false;
+    }
+    std::vector<char *> old_chunks;
+    old_chunks.swap (chunks);
+    size_t old_size = buffer_size;
+    size_t old_chunk_size = chunk_size;
+    // readers wait for the lock during reallocation, doubling keeps number of copies small
+    buffer_size = std::min (buffer_size * 2, max_buffer_size);
+    bool res = init_chunks ();
+    // buffer is full, the oldest package is at first_free. Old consumed packages are kept for
+    // reader cursors
+    for (size_t i = 0; (res) && (i < old_size); i++)
+    {
+        size_t slot = (first_free + i) % old_size;
+        char *package = get_package_for_write (i);
+        res = (package != NULL);
+        if (res)
+        {
+            memcpy (package,
+                old_chunks[slot / old_chunk_size] + (slot % old_chunk_size) * package_bytes,
+                package_bytes);
+        }
+    }
+    if (!res)
+    {
+        free_chunks (chunks, buffer_size, chunk_size);
+        chunks.swap (old_chunks);
+        buffer_size = old_size;
+        chunk_size = old_chunk_size;
+        return false;
+    }
+    free_chunks (old_chunks, old_size, old_chunk_size);
+    first_used = old_size - count;
+    first_free = old_size;
+    return true;
+}
+
+void DataBuffer::notify_waiters (size_t data_count)
+{
+    // pairs with the fence in wait_for_data, either producer sees new threshold or waiter sees new
+    // data
+    std::atomic_thread_fence (std::memory_order_seq_cst);
+    if (data_count >= wake_threshold.load (std::memory_order_relaxed))
+    {
+        // lock is required to not lose notification if waiter is checking the condition right now
+        {
+            std::lock_guard<std::mutex> wait_lock (wait_mutex);
+        }
+        wait_cv.notify_all ();
+    }
+}
+
+bool DataBuffer::wait_for_data (size_t num_samples, int timeout_ms)
+{
+    std::unique_lock<std::mutex> wait_lock (wait_mutex);
+    auto it = wait_thresholds.insert (num_samples);
+    wake_threshold.store (*wait_thresholds.begin (), std::memory_order_relaxed);
+    std::atomic_thread_fence (std::memory_order_seq_cst);
+    bool res = wait_cv.wait_for (wait_lock, std::chrono::milliseconds (timeout_ms),
+        [this, num_samples] { return (is_waiting_stopped) || (get_data_count () >= num_samples); });
+    wait_thresholds.erase (it);
+    wake_threshold.store (
+        wait_thresholds.empty () ? std::numeric_limits<size_t>::max () : *wait_thresholds.begin (),
+        std::memory_order_relaxed);
+    return (res) && (!is_waiting_stopped);
+}
+
+void DataBuffer::stop_waiting ()
+{
+    {
+        std::lock_guard<std::mutex> wait_lock (wait_mutex);
+        is_waiting_stopped = true;
+    }
+    wait_cv.notify_all ();
 }
 
 void DataBuffer::get_chunk (size_t start, size_t size, double *data_buf)
 {
-    if (start + size < buffer_size)
+    // packages are contiguous until the end of chunk or the end of ring
+    for (size_t i = 0, run = 0; i < size; i += run)
     {
-        memcpy (data_buf, data + start * num_samples, size * sizeof (double) * num_samples);
+        size_t slot = (start + i) % buffer_size;
+        run = std::min (size - i, std::min (chunk_size - slot % chunk_size, buffer_size - slot));
+        const char *package = get_package (slot);
+        double *output = data_buf + i * num_samples;
+        if ((package != NULL) && (float_rows.empty ()))
+        {
+            memcpy (output, package, run * package_bytes);
+            continue;
+        }
+        for (size_t j = 0; j < run; j++)
+        {
+            read_package (
+                (package == NULL) ? NULL : package + j * package_bytes, output + j * num_samples);
+        }
     }
-    else
+}
+
+void DataBuffer::get_chunk_transposed (
+    size_t start, size_t size, double *data_buf, size_t output_cols)
+{
+    for (size_t i = 0, run = 0; i < size; i += run)
     {
-        size_t first_half = buffer_size - start;
-        size_t second_half = size - first_half;
-        memcpy (data_buf, data + start * num_samples, first_half * sizeof (double) * num_samples);
-        memcpy (
-            data_buf + first_half * num_samples, data, second_half * sizeof (double) * num_samples);
+        size_t slot = (start + i) % buffer_size;
+        run = std::min (size - i, std::min (chunk_size - slot % chunk_size, buffer_size - slot));
+        const char *package = get_package (slot);
+        for (size_t j = 0; j < run; j++)
+        {
+            size_t col = i + j;
+            if (package == NULL)
+            {
+                for (size_t k = 0; k < num_samples; k++)
+                {
+                    data_buf[k * output_cols + col] = 0.0;
+                }
+                continue;
+            }
+            const double *doubles = (const double *)(package + j * package_bytes);
+            if (float_rows.empty ())
+            {
+                for (size_t k = 0; k < num_samples; k++)
+                {
+                    data_buf[k * output_cols + col] = doubles[k];
+                }
+                continue;
+            }
+            for (size_t k = 0; k < double_rows.size (); k++)
+            {
+                data_buf[double_rows[k] * output_cols + col] = doubles[k];
+            }
+            const float *floats = (const float *)(doubles + double_rows.size ());
+            for (size_t k = 0; k < float_rows.size (); k++)
+            {
+                data_buf[float_rows[k] * output_cols + col] = (double)floats[k];
+            }
+        }
     }
 }
 
@@ -92,6 +390,7 @@ size_t DataBuffer::get_data (size_t max_count, double *data_buf)
         first_used = (first_used + result_count) % buffer_size;
         count -= result_count;
     }
+    lost_count = 0;
     lock.unlock ();
     return result_count;
 }
@@ -112,6 +411,57 @@ size_t DataBuffer::get_current_data (size_t max_count, double *data_buf)
     return result_count;
 }
 
+// Removes data from buffer, no intermediate copy
+size_t DataBuffer::get_data_transposed (
+    size_t max_count, double *data_buf, size_t output_cols, size_t &lost)
+{
+    lock.lock ();
+    size_t result_count = max_count;
+    if (result_count > count)
+    {
+        result_count = count;
+    }
+    if ((output_cols != 0) && (result_count > output_cols))
+    {
+        result_count = output_cols;
+    }
+    if (result_count)
+    {
+        get_chunk_transposed (
+            first_used, result_count, data_buf, (output_cols == 0) ? result_count : output_cols);
+        first_used = (first_used + result_count) % buffer_size;
+        count -= result_count;
+    }
+    lost = lost_count;
+    lost_count = 0;
+    lock.unlock ();
+    return result_count;
+}
+
+// Doesn't remove data from buffer, no intermediate copy
+size_t DataBuffer::get_current_data_transposed (
+    size_t max_count, double *data_buf, size_t output_cols)
+{
+    lock.lock ();
+    size_t result_count = max_count;
+    if (result_count > count)
+    {
+        result_count = count;
+    }
+    if ((output_cols != 0) && (result_count > output_cols))
+    {
+        result_count = output_cols;
+    }
+    if (result_count)
+    {
+        size_t first_return = (first_used + (count - result_count)) % buffer_size;
+        get_chunk_transposed (
+            first_return, result_count, data_buf, (output_cols == 0) ? result_count : output_cols);
+    }
+    lock.unlock ();
+    return result_count;
+}
+
 size_t DataBuffer::get_data_count ()
 {
     lock.lock ();
@@ -119,3 +469,86 @@ size_t DataBuffer::get_data_count ()
     lock.unlock ();
     return result;
 }
+
+size_t DataBuffer::get_capacity ()
+{
+    // can be changed by add_data with GROW policy
+    lock.lock ();
+    size_t result = buffer_size;
+    lock.unlock ();
+    return result;
+}
+
+size_t DataBuffer::get_new_data_transposed (unsigned long long &cursor, size_t max_count,
+    double *data_buf, size_t output_cols, size_t &missed)
+{
+    missed = 0;
+    lock.lock ();
+    if (cursor > total_count)
+    {
+        cursor = total_count;
+    }
+    // only the last stored_count packages are available
+    unsigned long long first_seq = cursor;
+    if (total_count - first_seq > stored_count)
+    {
+        first_seq = total_count - stored_count;
+    }
+    size_t result_count = (size_t)(total_count - first_seq);
+    if (result_count > max_count)
+    {
+        result_count = max_count;
+    }
+    if ((output_cols != 0) && (result_count > output_cols))
+    {
+        result_count = output_cols;
+    }
+    if (result_count)
+    {
+        size_t first_return =
+            (first_free + buffer_size - (size_t)(total_count - first_seq)) % buffer_size;
+        get_chunk_transposed (
+            first_return, result_count, data_buf, (output_cols == 0) ? result_count : output_cols);
+    }
+    missed = (size_t)(first_seq - cursor);
+    cursor = first_seq + result_count;
+    lock.unlock ();
+    return result_count;
+}
+
+size_t DataBuffer::get_new_data_count (unsigned long long cursor)
+{
+    lock.lock ();
+    size_t result = 0;
+    if (total_count > cursor)
+    {
+        result =
+            (total_count - cursor > stored_count) ? stored_count : (size_t)(total_count - cursor);
+    }
+    lock.unlock ();
+    return result;
+}
+
+unsigned long long DataBuffer::get_total_count ()
+{
+    lock.lock ();
+    unsigned long long result = total_count;
+    lock.unlock ();
+    return result;
+}
+
+unsigned long long DataBuffer::get_overwritten_count ()
+{
+    lock.lock ();
+    unsigned long long result = overwritten_count;
+    lock.unlock ();
+    return result;
+}
+
+unsigned long long DataBuffer::get_dropped_count ()
+{
+    lock.lock ();
+    unsigned long long result = dropped_count;
+    lock.unlock ();
+    return result;
+}
@@ -0,0 +1,49 @@
+#pragma once
+
+#include <stdio.h>
+#include <string>
+
+// binary recording format, all numbers are stored in native(little endian on all supported
+// platforms) byte order:
+// header: magic(8 bytes), version, board_id, preset, num_rows, sampling_rate, descr_len (int32),
+//     descr (descr_len bytes, json with board description for this preset, "{}" if unknown)
+// chunks until EOF: num_cols (int32), then num_rows * num_cols doubles stored channel major,
+//     e.g. all samples for channel 0 first, all samples for channel 1 next and so on
+
+#define BFBIN_MAGIC_LEN 8
+#define BFBIN_VERSION 1
+#define BFBIN_FILE_EXTENSION ".bfbin"
+
+struct BFBinHeader
+{
+    int version;
+    int board_id;
+    int preset;
+    int num_rows;
+    int sampling_rate;
+    std::string descr;
+
+    BFBinHeader ()
+    {
+        version = BFBIN_VERSION;
+        board_id = -100;
+        preset = 0;
+        num_rows = 0;
+        sampling_rate = 0;
+        descr = "{}";
+    }
+};
+
+// returns true if file exists and starts with bfbin magic
+bool is_bfbin_file (const char *file_name);
+// returns true if file name has .bfbin extension
+bool has_bfbin_extension (const char *file_name);
+int write_bfbin_header (FILE *fp, const BFBinHeader &header);
+// on success file position points to the first chunk
+int read_bfbin_header (FILE *fp, BFBinHeader &header);
+// data is channel major: data[channel * num_cols + sample]
+int write_bfbin_chunk (FILE *fp, const double *data, int num_rows, int num_cols);
+// sums num_cols from all chunks, file position must point to the first chunk
+int get_bfbin_num_cols (FILE *fp, int num_rows, long long *total_cols);
+// reads up to max_cols samples into row major array data[row * max_cols + col]
+int read_bfbin_data (FILE *fp, int num_rows, int max_cols, double *data, int *num_cols);
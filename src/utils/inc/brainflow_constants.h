@@ -111,11 +111,21 @@ enum class FilterTypes : int
     BESSEL_ZERO_PHASE = 5
 };
 
+enum class FilterOperations : int
+{
+    LOWPASS = 0,
+    HIGHPASS = 1,
+    BANDPASS = 2,
+    BANDSTOP = 3
+};
+
 enum class AggOperations : int
 {
     MEAN = 0,
     MEDIAN = 1,
-    EACH = 2
+    EACH = 2,
+    MIN = 3,
+    MAX = 4
 };
 
 enum class WindowOperations : int
@@ -154,6 +164,28 @@ enum class BrainFlowPresets : int
     ANCILLARY_PRESET = 2
 };
 
+enum class BufferTypes : int
+{
+    SPIN_LOCK_BUFFER = 0,
+    LOCK_FREE_BUFFER = 1
+};
+
+// BLOCK waits in the board thread until streamers catch up, the wait is limited by
+// streamer_block_timeout_ms, after that packages are dropped and counted like with DROP_NEWEST
+enum class StreamerOverflowPolicies : int
+{
+    BLOCK = 0,
+    DROP_OLDEST = 1,
+    DROP_NEWEST = 2
+};
+
+enum class BufferOverflowPolicies : int
+{
+    OVERWRITE_OLDEST = 0,
+    DROP_NEWEST = 1,
+    GROW = 2
+};
+
 enum class LogLevels : int
 {
     LEVEL_TRACE = 0,
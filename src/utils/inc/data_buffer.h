@@ -1,34 +1,144 @@
 #pragma once
 
+#include "brainflow_constants.h"
 #include "spinlock.h"
+#include <atomic>
+#include <condition_variable>
+#include <mutex>
+#include <set>
 #include <stdlib.h>
 #include <string.h>
+#include <vector>
+
+// number of packages in a chunk of lazily allocated buffer
+#define DATA_BUFFER_CHUNK_SIZE 1024
+
+
+// memory layout of packages, by default buffer is a single array of doubles allocated in
+// constructor
+struct DataBufferStorage
+{
+    // allocate memory in chunks of DATA_BUFFER_CHUNK_SIZE packages when they are written first time
+    bool lazy_allocation;
+    // these rows are stored as float32 and converted back to double on retrieval
+    std::vector<int> float_rows;
+
+    DataBufferStorage ()
+    {
+        lazy_allocation = false;
+    }
+};
 
 class DataBuffer
 {
 
     SpinLock lock;
-    double *data;
 
-    size_t buffer_size;
     size_t first_used, first_free;
     size_t count;
-    size_t num_samples;
+    unsigned long long total_count; // number of packages added since creation
+    // number of slots with packages, reader cursors can not go further back
+    size_t stored_count;
+
+    int overflow_policy;
+    size_t max_buffer_size;
+    unsigned long long overwritten_count;
+    unsigned long long dropped_count;
+    // packages overwritten or dropped since the last get_data call
+    size_t lost_count;
 
     size_t next (size_t index)
     {
         return (index + 1) % buffer_size;
     }
 
+    // called by add_data if buffer is full and policy is GROW
+    bool grow ();
+
+    bool lazy_allocation;
+    size_t chunk_size; // number of packages in a chunk, buffer_size if allocation is not lazy
+    std::vector<char *> chunks;
+    // package is stored as doubles followed by floats, rows are indices of these values in package
+    std::vector<size_t> double_rows;
+    std::vector<size_t> float_rows;
+    size_t package_bytes;
+    std::atomic<size_t> allocated_bytes;
+    bool ready;
+
+    bool init_rows (const std::vector<int> &rows);
+    bool init_chunks ();
+    void free_chunks (
+        std::vector<char *> &chunks_to_free, size_t num_packages, size_t packages_in_chunk);
+    char *get_package (size_t slot)
+    {
+        char *chunk = chunks[slot / chunk_size];
+        return (chunk == NULL) ? NULL : chunk + (slot % chunk_size) * package_bytes;
+    }
+    // allocates chunk for this slot if needed, returns NULL if there is no memory
+    char *get_package_for_write (size_t slot);
+    void read_package (const char *package, double *value);
+
+    std::mutex wait_mutex;
+    std::condition_variable wait_cv;
+    std::multiset<size_t> wait_thresholds;
+    std::atomic<size_t> wake_threshold; // the smallest threshold of waiting threads
+    bool is_waiting_stopped;
+
+protected:
+    size_t buffer_size;
+    size_t num_samples;
+
+    // returns false if memory for this slot can not be allocated
+    bool write_package (size_t slot, const double *value);
     void get_chunk (size_t start, size_t size, double *data_buf);
+    void get_chunk_transposed (size_t start, size_t size, double *data_buf, size_t output_cols);
+    // should be called by producer after each package, its cheap if there are no waiting threads
+    void notify_waiters (size_t data_count);
 
 public:
-    DataBuffer (int num_samples, size_t buffer_size);
-    ~DataBuffer ();
+    // overflow_policy is a value from BufferOverflowPolicies, with GROW policy capacity is doubled
+    // up to max_buffer_size and after that the oldest packages are overwritten
+    DataBuffer (int num_samples, size_t buffer_size,
+        int overflow_policy = (int)BufferOverflowPolicies::OVERWRITE_OLDEST,
+        size_t max_buffer_size = 0, const DataBufferStorage &storage = DataBufferStorage ());
+    virtual ~DataBuffer ();
 
-    void add_data (double *value);
-    size_t get_data (size_t max_count, double *data_buf);
-    size_t get_current_data (size_t max_count, double *data_buf);
-    size_t get_data_count ();
+    virtual void add_data (double *value);
+    virtual size_t get_data (size_t max_count, double *data_buf);
+    virtual size_t get_current_data (size_t max_count, double *data_buf);
+    // same as methods above but write directly to row major (num_samples x output_cols) array, if
+    // output_cols is 0 number of returned elements is used as a row length. lost is set to the
+    // number of packages which were overwritten or dropped since the previous get_data call
+    virtual size_t get_data_transposed (
+        size_t max_count, double *data_buf, size_t output_cols, size_t &lost);
+    size_t get_data_transposed (size_t max_count, double *data_buf, size_t output_cols)
+    {
+        size_t lost = 0;
+        return get_data_transposed (max_count, data_buf, output_cols, lost);
+    }
+    virtual size_t get_current_data_transposed (
+        size_t max_count, double *data_buf, size_t output_cols);
+    virtual size_t get_data_count ();
+    // max number of packages which can be stored in buffer
+    virtual size_t get_capacity ();
+    // reader cursors, cursor is a sequence number of the next package for this reader. Data is not
+    // removed and other reads dont move cursors. missed is set to the number of packages which were
+    // overwritten before reader got them
+    virtual size_t get_new_data_transposed (unsigned long long &cursor, size_t max_count,
+        double *data_buf, size_t output_cols, size_t &missed);
+    virtual size_t get_new_data_count (unsigned long long cursor);
+    // sequence number of the next package, use it to create a cursor which skips existing data
+    virtual unsigned long long get_total_count ();
+    // packages removed from full buffer before anybody got them and packages rejected by
+    // DROP_NEWEST policy since creation
+    virtual unsigned long long get_overwritten_count ();
+    virtual unsigned long long get_dropped_count ();
+    // bytes allocated for packages, with lazy allocation it grows while buffer is filled first time
+    size_t get_memory_usage ();
     bool is_ready ();
+    // blocks until buffer has at least num_samples packages, returns false on timeout or if
+    // stop_waiting was called
+    bool wait_for_data (size_t num_samples, int timeout_ms);
+    // wakes up all waiting threads, next waits return immediately
+    void stop_waiting ();
 };
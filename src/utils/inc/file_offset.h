@@ -0,0 +1,41 @@
+#pragma once
+
+// long is 32 bit on windows, so fseek and ftell fail for files larger than 2 GB. On 32 bit
+// linux off_t is 64 bit only with _FILE_OFFSET_BITS, include this header before other headers
+#ifndef _WIN32
+#ifndef _FILE_OFFSET_BITS
+#define _FILE_OFFSET_BITS 64
+#endif
+#include <sys/types.h>
+#endif
+#include <stdio.h>
+
+
+inline int file_seek (FILE *fp, long long offset, int origin)
+{
+#ifdef _WIN32
+    return _fseeki64 (fp, (__int64)offset, origin);
+#else
+    return fseeko (fp, (off_t)offset, origin);
+#endif
+}
+
+inline long long file_tell (FILE *fp)
+{
+#ifdef _WIN32
+    return (long long)_ftelli64 (fp);
+#else
+    return (long long)ftello (fp);
+#endif
+}
+
+// position of a stream opened in append mode is not defined until the first write(msvc reports
+// 0), seek to the end to get the size, writes in append mode go to the end anyway
+inline long long file_size (FILE *fp)
+{
+    if (file_seek (fp, 0, SEEK_END) != 0)
+    {
+        return -1;
+    }
+    return file_tell (fp);
+}
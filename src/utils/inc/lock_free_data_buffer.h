@@ -0,0 +1,51 @@
+#pragma once
+
+#include <atomic>
+
+#include "data_buffer.h"
+
+// Ring buffer for a single producer: add_data never waits for readers. Readers use sequence numbers
+// to take snapshots and retry if the producer overwrote a package while it was being copied.
+// Several threads may still call add_data if they are serialized externally, e.g. by Board::lock.
+// GROW policy is not supported, buffer can not be reallocated while readers copy packages
+class LockFreeDataBuffer : public DataBuffer
+{
+    std::atomic<unsigned long long> head; // sequence number of the next package to write
+    std::atomic<unsigned long long> tail; // sequence number of the oldest not consumed package
+    // one extra slot is allocated for the package which is being written by the producer
+    size_t capacity;
+    int overflow_policy;
+    // packages which consumers found overwritten, packages which are overwritten but not consumed
+    // yet are computed from head and tail
+    std::atomic<unsigned long long> overwritten;
+    // written only by producer, consumers move dropped_reported to report each package once
+    std::atomic<unsigned long long> dropped;
+    std::atomic<unsigned long long> dropped_reported;
+
+    size_t read_packages (size_t max_count, double *data_buf, size_t output_cols, bool transposed,
+        bool latest, bool consume, size_t *lost);
+
+public:
+    LockFreeDataBuffer (int num_samples, size_t buffer_size,
+        int overflow_policy = (int)BufferOverflowPolicies::OVERWRITE_OLDEST,
+        const DataBufferStorage &storage = DataBufferStorage ());
+    ~LockFreeDataBuffer () override;
+
+    using DataBuffer::get_data_transposed;
+
+    void add_data (double *value) override;
+    size_t get_data (size_t max_count, double *data_buf) override;
+    size_t get_current_data (size_t max_count, double *data_buf) override;
+    size_t get_data_transposed (
+        size_t max_count, double *data_buf, size_t output_cols, size_t &lost) override;
+    size_t get_current_data_transposed (
+        size_t max_count, double *data_buf, size_t output_cols) override;
+    size_t get_data_count () override;
+    size_t get_capacity () override;
+    size_t get_new_data_transposed (unsigned long long &cursor, size_t max_count, double *data_buf,
+        size_t output_cols, size_t &missed) override;
+    size_t get_new_data_count (unsigned long long cursor) override;
+    unsigned long long get_total_count () override;
+    unsigned long long get_overwritten_count () override;
+    unsigned long long get_dropped_count () override;
+};
@@ -0,0 +1,109 @@
+#pragma once
+
+#include <list>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <utility>
+
+
+// thread safe bounded cache with least recently used eviction, values are shared so evicted
+// value stays alive while it is used by another thread. Size is limited by number of items and
+// optionally by total bytes reported by callers, 0 means no limit for bytes
+template <typename Key, typename Value>
+class LRUCache
+{
+
+public:
+    LRUCache (size_t max_size, size_t max_bytes = 0)
+    {
+        this->max_size = max_size;
+        this->max_bytes = max_bytes;
+        total_bytes = 0;
+        hits = 0;
+        misses = 0;
+    }
+
+    // returns cached value or creates it using factory, factory can return nullptr on error.
+    // value_bytes is the memory used by value, value larger than max_bytes is returned without
+    // caching
+    template <typename Factory>
+    std::shared_ptr<Value> get (const Key &key, Factory create, size_t value_bytes = 0)
+    {
+        {
+            std::lock_guard<std::mutex> lock (m);
+            auto it = index.find (key);
+            if (it != index.end ())
+            {
+                hits++;
+                items.splice (items.begin (), items, it->second);
+                return it->second->second.value;
+            }
+            misses++;
+        }
+        // dont hold the lock while value is created, it may take a while
+        std::shared_ptr<Value> value = create ();
+        if ((!value) || ((max_bytes != 0) && (value_bytes > max_bytes)))
+        {
+            return value;
+        }
+        std::lock_guard<std::mutex> lock (m);
+        auto it = index.find (key);
+        if (it != index.end ())
+        {
+            // created by another thread in the meantime
+            return it->second->second.value;
+        }
+        items.emplace_front (key, Item {value, value_bytes});
+        index[key] = items.begin ();
+        total_bytes += value_bytes;
+        while ((items.size () > max_size) || ((max_bytes != 0) && (total_bytes > max_bytes)))
+        {
+            total_bytes -= items.back ().second.bytes;
+            index.erase (items.back ().first);
+            items.pop_back ();
+        }
+        return value;
+    }
+
+    void clear ()
+    {
+        std::lock_guard<std::mutex> lock (m);
+        index.clear ();
+        items.clear ();
+        total_bytes = 0;
+        hits = 0;
+        misses = 0;
+    }
+
+    size_t get_bytes ()
+    {
+        std::lock_guard<std::mutex> lock (m);
+        return total_bytes;
+    }
+
+    void get_stats (long long *hits, long long *misses, int *size)
+    {
+        std::lock_guard<std::mutex> lock (m);
+        *hits = this->hits;
+        *misses = this->misses;
+        *size = (int)items.size ();
+    }
+
+private:
+    struct Item
+    {
+        std::shared_ptr<Value> value;
+        size_t bytes;
+    };
+
+    size_t max_size;
+    size_t max_bytes;
+    size_t total_bytes;
+    long long hits;
+    long long misses;
+    // most recently used item first
+    std::list<std::pair<Key, Item>> items;
+    std::map<Key, typename std::list<std::pair<Key, Item>>::iterator> index;
+    std::mutex m;
+};
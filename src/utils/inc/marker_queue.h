@@ -0,0 +1,60 @@
+#pragma once
+
+#include <atomic>
+#include <stddef.h>
+
+#define MARKER_QUEUE_SIZE 1024
+
+
+// hands markers from insert_marker to the board thread without locks. There must be a single
+// producer and a single consumer, insert_marker calls are serialized by session mutex and
+// push_package is called only from the board thread
+class MarkerQueue
+{
+
+public:
+    MarkerQueue ()
+    {
+        first = 0;
+        last = 0;
+    }
+
+    // returns false if queue is full, up to MARKER_QUEUE_SIZE - 1 markers can wait for a package
+    bool push (double value)
+    {
+        size_t pos = last.load (std::memory_order_relaxed);
+        size_t next = (pos + 1) % MARKER_QUEUE_SIZE;
+        if (next == first.load (std::memory_order_acquire))
+        {
+            return false;
+        }
+        values[pos] = value;
+        last.store (next, std::memory_order_release);
+        return true;
+    }
+
+    // returns false if queue is empty
+    bool pop (double &value)
+    {
+        size_t pos = first.load (std::memory_order_relaxed);
+        if (pos == last.load (std::memory_order_acquire))
+        {
+            return false;
+        }
+        value = values[pos];
+        first.store ((pos + 1) % MARKER_QUEUE_SIZE, std::memory_order_release);
+        return true;
+    }
+
+    // only when neither producer nor consumer is running
+    void clear ()
+    {
+        first.store (0, std::memory_order_relaxed);
+        last.store (0, std::memory_order_relaxed);
+    }
+
+private:
+    double values[MARKER_QUEUE_SIZE];
+    std::atomic<size_t> first;
+    std::atomic<size_t> last;
+};
@@ -15,6 +15,12 @@ public:
         }
     }
 
+    // returns false if lock is held by another thread, used to measure contention
+    inline bool try_lock ()
+    {
+        return !lck.test_and_set (std::memory_order_acquire);
+    }
+
     inline void unlock ()
     {
         lck.clear (std::memory_order_release);
@@ -0,0 +1,261 @@
+#include "lock_free_data_buffer.h"
+
+#include <algorithm>
+
+
+LockFreeDataBuffer::LockFreeDataBuffer (
+    int num_samples, size_t buffer_size, int overflow_policy, const DataBufferStorage &storage)
+    : DataBuffer (num_samples, (buffer_size == 0) ? 0 : buffer_size + 1,
+          (int)BufferOverflowPolicies::OVERWRITE_OLDEST, 0, storage)
+{
+    capacity = buffer_size;
+    this->overflow_policy = overflow_policy;
+    head = 0;
+    tail = 0;
+    overwritten = 0;
+    dropped = 0;
+    dropped_reported = 0;
+}
+
+LockFreeDataBuffer::~LockFreeDataBuffer ()
+{
+}
+
+void LockFreeDataBuffer::add_data (double *value)
+{
+    if (!is_ready ())
+    {
+        return;
+    }
+
+    unsigned long long seq = head.load (std::memory_order_relaxed);
+    if ((overflow_policy == (int)BufferOverflowPolicies::DROP_NEWEST) &&
+        (seq - tail.load (std::memory_order_acquire) >= capacity))
+    {
+        dropped.store (dropped.load (std::memory_order_relaxed) + 1, std::memory_order_release);
+        return;
+    }
+    // readers which see any part of this package must also see head == seq, so they treat the slot
+    // being written as overwritten. Readers never return more than capacity packages and this slot
+    // is the extra one
+    std::atomic_thread_fence (std::memory_order_release);
+    // memory for a chunk of lazily allocated buffer is allocated here, package is dropped if it
+    // fails
+    if (!write_package ((size_t)(seq % buffer_size), value))
+    {
+        dropped.store (dropped.load (std::memory_order_relaxed) + 1, std::memory_order_release);
+        return;
+    }
+    head.store (seq + 1, std::memory_order_release);
+    notify_waiters ((size_t)std::min<unsigned long long> (
+        seq + 1 - tail.load (std::memory_order_relaxed), capacity));
+}
+
+size_t LockFreeDataBuffer::read_packages (size_t max_count, double *data_buf, size_t output_cols,
+    bool transposed, bool latest, bool consume, size_t *lost)
+{
+    if (!is_ready ())
+    {
+        return 0;
+    }
+
+    while (true)
+    {
+        unsigned long long tail_seq = tail.load (std::memory_order_acquire);
+        unsigned long long head_seq = head.load (std::memory_order_acquire);
+        unsigned long long first_seq = tail_seq;
+        if (head_seq - first_seq > capacity)
+        {
+            first_seq = head_seq - capacity;
+        }
+
+        size_t result_count = (size_t)(head_seq - first_seq);
+        if (result_count > max_count)
+        {
+            result_count = max_count;
+        }
+        if ((output_cols != 0) && (result_count > output_cols))
+        {
+            result_count = output_cols;
+        }
+        if ((result_count == 0) && (!consume))
+        {
+            return 0;
+        }
+
+        unsigned long long start_seq = latest ? head_seq - result_count : first_seq;
+        size_t start = (size_t)(start_seq % buffer_size);
+        if (transposed)
+        {
+            get_chunk_transposed (
+                start, result_count, data_buf, (output_cols == 0) ? result_count : output_cols);
+        }
+        else
+        {
+            get_chunk (start, result_count, data_buf);
+        }
+
+        // validate snapshot, producer may have started to overwrite the oldest copied package
+        std::atomic_thread_fence (std::memory_order_acquire);
+        if (head.load (std::memory_order_relaxed) >= start_seq + buffer_size)
+        {
+            continue;
+        }
+        if (!consume)
+        {
+            return result_count;
+        }
+        // another consumer may have taken these packages in the meantime
+        if (!tail.compare_exchange_strong (
+                tail_seq, start_seq + result_count, std::memory_order_acq_rel))
+        {
+            continue;
+        }
+        size_t num_lost = (size_t)(first_seq - tail_seq);
+        if (num_lost > 0)
+        {
+            overwritten.fetch_add (num_lost, std::memory_order_relaxed);
+        }
+        unsigned long long dropped_seq = dropped.load (std::memory_order_acquire);
+        unsigned long long reported = dropped_reported.load (std::memory_order_relaxed);
+        while ((reported < dropped_seq) &&
+            (!dropped_reported.compare_exchange_weak (
+                reported, dropped_seq, std::memory_order_relaxed)))
+        {
+        }
+        if (reported < dropped_seq)
+        {
+            num_lost += (size_t)(dropped_seq - reported);
+        }
+        if (lost != NULL)
+        {
+            *lost = num_lost;
+        }
+        return result_count;
+    }
+}
+
+// Removes data from buffer
+size_t LockFreeDataBuffer::get_data (size_t max_count, double *data_buf)
+{
+    return read_packages (max_count, data_buf, 0, false, false, true, NULL);
+}
+
+// Doesn't remove data from buffer
+size_t LockFreeDataBuffer::get_current_data (size_t max_count, double *data_buf)
+{
+    return read_packages (max_count, data_buf, 0, false, true, false, NULL);
+}
+
+size_t LockFreeDataBuffer::get_data_transposed (
+    size_t max_count, double *data_buf, size_t output_cols, size_t &lost)
+{
+    lost = 0;
+    return read_packages (max_count, data_buf, output_cols, true, false, true, &lost);
+}
+
+size_t LockFreeDataBuffer::get_current_data_transposed (
+    size_t max_count, double *data_buf, size_t output_cols)
+{
+    return read_packages (max_count, data_buf, output_cols, true, true, false, NULL);
+}
+
+size_t LockFreeDataBuffer::get_data_count ()
+{
+    unsigned long long tail_seq = tail.load (std::memory_order_acquire);
+    unsigned long long head_seq = head.load (std::memory_order_acquire);
+    if (head_seq - tail_seq > capacity)
+    {
+        return capacity;
+    }
+    return (size_t)(head_seq - tail_seq);
+}
+
+size_t LockFreeDataBuffer::get_capacity ()
+{
+    return capacity;
+}
+
+size_t LockFreeDataBuffer::get_new_data_transposed (unsigned long long &cursor, size_t max_count,
+    double *data_buf, size_t output_cols, size_t &missed)
+{
+    missed = 0;
+    if (!is_ready ())
+    {
+        return 0;
+    }
+
+    while (true)
+    {
+        unsigned long long head_seq = head.load (std::memory_order_acquire);
+        if (cursor > head_seq)
+        {
+            cursor = head_seq;
+        }
+        unsigned long long first_seq = cursor;
+        if (head_seq - first_seq > capacity)
+        {
+            first_seq = head_seq - capacity;
+        }
+
+        size_t result_count = (size_t)(head_seq - first_seq);
+        if (result_count > max_count)
+        {
+            result_count = max_count;
+        }
+        if ((output_cols != 0) && (result_count > output_cols))
+        {
+            result_count = output_cols;
+        }
+        if (result_count)
+        {
+            get_chunk_transposed ((size_t)(first_seq % buffer_size), result_count, data_buf,
+                (output_cols == 0) ? result_count : output_cols);
+            // same validation as in read_packages
+            std::atomic_thread_fence (std::memory_order_acquire);
+            if (head.load (std::memory_order_relaxed) >= first_seq + buffer_size)
+            {
+                continue;
+            }
+        }
+        missed = (size_t)(first_seq - cursor);
+        cursor = first_seq + result_count;
+        return result_count;
+    }
+}
+
+size_t LockFreeDataBuffer::get_new_data_count (unsigned long long cursor)
+{
+    unsigned long long head_seq = head.load (std::memory_order_acquire);
+    if (head_seq <= cursor)
+    {
+        return 0;
+    }
+    if (head_seq - cursor > capacity)
+    {
+        return capacity;
+    }
+    return (size_t)(head_seq - cursor);
+}
+
+unsigned long long LockFreeDataBuffer::get_total_count ()
+{
+    return head.load (std::memory_order_acquire);
+}
+
+unsigned long long LockFreeDataBuffer::get_overwritten_count ()
+{
+    unsigned long long tail_seq = tail.load (std::memory_order_acquire);
+    unsigned long long head_seq = head.load (std::memory_order_acquire);
+    unsigned long long result = overwritten.load (std::memory_order_relaxed);
+    if (head_seq - tail_seq > capacity)
+    {
+        result += head_seq - tail_seq - capacity;
+    }
+    return result;
+}
+
+unsigned long long LockFreeDataBuffer::get_dropped_count ()
+{
+    return dropped.load (std::memory_order_acquire);
+}